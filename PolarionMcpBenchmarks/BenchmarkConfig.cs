@@ -0,0 +1,27 @@
+using BenchmarkDotNet.Columns;
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Diagnosers;
+using BenchmarkDotNet.Exporters;
+using BenchmarkDotNet.Exporters.Json;
+using BenchmarkDotNet.Jobs;
+using BenchmarkDotNet.Toolchains.InProcess.Emit;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Shared settings of every benchmark: allocations per call, throughput (operations per second), and JSON and
+/// GitHub Markdown reports for comparing runs in CI.
+/// </summary>
+public sealed class BenchmarkConfig : ManualConfig
+{
+    public BenchmarkConfig()
+    {
+        // The REST benchmarks host the server through WebApplicationFactory, which needs the server's deps file
+        // next to this assembly; running in-process keeps that true for every benchmark
+        AddJob(Job.Default.WithToolchain(InProcessEmitToolchain.Instance));
+        AddDiagnoser(MemoryDiagnoser.Default);
+        AddColumn(StatisticColumn.OperationsPerSecond);
+        AddExporter(JsonExporter.Full);
+        AddExporter(MarkdownExporter.GitHub);
+    }
+}
@@ -0,0 +1,70 @@
+using System.Diagnostics.CodeAnalysis;
+using BenchmarkDotNet.Attributes;
+using PolarionMcpSimulator;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Parallel REST requests against a simulator with Polarion-like latency, measuring how the session pool,
+/// bulkheads and call coalescing hold up as concurrency grows. Results are per request.
+/// </summary>
+[Config(typeof(BenchmarkConfig))]
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class ConcurrencyBenchmarks
+{
+    private const int RequestsPerInvoke = 64;
+
+    private SimulatedServerFactory _factory = null!;
+    private HttpClient _client = null!;
+    private string[] _paths = null!;
+
+    /// <summary>
+    /// Number of requests in flight at once.
+    /// </summary>
+    [Params(1, 8, 32)]
+    public int Concurrency { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        var options = new SimulatorOptions
+        {
+            LatencyMilliseconds = 2,
+            LatencyJitterMilliseconds = 1,
+            LatencyPerItemMicroseconds = 5
+        };
+        var project = new SyntheticProject(options);
+        _factory = new SimulatedServerFactory(options);
+        _client = _factory.CreateAuthenticatedClient();
+
+        // A mix of distinct work items and one hot document, so both pooling and coalescing are exercised
+        var projectPath = $"/polarion/rest/v1/projects/{Uri.EscapeDataString(_factory.ProjectId)}";
+        var (space, documentId) = project.GetDocumentLocation(SimulatedHost.DocumentIndex);
+        _paths = Enumerable.Range(0, RequestsPerInvoke)
+            .Select(i => i % 4 == 0
+                ? $"{projectPath}/spaces/{Uri.EscapeDataString(space)}/documents/{Uri.EscapeDataString(documentId)}/workitems"
+                : $"{projectPath}/workitems/{project.GetWorkItemId(i % project.DocumentCount, i % options.WorkItemsPerDocument)}")
+            .ToArray();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _client.Dispose();
+        _factory.Dispose();
+    }
+
+    [Benchmark(OperationsPerInvoke = RequestsPerInvoke)]
+    public Task ParallelRequests()
+    {
+        return Parallel.ForEachAsync(
+            _paths,
+            new ParallelOptions { MaxDegreeOfParallelism = Concurrency },
+            async (path, cancellationToken) =>
+            {
+                using var response = await _client.GetAsync(path, cancellationToken);
+                response.EnsureSuccessStatusCode();
+                await response.Content.ReadAsStringAsync(cancellationToken);
+            });
+    }
+}
@@ -0,0 +1,107 @@
+using System.Diagnostics.CodeAnalysis;
+using BenchmarkDotNet.Attributes;
+using Microsoft.Extensions.DependencyInjection;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Every MCP tool, called directly on <see cref="McpTools"/> against the simulated project.
+/// </summary>
+[Config(typeof(BenchmarkConfig))]
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class McpToolBenchmarks
+{
+    private ServiceProvider _services = null!;
+    private McpTools _tools = null!;
+    private string _space = null!;
+    private string _documentId = null!;
+    private string _documentRevision = null!;
+    private string _sectionNumber = null!;
+    private string _workItemId = null!;
+    private string _workItemRevision = null!;
+    private string _detailIds = null!;
+
+    /// <summary>
+    /// Whether the shared caches and the catalog are enabled; repeated calls are then served from memory.
+    /// </summary>
+    [Params(true, false)]
+    public bool Caching { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _services = SimulatedHost.CreateToolServices(new SimulatorOptions(), Caching);
+        _tools = new McpTools(_services);
+
+        var project = _services.GetRequiredService<SyntheticProject>();
+        (_space, _documentId) = project.GetDocumentLocation(SimulatedHost.DocumentIndex);
+        _documentRevision = project.GetDocumentRevision(SimulatedHost.DocumentIndex, revisionsBack: 5);
+        _sectionNumber = project.GetSectionNumber(1);
+        _workItemId = project.GetWorkItemId(SimulatedHost.DocumentIndex, SimulatedHost.WorkItemPosition);
+        _workItemRevision = project.GetWorkItemRevision(SimulatedHost.DocumentIndex, SimulatedHost.WorkItemPosition, revisionsBack: 3);
+        _detailIds = string.Join(",", Enumerable.Range(SimulatedHost.WorkItemPosition, 5)
+            .Select(position => project.GetWorkItemId(SimulatedHost.DocumentIndex, position)));
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _services.Dispose();
+    }
+
+    [Benchmark]
+    public Task<string> DiffDocumentRevisions() => _tools.DiffDocumentRevisions(_space, _documentId, _documentRevision);
+
+    [Benchmark]
+    public Task<string> GetDocumentInfo() => _tools.GetDocumentInfo(_space, _documentId, "all");
+
+    [Benchmark]
+    public Task<string> GetDocumentOutline() => _tools.GetDocumentOutline(_space, _documentId);
+
+    [Benchmark]
+    public Task<string> GetDocumentRevisionHistory() => _tools.GetDocumentRevisionHistory(_space, _documentId, 10);
+
+    [Benchmark]
+    public Task<string> GetDocumentSection() => _tools.GetDocumentSection(_space, _documentId, _sectionNumber);
+
+    [Benchmark]
+    public Task<string> GetWorkItemsInModule() => _tools.GetWorkItemsInModule(_space, _documentId);
+
+    [Benchmark]
+    public Task<string> GetWorkItemsInModuleAtRevision() => _tools.GetWorkItemsInModule(_space, _documentId, revision: _documentRevision);
+
+    [Benchmark]
+    public Task<string> GetWorkitem() => _tools.GetWorkitem(_workItemId);
+
+    [Benchmark]
+    public Task<string> GetWorkitemAtRevision() => _tools.GetWorkitem(_workItemId, _workItemRevision);
+
+    [Benchmark]
+    public Task<string> GetWorkitemDetails() => _tools.GetWorkitemDetails(_detailIds, "all", "both", null, 2);
+
+    [Benchmark]
+    public Task<string> GetWorkitemHistory() => _tools.GetWorkitemHistory(_workItemId, 10);
+
+    [Benchmark]
+    public Task<string> ListCustomFields() => _tools.ListCustomFields("requirement");
+
+    [Benchmark]
+    public Task<string> ListDocumentsInSpace() => _tools.ListDocuments(_space);
+
+    [Benchmark]
+    public Task<string> ListDocumentsAllSpaces() => _tools.ListDocuments(titleFilter: "voltage");
+
+    [Benchmark]
+    public Task<string> ListSpaces() => _tools.ListSpaces();
+
+    [Benchmark]
+    public Task<string> ListWorkitemTypes() => _tools.ListWorkitemTypes();
+
+    [Benchmark]
+    public Task<string> SearchInDocument() => _tools.SearchInDocument(_space, _documentId, "voltage sensor");
+
+    [Benchmark]
+    public Task<string> SearchWorkitems() => _tools.SearchWorkitems("voltage sensor", itemTypes: "requirement");
+}
@@ -0,0 +1,15 @@
+using BenchmarkDotNet.Running;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Runs the benchmarks against the in-process Polarion simulator; no Polarion server or network is needed.
+/// Pass BenchmarkDotNet arguments, e.g. <c>--filter *McpTool*</c> or <c>--list flat</c>.
+/// </summary>
+public static class Program
+{
+    public static void Main(string[] args)
+    {
+        BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
+    }
+}
@@ -0,0 +1,161 @@
+using System.Diagnostics.CodeAnalysis;
+using BenchmarkDotNet.Attributes;
+using PolarionMcpSimulator;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Every REST API route, called through the in-memory server against the simulated project.
+/// Each benchmark reads the whole response body, so serialization is part of the measurement.
+/// The space and project exports run against a second, smaller project so one call stays in the range of
+/// the other benchmarks.
+/// </summary>
+[Config(typeof(BenchmarkConfig))]
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class RestApiBenchmarks
+{
+    /// <summary>
+    /// 4 spaces and 40 documents, 4,800 work items in all.
+    /// </summary>
+    private static readonly SimulatorOptions ExportOptions = new()
+    {
+        SpaceCount = 4,
+        DocumentCount = 40
+    };
+
+    private SimulatedServerFactory _factory = null!;
+    private HttpClient _client = null!;
+    private string _projectPath = null!;
+    private string _spacePath = null!;
+    private string _documentPath = null!;
+    private string _workItemPath = null!;
+    private string _workItemRevision = null!;
+    private string _documentRevision = null!;
+    private string _batchIds = null!;
+    private SimulatedServerFactory _exportFactory = null!;
+    private HttpClient _exportClient = null!;
+    private string _exportProjectPath = null!;
+    private string _exportSpacePath = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        var options = new SimulatorOptions();
+        var project = new SyntheticProject(options);
+        _factory = new SimulatedServerFactory(options);
+        _client = _factory.CreateAuthenticatedClient();
+
+        var (space, documentId) = project.GetDocumentLocation(SimulatedHost.DocumentIndex);
+        _projectPath = $"/polarion/rest/v1/projects/{Uri.EscapeDataString(_factory.ProjectId)}";
+        _spacePath = $"{_projectPath}/spaces/{Uri.EscapeDataString(space)}";
+        _documentPath = $"{_spacePath}/documents/{Uri.EscapeDataString(documentId)}";
+        _workItemPath = $"{_projectPath}/workitems/{project.GetWorkItemId(SimulatedHost.DocumentIndex, SimulatedHost.WorkItemPosition)}";
+        _workItemRevision = project.GetWorkItemRevision(SimulatedHost.DocumentIndex, SimulatedHost.WorkItemPosition, revisionsBack: 3);
+        _documentRevision = project.GetDocumentRevision(SimulatedHost.DocumentIndex, revisionsBack: 5);
+        _batchIds = string.Join(",", Enumerable.Range(0, 20)
+            .Select(position => project.GetWorkItemId(SimulatedHost.DocumentIndex, position)));
+
+        _exportFactory = new SimulatedServerFactory(ExportOptions);
+        _exportClient = _exportFactory.CreateAuthenticatedClient();
+        var exportSpace = new SyntheticProject(ExportOptions).GetDocumentLocation(0).Space;
+        _exportProjectPath = $"/polarion/rest/v1/projects/{Uri.EscapeDataString(_exportFactory.ProjectId)}";
+        _exportSpacePath = $"{_exportProjectPath}/spaces/{Uri.EscapeDataString(exportSpace)}";
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _client.Dispose();
+        _factory.Dispose();
+        _exportClient.Dispose();
+        _exportFactory.Dispose();
+    }
+
+    [Benchmark]
+    public Task<string> GetSpaces() => GetAsync($"{_projectPath}/spaces");
+
+    [Benchmark]
+    public Task<string> RefreshCatalog() => PostAsync($"{_projectPath}/catalog/refresh");
+
+    [Benchmark]
+    public Task<string> GetDocuments() => GetAsync($"{_spacePath}/documents");
+
+    [Benchmark]
+    public Task<string> GetDocument() => GetAsync(_documentPath);
+
+    [Benchmark]
+    public Task<string> GetDocumentWorkItems() => GetAsync($"{_documentPath}/workitems");
+
+    [Benchmark]
+    public Task<string> GetDocumentWorkItemsAtRevision() => GetAsync($"{_documentPath}/workitems?revision={_documentRevision}");
+
+    [Benchmark]
+    public Task<string> GetDocumentRevisions() => GetAsync($"{_documentPath}/revisions");
+
+    [Benchmark]
+    public Task<string> GetDocumentDiff() => GetAsync($"{_documentPath}/diff?from={_documentRevision}");
+
+    [Benchmark]
+    public Task<string> ExportDocument() => GetAsync($"{_documentPath}/export");
+
+    [Benchmark]
+    public Task<string> ExportSpace() => GetAsync(_exportClient, $"{_exportSpacePath}/export");
+
+    [Benchmark]
+    public Task<string> ExportProject() => GetAsync(_exportClient, $"{_exportProjectPath}/export");
+
+    [Benchmark]
+    public Task<string> SearchWorkItems() => GetAsync($"{_projectPath}/workitems?query=voltage%20sensor&types=requirement&page%5Bsize%5D=50");
+
+    [Benchmark]
+    public Task<string> GetWorkItemsById() => GetAsync($"{_projectPath}/workitems?filter%5Bid%5D={_batchIds}");
+
+    [Benchmark]
+    public Task<string> GetWorkItem() => GetAsync(_workItemPath);
+
+    [Benchmark]
+    public Task<string> GetWorkItemAtRevision() => GetAsync($"{_workItemPath}?revision={_workItemRevision}");
+
+    [Benchmark]
+    public Task<string> GetWorkItemRevisions() => GetAsync($"{_workItemPath}/revisions");
+
+    [Benchmark]
+    public Task<string> GetLinkedWorkItems() => GetAsync($"{_workItemPath}/linkedworkitems");
+
+    [Benchmark]
+    public Task<string> GetBackLinkedWorkItems() => GetAsync($"{_workItemPath}/backlinkedworkitems");
+
+    [Benchmark]
+    public Task<string> Health() => GetAsync("/api/health");
+
+    [Benchmark]
+    public Task<string> Version() => GetAsync("/api/version");
+
+    [Benchmark]
+    public Task<string> Readiness() => GetAsync("/api/health/ready");
+
+    [Benchmark]
+    public Task<string> CoalescingStatistics() => GetAsync("/api/health/coalescing");
+
+    [Benchmark]
+    public Task<string> BulkheadStatistics() => GetAsync("/api/health/bulkheads");
+
+    [Benchmark]
+    public Task<string> Metrics() => GetAsync("/api/metrics");
+
+    private Task<string> GetAsync(string path) => GetAsync(_client, path);
+
+    private static async Task<string> GetAsync(HttpClient client, string path)
+    {
+        using var response = await client.GetAsync(path);
+        response.EnsureSuccessStatusCode();
+        return await response.Content.ReadAsStringAsync();
+    }
+
+    private async Task<string> PostAsync(string path)
+    {
+        using var response = await _client.PostAsync(path, content: null);
+        response.EnsureSuccessStatusCode();
+        return await response.Content.ReadAsStringAsync();
+    }
+}
@@ -0,0 +1,64 @@
+using System.Diagnostics.CodeAnalysis;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// The simulated project and the services the MCP tools need, registered like the servers do.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+internal static class SimulatedHost
+{
+    public const string ProjectAlias = "simulated";
+
+    /// <summary>
+    /// The document the single-document benchmarks read; any non-archived document behaves the same.
+    /// </summary>
+    public const int DocumentIndex = 7;
+
+    /// <summary>
+    /// The position, within <see cref="DocumentIndex"/>, of the work item the single-item benchmarks read.
+    /// </summary>
+    public const int WorkItemPosition = 3;
+
+    /// <summary>
+    /// Builds the tool services over the simulator. Without <paramref name="caching"/> the module snapshot,
+    /// Markdown and historical work item caches and the catalog are disabled, so every call reaches the simulator.
+    /// </summary>
+    public static ServiceProvider CreateToolServices(SimulatorOptions options, bool caching)
+    {
+        var configuration = new ConfigurationBuilder()
+            .AddInMemoryCollection(SimulatorServiceCollectionExtensions.CreateProjectSettings(options, ProjectAlias))
+            .Build();
+
+        var projects = configuration.GetSection("PolarionProjects").Get<List<PolarionProjectConfig>>()
+            ?? throw new InvalidOperationException("The simulated project configuration could not be bound.");
+
+        var cacheConfig = caching
+            ? new PolarionCacheConfig()
+            : new PolarionCacheConfig
+            {
+                ModuleSnapshotMaxMegabytes = 0,
+                MarkdownMaxMegabytes = 0,
+                HistoricalWorkItemMaxMegabytes = 0,
+                CatalogRefreshSeconds = 0
+            };
+
+        var services = new ServiceCollection();
+        services.AddLogging();
+        services.AddSingleton(projects);
+        services.AddSingleton<PolarionCallCoalescer>();
+        services.AddSingleton(cacheConfig);
+        services.AddSingleton<HistoricalWorkItemCache>();
+        services.AddSingleton<ModuleSnapshotCache>();
+        services.AddSingleton<MarkdownConversionService>();
+        services.AddSingleton<PolarionProjectCatalog>();
+        services.AddScoped<IPolarionClientFactory, SimulatedPolarionClientFactory>();
+        services.AddPolarionSimulator(options);
+
+        return services.BuildServiceProvider();
+    }
+}
@@ -0,0 +1,58 @@
+using System.Diagnostics.CodeAnalysis;
+using Microsoft.AspNetCore.Hosting;
+using Microsoft.AspNetCore.Mvc.Testing;
+using Microsoft.AspNetCore.TestHost;
+using PolarionMcpSimulator;
+
+namespace PolarionMcpBenchmarks;
+
+/// <summary>
+/// Hosts the remote server in memory with its Polarion sessions served by the simulator, so the REST benchmarks
+/// cover routing, authentication, the session pool and JSON:API serialization without a network.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class SimulatedServerFactory : WebApplicationFactory<PolarionRemoteMcpServer.Program>
+{
+    private const string ApiKey = "benchmark-api-key";
+
+    private readonly SimulatorOptions _options;
+
+    public SimulatedServerFactory(SimulatorOptions options)
+    {
+        _options = options;
+    }
+
+    /// <summary>
+    /// The Polarion project ID of the simulated project, as used in the REST routes.
+    /// </summary>
+    public string ProjectId => _options.ProjectId;
+
+    protected override void ConfigureWebHost(IWebHostBuilder builder)
+    {
+        builder.UseEnvironment("Benchmark");
+
+        // Settings are applied before Program reads its configuration, unlike ConfigureAppConfiguration
+        foreach (var (key, value) in SimulatorServiceCollectionExtensions.CreateProjectSettings(_options, SimulatedHost.ProjectAlias))
+        {
+            builder.UseSetting(key, value);
+        }
+
+        builder.UseSetting("Logging:LogLevel:Default", "Warning");
+        builder.UseSetting("ApiConsumers:Consumers:benchmark:Name", "Benchmark");
+        builder.UseSetting("ApiConsumers:Consumers:benchmark:ApplicationKey", ApiKey);
+        builder.UseSetting("ApiConsumers:Consumers:benchmark:Active", "true");
+        builder.UseSetting("ApiConsumers:Consumers:benchmark:AllowedScopes:0", "polarion:read");
+
+        builder.ConfigureTestServices(services => services.AddPolarionSimulator(_options));
+    }
+
+    /// <summary>
+    /// Creates an HTTP client that sends the benchmark consumer's API key.
+    /// </summary>
+    public HttpClient CreateAuthenticatedClient()
+    {
+        var client = CreateClient();
+        client.DefaultRequestHeaders.Add("X-API-Key", ApiKey);
+        return client;
+    }
+}
@@ -11,16 +11,19 @@ namespace PolarionMcpServer
     {
         private readonly List<PolarionProjectConfig> _projectConfigs; // Changed from single configuration
         private readonly ILogger<PolarionStdioClientFactory> _logger;
+        private readonly PolarionSessionPool _sessionPool;
         private readonly string? _commandLineProjectAlias; // Project alias from command line arguments
 
 
         // Constructor updated to inject the list of project configurations and optional command line project alias
         public PolarionStdioClientFactory(
             List<PolarionProjectConfig> projectConfigs, // Changed parameter type
+            PolarionSessionPool sessionPool,
             ILogger<PolarionStdioClientFactory> logger,
             string? commandLineProjectAlias = null)
         {
             _projectConfigs = projectConfigs; // Assign the injected list
+            _sessionPool = sessionPool;
             _logger = logger;
             _commandLineProjectAlias = commandLineProjectAlias;
         }
@@ -29,7 +32,13 @@ namespace PolarionMcpServer
         public string? ProjectId => null;
 
         [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
-        public async Task<Result<IPolarionClient>> CreateClientAsync()
+        public Task<Result<IPolarionClient>> CreateClientAsync()
+        {
+            return Task.FromResult(CreateClient());
+        }
+
+        [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+        private Result<IPolarionClient> CreateClient()
         {
             // First priority: Command line project alias
             string? effectiveProjectAlias = _commandLineProjectAlias;
@@ -79,11 +88,11 @@ namespace PolarionMcpServer
                 return Result.Fail(errorMessage);
             }
 
-            _logger.LogDebug("Creating Polarion client using Server: {ServerUrl}, User: {Username}, Project: {RealProjectId}", 
+            _logger.LogDebug("Creating pooled Polarion client using Server: {ServerUrl}, User: {Username}, Project: {RealProjectId}", 
                 clientConfig.ServerUrl, clientConfig.Username, clientConfig.ProjectId);
 
-            // Create the client using the selected configuration
-            var clientResult = await PolarionClient.CreateAsync(clientConfig); 
+            // The client takes a pooled session for each call and hands it back when the call completes
+            var clientResult = _sessionPool.GetClient(selectedConfig);
             if (clientResult.IsFailed)
             {
                 var errorMessage = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -92,9 +101,7 @@ namespace PolarionMcpServer
                 return Result.Fail($"Failed to create Polarion client via factory for alias '{selectedConfig.ProjectUrlAlias}': {errorMessage}");
             }
 
-            _logger.LogDebug("Successfully created new Polarion client for server: {ServerUrl} (Alias: {Alias})", 
-                clientConfig.ServerUrl, selectedConfig.ProjectUrlAlias);
-            return clientResult.Value;
+            return clientResult;
         }
     }
 }
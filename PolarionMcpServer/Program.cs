@@ -55,11 +55,12 @@ public class Program
                 }
             }
 
+            // Startup logger, replaced by the configured pipeline once appsettings.json has been read
             Log.Logger = new LoggerConfiguration()
                             .MinimumLevel.Verbose() // Capture all log levels
                             .WriteTo.File(Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "logs", "polarion_mcp_stdio_.log"),
                                 rollingInterval: RollingInterval.Day,
-                                outputTemplate: "{Timestamp:yyyy-MM-dd HH:mm:ss.fff zzz} [{Level:u3}] {Message:lj}{NewLine}{Exception}")
+                                outputTemplate: PolarionLogging.TextOutputTemplate)
                             .WriteTo.Debug()
                             .WriteTo.Console(standardErrorFromLevel: Serilog.Events.LogEventLevel.Verbose)
                             .CreateLogger();
@@ -160,6 +161,16 @@ public class Program
                  Log.Information("PolarionAppConfig: {PolarionAppConfig}", JsonSerializer.Serialize(appConfig, PolarionConfigJsonContext.Default.PolarionAppConfig));
             }
 
+            // Replace the startup logger with the pipeline described by the Logging section
+            //
+            Log.CloseAndFlush();
+            Log.Logger = PolarionLogging.CreateConfiguration(appConfig.Logging, (writeTo, formatter) => writeTo
+                    .File(formatter, Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "logs", "polarion_mcp_stdio_.log"),
+                        rollingInterval: RollingInterval.Day)
+                    .WriteTo.Debug(formatter)
+                    .WriteTo.Console(formatter, standardErrorFromLevel: Serilog.Events.LogEventLevel.Verbose))
+                .CreateLogger();
+
             var polarionProjects = appConfig.PolarionProjects ?? 
                                    throw new InvalidOperationException("PolarionProjects configuration section is missing or invalid within PolarionAppConfig.");
             
@@ -207,11 +218,21 @@ public class Program
             // Add the configurations and the factory to the DI container
             //
             builder.Services.AddSingleton(polarionProjects); // Register the list of project configurations
+            builder.Services.AddSingleton<PolarionCallCoalescer>(); // Single-flight sharing of identical in-flight Polarion calls
+            builder.Services.AddSingleton<PolarionSessionPool>(); // Warm Polarion sessions shared across tool calls
+            builder.Services.AddSingleton(appConfig.Caching ?? new PolarionCacheConfig());
+            builder.Services.AddSingleton<HistoricalWorkItemCache>(); // Immutable work items at specific revisions
+            builder.Services.AddSingleton<ModuleSnapshotCache>(); // Document work item snapshots shared across tool calls
+            builder.Services.AddSingleton<MarkdownConversionService>(); // Cached HTML to Markdown conversion
+            builder.Services.AddSingleton<PolarionProjectCatalog>(); // Space and document catalogs shared across tool calls
+            builder.Services.AddSingleton<PolarionWarmupService>(); // Opens sessions and loads catalogs and hot documents at startup
+            builder.Services.AddHostedService(sp => sp.GetRequiredService<PolarionWarmupService>());
             
             // Register the factory with the command line project alias
             builder.Services.AddScoped<IPolarionClientFactory>(sp => 
                 new PolarionStdioClientFactory(
                     polarionProjects,
+                    sp.GetRequiredService<PolarionSessionPool>(),
                     sp.GetRequiredService<ILogger<PolarionStdioClientFactory>>(),
                     projectAlias
                 )
@@ -228,6 +249,7 @@ public class Program
             //
             // Log.Information("Starting PolarionMcpServer...");
             builder.Build().Run();
+            Log.CloseAndFlush(); // Drain the background log writer
             return 0;
         }
         catch (Exception ex)
@@ -235,6 +257,7 @@ public class Program
             Console.ForegroundColor = ConsoleColor.Red;
             Log.Fatal($"Host terminated unexpectedly. Exception: {ex}");
             Console.ResetColor();
+            Log.CloseAndFlush();
             return 1;
         }
     }
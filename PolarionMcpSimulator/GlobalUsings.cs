@@ -0,0 +1,7 @@
+global using System.Diagnostics.CodeAnalysis;
+global using Polarion.Generated.Tracker;
+global using Polarion;
+global using Microsoft.Extensions.Logging;
+global using Microsoft.Extensions.DependencyInjection;
+global using FluentResults;
+global using PolarionMcpTools;
@@ -0,0 +1,125 @@
+using System.Text;
+
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// In-process <see cref="IPolarionClient"/> that answers from a <see cref="SyntheticProject"/> instead of a
+/// Polarion server, after the latency configured in <see cref="SimulatorOptions"/>.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class SimulatedPolarionClient : IPolarionClient
+{
+    private static readonly ThreadLocal<ReverseMarkdown.Converter> MarkdownConverter = new(() => new ReverseMarkdown.Converter());
+
+    private readonly SyntheticProject _project;
+
+    /// <summary>
+    /// Creates a client serving the given project.
+    /// </summary>
+    public SimulatedPolarionClient(SyntheticProject project)
+    {
+        _project = project;
+    }
+
+    public Task<Result<List<string>>> GetSpacesAsync(string? excludeSpaceNameContains = null)
+    {
+        var result = _project.GetSpaces(excludeSpaceNameContains);
+        return CompleteAsync(result, result.ValueOrDefault?.Count ?? 0);
+    }
+
+    public Task<Result<List<ModuleThin>>> GetModulesThinAsync(string? excludeSpaceNameContains = null, string? titleContains = null)
+    {
+        var result = _project.GetModulesThin(excludeSpaceNameContains, titleContains);
+        return CompleteAsync(result, result.ValueOrDefault?.Count ?? 0);
+    }
+
+    public Task<Result<List<ModuleThin>>> GetModulesInSpaceThinAsync(string spaceName)
+    {
+        var result = _project.GetModulesInSpaceThin(spaceName);
+        return CompleteAsync(result, result.ValueOrDefault?.Count ?? 0);
+    }
+
+    public Task<Result<Module>> GetModuleByLocationAsync(string location)
+    {
+        return CompleteAsync(_project.GetModuleByLocation(location), 1);
+    }
+
+    public Task<Result<Module[]>> GetModuleRevisionsByLocationAsync(string location, int limit)
+    {
+        var result = _project.GetModuleRevisions(location, limit);
+        return CompleteAsync(result, result.ValueOrDefault?.Length ?? 0);
+    }
+
+    public Task<Result<WorkItem[]>> QueryWorkItemsInModuleAsync(string space, string documentId, List<string>? itemTypes)
+    {
+        var result = _project.QueryWorkItemsInModule(space, documentId, itemTypes);
+        return CompleteAsync(result, result.ValueOrDefault?.Length ?? 0);
+    }
+
+    public Task<Result<WorkItemRevisionInfo[]>> GetWorkItemsByModuleRevisionAsync(string space, string documentId, string revision)
+    {
+        var result = _project.GetWorkItemsByModuleRevision(space, documentId, revision);
+        return CompleteAsync(result, result.ValueOrDefault?.Length ?? 0);
+    }
+
+    public Task<Result<WorkItem>> GetWorkItemByIdAsync(string workItemId)
+    {
+        return CompleteAsync(_project.GetWorkItemById(workItemId, null), 1);
+    }
+
+    public Task<Result<WorkItem>> GetWorkItemByIdAsync(string workItemId, string revision)
+    {
+        return CompleteAsync(_project.GetWorkItemById(workItemId, revision), 1);
+    }
+
+    public Task<Result<Dictionary<string, WorkItem>>> GetWorkItemRevisionsByIdAsync(string workItemId, int limit)
+    {
+        var result = _project.GetWorkItemRevisions(workItemId, limit);
+        return CompleteAsync(result, result.ValueOrDefault?.Count ?? 0);
+    }
+
+    public Task<Result<WorkItem[]>> SearchWorkitemAsync(string query, string order, List<string> fieldList)
+    {
+        var result = _project.Search(query, order, fieldList);
+        return CompleteAsync(result, result.ValueOrDefault?.Length ?? 0);
+    }
+
+    public string ConvertWorkItemToMarkdown(string workItemId, WorkItem? workItem)
+    {
+        if (workItem == null)
+        {
+            return string.Empty;
+        }
+
+        var markdown = new StringBuilder();
+        markdown.Append("## ").Append(workItemId).Append(": ").AppendLine(workItem.title);
+        if (!string.IsNullOrEmpty(workItem.description?.content))
+        {
+            markdown.AppendLine().AppendLine(MarkdownConverter.Value!.Convert(workItem.description.content));
+        }
+
+        return markdown.ToString();
+    }
+
+    private async Task<Result<T>> CompleteAsync<T>(Result<T> result, int items)
+    {
+        var options = _project.Options;
+        var milliseconds = (double)options.LatencyMilliseconds;
+        if (options.LatencyJitterMilliseconds > 0)
+        {
+            milliseconds += Random.Shared.NextDouble() * options.LatencyJitterMilliseconds;
+        }
+
+        if (options.LatencyPerItemMicroseconds > 0 && result.IsSuccess)
+        {
+            milliseconds += items * options.LatencyPerItemMicroseconds / 1000.0;
+        }
+
+        if (milliseconds > 0)
+        {
+            await Task.Delay(TimeSpan.FromMilliseconds(milliseconds));
+        }
+
+        return result;
+    }
+}
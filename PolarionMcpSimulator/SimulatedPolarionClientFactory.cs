@@ -0,0 +1,31 @@
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// <see cref="IPolarionClientFactory"/> for running the MCP tools against the simulator: hands out clients of one
+/// project from the registered <see cref="PolarionSessionPool"/>, which take a pooled session for each call.
+/// </summary>
+public sealed class SimulatedPolarionClientFactory : IPolarionClientFactory
+{
+    private readonly List<PolarionProjectConfig> _projectConfigs;
+    private readonly PolarionSessionPool _sessionPool;
+
+    public SimulatedPolarionClientFactory(List<PolarionProjectConfig> projectConfigs, PolarionSessionPool sessionPool)
+    {
+        _projectConfigs = projectConfigs;
+        _sessionPool = sessionPool;
+    }
+
+    public string? ProjectId => _projectConfigs.FirstOrDefault(p => p.Default)?.ProjectUrlAlias;
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public Task<Result<IPolarionClient>> CreateClientAsync()
+    {
+        var projectConfig = _projectConfigs.FirstOrDefault(p => p.Default) ?? _projectConfigs.FirstOrDefault();
+        if (projectConfig == null)
+        {
+            return Task.FromResult<Result<IPolarionClient>>(Result.Fail("No Polarion project is configured."));
+        }
+
+        return Task.FromResult(_sessionPool.GetClient(projectConfig));
+    }
+}
@@ -0,0 +1,27 @@
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// <see cref="PolarionSessionPool"/> whose sessions are <see cref="SimulatedPolarionClient"/>s. Only the login
+/// is replaced, so leases still go through the pool, the call coalescer and the project bulkhead like in production.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class SimulatedSessionPool : PolarionSessionPool
+{
+    private readonly SyntheticProject _project;
+
+    public SimulatedSessionPool(SyntheticProject project, ILogger<PolarionSessionPool> logger, PolarionCallCoalescer coalescer)
+        : base(logger, coalescer)
+    {
+        _project = project;
+    }
+
+    protected override async Task<Result<IPolarionClient>> ConnectAsync(PolarionClientConfiguration sessionConfig)
+    {
+        if (_project.Options.LoginLatencyMilliseconds > 0)
+        {
+            await Task.Delay(_project.Options.LoginLatencyMilliseconds);
+        }
+
+        return Result.Ok<IPolarionClient>(new SimulatedPolarionClient(_project));
+    }
+}
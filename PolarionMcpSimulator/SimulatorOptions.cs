@@ -0,0 +1,93 @@
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// Describes the synthetic Polarion project served by the simulator. The same options and seed always produce
+/// the same project, so benchmark runs are comparable.
+/// </summary>
+public sealed class SimulatorOptions
+{
+    /// <summary>
+    /// Seed of every generated value (titles, statuses, links, dates).
+    /// </summary>
+    public int Seed { get; set; } = 42;
+
+    /// <summary>
+    /// The Polarion project ID reported by the simulated server.
+    /// </summary>
+    public string ProjectId { get; set; } = "SIMULATED";
+
+    /// <summary>
+    /// Prefix of the generated work item IDs, e.g. "SIM-1234".
+    /// </summary>
+    public string WorkItemPrefix { get; set; } = "SIM";
+
+    /// <summary>
+    /// The number of spaces the documents are spread over. The last space is named "Archive" so blacklists apply.
+    /// </summary>
+    public int SpaceCount { get; set; } = 20;
+
+    /// <summary>
+    /// The number of documents in the project.
+    /// </summary>
+    public int DocumentCount { get; set; } = 2000;
+
+    /// <summary>
+    /// The number of work items in every document, headings included.
+    /// </summary>
+    public int WorkItemsPerDocument { get; set; } = 120;
+
+    /// <summary>
+    /// The number of work items per outline section; the first one of each section is its heading.
+    /// </summary>
+    public int SectionSize { get; set; } = 8;
+
+    /// <summary>
+    /// The number of sub-sections under each heading.
+    /// </summary>
+    public int OutlineFanout { get; set; } = 4;
+
+    /// <summary>
+    /// The deepest heading level, e.g. 4 for "1.2.3.4".
+    /// </summary>
+    public int OutlineDepth { get; set; } = 4;
+
+    /// <summary>
+    /// The number of outgoing links of every non-heading work item, to work items anywhere in the project.
+    /// </summary>
+    public int LinksPerWorkItem { get; set; } = 4;
+
+    /// <summary>
+    /// The number of revisions in every work item's history.
+    /// </summary>
+    public int RevisionsPerWorkItem { get; set; } = 25;
+
+    /// <summary>
+    /// The number of revisions in every document's history. Each older revision holds one work item less.
+    /// </summary>
+    public int RevisionsPerDocument { get; set; } = 50;
+
+    /// <summary>
+    /// The approximate number of words in a work item description.
+    /// </summary>
+    public int DescriptionWords { get; set; } = 60;
+
+    /// <summary>
+    /// Fixed latency, in milliseconds, added to every simulated call. 0 completes calls synchronously.
+    /// </summary>
+    public int LatencyMilliseconds { get; set; } = 0;
+
+    /// <summary>
+    /// Random latency, in milliseconds, added on top of <see cref="LatencyMilliseconds"/>.
+    /// </summary>
+    public int LatencyJitterMilliseconds { get; set; } = 0;
+
+    /// <summary>
+    /// Latency, in microseconds, added per returned work item or document, so bulk pulls cost more than point lookups.
+    /// </summary>
+    public int LatencyPerItemMicroseconds { get; set; } = 0;
+
+    /// <summary>
+    /// Latency, in milliseconds, of opening a simulated session.
+    /// </summary>
+    public int LoginLatencyMilliseconds { get; set; } = 0;
+}
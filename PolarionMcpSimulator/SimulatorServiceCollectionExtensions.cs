@@ -0,0 +1,66 @@
+using System.Globalization;
+using Microsoft.Extensions.DependencyInjection.Extensions;
+
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// Wires the Polarion simulator into an application or benchmark host.
+/// </summary>
+public static class SimulatorServiceCollectionExtensions
+{
+    /// <summary>
+    /// Registers a <see cref="SyntheticProject"/> and replaces the <see cref="PolarionSessionPool"/> with a
+    /// <see cref="SimulatedSessionPool"/>, so every leased client talks to the simulator. Register it after the
+    /// application's own services.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public static IServiceCollection AddPolarionSimulator(this IServiceCollection services, SimulatorOptions options)
+    {
+        services.AddSingleton(new SyntheticProject(options));
+        services.RemoveAll<PolarionSessionPool>();
+        services.AddSingleton<PolarionSessionPool, SimulatedSessionPool>();
+        return services;
+    }
+
+    /// <summary>
+    /// Creates the configuration of a default project served by the simulator, as
+    /// <c>PolarionProjects:{index}:...</c> keys for an in-memory configuration source. The session settings only
+    /// identify the pool; nothing connects to them.
+    /// </summary>
+    public static Dictionary<string, string?> CreateProjectSettings(SimulatorOptions options, string projectAlias, int index = 0)
+    {
+        var prefix = $"PolarionProjects:{index.ToString(CultureInfo.InvariantCulture)}:";
+        var settings = new Dictionary<string, string?>
+        {
+            [prefix + "ProjectUrlAlias"] = projectAlias,
+            [prefix + "Default"] = "true",
+            [prefix + "SessionConfig:ServerUrl"] = "https://polarion.simulator.invalid/",
+            [prefix + "SessionConfig:Username"] = "simulator",
+            [prefix + "SessionConfig:Password"] = "simulator",
+            [prefix + "SessionConfig:ProjectId"] = options.ProjectId,
+            [prefix + "SessionConfig:TimeoutSeconds"] = "60",
+            [prefix + "WorkItemPrefix"] = options.WorkItemPrefix,
+            [prefix + "BlacklistSpaceContainingMatch"] = "Archive",
+            [prefix + "PolarionWorkItemTypes:0:id"] = "requirement",
+            [prefix + "PolarionWorkItemTypes:0:fields:0"] = "priority",
+            [prefix + "PolarionWorkItemTypes:0:fields:1"] = "verificationMethod",
+            [prefix + "PolarionWorkItemTypes:0:fields:2"] = "safetyLevel",
+            [prefix + "PolarionWorkItemTypes:1:id"] = "testCase",
+            [prefix + "PolarionWorkItemTypes:1:fields:0"] = "priority"
+        };
+
+        string[] workItemFields = ["author", "status", "type", "updated"];
+        for (var i = 0; i < workItemFields.Length; i++)
+        {
+            settings[$"{prefix}PolarionWorkItemDefaultFields:{i}"] = workItemFields[i];
+        }
+
+        string[] documentFields = ["title", "status", "author", "created", "updated", "updatedBy"];
+        for (var i = 0; i < documentFields.Length; i++)
+        {
+            settings[$"{prefix}PolarionDocumentDefaultFields:{i}"] = documentFields[i];
+        }
+
+        return settings;
+    }
+}
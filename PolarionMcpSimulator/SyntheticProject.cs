@@ -0,0 +1,794 @@
+using System.Globalization;
+using System.Text;
+using System.Text.RegularExpressions;
+
+namespace PolarionMcpSimulator;
+
+/// <summary>
+/// A deterministic synthetic Polarion project. Nothing is stored: spaces, documents, work items, links and
+/// revisions are computed from <see cref="SimulatorOptions"/> when they are read, so a project with hundreds of
+/// thousands of work items costs no memory up front and every call returns fresh objects, like the real client.
+/// </summary>
+/// <remarks>
+/// Work item <c>{prefix}-{n}</c> is item <c>(n - 1) % WorkItemsPerDocument</c> of document
+/// <c>(n - 1) / WorkItemsPerDocument</c>. Outline sections are numbered depth first ("1", "1.1", "1.1.1", ...)
+/// and items inside a section follow their heading as "1.1-1", "1.1-2", .... Searches match the words of a work
+/// item's title.
+/// </remarks>
+public sealed class SyntheticProject
+{
+    private const int RevisionBase = 10_000;
+    private const int RevisionStep = 977;
+
+    private static readonly DateTime Epoch = new(2023, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+
+    private static readonly string[] Areas =
+    {
+        "Requirements", "Design", "Verification", "Interfaces", "Safety", "Software", "Hardware", "Operations"
+    };
+
+    private static readonly string[] Vocabulary =
+    {
+        "voltage", "sensor", "timeout", "bus", "controller", "monitor", "fault", "power",
+        "thermal", "display", "brake", "altitude", "navigation", "radio", "hydraulic", "actuator",
+        "valve", "pressure", "fuel", "engine", "cabin", "door", "lighting", "battery",
+        "converter", "signal", "watchdog", "memory", "checksum", "startup", "shutdown", "calibration",
+        "telemetry", "logging", "alarm", "threshold", "latency", "bandwidth", "frame", "packet",
+        "channel", "redundancy", "failover", "input", "output", "interface", "protocol", "message",
+        "command", "mode", "health", "diagnostic", "clock", "timer", "interrupt", "register",
+        "firmware", "bootloader", "update", "configuration", "heater", "pump", "relay", "encoder"
+    };
+
+    private static readonly string[] Verbs = { "monitor", "report", "limit", "detect", "record", "isolate", "validate", "control" };
+    private static readonly string[] Statuses = { "draft", "inReview", "approved", "rejected" };
+    private static readonly string[] ItemTypes = { "requirement", "requirement", "testCase", "designElement" };
+    private static readonly string[] LinkRoles = { "parent", "verifies", "relates_to", "implements" };
+    private static readonly string[] Priorities = { "low", "medium", "high", "critical" };
+    private static readonly string[] VerificationMethods = { "test", "analysis", "inspection", "demonstration" };
+
+    private static readonly Regex FieldClause = new(@"(?<field>[A-Za-z]+):(?:\((?<values>[^)]*)\)|(?<value>[^\s()]+))", RegexOptions.Compiled);
+    private static readonly Regex Word = new(@"[\p{L}\p{N}_.-]+", RegexOptions.Compiled);
+
+    private readonly SimulatorOptions _options;
+    private readonly string[] _spaces;
+    private readonly int _itemsPerDocument;
+    private readonly int _sectionSize;
+    private readonly int _outlineFanout;
+    private readonly int _outlineDepth;
+    private readonly int _linksPerWorkItem;
+    private readonly int _itemRevisions;
+    private readonly int _documentRevisions;
+    private readonly Lazy<BacklinkIndex> _backlinks;
+
+    public SyntheticProject(SimulatorOptions options)
+    {
+        _options = options;
+        _itemsPerDocument = Math.Max(1, options.WorkItemsPerDocument);
+        _sectionSize = Math.Max(1, options.SectionSize);
+        _outlineFanout = Math.Max(2, options.OutlineFanout);
+        _outlineDepth = Math.Max(1, options.OutlineDepth);
+        _linksPerWorkItem = Math.Max(0, options.LinksPerWorkItem);
+        _itemRevisions = Math.Max(1, options.RevisionsPerWorkItem);
+        _documentRevisions = Math.Max(1, options.RevisionsPerDocument);
+        DocumentCount = Math.Max(1, options.DocumentCount);
+        WorkItemCount = DocumentCount * _itemsPerDocument;
+
+        var spaceCount = Math.Max(1, options.SpaceCount);
+        _spaces = Enumerable.Range(0, spaceCount)
+            .Select(i => spaceCount > 1 && i == spaceCount - 1
+                ? "Archive"
+                : i < Areas.Length ? Areas[i] : $"{Areas[i % Areas.Length]}_{i / Areas.Length + 1}")
+            .ToArray();
+
+        _backlinks = new Lazy<BacklinkIndex>(BuildBacklinkIndex);
+    }
+
+    public SimulatorOptions Options => _options;
+
+    public int DocumentCount { get; }
+
+    public int WorkItemCount { get; }
+
+    public IReadOnlyList<string> Spaces => _spaces;
+
+    /// <summary>
+    /// Gets the space and document ID of a document, e.g. to pick benchmark targets.
+    /// </summary>
+    public (string Space, string DocumentId) GetDocumentLocation(int documentIndex)
+    {
+        documentIndex = Math.Clamp(documentIndex, 0, DocumentCount - 1);
+        return (_spaces[documentIndex % _spaces.Length], $"Spec_{documentIndex + 1:D5}");
+    }
+
+    /// <summary>
+    /// Gets the ID of the work item at the given position of a document.
+    /// </summary>
+    public string GetWorkItemId(int documentIndex, int position)
+    {
+        documentIndex = Math.Clamp(documentIndex, 0, DocumentCount - 1);
+        position = Math.Clamp(position, 0, _itemsPerDocument - 1);
+        return FormatWorkItemId(documentIndex * _itemsPerDocument + position + 1);
+    }
+
+    /// <summary>
+    /// Gets the outline number of the heading of a document section.
+    /// </summary>
+    public string GetSectionNumber(int sectionIndex)
+    {
+        return GetSectionOutline(Math.Max(0, sectionIndex));
+    }
+
+    /// <summary>
+    /// Gets a document revision, <paramref name="revisionsBack"/> revisions before HEAD.
+    /// </summary>
+    public string GetDocumentRevision(int documentIndex, int revisionsBack)
+    {
+        return FormatRevision(DocumentRevisionNumber(documentIndex, _documentRevisions - 1 - Math.Clamp(revisionsBack, 0, _documentRevisions - 1)));
+    }
+
+    /// <summary>
+    /// Gets a revision of the work item at the given position of a document, <paramref name="revisionsBack"/>
+    /// revisions before HEAD.
+    /// </summary>
+    public string GetWorkItemRevision(int documentIndex, int position, int revisionsBack)
+    {
+        documentIndex = Math.Clamp(documentIndex, 0, DocumentCount - 1);
+        position = Math.Clamp(position, 0, _itemsPerDocument - 1);
+        var number = documentIndex * _itemsPerDocument + position + 1;
+        return FormatRevision(ItemRevisionNumber(number, _itemRevisions - 1 - Math.Clamp(revisionsBack, 0, _itemRevisions - 1)));
+    }
+
+    /// <summary>
+    /// Gets a word that appears in work item titles, for searches.
+    /// </summary>
+    public static string GetSearchTerm(int index)
+    {
+        return Vocabulary[Math.Abs(index) % Vocabulary.Length];
+    }
+
+    public Result<List<string>> GetSpaces(string? blacklistPattern)
+    {
+        return Result.Ok(_spaces.Where(space => !IsBlacklisted(space, blacklistPattern)).ToList());
+    }
+
+    public Result<List<ModuleThin>> GetModulesThin(string? blacklistPattern, string? titleFilter)
+    {
+        var documents = new List<ModuleThin>();
+        for (var documentIndex = 0; documentIndex < DocumentCount; documentIndex++)
+        {
+            var space = _spaces[documentIndex % _spaces.Length];
+            if (IsBlacklisted(space, blacklistPattern))
+            {
+                continue;
+            }
+
+            var title = GetDocumentTitle(documentIndex);
+            if (!string.IsNullOrEmpty(titleFilter) && !title.Contains(titleFilter, StringComparison.OrdinalIgnoreCase))
+            {
+                continue;
+            }
+
+            documents.Add(CreateModuleThin(documentIndex));
+        }
+
+        return Result.Ok(documents);
+    }
+
+    public Result<List<ModuleThin>> GetModulesInSpaceThin(string? space)
+    {
+        var spaceIndex = Array.IndexOf(_spaces, space);
+        if (spaceIndex < 0)
+        {
+            return Result.Ok(new List<ModuleThin>());
+        }
+
+        var documents = new List<ModuleThin>();
+        for (var documentIndex = spaceIndex; documentIndex < DocumentCount; documentIndex += _spaces.Length)
+        {
+            documents.Add(CreateModuleThin(documentIndex));
+        }
+
+        return Result.Ok(documents);
+    }
+
+    public Result<Module> GetModuleByLocation(string? location)
+    {
+        if (!TryResolveLocation(location, out var documentIndex))
+        {
+            return Result.Fail($"Document '{location}' not found");
+        }
+
+        return Result.Ok(CreateModule(documentIndex, _documentRevisions - 1, withRevision: false));
+    }
+
+    public Result<Module[]> GetModuleRevisions(string? location, int limit)
+    {
+        if (!TryResolveLocation(location, out var documentIndex))
+        {
+            return Result.Fail($"Document '{location}' not found");
+        }
+
+        var count = limit < 0 ? _documentRevisions : Math.Min(limit, _documentRevisions);
+        var revisions = new Module[count];
+        for (var i = 0; i < count; i++)
+        {
+            revisions[i] = CreateModule(documentIndex, _documentRevisions - 1 - i, withRevision: true);
+        }
+
+        return Result.Ok(revisions);
+    }
+
+    public Result<WorkItem[]> QueryWorkItemsInModule(string? space, string? documentId, IEnumerable<string>? itemTypes)
+    {
+        if (!TryResolveLocation($"{space}/{documentId}", out var documentIndex))
+        {
+            return Result.Fail($"Document '{space}/{documentId}' not found");
+        }
+
+        var types = itemTypes?.ToHashSet(StringComparer.OrdinalIgnoreCase) ?? new HashSet<string>();
+        var workItems = new List<WorkItem>(_itemsPerDocument);
+        for (var position = 0; position < _itemsPerDocument; position++)
+        {
+            var number = documentIndex * _itemsPerDocument + position + 1;
+            if (types.Count == 0 || types.Contains(GetItemType(number)))
+            {
+                workItems.Add(CreateWorkItem(number, _itemRevisions - 1, null));
+            }
+        }
+
+        return Result.Ok(workItems.ToArray());
+    }
+
+    public Result<WorkItemRevisionInfo[]> GetWorkItemsByModuleRevision(string? space, string? documentId, string? revision)
+    {
+        if (!TryResolveLocation($"{space}/{documentId}", out var documentIndex))
+        {
+            return Result.Fail($"Document '{space}/{documentId}' not found");
+        }
+
+        var revisionIndex = Enumerable.Range(0, _documentRevisions)
+            .FirstOrDefault(k => FormatRevision(DocumentRevisionNumber(documentIndex, k)) == revision, -1);
+        if (revisionIndex < 0)
+        {
+            return Result.Fail($"Revision '{revision}' of document '{space}/{documentId}' not found");
+        }
+
+        // The document grew by one work item per revision, and its work items were edited as often
+        var revisionsBack = _documentRevisions - 1 - revisionIndex;
+        var itemCount = Math.Max(1, _itemsPerDocument - revisionsBack);
+        var itemRevisionIndex = Math.Max(0, _itemRevisions - 1 - revisionsBack);
+
+        var infos = new WorkItemRevisionInfo[itemCount];
+        for (var position = 0; position < itemCount; position++)
+        {
+            var number = documentIndex * _itemsPerDocument + position + 1;
+            infos[position] = new WorkItemRevisionInfo
+            {
+                WorkItem = CreateWorkItem(number, itemRevisionIndex, null),
+                Revision = FormatRevision(ItemRevisionNumber(number, itemRevisionIndex)),
+                HeadRevision = FormatRevision(ItemRevisionNumber(number, _itemRevisions - 1)),
+                IsHistorical = itemRevisionIndex != _itemRevisions - 1
+            };
+        }
+
+        return Result.Ok(infos);
+    }
+
+    public Result<WorkItem> GetWorkItemById(string? workItemId, string? revision)
+    {
+        if (!TryParseWorkItemId(workItemId, out var number))
+        {
+            return Result.Fail($"WorkItem '{workItemId}' not found");
+        }
+
+        var revisionIndex = _itemRevisions - 1;
+        if (!string.IsNullOrEmpty(revision) && revision != "-1")
+        {
+            revisionIndex = Enumerable.Range(0, _itemRevisions)
+                .FirstOrDefault(k => FormatRevision(ItemRevisionNumber(number, k)) == revision, -1);
+            if (revisionIndex < 0)
+            {
+                return Result.Fail($"Revision '{revision}' of WorkItem '{workItemId}' not found");
+            }
+        }
+
+        return Result.Ok(CreateWorkItem(number, revisionIndex, null));
+    }
+
+    public Result<Dictionary<string, WorkItem>> GetWorkItemRevisions(string? workItemId, int limit)
+    {
+        if (!TryParseWorkItemId(workItemId, out var number))
+        {
+            return Result.Fail($"WorkItem '{workItemId}' not found");
+        }
+
+        // Newest first, in insertion order
+        var count = limit < 0 ? _itemRevisions : Math.Min(limit, _itemRevisions);
+        var revisions = new Dictionary<string, WorkItem>(count, StringComparer.Ordinal);
+        for (var k = _itemRevisions - 1; k >= _itemRevisions - count; k--)
+        {
+            revisions[FormatRevision(ItemRevisionNumber(number, k))] = CreateWorkItem(number, k, null);
+        }
+
+        return Result.Ok(revisions);
+    }
+
+    /// <summary>
+    /// Evaluates the subset of Lucene the tools and REST routes send: <c>id:</c>, <c>type:</c> and <c>status:</c>
+    /// clauses (a value or an OR list in parentheses) plus free-text terms, any of which must appear in the title.
+    /// Only the requested fields are filled in, like Polarion does.
+    /// </summary>
+    public Result<WorkItem[]> Search(string? query, string? sort, IEnumerable<string>? fields)
+    {
+        if (string.IsNullOrWhiteSpace(query))
+        {
+            return Result.Fail("Query must not be empty");
+        }
+
+        var clauses = new Dictionary<string, HashSet<string>>(StringComparer.OrdinalIgnoreCase);
+        foreach (Match match in FieldClause.Matches(query))
+        {
+            var values = match.Groups["values"].Success ? match.Groups["values"].Value : match.Groups["value"].Value;
+            if (!clauses.TryGetValue(match.Groups["field"].Value, out var set))
+            {
+                set = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+                clauses[match.Groups["field"].Value] = set;
+            }
+
+            foreach (var value in values.Split(' ', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+            {
+                if (value is not ("OR" or "AND"))
+                {
+                    set.Add(value.Trim('"'));
+                }
+            }
+        }
+
+        var terms = Word.Matches(FieldClause.Replace(query, " "))
+            .Select(m => m.Value.Trim('*').ToLowerInvariant())
+            .Where(term => term.Length > 0 && term is not ("or" or "and" or "not"))
+            .ToHashSet(StringComparer.Ordinal);
+
+        var fieldSet = fields?.ToHashSet(StringComparer.OrdinalIgnoreCase);
+        var results = new List<WorkItem>();
+
+        IEnumerable<int> candidates;
+        if (clauses.TryGetValue("id", out var ids))
+        {
+            candidates = ids
+                .Select(id => TryParseWorkItemId(id, out var number) ? number : 0)
+                .Where(number => number > 0)
+                .Distinct()
+                .Order();
+        }
+        else
+        {
+            candidates = Enumerable.Range(1, WorkItemCount);
+        }
+
+        clauses.TryGetValue("type", out var types);
+        clauses.TryGetValue("status", out var statuses);
+
+        foreach (var number in candidates)
+        {
+            if (types != null && !types.Contains(GetItemType(number)))
+            {
+                continue;
+            }
+
+            if (statuses != null && !statuses.Contains(Statuses[Hash(number, 4) % Statuses.Length]))
+            {
+                continue;
+            }
+
+            if (terms.Count > 0 && !TitleContainsAny(number, terms))
+            {
+                continue;
+            }
+
+            results.Add(CreateWorkItem(number, _itemRevisions - 1, fieldSet));
+        }
+
+        if (sort != null && sort.StartsWith('~'))
+        {
+            results.Reverse();
+        }
+
+        return Result.Ok(results.ToArray());
+    }
+
+    private WorkItem CreateWorkItem(int number, int revisionIndex, HashSet<string>? fields)
+    {
+        bool Include(string field) => fields == null || fields.Contains(field) || (field == "customFields" && fields.Any(f => f.StartsWith("customFields.", StringComparison.OrdinalIgnoreCase)));
+
+        var workItem = new WorkItem { id = FormatWorkItemId(number) };
+        var position = (number - 1) % _itemsPerDocument;
+        var isHeading = position % _sectionSize == 0;
+        var isHead = revisionIndex == _itemRevisions - 1;
+
+        if (Include("title"))
+        {
+            var title = GetTitle(number);
+            workItem.title = isHead ? title : $"{title} (v{revisionIndex + 1})";
+        }
+
+        if (Include("type"))
+        {
+            workItem.type = new EnumOptionId { id = GetItemType(number) };
+        }
+
+        if (Include("status"))
+        {
+            workItem.status = new EnumOptionId { id = Statuses[Hash(number, 4) % Statuses.Length] };
+        }
+
+        if (Include("outlineNumber"))
+        {
+            workItem.outlineNumber = GetOutlineNumber(position);
+        }
+
+        if (Include("description") && !isHeading)
+        {
+            workItem.description = new Text
+            {
+                type = "text/html",
+                content = GetDescription(number, revisionIndex)
+            };
+        }
+
+        var created = Epoch.AddMinutes(Hash(number, 5) % (365 * 24 * 60));
+        if (Include("created"))
+        {
+            workItem.created = created;
+            workItem.createdSpecified = true;
+        }
+
+        if (Include("updated"))
+        {
+            workItem.updated = created.AddDays(revisionIndex).AddMinutes(number % 60);
+            workItem.updatedSpecified = true;
+        }
+
+        if (Include("author"))
+        {
+            workItem.author = CreateUser(Hash(number, 6));
+        }
+
+        if (Include("assignee"))
+        {
+            workItem.assignee = new[] { CreateUser(Hash(number, 7)) };
+        }
+
+        if (Include("linkedWorkItems") && !isHeading)
+        {
+            var links = new List<LinkedWorkItem>(_linksPerWorkItem);
+            for (var l = 0; l < _linksPerWorkItem; l++)
+            {
+                var target = GetLinkTarget(number, l);
+                if (target != number)
+                {
+                    links.Add(CreateLink(target, LinkRoles[Hash(number, 300 + l) % LinkRoles.Length]));
+                }
+            }
+
+            workItem.linkedWorkItems = links.ToArray();
+        }
+
+        if (Include("linkedWorkItemsDerived"))
+        {
+            workItem.linkedWorkItemsDerived = _backlinks.Value.GetSources(number)
+                .Select(source => CreateLink(source.Number, LinkRoles[Hash(source.Number, 300 + source.Link) % LinkRoles.Length]))
+                .ToArray();
+        }
+
+        if (Include("customFields") && !isHeading)
+        {
+            workItem.customFields = new[]
+            {
+                new Custom { key = "priority", value = Priorities[Hash(number, 8) % Priorities.Length] },
+                new Custom { key = "verificationMethod", value = VerificationMethods[Hash(number, 9) % VerificationMethods.Length] },
+                new Custom { key = "safetyLevel", value = $"DAL-{(char)('A' + Hash(number, 10) % 5)}" }
+            };
+        }
+
+        return workItem;
+    }
+
+    private Module CreateModule(int documentIndex, int revisionIndex, bool withRevision)
+    {
+        var (space, documentId) = GetDocumentLocation(documentIndex);
+        var uri = $"subterra:data-service:objects:/default/{_options.ProjectId}${{Module}}{{moduleFolder}}{space}${{moduleName}}{documentId}";
+        if (withRevision)
+        {
+            uri += $"%{FormatRevision(DocumentRevisionNumber(documentIndex, revisionIndex))}";
+        }
+
+        var created = Epoch.AddMinutes(Hash(documentIndex, 20) % (180 * 24 * 60));
+        return new Module
+        {
+            id = documentId,
+            moduleName = documentId,
+            moduleFolder = space,
+            title = GetDocumentTitle(documentIndex),
+            type = new EnumOptionId { id = "req_specification" },
+            status = new EnumOptionId { id = revisionIndex == _documentRevisions - 1 ? "published" : "draft" },
+            uri = uri,
+            author = CreateUser(Hash(documentIndex, 21)),
+            created = created,
+            createdSpecified = true,
+            updated = created.AddDays(revisionIndex),
+            updatedSpecified = true,
+            updatedBy = CreateUser(Hash(documentIndex, 22 + revisionIndex)),
+            customFields = new[]
+            {
+                new Custom { key = "docOwner", value = $"user{Hash(documentIndex, 23) % 25 + 1:D2}" },
+                new Custom { key = "reviewCycle", value = $"R{revisionIndex + 1}" }
+            }
+        };
+    }
+
+    private ModuleThin CreateModuleThin(int documentIndex)
+    {
+        var (space, documentId) = GetDocumentLocation(documentIndex);
+        return new ModuleThin
+        {
+            Id = documentId,
+            Title = GetDocumentTitle(documentIndex),
+            Type = "req_specification",
+            Status = "published",
+            Space = space
+        };
+    }
+
+    private LinkedWorkItem CreateLink(int number, string role)
+    {
+        return new LinkedWorkItem
+        {
+            workItemURI = $"subterra:data-service:objects:/default/{_options.ProjectId}${{WorkItem}}{FormatWorkItemId(number)}",
+            role = new EnumOptionId { id = role }
+        };
+    }
+
+    private static User CreateUser(uint hash)
+    {
+        var user = hash % 25 + 1;
+        return new User { id = $"user{user:D2}", name = $"Simulated User {user}" };
+    }
+
+    private string GetItemType(int number)
+    {
+        var position = (number - 1) % _itemsPerDocument;
+        return position % _sectionSize == 0 ? "heading" : ItemTypes[Hash(number, 3) % ItemTypes.Length];
+    }
+
+    private int GetTitleWordCount(int number)
+    {
+        return (number - 1) % _itemsPerDocument % _sectionSize == 0 ? 2 : 3;
+    }
+
+    private string GetTitle(int number)
+    {
+        var first = Vocabulary[Hash(number, 11) % Vocabulary.Length];
+        var title = $"{char.ToUpperInvariant(first[0])}{first[1..]} {Vocabulary[Hash(number, 12) % Vocabulary.Length]}";
+        return GetTitleWordCount(number) == 2 ? title : $"{title} {Vocabulary[Hash(number, 13) % Vocabulary.Length]}";
+    }
+
+    private bool TitleContainsAny(int number, HashSet<string> terms)
+    {
+        for (var i = 0; i < GetTitleWordCount(number); i++)
+        {
+            if (terms.Contains(Vocabulary[Hash(number, 11 + i) % Vocabulary.Length]))
+            {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    private string GetDescription(int number, int revisionIndex)
+    {
+        var words = Math.Max(1, _options.DescriptionWords);
+        var description = new StringBuilder(words * 10);
+        description.Append("<p>The ")
+            .Append(Vocabulary[Hash(number, 11) % Vocabulary.Length]).Append(' ')
+            .Append(Vocabulary[Hash(number, 12) % Vocabulary.Length]).Append(" shall ")
+            .Append(Verbs[Hash(number, 14) % Verbs.Length]).Append(" the ")
+            .Append(Vocabulary[Hash(number, 13) % Vocabulary.Length])
+            .Append(" within ").Append(Hash(number, 15) % 500 + 10).Append(" ms.");
+
+        for (var i = 8; i < words; i++)
+        {
+            description.Append(i % 12 == 0 ? "</p><p>" : " ").Append(Vocabulary[Hash(number, 100 + i) % Vocabulary.Length]);
+        }
+
+        return description.Append(" (revision ").Append(revisionIndex + 1).Append(").</p>").ToString();
+    }
+
+    private string GetDocumentTitle(int documentIndex)
+    {
+        var first = Vocabulary[Hash(documentIndex, 1) % Vocabulary.Length];
+        return $"{char.ToUpperInvariant(first[0])}{first[1..]} {Vocabulary[Hash(documentIndex, 2) % Vocabulary.Length]} Specification {documentIndex + 1}";
+    }
+
+    private string GetOutlineNumber(int position)
+    {
+        var section = GetSectionOutline(position / _sectionSize);
+        var offset = position % _sectionSize;
+        return offset == 0 ? section : $"{section}-{offset}";
+    }
+
+    /// <summary>
+    /// Numbers section <paramref name="index"/> in a depth-first walk of a tree with
+    /// <see cref="SimulatorOptions.OutlineFanout"/> children per heading, down to <see cref="SimulatorOptions.OutlineDepth"/>.
+    /// Past the end of the tree, top-level numbering simply continues.
+    /// </summary>
+    private string GetSectionOutline(int index)
+    {
+        var outline = new StringBuilder();
+        for (var level = 1; ; level++)
+        {
+            // Headings in a subtree rooted at this level, its root included
+            var subtreeSize = 1L;
+            for (var depth = level; depth < _outlineDepth; depth++)
+            {
+                subtreeSize = subtreeSize * _outlineFanout + 1;
+            }
+
+            var child = index / subtreeSize;
+            index = (int)(index % subtreeSize);
+            if (outline.Length > 0)
+            {
+                outline.Append('.');
+            }
+
+            outline.Append(child + 1);
+            if (index == 0)
+            {
+                return outline.ToString();
+            }
+
+            index--;
+        }
+    }
+
+    private int GetLinkTarget(int number, int link)
+    {
+        return (int)(Hash(number, 200 + link) % (uint)WorkItemCount) + 1;
+    }
+
+    private BacklinkIndex BuildBacklinkIndex()
+    {
+        // Compressed adjacency: the sources linking to work item n are Sources[Offsets[n - 1] .. Offsets[n]]
+        var offsets = new int[WorkItemCount + 1];
+        for (var number = 1; number <= WorkItemCount; number++)
+        {
+            if (GetItemType(number) == "heading")
+            {
+                continue;
+            }
+
+            for (var l = 0; l < _linksPerWorkItem; l++)
+            {
+                var target = GetLinkTarget(number, l);
+                if (target != number)
+                {
+                    offsets[target]++;
+                }
+            }
+        }
+
+        for (var i = 1; i < offsets.Length; i++)
+        {
+            offsets[i] += offsets[i - 1];
+        }
+
+        var sources = new (int Number, int Link)[offsets[^1]];
+        var next = (int[])offsets.Clone();
+        for (var number = 1; number <= WorkItemCount; number++)
+        {
+            if (GetItemType(number) == "heading")
+            {
+                continue;
+            }
+
+            for (var l = 0; l < _linksPerWorkItem; l++)
+            {
+                var target = GetLinkTarget(number, l);
+                if (target != number)
+                {
+                    sources[next[target - 1]++] = (number, l);
+                }
+            }
+        }
+
+        return new BacklinkIndex(offsets, sources);
+    }
+
+    private bool TryResolveLocation(string? location, out int documentIndex)
+    {
+        documentIndex = -1;
+        var separator = location?.LastIndexOf('/') ?? -1;
+        if (separator <= 0)
+        {
+            return false;
+        }
+
+        var documentId = location![(separator + 1)..];
+        if (!documentId.StartsWith("Spec_", StringComparison.Ordinal)
+            || !int.TryParse(documentId.AsSpan(5), NumberStyles.None, CultureInfo.InvariantCulture, out var documentNumber)
+            || documentNumber < 1 || documentNumber > DocumentCount)
+        {
+            return false;
+        }
+
+        documentIndex = documentNumber - 1;
+        return string.Equals(location[..separator], _spaces[documentIndex % _spaces.Length], StringComparison.Ordinal);
+    }
+
+    private bool TryParseWorkItemId(string? workItemId, out int number)
+    {
+        number = 0;
+        var prefix = _options.WorkItemPrefix + "-";
+        return workItemId != null
+            && workItemId.StartsWith(prefix, StringComparison.OrdinalIgnoreCase)
+            && int.TryParse(workItemId.AsSpan(prefix.Length), NumberStyles.None, CultureInfo.InvariantCulture, out number)
+            && number >= 1 && number <= WorkItemCount;
+    }
+
+    private string FormatWorkItemId(int number)
+    {
+        return $"{_options.WorkItemPrefix}-{number}";
+    }
+
+    private static int DocumentRevisionNumber(int documentIndex, int revisionIndex)
+    {
+        return RevisionBase + revisionIndex * RevisionStep + documentIndex % RevisionStep;
+    }
+
+    private static int ItemRevisionNumber(int number, int revisionIndex)
+    {
+        return RevisionBase + revisionIndex * RevisionStep + number % RevisionStep;
+    }
+
+    private static string FormatRevision(int revision)
+    {
+        return revision.ToString(CultureInfo.InvariantCulture);
+    }
+
+    private static bool IsBlacklisted(string space, string? blacklistPattern)
+    {
+        return !string.IsNullOrEmpty(blacklistPattern) && space.Contains(blacklistPattern, StringComparison.Ordinal);
+    }
+
+    private uint Hash(int value, int salt)
+    {
+        unchecked
+        {
+            var hash = (uint)_options.Seed * 0x9E3779B1u ^ (uint)value * 0x85EBCA77u ^ (uint)salt * 0xC2B2AE3Du;
+            hash ^= hash >> 15;
+            hash *= 0x2C1B3C6Du;
+            hash ^= hash >> 12;
+            hash *= 0x297A2D39u;
+            hash ^= hash >> 15;
+            return hash;
+        }
+    }
+
+    private sealed class BacklinkIndex
+    {
+        private readonly int[] _offsets;
+        private readonly (int Number, int Link)[] _sources;
+
+        public BacklinkIndex(int[] offsets, (int Number, int Link)[] sources)
+        {
+            _offsets = offsets;
+            _sources = sources;
+        }
+
+        public ArraySegment<(int Number, int Link)> GetSources(int number)
+        {
+            return new ArraySegment<(int Number, int Link)>(_sources, _offsets[number - 1], _offsets[number] - _offsets[number - 1]);
+        }
+    }
+}
@@ -13,5 +13,87 @@ namespace PolarionMcpTools
         /// Each configuration defines settings for a specific Polarion project instance.
         /// </summary>
         public List<PolarionProjectConfig>? PolarionProjects { get; set; }
+
+        /// <summary>
+        /// Gets or sets the in-memory cache settings shared by all projects.
+        /// If null, the defaults of <see cref="PolarionCacheConfig"/> are used.
+        /// </summary>
+        public PolarionCacheConfig? Caching { get; set; }
+
+        /// <summary>
+        /// Gets or sets the Serilog pipeline settings, read from the standard <c>Logging</c> section.
+        /// If null, the defaults of <see cref="PolarionLoggingConfig"/> are used.
+        /// </summary>
+        public PolarionLoggingConfig? Logging { get; set; }
+    }
+
+    /// <summary>
+    /// Represents the settings of the process-wide caches that sit in front of the Polarion API.
+    /// </summary>
+    public class PolarionCacheConfig
+    {
+        /// <summary>
+        /// Upper bound, in megabytes, of the estimated memory held by cached module (document) snapshots.
+        /// Least recently used snapshots are evicted first. Set to 0 to disable the cache.
+        /// </summary>
+        public int ModuleSnapshotMaxMegabytes { get; set; } = 256;
+
+        /// <summary>
+        /// How long, in seconds, a snapshot of the latest (HEAD) revision of a module is reused.
+        /// Historical revisions are immutable and never expire.
+        /// </summary>
+        public int HeadModuleTtlSeconds { get; set; } = 30;
+
+        /// <summary>
+        /// Upper bound, in megabytes, of the HTML to Markdown conversion cache. Set to 0 to disable the cache.
+        /// </summary>
+        public int MarkdownMaxMegabytes { get; set; } = 64;
+
+        /// <summary>
+        /// Upper bound, in megabytes, of the cache of work items at specific revisions. Entries never expire
+        /// because historical work item content is immutable. Set to 0 to disable the cache.
+        /// </summary>
+        public int HistoricalWorkItemMaxMegabytes { get; set; } = 128;
+
+        /// <summary>
+        /// How often, in seconds, each project's catalog of spaces and documents is reloaded in the background.
+        /// Set to 0 to disable the catalog so every listing reads from Polarion.
+        /// </summary>
+        public int CatalogRefreshSeconds { get; set; } = 300;
+    }
+
+    /// <summary>
+    /// Represents the settings of the Serilog logging pipeline. Lives in the standard <c>Logging</c> section so that
+    /// <c>Logging:LogLevel</c> sets the minimum levels, as it does for Microsoft.Extensions.Logging.
+    /// </summary>
+    public class PolarionLoggingConfig
+    {
+        /// <summary>
+        /// Minimum levels keyed by logger category (namespace) prefix, with <c>Default</c> for everything else.
+        /// Accepts Microsoft.Extensions.Logging (<c>Trace</c>, <c>Critical</c>, <c>None</c>) and Serilog level names.
+        /// If no <c>Default</c> is given, the minimum level is <c>Verbose</c> and every event is logged.
+        /// </summary>
+        public Dictionary<string, string>? LogLevel { get; set; }
+
+        /// <summary>
+        /// Output format of the file and console sinks: <c>Text</c> or <c>Json</c>.
+        /// </summary>
+        public string Format { get; set; } = "Text";
+
+        /// <summary>
+        /// Whether sinks are written on a background thread so that logging never blocks a request on I/O.
+        /// </summary>
+        public bool Async { get; set; } = true;
+
+        /// <summary>
+        /// Number of events the background writer buffers. When the buffer is full, new events are dropped
+        /// rather than blocking the caller.
+        /// </summary>
+        public int AsyncBufferSize { get; set; } = 10000;
+
+        /// <summary>
+        /// Keep one of every N Debug and Verbose events. 1 keeps them all.
+        /// </summary>
+        public int DebugSampleRate { get; set; } = 1;
     }
 }
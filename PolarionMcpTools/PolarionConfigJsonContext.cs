@@ -12,6 +12,12 @@ namespace PolarionMcpTools;
 [JsonSerializable(typeof(PolarionClientConfiguration))]
 [JsonSerializable(typeof(List<ArtifactCustomFieldConfig>))]
 [JsonSerializable(typeof(ArtifactCustomFieldConfig))]
+[JsonSerializable(typeof(PolarionSessionPoolConfig))]
+[JsonSerializable(typeof(PolarionCacheConfig))]
+[JsonSerializable(typeof(PolarionLoggingConfig))]
+[JsonSerializable(typeof(PolarionTraceabilityConfig))]
+[JsonSerializable(typeof(PolarionConcurrencyConfig))]
+[JsonSerializable(typeof(PolarionWarmupConfig))]
 public partial class PolarionConfigJsonContext : JsonSerializerContext
 {
 }
@@ -0,0 +1,107 @@
+using Serilog;
+using Serilog.Configuration;
+using Serilog.Events;
+using Serilog.Formatting;
+using Serilog.Formatting.Display;
+using Serilog.Formatting.Json;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Builds the Serilog pipeline shared by the stdio and remote servers from <see cref="PolarionLoggingConfig"/>:
+/// minimum levels per namespace, text or JSON output, Debug/Verbose sampling and background-buffered sinks.
+/// Each server supplies its own sinks.
+/// </summary>
+public static class PolarionLogging
+{
+    public const string TextOutputTemplate = "{Timestamp:yyyy-MM-dd HH:mm:ss.fff zzz} [{Level:u3}] {Message:lj}{NewLine}{Exception}";
+
+    /// <summary>
+    /// Creates a logger configuration with the configured levels, sampling and formatter.
+    /// </summary>
+    /// <param name="config">The <c>Logging</c> section, or null for the defaults.</param>
+    /// <param name="writeTo">Adds the server's sinks, using the given formatter for their output.</param>
+    public static LoggerConfiguration CreateConfiguration(
+        PolarionLoggingConfig? config,
+        Action<LoggerSinkConfiguration, ITextFormatter> writeTo)
+    {
+        config ??= new PolarionLoggingConfig();
+
+        var loggerConfig = new LoggerConfiguration();
+        var levels = config.LogLevel ?? new Dictionary<string, string>();
+
+        loggerConfig.MinimumLevel.Is(levels.TryGetValue("Default", out var defaultLevel)
+            ? ParseLevel(defaultLevel)
+            : LogEventLevel.Verbose);
+
+        foreach (var (category, level) in levels)
+        {
+            if (!category.Equals("Default", StringComparison.OrdinalIgnoreCase))
+            {
+                loggerConfig.MinimumLevel.Override(category, ParseLevel(level));
+            }
+        }
+
+        if (config.DebugSampleRate > 1)
+        {
+            var sampler = new DebugSampler(config.DebugSampleRate);
+            loggerConfig.Filter.ByExcluding(sampler.ShouldDrop);
+        }
+
+        ITextFormatter formatter = config.Format.Equals("Json", StringComparison.OrdinalIgnoreCase)
+            ? new JsonFormatter(renderMessage: true)
+            : new MessageTemplateTextFormatter(TextOutputTemplate);
+
+        if (config.Async)
+        {
+            // Events are queued and written on a background thread; a full queue drops events instead of blocking
+            loggerConfig.WriteTo.Async(
+                sinks => writeTo(sinks, formatter),
+                bufferSize: Math.Max(1, config.AsyncBufferSize),
+                blockWhenFull: false);
+        }
+        else
+        {
+            writeTo(loggerConfig.WriteTo, formatter);
+        }
+
+        return loggerConfig;
+    }
+
+    /// <summary>
+    /// Parses Microsoft.Extensions.Logging and Serilog level names.
+    /// </summary>
+    public static LogEventLevel ParseLevel(string level)
+    {
+        return level.Trim().ToLowerInvariant() switch
+        {
+            "trace" or "verbose" => LogEventLevel.Verbose,
+            "debug" => LogEventLevel.Debug,
+            "information" or "info" => LogEventLevel.Information,
+            "warning" or "warn" => LogEventLevel.Warning,
+            "error" => LogEventLevel.Error,
+            "critical" or "fatal" => LogEventLevel.Fatal,
+            "none" => LevelAlias.Off,
+            _ => throw new InvalidOperationException($"Unknown log level '{level}' in the Logging:LogLevel section.")
+        };
+    }
+
+    /// <summary>
+    /// Keeps one of every N Debug and Verbose events.
+    /// </summary>
+    private sealed class DebugSampler
+    {
+        private readonly int _rate;
+        private long _seen;
+
+        public DebugSampler(int rate)
+        {
+            _rate = rate;
+        }
+
+        public bool ShouldDrop(LogEvent logEvent)
+        {
+            return logEvent.Level <= LogEventLevel.Debug && Interlocked.Increment(ref _seen) % _rate != 0;
+        }
+    }
+}
@@ -19,6 +19,121 @@ namespace PolarionMcpTools
         public List<string> Fields { get; set; } = new List<string>();
     }
 
+    /// <summary>
+    /// Represents the limits applied when following work item links across several levels.
+    /// </summary>
+    public class PolarionTraceabilityConfig
+    {
+        /// <summary>
+        /// The maximum number of work items fetched from Polarion at the same time while walking links.
+        /// </summary>
+        public int MaxConcurrency { get; set; } = 8;
+
+        /// <summary>
+        /// The maximum number of linked work items fetched for one request. Links beyond the budget
+        /// are still listed but not followed further.
+        /// </summary>
+        public int NodeBudget { get; set; } = 500;
+    }
+
+    /// <summary>
+    /// Represents the sizing and lifetime settings of the pooled Polarion sessions
+    /// used for a project.
+    /// </summary>
+    public class PolarionSessionPoolConfig
+    {
+        /// <summary>
+        /// The number of authenticated sessions kept open even when the pool is idle.
+        /// </summary>
+        public int MinSize { get; set; } = 0;
+
+        /// <summary>
+        /// The maximum number of sessions that may be leased concurrently.
+        /// </summary>
+        public int MaxSize { get; set; } = 8;
+
+        /// <summary>
+        /// Idle sessions above <see cref="MinSize"/> are closed after this many seconds without use.
+        /// </summary>
+        public int IdleTimeoutSeconds { get; set; } = 300;
+
+        /// <summary>
+        /// Sessions older than this many seconds are discarded and replaced by a fresh login.
+        /// Keep this below the Polarion server's session timeout.
+        /// </summary>
+        public int MaxLifetimeSeconds { get; set; } = 1800;
+
+        /// <summary>
+        /// An idle session is validated with a cheap query before being handed out
+        /// when it has not been used for this many seconds.
+        /// </summary>
+        public int HealthCheckAfterSeconds { get; set; } = 60;
+
+        /// <summary>
+        /// How long a call waits for a free session when <see cref="MaxSize"/> sessions are leased.
+        /// </summary>
+        public int LeaseTimeoutSeconds { get; set; } = 30;
+    }
+
+    /// <summary>
+    /// Represents the limits on concurrent calls to the Polarion server for a project.
+    /// </summary>
+    public class PolarionConcurrencyConfig
+    {
+        /// <summary>
+        /// The maximum number of calls to the Polarion server running at the same time, across all sessions.
+        /// </summary>
+        public int MaxConcurrency { get; set; } = 8;
+
+        /// <summary>
+        /// The maximum number of those calls that may be bulk module pulls. The remaining slots are kept
+        /// for point lookups such as single work items and searches.
+        /// </summary>
+        public int MaxBulkConcurrency { get; set; } = 6;
+
+        /// <summary>
+        /// The maximum number of calls waiting for a slot. Calls beyond this are rejected immediately.
+        /// </summary>
+        public int MaxQueueLength { get; set; } = 100;
+
+        /// <summary>
+        /// How long a call waits for a slot before it is rejected.
+        /// </summary>
+        public int QueueTimeoutSeconds { get; set; } = 30;
+
+        /// <summary>
+        /// The <c>Retry-After</c> value, in seconds, sent to REST clients whose request was rejected.
+        /// </summary>
+        public int RetryAfterSeconds { get; set; } = 5;
+    }
+
+    /// <summary>
+    /// Represents the work done for a project at startup, before the first request arrives.
+    /// </summary>
+    public class PolarionWarmupConfig
+    {
+        /// <summary>
+        /// Whether the project is warmed up at startup.
+        /// </summary>
+        public bool Enabled { get; set; } = false;
+
+        /// <summary>
+        /// The number of Polarion sessions opened ahead of the first request.
+        /// </summary>
+        public int Sessions { get; set; } = 1;
+
+        /// <summary>
+        /// Whether the project's catalog of spaces and documents is loaded.
+        /// </summary>
+        public bool LoadCatalog { get; set; } = true;
+
+        /// <summary>
+        /// Documents whose work items are prefetched into the module snapshot cache, as <c>Space/DocumentId</c>,
+        /// optionally followed by <c>@revision</c> to pin a historical revision.
+        /// </summary>
+        public List<string>? Documents { get; set; }
+    }
+
     /// <summary>
     /// Represents the configuration for a single Polarion project instance
     /// defined in the application settings.
@@ -73,5 +188,29 @@ namespace PolarionMcpTools
         /// Gets or sets the prefix to be used when creating a Polarion WorkItem.
         /// If null or empty, no prefix will be used.
         public string? WorkItemPrefix { get; set; }
+
+        /// <summary>
+        /// Gets or sets the session pool settings for this project.
+        /// If null, the defaults of <see cref="PolarionSessionPoolConfig"/> are used.
+        /// </summary>
+        public PolarionSessionPoolConfig? SessionPool { get; set; }
+
+        /// <summary>
+        /// Gets or sets the traceability walk settings for this project.
+        /// If null, the defaults of <see cref="PolarionTraceabilityConfig"/> are used.
+        /// </summary>
+        public PolarionTraceabilityConfig? Traceability { get; set; }
+
+        /// <summary>
+        /// Gets or sets the limits on concurrent Polarion calls for this project.
+        /// If null, the defaults of <see cref="PolarionConcurrencyConfig"/> are used.
+        /// </summary>
+        public PolarionConcurrencyConfig? Concurrency { get; set; }
+
+        /// <summary>
+        /// Gets or sets the startup warm-up settings for this project.
+        /// If null, the project is not warmed up.
+        /// </summary>
+        public PolarionWarmupConfig? Warmup { get; set; }
     }
 }
@@ -0,0 +1,19 @@
+namespace PolarionMcpTools;
+
+public static class PolarionProjectConfigExtensions
+{
+    /// <summary>
+    /// Gets a key identifying the Polarion server and project behind this configuration,
+    /// used to partition process-wide caches between projects.
+    /// </summary>
+    public static string GetProjectKey(this PolarionProjectConfig? projectConfig)
+    {
+        var sessionConfig = projectConfig?.SessionConfig;
+        if (sessionConfig == null)
+        {
+            return projectConfig?.ProjectUrlAlias ?? string.Empty;
+        }
+
+        return $"{sessionConfig.ServerUrl.TrimEnd('/')}|{sessionConfig.ProjectId}";
+    }
+}
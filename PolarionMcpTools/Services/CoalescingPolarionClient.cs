@@ -0,0 +1,86 @@
+using System.Collections;
+using System.Reflection;
+using System.Runtime.ExceptionServices;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// <see cref="IPolarionClient"/> decorator that sends the read calls agents most often repeat in parallel
+/// (module, work item and search queries) through a <see cref="PolarionCallCoalescer"/>. Every other member is
+/// forwarded to the wrapped client unchanged. Built as a <see cref="DispatchProxy"/> so it follows the client
+/// interface as the Polarion package evolves.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class CoalescingPolarionClient : DispatchProxy
+{
+    /// <summary>
+    /// The <see cref="IPolarionClient"/> methods whose identical concurrent calls share one upstream call.
+    /// </summary>
+    public static readonly IReadOnlySet<string> CoalescedMethods = new HashSet<string>(StringComparer.Ordinal)
+    {
+        nameof(IPolarionClient.QueryWorkItemsInModuleAsync),
+        nameof(IPolarionClient.GetWorkItemsByModuleRevisionAsync),
+        nameof(IPolarionClient.GetWorkItemByIdAsync),
+        nameof(IPolarionClient.SearchWorkitemAsync)
+    };
+
+    private IPolarionClient _inner = null!;
+    private PolarionCallCoalescer _coalescer = null!;
+    private string _partitionKey = string.Empty;
+
+    /// <summary>
+    /// Wraps a client so its coalesced calls are shared with other clients of the same partition.
+    /// </summary>
+    /// <param name="inner">The authenticated client that performs the calls.</param>
+    /// <param name="coalescer">The process-wide coalescer.</param>
+    /// <param name="partitionKey">Identifies the server, user and project the client is bound to.</param>
+    public static IPolarionClient Wrap(IPolarionClient inner, PolarionCallCoalescer coalescer, string partitionKey)
+    {
+        var proxy = Create<IPolarionClient, CoalescingPolarionClient>();
+        var coalescing = (CoalescingPolarionClient)(object)proxy;
+        coalescing._inner = inner;
+        coalescing._coalescer = coalescer;
+        coalescing._partitionKey = partitionKey;
+        return proxy;
+    }
+
+    protected override object? Invoke(MethodInfo? targetMethod, object?[]? args)
+    {
+        ArgumentNullException.ThrowIfNull(targetMethod);
+
+        if (!CoalescedMethods.Contains(targetMethod.Name)
+            || !typeof(Task).IsAssignableFrom(targetMethod.ReturnType)
+            || (args != null && args.Any(arg => arg is CancellationToken)))
+        {
+            return Forward(targetMethod, args);
+        }
+
+        // The full signature tells overloads apart, e.g. GetWorkItemByIdAsync(id) and GetWorkItemByIdAsync(id, revision)
+        var arguments = $"{targetMethod}\u001e{string.Join('\u001f', (args ?? Array.Empty<object?>()).Select(FormatArgument))}";
+        return _coalescer.Run(_partitionKey, targetMethod.Name, arguments, () => (Task)Forward(targetMethod, args)!);
+    }
+
+    private object? Forward(MethodInfo targetMethod, object?[]? args)
+    {
+        try
+        {
+            return targetMethod.Invoke(_inner, args);
+        }
+        catch (TargetInvocationException ex) when (ex.InnerException != null)
+        {
+            ExceptionDispatchInfo.Capture(ex.InnerException).Throw();
+            throw;
+        }
+    }
+
+    private static string FormatArgument(object? argument)
+    {
+        return argument switch
+        {
+            null => "<null>",
+            string value => value,
+            IEnumerable values => $"[{string.Join(",", values.Cast<object?>().Select(FormatArgument))}]",
+            _ => argument.ToString() ?? string.Empty
+        };
+    }
+}
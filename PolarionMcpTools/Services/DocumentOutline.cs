@@ -0,0 +1,301 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Orders Polarion outline numbers segment by segment, comparing numeric segments by value so that
+/// "1.2" sorts before "1.10". A '-' separator (work items within a section, e.g. "1.2-1") sorts before
+/// a '.' separator (sub-sections, e.g. "1.2.1"), and a number sorts before everything below it.
+/// </summary>
+public sealed class OutlineNumberComparer : IComparer<string>
+{
+    public static readonly OutlineNumberComparer Instance = new();
+
+    public int Compare(string? x, string? y)
+    {
+        if (ReferenceEquals(x, y))
+        {
+            return 0;
+        }
+
+        if (x == null)
+        {
+            return -1;
+        }
+
+        if (y == null)
+        {
+            return 1;
+        }
+
+        var xPosition = 0;
+        var yPosition = 0;
+
+        while (true)
+        {
+            var xSegment = ReadSegment(x, ref xPosition, out var xSeparator);
+            var ySegment = ReadSegment(y, ref yPosition, out var ySeparator);
+
+            var segmentComparison = CompareSegments(xSegment, ySegment);
+            if (segmentComparison != 0)
+            {
+                return segmentComparison;
+            }
+
+            var separatorComparison = SeparatorRank(xSeparator).CompareTo(SeparatorRank(ySeparator));
+            if (separatorComparison != 0 || xSeparator == '\0')
+            {
+                return separatorComparison;
+            }
+        }
+    }
+
+    private static ReadOnlySpan<char> ReadSegment(string value, ref int position, out char separator)
+    {
+        var start = position;
+        while (position < value.Length && value[position] != '.' && value[position] != '-')
+        {
+            position++;
+        }
+
+        var segment = value.AsSpan(start, position - start);
+        separator = position < value.Length ? value[position++] : '\0';
+        return segment;
+    }
+
+    private static int CompareSegments(ReadOnlySpan<char> x, ReadOnlySpan<char> y)
+    {
+        if (IsNumber(x) && IsNumber(y))
+        {
+            // Compare by value without parsing, so arbitrarily long numbers cannot overflow
+            x = x.TrimStart('0');
+            y = y.TrimStart('0');
+            if (x.Length != y.Length)
+            {
+                return x.Length.CompareTo(y.Length);
+            }
+
+            return x.SequenceCompareTo(y);
+        }
+
+        return x.CompareTo(y, StringComparison.OrdinalIgnoreCase);
+    }
+
+    private static bool IsNumber(ReadOnlySpan<char> segment)
+    {
+        if (segment.IsEmpty)
+        {
+            return false;
+        }
+
+        foreach (var c in segment)
+        {
+            if (!char.IsAsciiDigit(c))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    private static int SeparatorRank(char separator)
+    {
+        return separator switch
+        {
+            '\0' => 0,
+            '-' => 1,
+            _ => 2
+        };
+    }
+}
+
+/// <summary>
+/// A work item in a <see cref="DocumentOutline"/>, with its place in the outline hierarchy.
+/// </summary>
+public sealed class OutlineNode
+{
+    internal OutlineNode(WorkItem workItem, int index)
+    {
+        WorkItem = workItem;
+        Index = index;
+        OutlineNumber = workItem.outlineNumber ?? string.Empty;
+        IsHeading = workItem.type?.id?.Equals("heading", StringComparison.OrdinalIgnoreCase) == true;
+    }
+
+    public WorkItem WorkItem { get; }
+
+    public string OutlineNumber { get; }
+
+    public bool IsHeading { get; }
+
+    /// <summary>
+    /// The position of this node in <see cref="DocumentOutline.Nodes"/>.
+    /// </summary>
+    public int Index { get; }
+
+    /// <summary>
+    /// The position just past the last descendant of this node in <see cref="DocumentOutline.Nodes"/>;
+    /// the node and its whole subtree occupy [<see cref="Index"/>, <see cref="SubtreeEnd"/>).
+    /// </summary>
+    public int SubtreeEnd { get; internal set; }
+
+    /// <summary>
+    /// The closest node whose outline number is a section prefix of this one, or null for top-level nodes.
+    /// </summary>
+    public OutlineNode? Parent { get; internal set; }
+
+    public List<OutlineNode> Children { get; } = new();
+}
+
+/// <summary>
+/// The outline hierarchy of one module snapshot, built once and shared by the outline and section tools.
+/// Work items are ordered by <see cref="OutlineNumberComparer"/>, each section's work items form one contiguous
+/// range, and headings, sections and top-level sections are looked up without scanning the module.
+/// </summary>
+public sealed class DocumentOutline
+{
+    private readonly OutlineNode[] _nodes;
+    private readonly Dictionary<string, OutlineNode> _nodesByNumber = new(StringComparer.OrdinalIgnoreCase);
+
+    public DocumentOutline(IEnumerable<WorkItem?> workItems)
+    {
+        // OrderBy is stable, so work items sharing an outline number keep their module order
+        _nodes = workItems
+            .Where(wi => wi != null)
+            .OrderBy(wi => wi!.outlineNumber ?? string.Empty, OutlineNumberComparer.Instance)
+            .Select((wi, index) => new OutlineNode(wi!, index))
+            .ToArray();
+
+        var ancestors = new Stack<OutlineNode>();
+        var roots = new List<OutlineNode>();
+
+        foreach (var node in _nodes)
+        {
+            while (ancestors.Count > 0 && !IsInSection(node.OutlineNumber, ancestors.Peek().OutlineNumber))
+            {
+                ancestors.Pop().SubtreeEnd = node.Index;
+            }
+
+            if (ancestors.TryPeek(out var parent))
+            {
+                node.Parent = parent;
+                parent.Children.Add(node);
+            }
+            else
+            {
+                roots.Add(node);
+            }
+
+            ancestors.Push(node);
+            _nodesByNumber.TryAdd(node.OutlineNumber, node);
+        }
+
+        while (ancestors.Count > 0)
+        {
+            ancestors.Pop().SubtreeEnd = _nodes.Length;
+        }
+
+        Roots = roots;
+        Headings = _nodes.Where(n => n.IsHeading).ToList();
+    }
+
+    /// <summary>
+    /// Every work item of the module in outline order.
+    /// </summary>
+    public IReadOnlyList<OutlineNode> Nodes => _nodes;
+
+    /// <summary>
+    /// Nodes without a parent, in outline order.
+    /// </summary>
+    public IReadOnlyList<OutlineNode> Roots { get; }
+
+    /// <summary>
+    /// Heading work items in outline order.
+    /// </summary>
+    public IReadOnlyList<OutlineNode> Headings { get; }
+
+    /// <summary>
+    /// Finds the node with the given outline number, or null.
+    /// </summary>
+    public OutlineNode? Find(string outlineNumber)
+    {
+        return _nodesByNumber.GetValueOrDefault(outlineNumber);
+    }
+
+    /// <summary>
+    /// Gets the work items of a section and all of its sub-sections in outline order. Section "6.1" covers
+    /// "6.1", "6.1-1" and "6.1.2.3" but not "6.10" or "6.2". The section itself need not be a work item.
+    /// </summary>
+    public IReadOnlyList<WorkItem> GetSection(string sectionNumber)
+    {
+        if (string.IsNullOrEmpty(sectionNumber))
+        {
+            return Array.Empty<WorkItem>();
+        }
+
+        if (Find(sectionNumber) is { } sectionNode)
+        {
+            return Slice(sectionNode.Index, sectionNode.SubtreeEnd);
+        }
+
+        // No work item carries the section number itself, but its sub-sections still sort directly after it
+        var start = LowerBound(sectionNumber);
+        var end = start;
+        while (end < _nodes.Length && IsInSection(_nodes[end].OutlineNumber, sectionNumber))
+        {
+            end++;
+        }
+
+        return Slice(start, end);
+    }
+
+    /// <summary>
+    /// Returns true if <paramref name="outlineNumber"/> is <paramref name="sectionNumber"/> or lies below it.
+    /// A dot separates sub-sections (e.g. 6.1.2); a dash separates work items within a section (e.g. 6.1.2-1).
+    /// </summary>
+    public static bool IsInSection(string outlineNumber, string sectionNumber)
+    {
+        if (string.IsNullOrEmpty(outlineNumber) || string.IsNullOrEmpty(sectionNumber))
+        {
+            return false;
+        }
+
+        if (!outlineNumber.StartsWith(sectionNumber, StringComparison.OrdinalIgnoreCase))
+        {
+            return false;
+        }
+
+        return outlineNumber.Length == sectionNumber.Length
+            || outlineNumber[sectionNumber.Length] == '.'
+            || outlineNumber[sectionNumber.Length] == '-';
+    }
+
+    private int LowerBound(string outlineNumber)
+    {
+        int low = 0, high = _nodes.Length;
+        while (low < high)
+        {
+            var middle = low + (high - low) / 2;
+            if (OutlineNumberComparer.Instance.Compare(_nodes[middle].OutlineNumber, outlineNumber) < 0)
+            {
+                low = middle + 1;
+            }
+            else
+            {
+                high = middle;
+            }
+        }
+
+        return low;
+    }
+
+    private WorkItem[] Slice(int start, int end)
+    {
+        var workItems = new WorkItem[end - start];
+        for (var i = start; i < end; i++)
+        {
+            workItems[i - start] = _nodes[i].WorkItem;
+        }
+
+        return workItems;
+    }
+}
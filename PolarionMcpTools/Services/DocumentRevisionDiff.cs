@@ -0,0 +1,505 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// How a work item differs between two revisions of a document.
+/// </summary>
+public enum WorkItemChangeKind
+{
+    Added,
+    Removed,
+    Modified,
+    Moved
+}
+
+/// <summary>
+/// One changed field of a work item. Values are the raw Polarion values as text; descriptions and rich-text
+/// custom fields are HTML.
+/// </summary>
+public sealed record WorkItemFieldChange(string Field, string? From, string? To);
+
+/// <summary>
+/// A work item that was added, removed, moved or modified between two document revisions. A work item that was
+/// both moved and modified has <see cref="WorkItemChangeKind.Modified"/> as its <see cref="Kind"/> and
+/// <see cref="IsMoved"/> set.
+/// </summary>
+public sealed record WorkItemChange(
+    string Id,
+    WorkItemChangeKind Kind,
+    string? Type,
+    string? Title,
+    string? FromOutlineNumber,
+    string? ToOutlineNumber,
+    string? FromRevision,
+    string? ToRevision,
+    bool IsMoved,
+    IReadOnlyList<WorkItemFieldChange> FieldChanges);
+
+/// <summary>
+/// The differences between the work items of two snapshots of the same document.
+/// Work items whose per-item revision is the same in both snapshots are counted as unchanged without comparing
+/// their content; the rest are compared field by field. Both snapshots are still loaded in full, because the Polarion
+/// client has no call that returns a document's per-item revisions without the work items themselves. A work item counts as moved when it changed parent
+/// section or its position relative to the other work items; outline numbers that shift only because of
+/// insertions or removals elsewhere are reported but do not make a work item moved.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class DocumentRevisionDiff
+{
+    private DocumentRevisionDiff(
+        string fromRevision,
+        string toRevision,
+        int fromCount,
+        int toCount,
+        int unchangedCount,
+        int skippedByRevisionCount,
+        IReadOnlyList<WorkItemChange> changes)
+    {
+        FromRevision = fromRevision;
+        ToRevision = toRevision;
+        FromCount = fromCount;
+        ToCount = toCount;
+        UnchangedCount = unchangedCount;
+        SkippedByRevisionCount = skippedByRevisionCount;
+        Changes = changes;
+    }
+
+    public string FromRevision { get; }
+
+    public string ToRevision { get; }
+
+    /// <summary>
+    /// Number of work items in the document at <see cref="FromRevision"/>.
+    /// </summary>
+    public int FromCount { get; }
+
+    /// <summary>
+    /// Number of work items in the document at <see cref="ToRevision"/>.
+    /// </summary>
+    public int ToCount { get; }
+
+    /// <summary>
+    /// Number of work items present in both revisions with no content change and no move.
+    /// </summary>
+    public int UnchangedCount { get; }
+
+    /// <summary>
+    /// Number of work items present in both revisions whose content was not compared because their per-item
+    /// revision did not change.
+    /// </summary>
+    public int SkippedByRevisionCount { get; }
+
+    /// <summary>
+    /// Added, moved and modified work items in outline order of <see cref="ToRevision"/>, followed by removed
+    /// work items in outline order of <see cref="FromRevision"/>.
+    /// </summary>
+    public IReadOnlyList<WorkItemChange> Changes { get; }
+
+    public int AddedCount => Changes.Count(c => c.Kind == WorkItemChangeKind.Added);
+
+    public int RemovedCount => Changes.Count(c => c.Kind == WorkItemChangeKind.Removed);
+
+    public int ModifiedCount => Changes.Count(c => c.Kind == WorkItemChangeKind.Modified);
+
+    public int MovedCount => Changes.Count(c => c.IsMoved);
+
+    /// <summary>
+    /// Compares two snapshots of the same document.
+    /// </summary>
+    public static DocumentRevisionDiff Compute(ModuleSnapshot from, ModuleSnapshot to)
+    {
+        var fromNodes = IndexNodes(from.Outline);
+        var toNodes = IndexNodes(to.Outline);
+
+        // Work items present in both revisions, in outline order of the "from" revision; the ones outside the
+        // longest run that keeps its relative order in the "to" revision are the ones that were reordered
+        var common = from.Outline.Nodes
+            .Where(n => n.WorkItem.id != null && toNodes.ContainsKey(n.WorkItem.id) && fromNodes[n.WorkItem.id] == n)
+            .Select(n => n.WorkItem.id!)
+            .ToList();
+        var inOrder = LongestIncreasingSubsequence(common.Select(id => toNodes[id].Index).ToList())
+            .Select(i => common[i])
+            .ToHashSet(StringComparer.Ordinal);
+
+        var changes = new List<WorkItemChange>();
+        var unchangedCount = 0;
+        var skippedByRevisionCount = 0;
+
+        foreach (var toNode in to.Outline.Nodes)
+        {
+            var toItem = toNode.WorkItem;
+            if (toItem.id == null || toNodes[toItem.id] != toNode)
+            {
+                continue;
+            }
+
+            if (!fromNodes.TryGetValue(toItem.id, out var fromNode))
+            {
+                changes.Add(new WorkItemChange(
+                    toItem.id, WorkItemChangeKind.Added, toItem.type?.id, toItem.title,
+                    null, toItem.outlineNumber, null, GetItemRevision(to, toItem.id),
+                    false, Array.Empty<WorkItemFieldChange>()));
+                continue;
+            }
+
+            var fromItem = fromNode.WorkItem;
+            var isMoved = !inOrder.Contains(toItem.id)
+                || !string.Equals(fromNode.Parent?.WorkItem.id, toNode.Parent?.WorkItem.id, StringComparison.Ordinal);
+
+            IReadOnlyList<WorkItemFieldChange> fieldChanges;
+            if (ReferenceEquals(fromItem, toItem) || HasSameRevision(toItem.id, from, to))
+            {
+                skippedByRevisionCount++;
+                fieldChanges = Array.Empty<WorkItemFieldChange>();
+            }
+            else
+            {
+                fieldChanges = CompareFields(fromItem, toItem);
+            }
+
+            if (fieldChanges.Count == 0 && !isMoved)
+            {
+                unchangedCount++;
+                continue;
+            }
+
+            changes.Add(new WorkItemChange(
+                toItem.id,
+                fieldChanges.Count > 0 ? WorkItemChangeKind.Modified : WorkItemChangeKind.Moved,
+                toItem.type?.id,
+                toItem.title,
+                fromItem.outlineNumber,
+                toItem.outlineNumber,
+                GetItemRevision(from, toItem.id),
+                GetItemRevision(to, toItem.id),
+                isMoved,
+                fieldChanges));
+        }
+
+        foreach (var fromNode in from.Outline.Nodes)
+        {
+            var fromItem = fromNode.WorkItem;
+            if (fromItem.id == null || fromNodes[fromItem.id] != fromNode || toNodes.ContainsKey(fromItem.id))
+            {
+                continue;
+            }
+
+            changes.Add(new WorkItemChange(
+                fromItem.id, WorkItemChangeKind.Removed, fromItem.type?.id, fromItem.title,
+                fromItem.outlineNumber, null, GetItemRevision(from, fromItem.id), null,
+                false, Array.Empty<WorkItemFieldChange>()));
+        }
+
+        return new DocumentRevisionDiff(
+            from.Revision,
+            to.Revision,
+            fromNodes.Count,
+            toNodes.Count,
+            unchangedCount,
+            skippedByRevisionCount,
+            changes);
+    }
+
+    /// <summary>
+    /// Compares the title, type, status, description and custom fields of two revisions of a work item.
+    /// </summary>
+    public static IReadOnlyList<WorkItemFieldChange> CompareFields(WorkItem from, WorkItem to)
+    {
+        var changes = new List<WorkItemFieldChange>();
+
+        AddIfChanged(changes, "title", from.title, to.title);
+        AddIfChanged(changes, "type", from.type?.id, to.type?.id);
+        AddIfChanged(changes, "status", from.status?.id, to.status?.id);
+        AddIfChanged(changes, "description", from.description?.content, to.description?.content);
+
+        var fromFields = GetCustomFields(from);
+        var toFields = GetCustomFields(to);
+        foreach (var key in fromFields.Keys.Union(toFields.Keys).Order(StringComparer.Ordinal))
+        {
+            AddIfChanged(changes, $"customFields.{key}", fromFields.GetValueOrDefault(key), toFields.GetValueOrDefault(key));
+        }
+
+        return changes;
+    }
+
+    /// <summary>
+    /// Line-level differences between two texts, as (' ', line) for common lines, ('-', line) for lines only in
+    /// <paramref name="from"/> and ('+', line) for lines only in <paramref name="to"/>. The common prefix and suffix
+    /// are matched directly; when the lines in between still exceed <paramref name="maxLines"/> on either side, they
+    /// are reported as all removed and all added instead of running the quadratic comparison.
+    /// </summary>
+    public static IReadOnlyList<(char Operation, string Line)> DiffLines(string? from, string? to, int maxLines = 400)
+    {
+        var a = SplitLines(from);
+        var b = SplitLines(to);
+
+        var prefix = 0;
+        while (prefix < a.Length && prefix < b.Length && a[prefix] == b[prefix])
+        {
+            prefix++;
+        }
+
+        var suffix = 0;
+        while (suffix < a.Length - prefix && suffix < b.Length - prefix && a[^(suffix + 1)] == b[^(suffix + 1)])
+        {
+            suffix++;
+        }
+
+        var lines = new List<(char, string)>(a.Length + b.Length - prefix - suffix);
+        lines.AddRange(a.Take(prefix).Select(line => (' ', line)));
+
+        var aEnd = a.Length - suffix;
+        var bEnd = b.Length - suffix;
+        if (aEnd - prefix > maxLines || bEnd - prefix > maxLines)
+        {
+            lines.AddRange(a[prefix..aEnd].Select(line => ('-', line)));
+            lines.AddRange(b[prefix..bEnd].Select(line => ('+', line)));
+        }
+        else
+        {
+            AppendMiddleDiff(lines, a[prefix..aEnd], b[prefix..bEnd]);
+        }
+
+        lines.AddRange(a[aEnd..].Select(line => (' ', line)));
+        return lines;
+    }
+
+    /// <summary>
+    /// Formats the differences between two texts as unified diff hunks with <paramref name="context"/> unchanged lines
+    /// around each change; unchanged runs further away from a change are left out. Empty if the texts are equal.
+    /// </summary>
+    public static IReadOnlyList<string> FormatUnifiedDiff(string? from, string? to, int context = 3)
+    {
+        var lines = DiffLines(from, to);
+        var output = new List<string>();
+
+        var i = 0;
+        while (i < lines.Count)
+        {
+            var nextChange = FindChange(lines, i);
+            if (nextChange < 0)
+            {
+                break;
+            }
+
+            // Extend the hunk while the next change is close enough for the context lines to overlap
+            var hunkStart = Math.Max(i, nextChange - context);
+            var hunkEnd = nextChange;
+            while (true)
+            {
+                while (hunkEnd < lines.Count && lines[hunkEnd].Operation != ' ')
+                {
+                    hunkEnd++;
+                }
+
+                var following = FindChange(lines, hunkEnd);
+                if (following < 0 || following - hunkEnd > 2 * context)
+                {
+                    break;
+                }
+
+                hunkEnd = following;
+            }
+
+            hunkEnd = Math.Min(lines.Count, hunkEnd + context);
+
+            var fromLine = 1 + lines.Take(hunkStart).Count(l => l.Operation != '+');
+            var toLine = 1 + lines.Take(hunkStart).Count(l => l.Operation != '-');
+            var hunk = lines.Skip(hunkStart).Take(hunkEnd - hunkStart).ToList();
+            output.Add($"@@ -{fromLine},{hunk.Count(l => l.Operation != '+')} +{toLine},{hunk.Count(l => l.Operation != '-')} @@");
+            output.AddRange(hunk.Select(l => $"{l.Operation}{l.Line}"));
+
+            i = hunkEnd;
+        }
+
+        return output;
+    }
+
+    private static int FindChange(IReadOnlyList<(char Operation, string Line)> lines, int start)
+    {
+        for (var i = start; i < lines.Count; i++)
+        {
+            if (lines[i].Operation != ' ')
+            {
+                return i;
+            }
+        }
+
+        return -1;
+    }
+
+    private static void AppendMiddleDiff(List<(char, string)> lines, string[] a, string[] b)
+    {
+        // lcs[i, j] is the length of the longest common subsequence of a[i..] and b[j..]
+        var lcs = new int[a.Length + 1, b.Length + 1];
+        for (var i = a.Length - 1; i >= 0; i--)
+        {
+            for (var j = b.Length - 1; j >= 0; j--)
+            {
+                lcs[i, j] = a[i] == b[j] ? lcs[i + 1, j + 1] + 1 : Math.Max(lcs[i + 1, j], lcs[i, j + 1]);
+            }
+        }
+
+        int x = 0, y = 0;
+        while (x < a.Length && y < b.Length)
+        {
+            if (a[x] == b[y])
+            {
+                lines.Add((' ', a[x++]));
+                y++;
+            }
+            else if (lcs[x + 1, y] >= lcs[x, y + 1])
+            {
+                lines.Add(('-', a[x++]));
+            }
+            else
+            {
+                lines.Add(('+', b[y++]));
+            }
+        }
+
+        while (x < a.Length)
+        {
+            lines.Add(('-', a[x++]));
+        }
+
+        while (y < b.Length)
+        {
+            lines.Add(('+', b[y++]));
+        }
+    }
+
+    /// <summary>
+    /// True if the work item is at the same per-item revision in both snapshots, so its content cannot differ.
+    /// A HEAD snapshot has no per-item metadata; there the historical side's "same as HEAD" flag is used.
+    /// </summary>
+    private static bool HasSameRevision(string workItemId, ModuleSnapshot from, ModuleSnapshot to)
+    {
+        var hasFrom = TryGetMetadata(from, workItemId, out var fromMetadata);
+        var hasTo = TryGetMetadata(to, workItemId, out var toMetadata);
+
+        return (from.IsHistorical, to.IsHistorical) switch
+        {
+            (true, true) => hasFrom && hasTo && fromMetadata.Revision == toMetadata.Revision,
+            (true, false) => hasFrom && !fromMetadata.IsHistorical,
+            (false, true) => hasTo && !toMetadata.IsHistorical,
+            _ => true
+        };
+    }
+
+    private static string? GetItemRevision(ModuleSnapshot snapshot, string workItemId)
+    {
+        return TryGetMetadata(snapshot, workItemId, out var metadata) ? metadata.Revision : null;
+    }
+
+    private static bool TryGetMetadata(
+        ModuleSnapshot snapshot,
+        string workItemId,
+        out (string Revision, string HeadRevision, bool IsHistorical) metadata)
+    {
+        if (snapshot.RevisionMetadata != null && snapshot.RevisionMetadata.TryGetValue(workItemId, out metadata))
+        {
+            return true;
+        }
+
+        metadata = default;
+        return false;
+    }
+
+    /// <summary>
+    /// The first outline node of each work item ID; a module lists a work item only once, but the lookup must
+    /// not fail if Polarion returns a duplicate.
+    /// </summary>
+    private static Dictionary<string, OutlineNode> IndexNodes(DocumentOutline outline)
+    {
+        var nodes = new Dictionary<string, OutlineNode>(StringComparer.Ordinal);
+        foreach (var node in outline.Nodes)
+        {
+            if (node.WorkItem.id != null)
+            {
+                nodes.TryAdd(node.WorkItem.id, node);
+            }
+        }
+
+        return nodes;
+    }
+
+    private static Dictionary<string, string?> GetCustomFields(WorkItem workItem)
+    {
+        var fields = new Dictionary<string, string?>(StringComparer.Ordinal);
+        if (workItem.customFields == null)
+        {
+            return fields;
+        }
+
+        foreach (var customField in workItem.customFields)
+        {
+            if (customField?.key != null)
+            {
+                fields.TryAdd(customField.key, customField.value == null ? null : Utils.PolarionValueToString(customField.value, null));
+            }
+        }
+
+        return fields;
+    }
+
+    private static void AddIfChanged(List<WorkItemFieldChange> changes, string field, string? from, string? to)
+    {
+        if (!string.Equals(from, to, StringComparison.Ordinal))
+        {
+            changes.Add(new WorkItemFieldChange(field, from, to));
+        }
+    }
+
+    private static string[] SplitLines(string? text)
+    {
+        return string.IsNullOrEmpty(text)
+            ? Array.Empty<string>()
+            : text.ReplaceLineEndings("\n").TrimEnd('\n').Split('\n');
+    }
+
+    /// <summary>
+    /// Positions in <paramref name="values"/> of one longest strictly increasing subsequence (patience sorting).
+    /// </summary>
+    private static List<int> LongestIncreasingSubsequence(IReadOnlyList<int> values)
+    {
+        // tails[k] is the position of the smallest value ending an increasing run of length k + 1
+        var tails = new List<int>();
+        var previous = new int[values.Count];
+
+        for (var i = 0; i < values.Count; i++)
+        {
+            int low = 0, high = tails.Count;
+            while (low < high)
+            {
+                var mid = (low + high) / 2;
+                if (values[tails[mid]] < values[i])
+                {
+                    low = mid + 1;
+                }
+                else
+                {
+                    high = mid;
+                }
+            }
+
+            previous[i] = low > 0 ? tails[low - 1] : -1;
+            if (low == tails.Count)
+            {
+                tails.Add(i);
+            }
+            else
+            {
+                tails[low] = i;
+            }
+        }
+
+        var result = new List<int>(tails.Count);
+        for (var i = tails.Count > 0 ? tails[^1] : -1; i >= 0; i = previous[i])
+        {
+            result.Add(i);
+        }
+
+        result.Reverse();
+        return result;
+    }
+}
@@ -0,0 +1,97 @@
+namespace PolarionMcpTools;
+
+public sealed record HistoricalWorkItemCacheStatistics(
+    int Entries,
+    long EstimatedBytes,
+    long MaxBytes,
+    long Hits,
+    long Misses,
+    long Evictions);
+
+/// <summary>
+/// Process-wide, memory-bounded LRU cache of work items at a specific revision, keyed by
+/// (project, work item ID, revision). The content of a work item at a given revision never changes, so entries
+/// never expire. Historical module snapshots, revision history reads and <c>get_workitem</c> revision lookups
+/// all feed the cache, and snapshots of neighbouring baselines share the work item instances they have in common.
+/// </summary>
+public sealed class HistoricalWorkItemCache
+{
+    private readonly LruCache<string, WorkItem> _cache;
+    private readonly bool _enabled;
+    private long _hits;
+    private long _misses;
+
+    public HistoricalWorkItemCache(PolarionCacheConfig cacheConfig)
+    {
+        _enabled = cacheConfig.HistoricalWorkItemMaxMegabytes > 0;
+        _cache = new LruCache<string, WorkItem>(Math.Max(1, cacheConfig.HistoricalWorkItemMaxMegabytes) * 1024L * 1024L, StringComparer.Ordinal);
+    }
+
+    /// <summary>
+    /// Stores a work item known to be the content of <paramref name="workItemId"/> at <paramref name="revision"/>,
+    /// returning the instance already cached for that key if there is one.
+    /// </summary>
+    public WorkItem Intern(string projectKey, string workItemId, string revision, WorkItem workItem)
+    {
+        if (!_enabled || string.IsNullOrEmpty(revision) || revision == "-1")
+        {
+            return workItem;
+        }
+
+        var key = BuildKey(projectKey, workItemId, revision);
+        if (_cache.TryGet(key, out var cached))
+        {
+            return cached;
+        }
+
+        _cache.Set(key, workItem, EstimateSize(workItem));
+        return workItem;
+    }
+
+    /// <summary>
+    /// Gets a work item at a revision, fetching it from Polarion on a miss. Failed lookups are not cached.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public async Task<Result<WorkItem>> GetAsync(IPolarionClient polarionClient, string projectKey, string workItemId, string revision)
+    {
+        if (_enabled && _cache.TryGet(BuildKey(projectKey, workItemId, revision), out var cached))
+        {
+            Interlocked.Increment(ref _hits);
+            return Result.Ok(cached);
+        }
+
+        Interlocked.Increment(ref _misses);
+        var fetchResult = await polarionClient.GetWorkItemByIdAsync(workItemId, revision);
+        if (fetchResult.IsFailed)
+        {
+            return Result.Fail(fetchResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        return fetchResult.Value != null
+            ? Result.Ok(Intern(projectKey, workItemId, revision, fetchResult.Value))
+            : Result.Fail<WorkItem>($"WorkItem '{workItemId}' not found at revision '{revision}'.");
+    }
+
+    public HistoricalWorkItemCacheStatistics GetStatistics()
+    {
+        return new HistoricalWorkItemCacheStatistics(
+            _cache.Count,
+            _cache.CurrentSize,
+            _cache.MaxSize,
+            Interlocked.Read(ref _hits),
+            Interlocked.Read(ref _misses),
+            _cache.Evictions);
+    }
+
+    private static long EstimateSize(WorkItem workItem)
+    {
+        // Fixed overhead for the object graph plus UTF-16 text of the large string fields
+        return 512 + 2L * ((workItem.id?.Length ?? 0) + (workItem.title?.Length ?? 0) +
+                           (workItem.outlineNumber?.Length ?? 0) + (workItem.description?.content?.Length ?? 0));
+    }
+
+    private static string BuildKey(string projectKey, string workItemId, string revision)
+    {
+        return $"{projectKey}\n{workItemId}\n{revision}";
+    }
+}
@@ -0,0 +1,111 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Reflection;
+using System.Runtime.ExceptionServices;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// <see cref="IPolarionClient"/> decorator that times every call to the Polarion server and reports it to
+/// <see cref="PolarionMetrics"/>. A call counts as failed if it throws or returns a failed FluentResults result.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class InstrumentedPolarionClient : DispatchProxy
+{
+    private static readonly MethodInfo IsFailedResultDefinition = typeof(InstrumentedPolarionClient)
+        .GetMethod(nameof(IsFailedResult), BindingFlags.Static | BindingFlags.NonPublic)!;
+
+    private static readonly ConcurrentDictionary<Type, Func<Task, bool>?> FailureChecks = new();
+
+    private IPolarionClient _inner = null!;
+
+    /// <summary>
+    /// Wraps a client so its calls are measured.
+    /// </summary>
+    public static IPolarionClient Wrap(IPolarionClient inner)
+    {
+        var proxy = Create<IPolarionClient, InstrumentedPolarionClient>();
+        ((InstrumentedPolarionClient)(object)proxy)._inner = inner;
+        return proxy;
+    }
+
+    protected override object? Invoke(MethodInfo? targetMethod, object?[]? args)
+    {
+        ArgumentNullException.ThrowIfNull(targetMethod);
+
+        if (!typeof(Task).IsAssignableFrom(targetMethod.ReturnType))
+        {
+            return Forward(targetMethod, args);
+        }
+
+        var operation = targetMethod.Name;
+        var failureCheck = GetFailureCheck(targetMethod.ReturnType);
+        var startTimestamp = Stopwatch.GetTimestamp();
+        PolarionMetrics.AddActiveClientCall(operation, 1);
+
+        Task task;
+        try
+        {
+            task = (Task)Forward(targetMethod, args)!;
+        }
+        catch
+        {
+            PolarionMetrics.AddActiveClientCall(operation, -1);
+            PolarionMetrics.RecordClientCall(operation, Stopwatch.GetElapsedTime(startTimestamp), failed: true);
+            throw;
+        }
+
+        task.ContinueWith(
+            completed =>
+            {
+                PolarionMetrics.AddActiveClientCall(operation, -1);
+                PolarionMetrics.RecordClientCall(operation, Stopwatch.GetElapsedTime(startTimestamp), IsFailed(completed, failureCheck));
+            },
+            CancellationToken.None,
+            TaskContinuationOptions.ExecuteSynchronously,
+            TaskScheduler.Default);
+
+        return task;
+    }
+
+    private object? Forward(MethodInfo targetMethod, object?[]? args)
+    {
+        try
+        {
+            return targetMethod.Invoke(_inner, args);
+        }
+        catch (TargetInvocationException ex) when (ex.InnerException != null)
+        {
+            ExceptionDispatchInfo.Capture(ex.InnerException).Throw();
+            throw;
+        }
+    }
+
+    private static bool IsFailed(Task task, Func<Task, bool>? failureCheck)
+    {
+        if (task.Status != TaskStatus.RanToCompletion)
+        {
+            return true;
+        }
+
+        return failureCheck?.Invoke(task) ?? false;
+    }
+
+    /// <summary>
+    /// Gets the check for a failed result of a method returning <paramref name="returnType"/>, or null if the
+    /// method returns a plain <see cref="Task"/>. Client methods return <c>Task&lt;Result&lt;T&gt;&gt;</c>; the
+    /// check is a typed delegate built once per return type, so the result is read without reflection.
+    /// </summary>
+    private static Func<Task, bool>? GetFailureCheck(Type returnType)
+    {
+        return FailureChecks.GetOrAdd(returnType, type =>
+            type.IsGenericType && type.GetGenericTypeDefinition() == typeof(Task<>)
+                ? IsFailedResultDefinition.MakeGenericMethod(type.GetGenericArguments()[0]).CreateDelegate<Func<Task, bool>>()
+                : null);
+    }
+
+    private static bool IsFailedResult<T>(Task task)
+    {
+        return ((Task<T>)task).Result is IResultBase { IsFailed: true };
+    }
+}
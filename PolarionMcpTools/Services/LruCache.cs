@@ -0,0 +1,130 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// A thread-safe least-recently-used cache bounded by the total size of its entries
+/// rather than by entry count. Entry sizes are supplied by the caller in any consistent unit.
+/// </summary>
+public sealed class LruCache<TKey, TValue> where TKey : notnull
+{
+    private readonly Dictionary<TKey, LinkedListNode<Entry>> _map;
+    private readonly LinkedList<Entry> _recency = new(); // most recently used first
+    private readonly object _lock = new();
+    private readonly long _maxSize;
+    private long _currentSize;
+    private long _evictions;
+
+    public LruCache(long maxSize, IEqualityComparer<TKey>? comparer = null)
+    {
+        _maxSize = Math.Max(1, maxSize);
+        _map = new Dictionary<TKey, LinkedListNode<Entry>>(comparer);
+    }
+
+    public int Count
+    {
+        get { lock (_lock) { return _map.Count; } }
+    }
+
+    public long CurrentSize => Interlocked.Read(ref _currentSize);
+
+    public long MaxSize => _maxSize;
+
+    public long Evictions => Interlocked.Read(ref _evictions);
+
+    public bool TryGet(TKey key, [MaybeNullWhen(false)] out TValue value)
+    {
+        lock (_lock)
+        {
+            if (_map.TryGetValue(key, out var node))
+            {
+                _recency.Remove(node);
+                _recency.AddFirst(node);
+                value = node.Value.Value;
+                return true;
+            }
+        }
+
+        value = default;
+        return false;
+    }
+
+    /// <summary>
+    /// Adds or replaces an entry, evicting least recently used entries until the cache fits.
+    /// Entries larger than the whole cache are not stored.
+    /// </summary>
+    public void Set(TKey key, TValue value, long size)
+    {
+        size = Math.Max(1, size);
+
+        lock (_lock)
+        {
+            if (_map.TryGetValue(key, out var existing))
+            {
+                RemoveNode(existing);
+            }
+
+            if (size > _maxSize)
+            {
+                return;
+            }
+
+            var node = _recency.AddFirst(new Entry(key, value, size));
+            _map[key] = node;
+            Interlocked.Add(ref _currentSize, size);
+
+            while (Interlocked.Read(ref _currentSize) > _maxSize && _recency.Last != null)
+            {
+                RemoveNode(_recency.Last);
+                Interlocked.Increment(ref _evictions);
+            }
+        }
+    }
+
+    public bool Remove(TKey key)
+    {
+        lock (_lock)
+        {
+            if (_map.TryGetValue(key, out var node))
+            {
+                RemoveNode(node);
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    /// <summary>
+    /// Removes every entry whose key matches the predicate.
+    /// </summary>
+    public int RemoveWhere(Func<TKey, bool> predicate)
+    {
+        lock (_lock)
+        {
+            var matches = _map.Where(kvp => predicate(kvp.Key)).Select(kvp => kvp.Value).ToList();
+            foreach (var node in matches)
+            {
+                RemoveNode(node);
+            }
+            return matches.Count;
+        }
+    }
+
+    public void Clear()
+    {
+        lock (_lock)
+        {
+            _map.Clear();
+            _recency.Clear();
+            Interlocked.Exchange(ref _currentSize, 0);
+        }
+    }
+
+    private void RemoveNode(LinkedListNode<Entry> node)
+    {
+        _recency.Remove(node);
+        _map.Remove(node.Value.Key);
+        Interlocked.Add(ref _currentSize, -node.Value.Size);
+    }
+
+    private sealed record Entry(TKey Key, TValue Value, long Size);
+}
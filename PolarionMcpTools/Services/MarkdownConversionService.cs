@@ -0,0 +1,123 @@
+using System.Diagnostics;
+using System.Security.Cryptography;
+
+namespace PolarionMcpTools;
+
+public sealed record MarkdownConversionStatistics(
+    long Conversions,
+    double TotalConversionMilliseconds,
+    long CacheHits,
+    long CacheMisses,
+    int CachedEntries,
+    long CachedBytes,
+    long Evictions)
+{
+    public double AverageConversionMilliseconds => Conversions == 0 ? 0 : TotalConversionMilliseconds / Conversions;
+
+    public double CacheHitRate => CacheHits + CacheMisses == 0 ? 0 : (double)CacheHits / (CacheHits + CacheMisses);
+}
+
+/// <summary>
+/// Process-wide HTML to Markdown conversion. Reuses one <see cref="ReverseMarkdown.Converter"/> per thread and caches
+/// converted Markdown in a size-bounded LRU keyed by a SHA-256 hash of the input, so descriptions read again by
+/// outline, section or search calls are converted only once.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class MarkdownConversionService
+{
+    private readonly ThreadLocal<ReverseMarkdown.Converter> _converter = new(() => new ReverseMarkdown.Converter());
+    private readonly LruCache<string, string> _cache;
+    private readonly bool _enabled;
+    private long _conversions;
+    private long _conversionTicks;
+    private long _hits;
+    private long _misses;
+
+    public MarkdownConversionService(PolarionCacheConfig cacheConfig)
+    {
+        _enabled = cacheConfig.MarkdownMaxMegabytes > 0;
+        _cache = new LruCache<string, string>(Math.Max(1, cacheConfig.MarkdownMaxMegabytes) * 1024L * 1024L, StringComparer.Ordinal);
+    }
+
+    /// <summary>
+    /// Converts an HTML fragment to Markdown.
+    /// </summary>
+    public string ConvertHtml(string html)
+    {
+        if (string.IsNullOrEmpty(html))
+        {
+            return string.Empty;
+        }
+
+        return GetOrConvert("html\n" + html, () => _converter.Value!.Convert(html));
+    }
+
+    /// <summary>
+    /// Converts a work item to Markdown with <see cref="IPolarionClient.ConvertWorkItemToMarkdown"/>.
+    /// The cache key covers the work item ID, its last-updated stamp, title and description, so an edited
+    /// work item is converted again.
+    /// </summary>
+    public string ConvertWorkItem(IPolarionClient polarionClient, string workItemId, WorkItem workItem)
+    {
+        var updated = workItem.updatedSpecified ? workItem.updated.Ticks : 0;
+        var key = $"workitem\n{workItemId}\n{updated}\n{workItem.title}\n{workItem.description?.content}";
+
+        return GetOrConvert(key, () => polarionClient.ConvertWorkItemToMarkdown(workItemId, workItem));
+    }
+
+    /// <summary>
+    /// Same as <see cref="Utils.PolarionValueToString"/>, with rich text converted through the shared cache.
+    /// </summary>
+    public string ValueToString(object? value)
+    {
+        if (value is Text text)
+        {
+            try
+            {
+                return $"\n\n{ConvertHtml(text.content?.ToString() ?? string.Empty)}\n";
+            }
+            catch (Exception ex)
+            {
+                return $"ERROR: Failed to convert Text value to markdown due to exception: {ex.Message}";
+            }
+        }
+
+        return Utils.PolarionValueToString(value, null);
+    }
+
+    public MarkdownConversionStatistics GetStatistics()
+    {
+        return new MarkdownConversionStatistics(
+            Interlocked.Read(ref _conversions),
+            TimeSpan.FromTicks(Interlocked.Read(ref _conversionTicks)).TotalMilliseconds,
+            Interlocked.Read(ref _hits),
+            Interlocked.Read(ref _misses),
+            _cache.Count,
+            _cache.CurrentSize,
+            _cache.Evictions);
+    }
+
+    private string GetOrConvert(string input, Func<string> convert)
+    {
+        var key = _enabled ? Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(input))) : string.Empty;
+        if (_enabled && _cache.TryGet(key, out var cached))
+        {
+            Interlocked.Increment(ref _hits);
+            return cached;
+        }
+
+        Interlocked.Increment(ref _misses);
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+        var markdown = convert() ?? string.Empty;
+        Interlocked.Add(ref _conversionTicks, Stopwatch.GetElapsedTime(startTimestamp).Ticks);
+        Interlocked.Increment(ref _conversions);
+
+        if (_enabled)
+        {
+            _cache.Set(key, markdown, 2L * markdown.Length + 128);
+        }
+
+        return markdown;
+    }
+}
@@ -0,0 +1,303 @@
+using System.Net;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Inverted index over the titles and descriptions of one module snapshot. Text is HTML-stripped, lowercased
+/// and split into letter/digit tokens; each term's posting list records the work items it occurs in and the
+/// token positions, so AND, OR and phrase queries are answered without rescanning the text.
+/// The index is read-only once built and safe to share between requests.
+/// </summary>
+public sealed class ModuleSearchIndex
+{
+    /// <summary>
+    /// How much more a hit in the title counts than a hit in the description when ranking.
+    /// </summary>
+    public const int TitleWeight = 2;
+
+    private readonly List<WorkItem> _workItems = new();
+    private readonly List<int> _titleTokenCounts = new();
+    private readonly Dictionary<string, List<Posting>> _postings = new(StringComparer.Ordinal);
+
+    public ModuleSearchIndex(IEnumerable<WorkItem?> workItems)
+    {
+        foreach (var workItem in workItems)
+        {
+            if (workItem == null)
+            {
+                continue;
+            }
+
+            var itemIndex = _workItems.Count;
+            var titleTokens = Tokenize(workItem.title ?? string.Empty);
+            var descriptionTokens = Tokenize(StripHtml(workItem.description?.content ?? string.Empty));
+
+            _workItems.Add(workItem);
+            _titleTokenCounts.Add(titleTokens.Count);
+
+            // Title and description form one token stream, so a phrase may run from the title into the description
+            var position = 0;
+            foreach (var token in titleTokens.Concat(descriptionTokens))
+            {
+                AddPosting(token, itemIndex, position++);
+            }
+        }
+    }
+
+    /// <summary>
+    /// The number of indexed work items.
+    /// </summary>
+    public int Count => _workItems.Count;
+
+    /// <summary>
+    /// The number of distinct terms in the index.
+    /// </summary>
+    public int TermCount => _postings.Count;
+
+    /// <summary>
+    /// Finds the work items matching the query terms, ranked by TF-IDF with title hits weighted by
+    /// <see cref="TitleWeight"/>; equal scores keep module order. A term matches inside words as the previous
+    /// substring search did, and a term of several words (e.g. "voltage regulator") matches them as a phrase.
+    /// Terms without any letters or digits are ignored.
+    /// </summary>
+    /// <param name="terms">The search terms.</param>
+    /// <param name="matchAll">True if every term must match (AND), false if any term may match (OR).</param>
+    public IReadOnlyList<WorkItem> Search(IReadOnlyList<string> terms, bool matchAll)
+    {
+        Dictionary<int, double>? scores = null;
+
+        foreach (var term in terms)
+        {
+            var tokens = Tokenize(term);
+            if (tokens.Count == 0)
+            {
+                continue;
+            }
+
+            var termFrequencies = MatchTokens(tokens);
+            if (matchAll && termFrequencies.Count == 0)
+            {
+                return Array.Empty<WorkItem>();
+            }
+
+            var inverseDocumentFrequency = termFrequencies.Count == 0
+                ? 0
+                : Math.Log(1.0 + (double)_workItems.Count / termFrequencies.Count);
+
+            if (scores == null)
+            {
+                scores = termFrequencies.ToDictionary(entry => entry.Key, entry => entry.Value * inverseDocumentFrequency);
+                continue;
+            }
+
+            if (matchAll)
+            {
+                foreach (var itemIndex in scores.Keys.ToList())
+                {
+                    if (termFrequencies.TryGetValue(itemIndex, out var frequency))
+                    {
+                        scores[itemIndex] += frequency * inverseDocumentFrequency;
+                    }
+                    else
+                    {
+                        scores.Remove(itemIndex);
+                    }
+                }
+            }
+            else
+            {
+                foreach (var (itemIndex, frequency) in termFrequencies)
+                {
+                    scores[itemIndex] = scores.GetValueOrDefault(itemIndex) + frequency * inverseDocumentFrequency;
+                }
+            }
+        }
+
+        if (scores == null || scores.Count == 0)
+        {
+            return Array.Empty<WorkItem>();
+        }
+
+        return scores
+            .OrderByDescending(entry => entry.Value)
+            .ThenBy(entry => entry.Key)
+            .Select(entry => _workItems[entry.Key])
+            .ToList();
+    }
+
+    /// <summary>
+    /// Splits text into lowercase runs of letters and digits.
+    /// </summary>
+    public static List<string> Tokenize(string text)
+    {
+        var tokens = new List<string>();
+        var start = -1;
+
+        for (var i = 0; i <= text.Length; i++)
+        {
+            var isTokenChar = i < text.Length && char.IsLetterOrDigit(text[i]);
+            if (isTokenChar && start < 0)
+            {
+                start = i;
+            }
+            else if (!isTokenChar && start >= 0)
+            {
+                tokens.Add(text[start..i].ToLowerInvariant());
+                start = -1;
+            }
+        }
+
+        return tokens;
+    }
+
+    /// <summary>
+    /// Removes HTML tags and decodes character entities, leaving the visible text.
+    /// </summary>
+    public static string StripHtml(string html)
+    {
+        if (html.IndexOf('<') < 0 && html.IndexOf('&') < 0)
+        {
+            return html;
+        }
+
+        var text = new StringBuilder(html.Length);
+        var inTag = false;
+
+        foreach (var c in html)
+        {
+            if (c == '<')
+            {
+                inTag = true;
+                text.Append(' ');
+            }
+            else if (c == '>' && inTag)
+            {
+                inTag = false;
+            }
+            else if (!inTag)
+            {
+                text.Append(c);
+            }
+        }
+
+        return WebUtility.HtmlDecode(text.ToString());
+    }
+
+    /// <summary>
+    /// Returns the weighted number of occurrences per work item of a single token, or of several tokens as a phrase.
+    /// </summary>
+    private Dictionary<int, double> MatchTokens(List<string> tokens)
+    {
+        // A single token may occur anywhere inside a word. In a phrase the first token may end a word,
+        // the last token may start one, and tokens in between must match whole words.
+        var positionSets = new List<Dictionary<int, HashSet<int>>>(tokens.Count);
+        for (var i = 0; i < tokens.Count; i++)
+        {
+            var token = tokens[i];
+            IEnumerable<List<Posting>> postingLists;
+
+            if (tokens.Count > 1 && i > 0 && i < tokens.Count - 1)
+            {
+                postingLists = _postings.TryGetValue(token, out var exactPostings) ? new[] { exactPostings } : Array.Empty<List<Posting>>();
+            }
+            else
+            {
+                Func<string, bool> matches = tokens.Count == 1
+                    ? term => term.Contains(token, StringComparison.Ordinal)
+                    : i == 0
+                        ? term => term.EndsWith(token, StringComparison.Ordinal)
+                        : term => term.StartsWith(token, StringComparison.Ordinal);
+
+                // Partial matches need a pass over the vocabulary, which is far smaller than the text of the module
+                postingLists = _postings.Where(entry => matches(entry.Key)).Select(entry => entry.Value);
+            }
+
+            var positions = CollectPositions(postingLists);
+            if (positions.Count == 0)
+            {
+                return new Dictionary<int, double>();
+            }
+
+            positionSets.Add(positions);
+        }
+
+        var frequencies = new Dictionary<int, double>();
+        foreach (var (itemIndex, firstPositions) in positionSets[0])
+        {
+            var titleTokenCount = _titleTokenCounts[itemIndex];
+            double frequency = 0;
+
+            foreach (var position in firstPositions)
+            {
+                var isPhrase = true;
+                for (var offset = 1; offset < positionSets.Count && isPhrase; offset++)
+                {
+                    isPhrase = positionSets[offset].TryGetValue(itemIndex, out var nextPositions)
+                        && nextPositions.Contains(position + offset);
+                }
+
+                if (isPhrase)
+                {
+                    frequency += position < titleTokenCount ? TitleWeight : 1;
+                }
+            }
+
+            if (frequency > 0)
+            {
+                frequencies[itemIndex] = frequency;
+            }
+        }
+
+        return frequencies;
+    }
+
+    private static Dictionary<int, HashSet<int>> CollectPositions(IEnumerable<List<Posting>> postingLists)
+    {
+        var positions = new Dictionary<int, HashSet<int>>();
+
+        foreach (var postings in postingLists)
+        {
+            foreach (var posting in postings)
+            {
+                if (!positions.TryGetValue(posting.ItemIndex, out var itemPositions))
+                {
+                    itemPositions = new HashSet<int>();
+                    positions[posting.ItemIndex] = itemPositions;
+                }
+
+                itemPositions.UnionWith(posting.Positions);
+            }
+        }
+
+        return positions;
+    }
+
+    private void AddPosting(string token, int itemIndex, int position)
+    {
+        if (!_postings.TryGetValue(token, out var postings))
+        {
+            postings = new List<Posting>();
+            _postings[token] = postings;
+        }
+
+        // Tokens are added item by item, so an existing posting for this item is always the last one
+        if (postings.Count == 0 || postings[^1].ItemIndex != itemIndex)
+        {
+            postings.Add(new Posting(itemIndex));
+        }
+
+        postings[^1].Positions.Add(position);
+    }
+
+    private sealed class Posting
+    {
+        public Posting(int itemIndex)
+        {
+            ItemIndex = itemIndex;
+        }
+
+        public int ItemIndex { get; }
+
+        public List<int> Positions { get; } = new();
+    }
+}
@@ -0,0 +1,306 @@
+using System.Collections.Concurrent;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// The work items of one module (document) at one revision, as returned by Polarion.
+/// Snapshots are shared between requests and must be treated as read-only.
+/// </summary>
+public sealed class ModuleSnapshot
+{
+    private readonly Lazy<ModuleSearchIndex> _searchIndex;
+    private readonly Lazy<DocumentOutline> _outline;
+
+    public ModuleSnapshot(
+        string space,
+        string documentId,
+        string revision,
+        WorkItem[] workItems,
+        IReadOnlyDictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata)
+    {
+        Space = space;
+        DocumentId = documentId;
+        Revision = revision;
+        WorkItems = workItems;
+        RevisionMetadata = revisionMetadata;
+        LoadedUtc = DateTime.UtcNow;
+        EstimatedSize = EstimateSize(workItems);
+        _searchIndex = new Lazy<ModuleSearchIndex>(() => new ModuleSearchIndex(workItems));
+        _outline = new Lazy<DocumentOutline>(() => new DocumentOutline(workItems));
+    }
+
+    public string Space { get; }
+
+    public string DocumentId { get; }
+
+    /// <summary>
+    /// The document revision, or "-1" for the latest (HEAD) revision.
+    /// </summary>
+    public string Revision { get; }
+
+    public bool IsHistorical => Revision != "-1";
+
+    public WorkItem[] WorkItems { get; }
+
+    /// <summary>
+    /// Per work item revision information for historical snapshots, keyed by work item ID. Null for HEAD.
+    /// </summary>
+    public IReadOnlyDictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? RevisionMetadata { get; }
+
+    public DateTime LoadedUtc { get; }
+
+    /// <summary>
+    /// Rough number of bytes held by this snapshot, used to bound the cache.
+    /// </summary>
+    public long EstimatedSize { get; }
+
+    /// <summary>
+    /// Full-text index over the titles and descriptions of <see cref="WorkItems"/>, built on first use
+    /// and kept for as long as the snapshot is cached.
+    /// </summary>
+    public ModuleSearchIndex SearchIndex => _searchIndex.Value;
+
+    /// <summary>
+    /// Outline hierarchy of <see cref="WorkItems"/>, built on first use and kept for as long as the snapshot is cached.
+    /// </summary>
+    public DocumentOutline Outline => _outline.Value;
+
+    /// <summary>
+    /// Returns the work items whose type is one of <paramref name="typeList"/>, or all work items when no types are given.
+    /// </summary>
+    public WorkItem[] FilterByTypes(IReadOnlyCollection<string>? typeList)
+    {
+        if (typeList == null || typeList.Count == 0)
+        {
+            return WorkItems;
+        }
+
+        var types = new HashSet<string>(typeList, StringComparer.OrdinalIgnoreCase);
+        return WorkItems
+            .Where(wi => wi?.type?.id != null && types.Contains(wi.type.id))
+            .ToArray();
+    }
+
+    private static long EstimateSize(WorkItem[] workItems)
+    {
+        long size = 1024;
+        foreach (var wi in workItems)
+        {
+            if (wi == null)
+            {
+                continue;
+            }
+
+            // Fixed overhead for the object graph plus UTF-16 text of the large string fields,
+            // counted twice to leave room for the search index built over the same text
+            size += 512;
+            size += 4L * ((wi.id?.Length ?? 0) + (wi.title?.Length ?? 0) + (wi.outlineNumber?.Length ?? 0) + (wi.description?.content?.Length ?? 0));
+        }
+        return size;
+    }
+}
+
+public sealed record ModuleSnapshotCacheStatistics(
+    int Entries,
+    long EstimatedBytes,
+    long MaxBytes,
+    long Hits,
+    long Misses,
+    long Evictions);
+
+/// <summary>
+/// Process-wide, memory-bounded LRU cache of module work item snapshots keyed by
+/// (project, space, document, revision). Historical revisions are immutable and never expire;
+/// the latest (HEAD) revision is reused for <see cref="PolarionCacheConfig.HeadModuleTtlSeconds"/>, except that a
+/// prefetched HEAD snapshot is kept until its first use.
+/// HEAD snapshots always hold every work item type so one fetch serves all type filters.
+/// </summary>
+public class ModuleSnapshotCache
+{
+    private readonly LruCache<string, ModuleSnapshot> _cache;
+    private readonly ConcurrentDictionary<string, byte> _prefetched = new(StringComparer.Ordinal);
+    private readonly HistoricalWorkItemCache _historicalWorkItems;
+    private readonly TimeSpan _headTtl;
+    private readonly bool _enabled;
+    private long _hits;
+    private long _misses;
+
+    public ModuleSnapshotCache(PolarionCacheConfig cacheConfig, HistoricalWorkItemCache historicalWorkItems)
+    {
+        _historicalWorkItems = historicalWorkItems;
+        _enabled = cacheConfig.ModuleSnapshotMaxMegabytes > 0;
+        _cache = new LruCache<string, ModuleSnapshot>(Math.Max(1, cacheConfig.ModuleSnapshotMaxMegabytes) * 1024L * 1024L, StringComparer.Ordinal);
+        _headTtl = TimeSpan.FromSeconds(Math.Max(0, cacheConfig.HeadModuleTtlSeconds));
+    }
+
+    /// <summary>
+    /// Gets the snapshot of a module at the given revision ("-1" for HEAD), loading it from Polarion on a miss.
+    /// Failures carry the Polarion error message unchanged so callers can inspect it.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public Task<Result<ModuleSnapshot>> GetAsync(
+        IPolarionClient polarionClient,
+        string projectKey,
+        string space,
+        string documentId,
+        string revision)
+    {
+        return GetAsync(polarionClient, projectKey, space, documentId, revision, addOnMiss: true);
+    }
+
+    /// <summary>
+    /// Gets the snapshot of a module like <see cref="GetAsync(IPolarionClient, string, string, string, string)"/>,
+    /// but a snapshot loaded on a miss is not added to the cache. For bulk reads such as exports, which would
+    /// otherwise evict the snapshots that interactive requests reuse.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public Task<Result<ModuleSnapshot>> GetWithoutCachingAsync(
+        IPolarionClient polarionClient,
+        string projectKey,
+        string space,
+        string documentId,
+        string revision)
+    {
+        return GetAsync(polarionClient, projectKey, space, documentId, revision, addOnMiss: false);
+    }
+
+    /// <summary>
+    /// Loads the snapshot of a module ahead of use, e.g. during warm-up. A prefetched HEAD snapshot is served to the
+    /// first request for it even when that request comes after <see cref="PolarionCacheConfig.HeadModuleTtlSeconds"/>,
+    /// since a long warm-up would otherwise leave it expired before traffic arrives; after that the TTL applies.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public async Task<Result<ModuleSnapshot>> PrefetchAsync(
+        IPolarionClient polarionClient,
+        string projectKey,
+        string space,
+        string documentId,
+        string revision)
+    {
+        var snapshotResult = await GetAsync(polarionClient, projectKey, space, documentId, revision, addOnMiss: true);
+        if (snapshotResult.IsSuccess && _enabled && !snapshotResult.Value.IsHistorical)
+        {
+            _prefetched[BuildKey(projectKey, space, documentId, snapshotResult.Value.Revision)] = 0;
+        }
+
+        return snapshotResult;
+    }
+
+    /// <summary>
+    /// Drops every cached revision of a module for the given project.
+    /// </summary>
+    public int Invalidate(string projectKey, string space, string documentId)
+    {
+        var prefix = BuildKey(projectKey, space, documentId, string.Empty);
+        foreach (var key in _prefetched.Keys.Where(k => k.StartsWith(prefix, StringComparison.Ordinal)))
+        {
+            _prefetched.TryRemove(key, out _);
+        }
+
+        return _cache.RemoveWhere(k => k.StartsWith(prefix, StringComparison.Ordinal));
+    }
+
+    public ModuleSnapshotCacheStatistics GetStatistics()
+    {
+        return new ModuleSnapshotCacheStatistics(
+            _cache.Count,
+            _cache.CurrentSize,
+            _cache.MaxSize,
+            Interlocked.Read(ref _hits),
+            Interlocked.Read(ref _misses),
+            _cache.Evictions);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private async Task<Result<ModuleSnapshot>> GetAsync(
+        IPolarionClient polarionClient,
+        string projectKey,
+        string space,
+        string documentId,
+        string revision,
+        bool addOnMiss)
+    {
+        if (string.IsNullOrWhiteSpace(revision))
+        {
+            revision = "-1";
+        }
+
+        var key = BuildKey(projectKey, space, documentId, revision);
+        var prefetched = _prefetched.TryRemove(key, out _);
+        if (_enabled && _cache.TryGet(key, out var cached))
+        {
+            if (cached.IsHistorical || prefetched || DateTime.UtcNow - cached.LoadedUtc < _headTtl)
+            {
+                Interlocked.Increment(ref _hits);
+                return Result.Ok(cached);
+            }
+
+            _cache.Remove(key);
+        }
+
+        Interlocked.Increment(ref _misses);
+
+        var snapshotResult = await LoadAsync(polarionClient, projectKey, space, documentId, revision);
+        if (snapshotResult.IsSuccess && _enabled && addOnMiss)
+        {
+            _cache.Set(key, snapshotResult.Value, snapshotResult.Value.EstimatedSize);
+        }
+
+        return snapshotResult;
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private async Task<Result<ModuleSnapshot>> LoadAsync(
+        IPolarionClient polarionClient,
+        string projectKey,
+        string space,
+        string documentId,
+        string revision)
+    {
+        if (revision == "-1")
+        {
+            var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(space, documentId, null);
+            if (workItemsResult.IsFailed)
+            {
+                return Result.Fail(workItemsResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+            }
+
+            return Result.Ok(new ModuleSnapshot(space, documentId, revision, workItemsResult.Value ?? Array.Empty<WorkItem>(), null));
+        }
+
+        var revisionResult = await polarionClient.GetWorkItemsByModuleRevisionAsync(space, documentId, revision);
+        if (revisionResult.IsFailed)
+        {
+            return Result.Fail(revisionResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var wiInfoArray = revisionResult.Value ?? [];
+        var revisionMetadata = new Dictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>();
+        var workItems = new List<WorkItem>(wiInfoArray.Length);
+        foreach (var wiInfo in wiInfoArray)
+        {
+            if (wiInfo?.WorkItem == null)
+            {
+                continue;
+            }
+
+            var workItem = wiInfo.WorkItem;
+            if (workItem.id != null)
+            {
+                revisionMetadata[workItem.id] = (wiInfo.Revision, wiInfo.HeadRevision, wiInfo.IsHistorical);
+
+                // Share work item instances with other baselines that resolved the same (id, revision)
+                workItem = _historicalWorkItems.Intern(projectKey, workItem.id, wiInfo.Revision, workItem);
+            }
+
+            workItems.Add(workItem);
+        }
+
+        return Result.Ok(new ModuleSnapshot(space, documentId, revision, workItems.ToArray(), revisionMetadata));
+    }
+
+    private static string BuildKey(string projectKey, string space, string documentId, string revision)
+    {
+        return $"{projectKey}\n{space}\n{documentId}\n{revision}";
+    }
+}
@@ -0,0 +1,256 @@
+using System.Diagnostics;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// The priority lane a Polarion call waits in when its project's <see cref="PolarionBulkhead"/> is saturated.
+/// </summary>
+public enum PolarionCallLane
+{
+    /// <summary>
+    /// Cheap point lookups (single work items, searches, revisions). Served first when a slot frees up.
+    /// </summary>
+    Point,
+
+    /// <summary>
+    /// Bulk module pulls. Limited to <see cref="PolarionConcurrencyConfig.MaxBulkConcurrency"/> slots so point
+    /// lookups always have capacity left.
+    /// </summary>
+    Bulk
+}
+
+/// <summary>
+/// Why a call was turned away by a <see cref="PolarionBulkhead"/>.
+/// </summary>
+public enum PolarionThrottleReason
+{
+    /// <summary>
+    /// The wait queue already held <see cref="PolarionConcurrencyConfig.MaxQueueLength"/> calls.
+    /// </summary>
+    QueueFull,
+
+    /// <summary>
+    /// The call waited <see cref="PolarionConcurrencyConfig.QueueTimeoutSeconds"/> without getting a slot.
+    /// </summary>
+    QueueTimeout
+}
+
+/// <summary>
+/// Thrown when a project's Polarion calls are throttled by its <see cref="PolarionBulkhead"/>.
+/// The REST API answers it with <c>429 Too Many Requests</c> or <c>503 Service Unavailable</c>.
+/// </summary>
+public sealed class PolarionThrottledException : Exception
+{
+    public PolarionThrottledException(string projectId, PolarionThrottleReason reason, TimeSpan retryAfter, string message)
+        : base(message)
+    {
+        ProjectId = projectId;
+        Reason = reason;
+        RetryAfter = retryAfter;
+    }
+
+    public string ProjectId { get; }
+
+    public PolarionThrottleReason Reason { get; }
+
+    /// <summary>
+    /// How long the caller should wait before trying again.
+    /// </summary>
+    public TimeSpan RetryAfter { get; }
+}
+
+/// <summary>
+/// Point-in-time counters of a single project bulkhead.
+/// </summary>
+public sealed record PolarionBulkheadStatistics(
+    string ProjectId,
+    int Active,
+    int ActiveBulk,
+    int QueuedPoint,
+    int QueuedBulk,
+    int MaxConcurrency,
+    long Rejected);
+
+/// <summary>
+/// Per-project concurrency governor for calls to the Polarion server. At most
+/// <see cref="PolarionConcurrencyConfig.MaxConcurrency"/> calls run at once; further calls wait in a bounded
+/// queue with two priority lanes, and are rejected with <see cref="PolarionThrottledException"/> when the queue
+/// is full or their wait times out. Point lookups are always dispatched before bulk module pulls, and bulk
+/// pulls never take the slots reserved for point lookups.
+/// </summary>
+public sealed class PolarionBulkhead
+{
+    private readonly object _lock = new();
+    private readonly LinkedList<TaskCompletionSource> _pointQueue = new();
+    private readonly LinkedList<TaskCompletionSource> _bulkQueue = new();
+    private readonly string _projectId;
+    private readonly int _maxConcurrency;
+    private readonly int _maxBulkConcurrency;
+    private readonly int _maxQueueLength;
+    private readonly TimeSpan _queueTimeout;
+    private readonly TimeSpan _retryAfter;
+    private int _active;
+    private int _activeBulk;
+    private long _rejected;
+
+    public PolarionBulkhead(string projectId, PolarionConcurrencyConfig options)
+    {
+        _projectId = projectId;
+        _maxConcurrency = Math.Max(1, options.MaxConcurrency);
+        _maxBulkConcurrency = Math.Clamp(options.MaxBulkConcurrency, 1, _maxConcurrency);
+        _maxQueueLength = Math.Max(0, options.MaxQueueLength);
+        _queueTimeout = TimeSpan.FromSeconds(Math.Max(1, options.QueueTimeoutSeconds));
+        _retryAfter = TimeSpan.FromSeconds(Math.Max(1, options.RetryAfterSeconds));
+    }
+
+    /// <summary>
+    /// Takes a slot if one is free and no call of the same lane is already waiting.
+    /// </summary>
+    /// <returns>True if the caller holds a slot and must call <see cref="Exit"/> when done.</returns>
+    public bool TryEnter(PolarionCallLane lane)
+    {
+        lock (_lock)
+        {
+            if (GetQueue(lane).Count > 0 || !HasFreeSlot(lane))
+            {
+                return false;
+            }
+
+            Take(lane);
+            return true;
+        }
+    }
+
+    /// <summary>
+    /// Takes a slot, waiting in the lane's queue if none is free.
+    /// The caller must call <see cref="Exit"/> when done.
+    /// </summary>
+    /// <exception cref="PolarionThrottledException">The queue is full or the wait timed out.</exception>
+    public async Task EnterAsync(PolarionCallLane lane)
+    {
+        TaskCompletionSource waiter;
+        LinkedListNode<TaskCompletionSource> node;
+        var laneName = GetLaneName(lane);
+
+        lock (_lock)
+        {
+            var queue = GetQueue(lane);
+            if (queue.Count == 0 && HasFreeSlot(lane))
+            {
+                Take(lane);
+                return;
+            }
+
+            if (_pointQueue.Count + _bulkQueue.Count >= _maxQueueLength)
+            {
+                _rejected++;
+                PolarionMetrics.RecordBulkheadRejection(_projectId, laneName, "queue_full");
+                throw new PolarionThrottledException(_projectId, PolarionThrottleReason.QueueFull, _retryAfter,
+                    $"Polarion project '{_projectId}' is busy: {_maxConcurrency} calls are running and {_maxQueueLength} are queued. Retry after {_retryAfter.TotalSeconds}s.");
+            }
+
+            waiter = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+            node = queue.AddLast(waiter);
+            PolarionMetrics.AddBulkheadQueued(_projectId, laneName, 1);
+        }
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+        try
+        {
+            await waiter.Task.WaitAsync(_queueTimeout);
+            PolarionMetrics.RecordBulkheadWait(_projectId, laneName, Stopwatch.GetElapsedTime(startTimestamp), admitted: true);
+        }
+        catch (TimeoutException)
+        {
+            lock (_lock)
+            {
+                if (node.List == null)
+                {
+                    // Dispatched just as the wait timed out; the slot is ours
+                    PolarionMetrics.RecordBulkheadWait(_projectId, laneName, Stopwatch.GetElapsedTime(startTimestamp), admitted: true);
+                    return;
+                }
+
+                node.List.Remove(node);
+                _rejected++;
+                PolarionMetrics.AddBulkheadQueued(_projectId, laneName, -1);
+            }
+
+            PolarionMetrics.RecordBulkheadWait(_projectId, laneName, Stopwatch.GetElapsedTime(startTimestamp), admitted: false);
+            PolarionMetrics.RecordBulkheadRejection(_projectId, laneName, "queue_timeout");
+            throw new PolarionThrottledException(_projectId, PolarionThrottleReason.QueueTimeout, _retryAfter,
+                $"Timed out after {_queueTimeout.TotalSeconds}s waiting for a free Polarion call slot for project '{_projectId}'. Retry after {_retryAfter.TotalSeconds}s.");
+        }
+    }
+
+    /// <summary>
+    /// Releases a slot taken by <see cref="TryEnter"/> or <see cref="EnterAsync"/> and hands it to the next waiting call.
+    /// </summary>
+    public void Exit(PolarionCallLane lane)
+    {
+        lock (_lock)
+        {
+            _active--;
+            if (lane == PolarionCallLane.Bulk)
+            {
+                _activeBulk--;
+            }
+
+            // Point lookups first; bulk pulls only while they are under their own limit
+            while (_active < _maxConcurrency)
+            {
+                var nextLane = _pointQueue.Count > 0 ? PolarionCallLane.Point
+                    : _bulkQueue.Count > 0 && _activeBulk < _maxBulkConcurrency ? PolarionCallLane.Bulk
+                    : (PolarionCallLane?)null;
+                if (nextLane == null)
+                {
+                    break;
+                }
+
+                var queue = GetQueue(nextLane.Value);
+                var waiter = queue.First!.Value;
+                queue.RemoveFirst();
+                PolarionMetrics.AddBulkheadQueued(_projectId, GetLaneName(nextLane.Value), -1);
+
+                Take(nextLane.Value);
+                waiter.TrySetResult();
+            }
+        }
+    }
+
+    /// <summary>
+    /// Gets a point-in-time view of the bulkhead, for diagnostics.
+    /// </summary>
+    public PolarionBulkheadStatistics GetStatistics()
+    {
+        lock (_lock)
+        {
+            return new PolarionBulkheadStatistics(
+                _projectId, _active, _activeBulk, _pointQueue.Count, _bulkQueue.Count, _maxConcurrency, _rejected);
+        }
+    }
+
+    private bool HasFreeSlot(PolarionCallLane lane)
+    {
+        return _active < _maxConcurrency && (lane == PolarionCallLane.Point || _activeBulk < _maxBulkConcurrency);
+    }
+
+    private void Take(PolarionCallLane lane)
+    {
+        _active++;
+        if (lane == PolarionCallLane.Bulk)
+        {
+            _activeBulk++;
+        }
+    }
+
+    private LinkedList<TaskCompletionSource> GetQueue(PolarionCallLane lane)
+    {
+        return lane == PolarionCallLane.Bulk ? _bulkQueue : _pointQueue;
+    }
+
+    private static string GetLaneName(PolarionCallLane lane)
+    {
+        return lane == PolarionCallLane.Bulk ? "bulk" : "point";
+    }
+}
@@ -0,0 +1,83 @@
+using System.Collections.Concurrent;
+
+namespace PolarionMcpTools;
+
+public sealed record PolarionCallCoalescerStatistics(
+    long Executed,
+    long Coalesced,
+    int InFlight,
+    IReadOnlyDictionary<string, long> CoalescedByOperation);
+
+/// <summary>
+/// Single-flight coalescing of identical in-flight Polarion calls. While a call keyed by
+/// (partition, operation, arguments) is running, further identical calls share its task and result
+/// instead of going to Polarion again. Nothing is cached once the call completes.
+/// Shared results are seen by every caller and must be treated as read-only.
+/// </summary>
+public sealed class PolarionCallCoalescer
+{
+    private readonly ConcurrentDictionary<string, Lazy<Task>> _inFlight = new(StringComparer.Ordinal);
+    private readonly ConcurrentDictionary<string, long> _coalescedByOperation = new(StringComparer.Ordinal);
+    private long _executed;
+    private long _coalesced;
+
+    /// <summary>
+    /// Runs <paramref name="call"/>, or joins an identical call that is already running.
+    /// </summary>
+    /// <param name="partitionKey">Separates callers that must not share results, e.g. different servers, users or projects.</param>
+    /// <param name="operation">The operation name; calls of different operations never share a task.</param>
+    /// <param name="arguments">The operation arguments, formatted so that equal arguments give equal strings.</param>
+    /// <param name="call">Starts the upstream call.</param>
+    public Task<T> RunAsync<T>(string partitionKey, string operation, string arguments, Func<Task<T>> call)
+    {
+        return (Task<T>)Run(partitionKey, operation, arguments, () => call());
+    }
+
+    /// <summary>
+    /// Non-generic form of <see cref="RunAsync{T}"/>. The returned task is the one produced by <paramref name="call"/>,
+    /// so it can be cast back to the caller's <c>Task&lt;T&gt;</c>.
+    /// </summary>
+    public Task Run(string partitionKey, string operation, string arguments, Func<Task> call)
+    {
+        var key = $"{partitionKey}\n{operation}\n{arguments}";
+        var candidate = new Lazy<Task>(call, LazyThreadSafetyMode.ExecutionAndPublication);
+        var inFlight = _inFlight.GetOrAdd(key, candidate);
+
+        if (!ReferenceEquals(inFlight, candidate))
+        {
+            Interlocked.Increment(ref _coalesced);
+            _coalescedByOperation.AddOrUpdate(operation, 1, (_, count) => count + 1);
+            return inFlight.Value;
+        }
+
+        Interlocked.Increment(ref _executed);
+
+        Task task;
+        try
+        {
+            task = candidate.Value;
+        }
+        catch
+        {
+            _inFlight.TryRemove(new KeyValuePair<string, Lazy<Task>>(key, candidate));
+            throw;
+        }
+
+        task.ContinueWith(
+            _ => _inFlight.TryRemove(new KeyValuePair<string, Lazy<Task>>(key, candidate)),
+            CancellationToken.None,
+            TaskContinuationOptions.ExecuteSynchronously,
+            TaskScheduler.Default);
+
+        return task;
+    }
+
+    public PolarionCallCoalescerStatistics GetStatistics()
+    {
+        return new PolarionCallCoalescerStatistics(
+            Interlocked.Read(ref _executed),
+            Interlocked.Read(ref _coalesced),
+            _inFlight.Count,
+            new Dictionary<string, long>(_coalescedByOperation, StringComparer.Ordinal));
+    }
+}
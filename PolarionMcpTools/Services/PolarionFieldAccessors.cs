@@ -0,0 +1,69 @@
+using System.Collections.Frozen;
+using System.Reflection;
+using System.Runtime.CompilerServices;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Case-insensitive table of public property getters for a Polarion type (e.g. <see cref="WorkItem"/> or <see cref="Module"/>),
+/// built once per type. Replaces per-item <c>GetType().GetProperties()</c> scans when rendering configured fields.
+/// </summary>
+public static class PolarionFieldAccessors<[DynamicallyAccessedMembers(DynamicallyAccessedMemberTypes.PublicProperties)] T>
+    where T : class
+{
+    private static readonly ConditionalWeakTable<IReadOnlyList<string>, PolarionFieldPlan<T>> Plans = new();
+
+    /// <summary>
+    /// Getters keyed by property name, matched case-insensitively.
+    /// </summary>
+    public static FrozenDictionary<string, Func<T, object?>> Getters { get; } = BuildGetters();
+
+    /// <summary>
+    /// Gets the field plan for a configured field list, resolving the list against <see cref="Getters"/> only
+    /// the first time it is seen. Field lists come from the project configuration and live for the whole process.
+    /// </summary>
+    public static PolarionFieldPlan<T> GetPlan(IReadOnlyList<string> fieldNames)
+    {
+        return Plans.GetValue(fieldNames, names => new PolarionFieldPlan<T>(
+            names.Select(name => new PolarionFieldAccessor<T>(name, Getters.GetValueOrDefault(name))).ToArray()));
+    }
+
+    private static FrozenDictionary<string, Func<T, object?>> BuildGetters()
+    {
+        return typeof(T)
+            .GetProperties(BindingFlags.Public | BindingFlags.Instance)
+            .Where(p => p.GetMethod != null && p.GetIndexParameters().Length == 0)
+            .DistinctBy(p => p.Name, StringComparer.OrdinalIgnoreCase)
+            .ToFrozenDictionary(p => p.Name, CreateGetter, StringComparer.OrdinalIgnoreCase);
+    }
+
+    private static Func<T, object?> CreateGetter(PropertyInfo property)
+    {
+        // Reference-typed getters bind directly to a delegate; value types need boxing, so those go through
+        // the property's cached invoker instead.
+        if (!property.PropertyType.IsValueType)
+        {
+            return property.GetMethod!.CreateDelegate<Func<T, object?>>();
+        }
+
+        return instance => property.GetValue(instance);
+    }
+}
+
+/// <summary>
+/// A configured field name and the getter it resolved to, or null if <typeparamref name="T"/> has no such property.
+/// </summary>
+public sealed record PolarionFieldAccessor<T>(string FieldName, Func<T, object?>? Getter) where T : class;
+
+/// <summary>
+/// An ordered list of configured fields, resolved once, that each item is rendered through.
+/// </summary>
+public sealed class PolarionFieldPlan<T> where T : class
+{
+    public PolarionFieldPlan(IReadOnlyList<PolarionFieldAccessor<T>> fields)
+    {
+        Fields = fields;
+    }
+
+    public IReadOnlyList<PolarionFieldAccessor<T>> Fields { get; }
+}
@@ -0,0 +1,214 @@
+using System.Diagnostics.Metrics;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// <see cref="System.Diagnostics.Metrics"/> instruments for MCP tools, HTTP requests, Polarion client calls,
+/// session creation, the per-project bulkheads and the shared caches. Any <see cref="MeterListener"/> subscribed to <see cref="MeterName"/>
+/// (the remote server's Prometheus exporter, <c>dotnet-counters</c>, OpenTelemetry) receives the measurements.
+/// </summary>
+public static class PolarionMetrics
+{
+    /// <summary>
+    /// The name of the meter that owns every instrument.
+    /// </summary>
+    public const string MeterName = "PolarionMcpServer";
+
+    private static readonly Meter Meter = new(MeterName);
+
+    private static readonly Histogram<double> ToolDuration = Meter.CreateHistogram<double>(
+        "polarion.mcp.tool.duration", "s", "Duration of MCP tool calls.");
+
+    private static readonly Histogram<long> ToolResponseSize = Meter.CreateHistogram<long>(
+        "polarion.mcp.tool.response.size", "By", "Size of MCP tool call responses.");
+
+    private static readonly Histogram<double> HttpRequestDuration = Meter.CreateHistogram<double>(
+        "polarion.http.request.duration", "s", "Duration of HTTP requests by route.");
+
+    private static readonly Histogram<long> HttpResponseSize = Meter.CreateHistogram<long>(
+        "polarion.http.response.size", "By", "Size of HTTP response bodies by route.");
+
+    private static readonly UpDownCounter<long> HttpActiveRequests = Meter.CreateUpDownCounter<long>(
+        "polarion.http.requests.active", null, "HTTP requests currently being served.");
+
+    private static readonly Histogram<double> ClientCallDuration = Meter.CreateHistogram<double>(
+        "polarion.client.call.duration", "s", "Duration of calls to the Polarion server by client operation.");
+
+    private static readonly UpDownCounter<long> ClientActiveCalls = Meter.CreateUpDownCounter<long>(
+        "polarion.client.calls.active", null, "Calls to the Polarion server currently in flight.");
+
+    private static readonly Histogram<double> SessionCreateDuration = Meter.CreateHistogram<double>(
+        "polarion.session.create.duration", "s", "Duration of Polarion logins that open a pooled session.");
+
+    private static readonly UpDownCounter<long> BulkheadQueueDepth = Meter.CreateUpDownCounter<long>(
+        "polarion.bulkhead.queue.depth", null, "Polarion calls waiting for a slot in their project's bulkhead.");
+
+    private static readonly Histogram<double> BulkheadWaitDuration = Meter.CreateHistogram<double>(
+        "polarion.bulkhead.wait.duration", "s", "Time Polarion calls spent queued in their project's bulkhead.");
+
+    private static readonly Counter<long> BulkheadRejections = Meter.CreateCounter<long>(
+        "polarion.bulkhead.rejections", null, "Polarion calls rejected because the bulkhead queue was full or the wait timed out.");
+
+    private static int _cachesObserved;
+
+    /// <summary>
+    /// Records a completed MCP tool call.
+    /// </summary>
+    public static void RecordToolCall(string tool, TimeSpan elapsed, long responseBytes)
+    {
+        var toolTag = new KeyValuePair<string, object?>("tool", tool);
+        ToolDuration.Record(elapsed.TotalSeconds, toolTag);
+        ToolResponseSize.Record(responseBytes, toolTag);
+    }
+
+    /// <summary>
+    /// Records a completed HTTP request. <paramref name="route"/> is the route template, not the raw path,
+    /// so that IDs in the URL do not create a series per work item.
+    /// </summary>
+    public static void RecordHttpRequest(string route, string method, int statusCode, TimeSpan elapsed, long responseBytes)
+    {
+        var routeTag = new KeyValuePair<string, object?>("route", route);
+        HttpRequestDuration.Record(elapsed.TotalSeconds,
+            routeTag,
+            new KeyValuePair<string, object?>("method", method),
+            new KeyValuePair<string, object?>("status_code", statusCode));
+        HttpResponseSize.Record(responseBytes, routeTag);
+    }
+
+    /// <summary>
+    /// Adjusts the in-flight HTTP request gauge by +1 when a request starts and -1 when it ends.
+    /// </summary>
+    public static void AddActiveHttpRequest(string kind, int delta)
+    {
+        HttpActiveRequests.Add(delta, new KeyValuePair<string, object?>("kind", kind));
+    }
+
+    /// <summary>
+    /// Records a completed call to the Polarion server.
+    /// </summary>
+    public static void RecordClientCall(string operation, TimeSpan elapsed, bool failed)
+    {
+        ClientCallDuration.Record(elapsed.TotalSeconds,
+            new KeyValuePair<string, object?>("operation", operation),
+            new KeyValuePair<string, object?>("outcome", failed ? "error" : "ok"));
+    }
+
+    /// <summary>
+    /// Adjusts the in-flight Polarion call gauge by +1 when a call starts and -1 when it ends.
+    /// </summary>
+    public static void AddActiveClientCall(string operation, int delta)
+    {
+        ClientActiveCalls.Add(delta, new KeyValuePair<string, object?>("operation", operation));
+    }
+
+    /// <summary>
+    /// Records a Polarion login performed to open a pooled session.
+    /// </summary>
+    public static void RecordSessionCreated(TimeSpan elapsed, bool failed)
+    {
+        SessionCreateDuration.Record(elapsed.TotalSeconds,
+            new KeyValuePair<string, object?>("outcome", failed ? "error" : "ok"));
+    }
+
+    /// <summary>
+    /// Adjusts the bulkhead queue depth gauge by +1 when a call starts waiting and -1 when it stops.
+    /// </summary>
+    public static void AddBulkheadQueued(string project, string lane, int delta)
+    {
+        BulkheadQueueDepth.Add(delta,
+            new KeyValuePair<string, object?>("project", project),
+            new KeyValuePair<string, object?>("lane", lane));
+    }
+
+    /// <summary>
+    /// Records how long a queued call waited for a bulkhead slot.
+    /// </summary>
+    public static void RecordBulkheadWait(string project, string lane, TimeSpan elapsed, bool admitted)
+    {
+        BulkheadWaitDuration.Record(elapsed.TotalSeconds,
+            new KeyValuePair<string, object?>("project", project),
+            new KeyValuePair<string, object?>("lane", lane),
+            new KeyValuePair<string, object?>("outcome", admitted ? "admitted" : "timeout"));
+    }
+
+    /// <summary>
+    /// Records a call turned away by a bulkhead.
+    /// </summary>
+    public static void RecordBulkheadRejection(string project, string lane, string reason)
+    {
+        BulkheadRejections.Add(1,
+            new KeyValuePair<string, object?>("project", project),
+            new KeyValuePair<string, object?>("lane", lane),
+            new KeyValuePair<string, object?>("reason", reason));
+    }
+
+    /// <summary>
+    /// Publishes the hit, miss and size counters of the shared caches and the call coalescer as observable
+    /// instruments. Only the first call has an effect, since the caches are process-wide singletons.
+    /// </summary>
+    public static void ObserveCaches(
+        ModuleSnapshotCache snapshotCache,
+        HistoricalWorkItemCache historicalWorkItems,
+        MarkdownConversionService markdownConverter,
+        PolarionCallCoalescer coalescer)
+    {
+        if (Interlocked.Exchange(ref _cachesObserved, 1) == 1)
+        {
+            return;
+        }
+
+        Meter.CreateObservableCounter("polarion.cache.hits", () =>
+        {
+            var snapshots = snapshotCache.GetStatistics();
+            var historical = historicalWorkItems.GetStatistics();
+            var markdown = markdownConverter.GetStatistics();
+            return new[]
+            {
+                CacheMeasurement(snapshots.Hits, "module_snapshot"),
+                CacheMeasurement(historical.Hits, "historical_workitem"),
+                CacheMeasurement(markdown.CacheHits, "markdown")
+            };
+        }, null, "Lookups answered from a shared cache.");
+
+        Meter.CreateObservableCounter("polarion.cache.misses", () =>
+        {
+            var snapshots = snapshotCache.GetStatistics();
+            var historical = historicalWorkItems.GetStatistics();
+            var markdown = markdownConverter.GetStatistics();
+            return new[]
+            {
+                CacheMeasurement(snapshots.Misses, "module_snapshot"),
+                CacheMeasurement(historical.Misses, "historical_workitem"),
+                CacheMeasurement(markdown.CacheMisses, "markdown")
+            };
+        }, null, "Lookups that missed a shared cache.");
+
+        Meter.CreateObservableGauge("polarion.cache.size", () =>
+        {
+            var snapshots = snapshotCache.GetStatistics();
+            var historical = historicalWorkItems.GetStatistics();
+            var markdown = markdownConverter.GetStatistics();
+            return new[]
+            {
+                CacheMeasurement(snapshots.EstimatedBytes, "module_snapshot"),
+                CacheMeasurement(historical.EstimatedBytes, "historical_workitem"),
+                CacheMeasurement(markdown.CachedBytes, "markdown")
+            };
+        }, "By", "Estimated memory held by a shared cache.");
+
+        Meter.CreateObservableCounter("polarion.coalescer.calls", () =>
+        {
+            var statistics = coalescer.GetStatistics();
+            return new[]
+            {
+                new Measurement<long>(statistics.Executed, new KeyValuePair<string, object?>("result", "executed")),
+                new Measurement<long>(statistics.Coalesced, new KeyValuePair<string, object?>("result", "coalesced"))
+            };
+        }, null, "Coalescable Polarion calls, by whether they went upstream or joined an identical call in flight.");
+    }
+
+    private static Measurement<long> CacheMeasurement(long value, string cache)
+    {
+        return new Measurement<long>(value, new KeyValuePair<string, object?>("cache", cache));
+    }
+}
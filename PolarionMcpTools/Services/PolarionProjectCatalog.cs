@@ -0,0 +1,233 @@
+using System.Collections.Concurrent;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Point-in-time summary of one project's catalog.
+/// </summary>
+public sealed record PolarionProjectCatalogStatistics(
+    string ProjectKey,
+    int Spaces,
+    int Documents,
+    DateTime LoadedUtc);
+
+/// <summary>
+/// The spaces and thin document metadata of a project, loaded in one pass. Shared by every caller and must be
+/// treated as read-only; filtering returns new lists.
+/// </summary>
+public sealed class PolarionCatalogSnapshot
+{
+    public PolarionCatalogSnapshot(IReadOnlyList<string> spaces, IReadOnlyList<ModuleThin> documents)
+    {
+        Spaces = spaces;
+        Documents = documents;
+        LoadedUtc = DateTime.UtcNow;
+    }
+
+    public IReadOnlyList<string> Spaces { get; }
+
+    public IReadOnlyList<ModuleThin> Documents { get; }
+
+    public DateTime LoadedUtc { get; }
+
+    /// <summary>
+    /// Gets the space names, without those containing <paramref name="blacklistPattern"/>.
+    /// </summary>
+    public List<string> GetSpaces(string? blacklistPattern)
+    {
+        return Spaces.Where(space => !IsBlacklisted(space, blacklistPattern)).ToList();
+    }
+
+    /// <summary>
+    /// Gets the documents of one space, or of every space not containing <paramref name="blacklistPattern"/>
+    /// when <paramref name="space"/> is empty, optionally limited to titles containing <paramref name="titleFilter"/>
+    /// (case-insensitive). An explicitly requested space is returned even if it is blacklisted.
+    /// </summary>
+    public List<ModuleThin> GetDocuments(string? space, string? titleFilter, string? blacklistPattern)
+    {
+        IEnumerable<ModuleThin> documents = string.IsNullOrWhiteSpace(space)
+            ? Documents.Where(doc => !IsBlacklisted(doc.Space, blacklistPattern))
+            : Documents.Where(doc => string.Equals(doc.Space, space, StringComparison.Ordinal));
+
+        if (!string.IsNullOrWhiteSpace(titleFilter))
+        {
+            documents = documents.Where(doc => doc.Title != null && doc.Title.Contains(titleFilter, StringComparison.OrdinalIgnoreCase));
+        }
+
+        return documents.ToList();
+    }
+
+    private static bool IsBlacklisted(string? space, string? blacklistPattern)
+    {
+        return !string.IsNullOrEmpty(blacklistPattern) && space != null && space.Contains(blacklistPattern, StringComparison.Ordinal);
+    }
+}
+
+/// <summary>
+/// Per-project catalog of spaces and documents, so listing tools and REST routes filter in memory instead of
+/// enumerating every space and module on each call. A project's catalog is loaded on first use with the caller's
+/// client and then refreshed in the background every <see cref="PolarionCacheConfig.CatalogRefreshSeconds"/>
+/// with a pooled session; callers keep getting the previous catalog while a refresh runs or if it fails.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class PolarionProjectCatalog : IDisposable
+{
+    private readonly ConcurrentDictionary<string, CatalogEntry> _entries = new(StringComparer.Ordinal);
+    private readonly PolarionSessionPool _sessionPool;
+    private readonly ILogger<PolarionProjectCatalog> _logger;
+    private readonly bool _enabled;
+    private readonly Timer? _refreshTimer;
+    private int _refreshRunning;
+
+    public PolarionProjectCatalog(PolarionSessionPool sessionPool, PolarionCacheConfig cacheConfig, ILogger<PolarionProjectCatalog> logger)
+    {
+        _sessionPool = sessionPool;
+        _logger = logger;
+        _enabled = cacheConfig.CatalogRefreshSeconds > 0;
+
+        if (_enabled)
+        {
+            var interval = TimeSpan.FromSeconds(cacheConfig.CatalogRefreshSeconds);
+            _refreshTimer = new Timer(_ => _ = RefreshAllAsync(), null, interval, interval);
+        }
+    }
+
+    /// <summary>
+    /// Gets the catalog of a project, loading it with <paramref name="polarionClient"/> if it has not been loaded yet.
+    /// Concurrent first calls share one load.
+    /// </summary>
+    public async Task<Result<PolarionCatalogSnapshot>> GetAsync(IPolarionClient polarionClient, PolarionProjectConfig projectConfig)
+    {
+        var entry = GetEntry(projectConfig);
+        var snapshot = entry.Snapshot;
+        if (_enabled && snapshot != null)
+        {
+            return Result.Ok(snapshot);
+        }
+
+        return await LoadSharedAsync(entry, polarionClient);
+    }
+
+    /// <summary>
+    /// Reloads the catalog of a project now, e.g. after documents were created or moved.
+    /// </summary>
+    public Task<Result<PolarionCatalogSnapshot>> RefreshAsync(IPolarionClient polarionClient, PolarionProjectConfig projectConfig)
+    {
+        return LoadSharedAsync(GetEntry(projectConfig), polarionClient);
+    }
+
+    /// <summary>
+    /// Gets a point-in-time view of every loaded catalog, for diagnostics.
+    /// </summary>
+    public IReadOnlyList<PolarionProjectCatalogStatistics> GetStatistics()
+    {
+        return _entries
+            .Select(e => (Key: e.Key, Snapshot: e.Value.Snapshot))
+            .Where(e => e.Snapshot != null)
+            .Select(e => new PolarionProjectCatalogStatistics(e.Key, e.Snapshot!.Spaces.Count, e.Snapshot.Documents.Count, e.Snapshot.LoadedUtc))
+            .ToList();
+    }
+
+    public void Dispose()
+    {
+        _refreshTimer?.Dispose();
+    }
+
+    private CatalogEntry GetEntry(PolarionProjectConfig projectConfig)
+    {
+        return _entries.GetOrAdd(projectConfig.GetProjectKey(), _ => new CatalogEntry(projectConfig));
+    }
+
+    private Task<Result<PolarionCatalogSnapshot>> LoadSharedAsync(CatalogEntry entry, IPolarionClient polarionClient)
+    {
+        lock (entry)
+        {
+            if (entry.Loading is { IsCompleted: false } loading)
+            {
+                return loading;
+            }
+
+            entry.Loading = LoadAsync(entry, polarionClient);
+            return entry.Loading;
+        }
+    }
+
+    private async Task<Result<PolarionCatalogSnapshot>> LoadAsync(CatalogEntry entry, IPolarionClient polarionClient)
+    {
+        // Unfiltered, so projects sharing a Polarion project but using different blacklists share one catalog
+        var spacesResult = await polarionClient.GetSpacesAsync(null);
+        if (spacesResult.IsFailed)
+        {
+            return Result.Fail(spacesResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var documentsResult = await polarionClient.GetModulesThinAsync(null, null);
+        if (documentsResult.IsFailed)
+        {
+            return Result.Fail(documentsResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var snapshot = new PolarionCatalogSnapshot(spacesResult.Value.ToList(), documentsResult.Value.ToList());
+        entry.Snapshot = snapshot;
+
+        _logger.LogDebug("Loaded catalog of project '{ProjectKey}': {SpaceCount} spaces, {DocumentCount} documents",
+            entry.ProjectConfig.GetProjectKey(), snapshot.Spaces.Count, snapshot.Documents.Count);
+        return Result.Ok(snapshot);
+    }
+
+    private async Task RefreshAllAsync()
+    {
+        if (Interlocked.Exchange(ref _refreshRunning, 1) == 1)
+        {
+            return;
+        }
+
+        try
+        {
+            foreach (var entry in _entries.Values)
+            {
+                try
+                {
+                    var leaseResult = await _sessionPool.LeaseAsync(entry.ProjectConfig);
+                    if (leaseResult.IsFailed)
+                    {
+                        _logger.LogWarning("Skipped catalog refresh of project '{ProjectKey}': {Error}",
+                            entry.ProjectConfig.GetProjectKey(), leaseResult.Errors.FirstOrDefault()?.Message);
+                        continue;
+                    }
+
+                    using var lease = leaseResult.Value;
+                    var refreshResult = await LoadSharedAsync(entry, lease.Client);
+                    if (refreshResult.IsFailed)
+                    {
+                        _logger.LogWarning("Catalog refresh of project '{ProjectKey}' failed, keeping the previous catalog: {Error}",
+                            entry.ProjectConfig.GetProjectKey(), refreshResult.Errors.FirstOrDefault()?.Message);
+                    }
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogWarning("Catalog refresh of project '{ProjectKey}' failed, keeping the previous catalog: {Error}",
+                        entry.ProjectConfig.GetProjectKey(), ex.Message);
+                }
+            }
+        }
+        finally
+        {
+            Volatile.Write(ref _refreshRunning, 0);
+        }
+    }
+
+    private sealed class CatalogEntry
+    {
+        public CatalogEntry(PolarionProjectConfig projectConfig)
+        {
+            ProjectConfig = projectConfig;
+        }
+
+        public PolarionProjectConfig ProjectConfig { get; }
+
+        public volatile PolarionCatalogSnapshot? Snapshot;
+
+        public Task<Result<PolarionCatalogSnapshot>>? Loading;
+    }
+}
@@ -0,0 +1,553 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Keeps warm, authenticated Polarion clients per <see cref="PolarionClientConfiguration"/> so that
+/// calls from MCP tools and REST requests run on an existing session instead of performing a SOAP login
+/// every time. Idle sessions are validated before reuse, recycled once they exceed their maximum
+/// lifetime and closed after sitting idle.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class PolarionSessionPool : IDisposable
+{
+    private static readonly TimeSpan MaintenanceInterval = TimeSpan.FromSeconds(30);
+
+    private readonly ConcurrentDictionary<string, SessionBucket> _buckets = new(StringComparer.OrdinalIgnoreCase);
+    private readonly ILogger<PolarionSessionPool> _logger;
+    private readonly PolarionCallCoalescer _coalescer;
+    private readonly Timer _maintenanceTimer;
+    private int _maintenanceRunning;
+    private volatile bool _disposed;
+
+    public PolarionSessionPool(ILogger<PolarionSessionPool> logger, PolarionCallCoalescer coalescer)
+    {
+        _logger = logger;
+        _coalescer = coalescer;
+        _maintenanceTimer = new Timer(_ => _ = RunMaintenanceAsync(), null, MaintenanceInterval, MaintenanceInterval);
+    }
+
+    /// <summary>
+    /// Gets the key that identifies the pool serving the given session configuration.
+    /// Projects that share server, user and project ID share one pool.
+    /// </summary>
+    public static string GetPoolKey(PolarionClientConfiguration sessionConfig)
+    {
+        return $"{sessionConfig.ServerUrl}|{sessionConfig.Username}|{sessionConfig.ProjectId}";
+    }
+
+    /// <summary>
+    /// Gets a client for the given project that leases a pooled session for each call to the Polarion server
+    /// instead of for the whole request. Calls pass the call coalescer and the project bulkhead before they wait for
+    /// a session; a call that gets no session within <see cref="PolarionSessionPoolConfig.LeaseTimeoutSeconds"/>
+    /// fails with <see cref="PolarionThrottledException"/>.
+    /// </summary>
+    /// <param name="projectConfig">The project whose SessionConfig identifies the pool.</param>
+    /// <returns>A Result containing the client or an error.</returns>
+    public Result<IPolarionClient> GetClient(PolarionProjectConfig projectConfig)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+
+        var sessionConfig = projectConfig.SessionConfig;
+        if (sessionConfig == null)
+        {
+            return Result.Fail($"Project '{projectConfig.ProjectUrlAlias}' has no SessionConfig defined.");
+        }
+
+        return Result.Ok(GetBucket(projectConfig, sessionConfig).Client);
+    }
+
+    /// <summary>
+    /// Leases an authenticated client for the given project. The lease must be disposed to hand
+    /// the session back to the pool; call <see cref="PolarionSessionLease.Invalidate"/> first if the
+    /// session is known to be broken. Request handlers use <see cref="GetClient"/> instead, so they only hold a
+    /// session while a call is running.
+    /// </summary>
+    /// <param name="projectConfig">The project whose SessionConfig identifies the pool.</param>
+    /// <param name="cancellationToken">Cancels waiting for a free session.</param>
+    /// <returns>A Result containing the lease or an error.</returns>
+    public async Task<Result<PolarionSessionLease>> LeaseAsync(PolarionProjectConfig projectConfig, CancellationToken cancellationToken = default)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+
+        var sessionConfig = projectConfig.SessionConfig;
+        if (sessionConfig == null)
+        {
+            return Result.Fail($"Project '{projectConfig.ProjectUrlAlias}' has no SessionConfig defined.");
+        }
+
+        var bucket = GetBucket(projectConfig, sessionConfig);
+        if (!await WaitForCapacityAsync(bucket, cancellationToken))
+        {
+            return Result.Fail(GetLeaseTimeoutMessage(bucket));
+        }
+
+        var sessionResult = await TakeSessionAsync(bucket);
+        if (sessionResult.IsFailed)
+        {
+            return Result.Fail(sessionResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        return Result.Ok(CreateLease(bucket, sessionResult.Value));
+    }
+
+    /// <summary>
+    /// Gets a point-in-time view of every pool, for diagnostics.
+    /// </summary>
+    public IReadOnlyList<PolarionSessionPoolStatistics> GetStatistics()
+    {
+        return _buckets.Values
+            .Select(b => new PolarionSessionPoolStatistics(
+                b.SessionConfig.ProjectId,
+                Volatile.Read(ref b.OpenCount),
+                b.IdleCount,
+                b.MaxSize,
+                Interlocked.Read(ref b.SessionsCreated),
+                Interlocked.Read(ref b.LeasesServed)))
+            .ToList();
+    }
+
+    /// <summary>
+    /// Gets a point-in-time view of every project's bulkhead, for diagnostics.
+    /// </summary>
+    public IReadOnlyList<PolarionBulkheadStatistics> GetBulkheadStatistics()
+    {
+        return _buckets.Values.Select(b => b.Bulkhead.GetStatistics()).ToList();
+    }
+
+    /// <summary>
+    /// Opens a new authenticated Polarion client.
+    /// </summary>
+    protected virtual async Task<Result<IPolarionClient>> ConnectAsync(PolarionClientConfiguration sessionConfig)
+    {
+        var clientResult = await PolarionClient.CreateAsync(sessionConfig);
+        if (clientResult.IsFailed)
+        {
+            return Result.Fail(clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        return Result.Ok<IPolarionClient>(clientResult.Value);
+    }
+
+    private SessionBucket GetBucket(PolarionProjectConfig projectConfig, PolarionClientConfiguration sessionConfig)
+    {
+        return _buckets.GetOrAdd(
+            GetPoolKey(sessionConfig),
+            _ =>
+            {
+                var concurrency = projectConfig.Concurrency ?? new PolarionConcurrencyConfig();
+                var bucket = new SessionBucket(
+                    sessionConfig,
+                    projectConfig.SessionPool ?? new PolarionSessionPoolConfig(),
+                    new PolarionBulkhead(sessionConfig.ProjectId, concurrency),
+                    TimeSpan.FromSeconds(Math.Max(1, concurrency.RetryAfterSeconds)));
+
+                // Identical in-flight calls are shared first, then the remaining ones queue in the bulkhead, and only
+                // admitted calls wait for a session
+                bucket.Client = CoalescingPolarionClient.Wrap(
+                    ThrottledPolarionClient.Wrap(PooledPolarionClient.Wrap(() => LeaseForCallAsync(bucket)), bucket.Bulkhead),
+                    _coalescer,
+                    GetPoolKey(sessionConfig));
+                return bucket;
+            });
+    }
+
+    private async Task<bool> WaitForCapacityAsync(SessionBucket bucket, CancellationToken cancellationToken)
+    {
+        var leaseTimeout = TimeSpan.FromSeconds(Math.Max(1, bucket.Options.LeaseTimeoutSeconds));
+        if (await bucket.Capacity.WaitAsync(leaseTimeout, cancellationToken))
+        {
+            return true;
+        }
+
+        _logger.LogWarning("Timed out after {Timeout}s waiting for a free Polarion session for project '{ProjectId}' ({MaxSize} sessions in use)",
+            leaseTimeout.TotalSeconds, bucket.SessionConfig.ProjectId, bucket.MaxSize);
+        return false;
+    }
+
+    private static string GetLeaseTimeoutMessage(SessionBucket bucket)
+    {
+        return $"Timed out after {Math.Max(1, bucket.Options.LeaseTimeoutSeconds)}s waiting for a free Polarion session for project '{bucket.SessionConfig.ProjectId}'. All {bucket.MaxSize} sessions are in use.";
+    }
+
+    /// <summary>
+    /// Takes a healthy idle session or opens a new one. The caller already holds a unit of the bucket's capacity,
+    /// which is released again if no session can be had.
+    /// </summary>
+    private async Task<Result<PooledSession>> TakeSessionAsync(SessionBucket bucket)
+    {
+        try
+        {
+            while (bucket.TryTakeIdle(out var idleSession))
+            {
+                if (IsPastLifetime(idleSession, bucket.Options, DateTime.UtcNow))
+                {
+                    CloseSession(bucket, idleSession, "maximum lifetime exceeded");
+                    continue;
+                }
+
+                if (NeedsHealthCheck(idleSession, bucket.Options) && !await IsHealthyAsync(idleSession))
+                {
+                    CloseSession(bucket, idleSession, "failed health check");
+                    continue;
+                }
+
+                return Result.Ok(idleSession);
+            }
+
+            var sessionResult = await OpenSessionAsync(bucket);
+            if (sessionResult.IsFailed)
+            {
+                bucket.Capacity.Release();
+            }
+
+            return sessionResult;
+        }
+        catch
+        {
+            bucket.Capacity.Release();
+            throw;
+        }
+    }
+
+    private async Task<PolarionSessionLease> LeaseForCallAsync(SessionBucket bucket)
+    {
+        ObjectDisposedException.ThrowIf(_disposed, this);
+
+        if (!await WaitForCapacityAsync(bucket, CancellationToken.None))
+        {
+            throw new PolarionThrottledException(bucket.SessionConfig.ProjectId, PolarionThrottleReason.QueueTimeout, bucket.RetryAfter,
+                $"{GetLeaseTimeoutMessage(bucket)} Retry after {bucket.RetryAfter.TotalSeconds}s.");
+        }
+
+        var sessionResult = await TakeSessionAsync(bucket);
+        if (sessionResult.IsFailed)
+        {
+            throw new InvalidOperationException(
+                $"Failed to open a Polarion session for project '{bucket.SessionConfig.ProjectId}': {sessionResult.Errors.FirstOrDefault()?.Message ?? "Unknown error"}");
+        }
+
+        var session = sessionResult.Value;
+        Interlocked.Increment(ref bucket.LeasesServed);
+        return new PolarionSessionLease(session.InstrumentedClient, lease => Release(bucket, session, lease.IsInvalidated));
+    }
+
+    private async Task<Result<PooledSession>> OpenSessionAsync(SessionBucket bucket)
+    {
+        _logger.LogDebug("Opening Polarion session for Server: {ServerUrl}, User: {Username}, Project: {RealProjectId}",
+            bucket.SessionConfig.ServerUrl, bucket.SessionConfig.Username, bucket.SessionConfig.ProjectId);
+
+        var connectStart = Stopwatch.GetTimestamp();
+        var clientResult = await ConnectAsync(bucket.SessionConfig);
+        PolarionMetrics.RecordSessionCreated(Stopwatch.GetElapsedTime(connectStart), clientResult.IsFailed);
+        if (clientResult.IsFailed)
+        {
+            var errorMessage = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+            _logger.LogError("Failed to open Polarion session for server: {ServerUrl} (Project: {RealProjectId}). Error: {ErrorMessage}",
+                bucket.SessionConfig.ServerUrl, bucket.SessionConfig.ProjectId, errorMessage);
+            return Result.Fail(errorMessage);
+        }
+
+        var openCount = Interlocked.Increment(ref bucket.OpenCount);
+        Interlocked.Increment(ref bucket.SessionsCreated);
+        _logger.LogDebug("Opened Polarion session for project '{RealProjectId}' ({OpenCount} open)",
+            bucket.SessionConfig.ProjectId, openCount);
+
+        return Result.Ok(new PooledSession(clientResult.Value));
+    }
+
+    private PolarionSessionLease CreateLease(SessionBucket bucket, PooledSession session)
+    {
+        Interlocked.Increment(ref bucket.LeasesServed);
+
+        // Leased clients share identical in-flight calls with other leases of the same pool (server, user and project);
+        // only the calls that actually go upstream take a bulkhead slot and are timed
+        var client = CoalescingPolarionClient.Wrap(
+            ThrottledPolarionClient.Wrap(session.InstrumentedClient, bucket.Bulkhead),
+            _coalescer,
+            GetPoolKey(bucket.SessionConfig));
+        return new PolarionSessionLease(client, lease => Release(bucket, session, lease.IsInvalidated));
+    }
+
+    private void Release(SessionBucket bucket, PooledSession session, bool invalidated)
+    {
+        try
+        {
+            if (invalidated)
+            {
+                CloseSession(bucket, session, "invalidated by caller");
+            }
+            else if (_disposed || IsPastLifetime(session, bucket.Options, DateTime.UtcNow))
+            {
+                CloseSession(bucket, session, "maximum lifetime exceeded");
+            }
+            else
+            {
+                session.LastUsedUtc = DateTime.UtcNow;
+                bucket.ReturnIdle(session);
+            }
+        }
+        finally
+        {
+            bucket.Capacity.Release();
+        }
+    }
+
+    private async Task<bool> IsHealthyAsync(PooledSession session)
+    {
+        try
+        {
+            // A query that matches nothing is the cheapest round trip that still requires a valid session
+            var result = await session.Client.SearchWorkitemAsync("id:__session_health_check__", "id", new List<string> { "id" });
+            return result.IsSuccess;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug("Polarion session health check failed: {Error}", ex.Message);
+            return false;
+        }
+    }
+
+    private void CloseSession(SessionBucket bucket, PooledSession session, string reason)
+    {
+        var openCount = Interlocked.Decrement(ref bucket.OpenCount);
+        _logger.LogDebug("Closing Polarion session for project '{RealProjectId}' ({Reason}, {OpenCount} open)",
+            bucket.SessionConfig.ProjectId, reason, openCount);
+
+        try
+        {
+            (session.Client as IDisposable)?.Dispose();
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug("Ignoring error while disposing Polarion client: {Error}", ex.Message);
+        }
+    }
+
+    /// <summary>
+    /// Closes idle sessions that timed out or outlived their maximum lifetime, then opens sessions until every pool
+    /// holds at least its minimum size. Runs in the background every 30 seconds.
+    /// </summary>
+    public async Task RunMaintenanceAsync()
+    {
+        if (_disposed || Interlocked.Exchange(ref _maintenanceRunning, 1) == 1)
+        {
+            return;
+        }
+
+        try
+        {
+            foreach (var bucket in _buckets.Values)
+            {
+                var now = DateTime.UtcNow;
+                foreach (var (session, reason) in bucket.TakeEvictable(now, IsPastLifetime))
+                {
+                    CloseSession(bucket, session, reason);
+                }
+
+                while (!_disposed && Volatile.Read(ref bucket.OpenCount) < bucket.MinSize)
+                {
+                    var sessionResult = await OpenSessionAsync(bucket);
+                    if (sessionResult.IsFailed)
+                    {
+                        break;
+                    }
+
+                    bucket.ReturnIdle(sessionResult.Value);
+                }
+            }
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning("Polarion session pool maintenance failed: {Error}", ex.Message);
+        }
+        finally
+        {
+            Volatile.Write(ref _maintenanceRunning, 0);
+        }
+    }
+
+    private static bool IsPastLifetime(PooledSession session, PolarionSessionPoolConfig options, DateTime now)
+    {
+        return options.MaxLifetimeSeconds > 0 && now - session.CreatedUtc > TimeSpan.FromSeconds(options.MaxLifetimeSeconds);
+    }
+
+    private static bool NeedsHealthCheck(PooledSession session, PolarionSessionPoolConfig options)
+    {
+        return DateTime.UtcNow - session.LastUsedUtc > TimeSpan.FromSeconds(Math.Max(0, options.HealthCheckAfterSeconds));
+    }
+
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        _disposed = true;
+        _maintenanceTimer.Dispose();
+
+        foreach (var bucket in _buckets.Values)
+        {
+            while (bucket.TryTakeIdle(out var session))
+            {
+                CloseSession(bucket, session, "pool disposed");
+            }
+        }
+
+        GC.SuppressFinalize(this);
+    }
+
+    private sealed class PooledSession
+    {
+        public PooledSession(IPolarionClient client)
+        {
+            Client = client;
+            InstrumentedClient = InstrumentedPolarionClient.Wrap(client);
+            CreatedUtc = DateTime.UtcNow;
+            LastUsedUtc = CreatedUtc;
+        }
+
+        public IPolarionClient Client { get; }
+        public IPolarionClient InstrumentedClient { get; }
+        public DateTime CreatedUtc { get; }
+        public DateTime LastUsedUtc { get; set; }
+    }
+
+    private sealed class SessionBucket
+    {
+        // Most recently used session on top so cold sessions sink to the bottom and idle out
+        private readonly Stack<PooledSession> _idle = new();
+
+        public int OpenCount;
+        public long SessionsCreated;
+        public long LeasesServed;
+
+        public SessionBucket(PolarionClientConfiguration sessionConfig, PolarionSessionPoolConfig options, PolarionBulkhead bulkhead, TimeSpan retryAfter)
+        {
+            SessionConfig = sessionConfig;
+            Options = options;
+            Bulkhead = bulkhead;
+            RetryAfter = retryAfter;
+            MaxSize = Math.Max(1, options.MaxSize);
+            MinSize = Math.Clamp(options.MinSize, 0, MaxSize);
+            Capacity = new SemaphoreSlim(MaxSize, MaxSize);
+        }
+
+        public PolarionClientConfiguration SessionConfig { get; }
+        public PolarionSessionPoolConfig Options { get; }
+        public PolarionBulkhead Bulkhead { get; }
+        public TimeSpan RetryAfter { get; }
+        public IPolarionClient Client { get; set; } = null!;
+        public int MaxSize { get; }
+        public int MinSize { get; }
+        public SemaphoreSlim Capacity { get; }
+
+        public int IdleCount
+        {
+            get { lock (_idle) { return _idle.Count; } }
+        }
+
+        public bool TryTakeIdle([NotNullWhen(true)] out PooledSession? session)
+        {
+            lock (_idle)
+            {
+                return _idle.TryPop(out session);
+            }
+        }
+
+        public void ReturnIdle(PooledSession session)
+        {
+            lock (_idle)
+            {
+                _idle.Push(session);
+            }
+        }
+
+        public List<(PooledSession Session, string Reason)> TakeEvictable(
+            DateTime now,
+            Func<PooledSession, PolarionSessionPoolConfig, DateTime, bool> isPastLifetime)
+        {
+            var evicted = new List<(PooledSession Session, string Reason)>();
+            var idleTimeout = TimeSpan.FromSeconds(Math.Max(0, Options.IdleTimeoutSeconds));
+
+            lock (_idle)
+            {
+                var sessions = _idle.ToArray(); // most recently used first
+                _idle.Clear();
+
+                // Walk oldest first so the least recently used sessions are the ones closed
+                for (var i = sessions.Length - 1; i >= 0; i--)
+                {
+                    var session = sessions[i];
+                    var remainingOpen = Volatile.Read(ref OpenCount) - evicted.Count;
+
+                    if (isPastLifetime(session, Options, now))
+                    {
+                        evicted.Add((session, "maximum lifetime exceeded"));
+                    }
+                    else if (now - session.LastUsedUtc > idleTimeout && remainingOpen > MinSize)
+                    {
+                        evicted.Add((session, "idle timeout"));
+                    }
+                    else
+                    {
+                        _idle.Push(session);
+                    }
+                }
+            }
+
+            return evicted;
+        }
+    }
+}
+
+/// <summary>
+/// An exclusive lease on a pooled Polarion client. Disposing the lease returns the session to its pool.
+/// </summary>
+public sealed class PolarionSessionLease : IDisposable
+{
+    private readonly Action<PolarionSessionLease> _release;
+    private int _released;
+
+    internal PolarionSessionLease(IPolarionClient client, Action<PolarionSessionLease> release)
+    {
+        Client = client;
+        _release = release;
+    }
+
+    /// <summary>
+    /// The authenticated client held by this lease.
+    /// </summary>
+    public IPolarionClient Client { get; }
+
+    internal bool IsInvalidated { get; private set; }
+
+    /// <summary>
+    /// Marks the session as broken so it is closed instead of being returned to the pool.
+    /// </summary>
+    public void Invalidate()
+    {
+        IsInvalidated = true;
+    }
+
+    public void Dispose()
+    {
+        if (Interlocked.Exchange(ref _released, 1) == 0)
+        {
+            _release(this);
+        }
+    }
+}
+
+/// <summary>
+/// Point-in-time counters of a single session pool.
+/// </summary>
+public sealed record PolarionSessionPoolStatistics(
+    string ProjectId,
+    int OpenSessions,
+    int IdleSessions,
+    int MaxSize,
+    long SessionsCreated,
+    long LeasesServed);
@@ -0,0 +1,291 @@
+using System.Diagnostics;
+using Microsoft.Extensions.Hosting;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Warm-up progress of one project.
+/// </summary>
+public sealed record PolarionWarmupProjectStatus(
+    string Project,
+    string State,
+    int SessionsOpened,
+    bool CatalogLoaded,
+    int DocumentsLoaded,
+    int DocumentsTotal,
+    IReadOnlyList<string> Errors);
+
+/// <summary>
+/// Warm-up progress of every project with warm-up enabled. <see cref="Ready"/> turns true once all of them finished,
+/// whether or not every step succeeded.
+/// </summary>
+public sealed record PolarionWarmupStatus(
+    bool Ready,
+    IReadOnlyList<PolarionWarmupProjectStatus> Projects);
+
+/// <summary>
+/// Warms up the projects that have <see cref="PolarionWarmupConfig.Enabled"/> set, all at once in the background
+/// after startup: opens pooled sessions, loads the space and document catalog and prefetches the configured hot
+/// documents into the <see cref="ModuleSnapshotCache"/>, where prefetched HEAD snapshots stay until their first use
+/// however long the warm-up takes. Failures are logged and reported in
+/// <see cref="GetStatus"/>; they never stop the server.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class PolarionWarmupService : BackgroundService
+{
+    private readonly PolarionSessionPool _sessionPool;
+    private readonly PolarionProjectCatalog _catalog;
+    private readonly ModuleSnapshotCache _snapshotCache;
+    private readonly ILogger<PolarionWarmupService> _logger;
+    private readonly List<(PolarionProjectConfig Config, ProjectProgress Progress)> _projects;
+    private volatile bool _ready;
+
+    public PolarionWarmupService(
+        List<PolarionProjectConfig> projectConfigs,
+        PolarionSessionPool sessionPool,
+        PolarionProjectCatalog catalog,
+        ModuleSnapshotCache snapshotCache,
+        ILogger<PolarionWarmupService> logger)
+    {
+        _sessionPool = sessionPool;
+        _catalog = catalog;
+        _snapshotCache = snapshotCache;
+        _logger = logger;
+        _projects = projectConfigs
+            .Where(p => p.Warmup?.Enabled == true && p.SessionConfig != null)
+            .Select(p => (p, new ProjectProgress(p.ProjectUrlAlias, p.Warmup!.Documents?.Count ?? 0)))
+            .ToList();
+        _ready = _projects.Count == 0;
+    }
+
+    /// <summary>
+    /// True once every project finished warming up, or immediately if none is configured for it.
+    /// </summary>
+    public bool IsReady => _ready;
+
+    /// <summary>
+    /// Gets a point-in-time view of the warm-up progress.
+    /// </summary>
+    public PolarionWarmupStatus GetStatus()
+    {
+        return new PolarionWarmupStatus(_ready, _projects.Select(p => p.Progress.ToStatus()).ToList());
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (_projects.Count == 0)
+        {
+            return;
+        }
+
+        _logger.LogInformation("Warming up {Count} Polarion project(s)...", _projects.Count);
+        var startTimestamp = Stopwatch.GetTimestamp();
+
+        try
+        {
+            await Task.WhenAll(_projects.Select(p => WarmUpProjectAsync(p.Config, p.Progress, stoppingToken)));
+        }
+        finally
+        {
+            _ready = true;
+        }
+
+        _logger.LogInformation("Warm-up finished in {ElapsedSeconds:F1}s", Stopwatch.GetElapsedTime(startTimestamp).TotalSeconds);
+    }
+
+    private async Task WarmUpProjectAsync(PolarionProjectConfig projectConfig, ProjectProgress progress, CancellationToken stoppingToken)
+    {
+        // Let the host finish starting before logging in
+        await Task.Yield();
+
+        var warmup = projectConfig.Warmup!;
+        progress.SetState("running");
+
+        try
+        {
+            // More sessions than the pool allows would only wait for each other
+            var maxSessions = Math.Max(1, (projectConfig.SessionPool ?? new PolarionSessionPoolConfig()).MaxSize);
+            var sessions = Math.Clamp(warmup.Sessions, 1, maxSessions);
+            await OpenSessionsAsync(projectConfig, sessions, progress, stoppingToken);
+
+            if (warmup.LoadCatalog)
+            {
+                var leaseResult = await _sessionPool.LeaseAsync(projectConfig, stoppingToken);
+                if (leaseResult.IsFailed)
+                {
+                    progress.AddError(leaseResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+                    progress.SetState("failed");
+                    return;
+                }
+
+                using var lease = leaseResult.Value;
+                var catalogResult = await _catalog.GetAsync(lease.Client, projectConfig);
+                if (catalogResult.IsSuccess)
+                {
+                    progress.SetCatalogLoaded();
+                }
+                else
+                {
+                    progress.AddError($"Catalog: {catalogResult.Errors.FirstOrDefault()?.Message}");
+                }
+            }
+
+            // Each prefetch leases its own session, so the documents load over all the sessions just opened
+            var projectKey = projectConfig.GetProjectKey();
+            using var throttle = new SemaphoreSlim(sessions);
+            await Task.WhenAll((warmup.Documents ?? new List<string>())
+                .Select(async document =>
+                {
+                    await throttle.WaitAsync(stoppingToken);
+                    try
+                    {
+                        await PrefetchDocumentAsync(projectConfig, projectKey, document, progress, stoppingToken);
+                    }
+                    finally
+                    {
+                        throttle.Release();
+                    }
+                }));
+
+            progress.SetState(progress.HasErrors ? "completed_with_errors" : "completed");
+            _logger.LogInformation("Warmed up project '{ProjectAlias}'", projectConfig.ProjectUrlAlias);
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            progress.SetState("cancelled");
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning("Warm-up of project '{ProjectAlias}' failed: {Error}", projectConfig.ProjectUrlAlias, ex.Message);
+            progress.AddError(ex.Message);
+            progress.SetState("failed");
+        }
+    }
+
+    private async Task OpenSessionsAsync(PolarionProjectConfig projectConfig, int sessions, ProjectProgress progress, CancellationToken stoppingToken)
+    {
+        // Leasing several sessions at once makes the pool log in that many times; returning them leaves them idle and warm
+        var leaseResults = await Task.WhenAll(Enumerable.Range(0, sessions)
+            .Select(_ => _sessionPool.LeaseAsync(projectConfig, stoppingToken)));
+
+        foreach (var leaseResult in leaseResults)
+        {
+            if (leaseResult.IsSuccess)
+            {
+                leaseResult.Value.Dispose();
+                progress.AddSession();
+            }
+            else
+            {
+                progress.AddError($"Session: {leaseResult.Errors.FirstOrDefault()?.Message}");
+            }
+        }
+    }
+
+    private async Task PrefetchDocumentAsync(
+        PolarionProjectConfig projectConfig,
+        string projectKey,
+        string document,
+        ProjectProgress progress,
+        CancellationToken stoppingToken)
+    {
+        var revision = "-1";
+        var location = document.Trim();
+        var revisionSeparator = location.LastIndexOf('@');
+        if (revisionSeparator > 0)
+        {
+            revision = location[(revisionSeparator + 1)..];
+            location = location[..revisionSeparator];
+        }
+
+        var spaceSeparator = location.LastIndexOf('/');
+        if (spaceSeparator <= 0 || spaceSeparator == location.Length - 1)
+        {
+            progress.AddError($"Document '{document}': expected 'Space/DocumentId'");
+            return;
+        }
+
+        var leaseResult = await _sessionPool.LeaseAsync(projectConfig, stoppingToken);
+        if (leaseResult.IsFailed)
+        {
+            progress.AddError($"Document '{document}': {leaseResult.Errors.FirstOrDefault()?.Message}");
+            return;
+        }
+
+        using var lease = leaseResult.Value;
+
+        try
+        {
+            var snapshotResult = await _snapshotCache.PrefetchAsync(
+                lease.Client, projectKey, location[..spaceSeparator], location[(spaceSeparator + 1)..], revision);
+            if (snapshotResult.IsSuccess)
+            {
+                progress.AddDocument();
+            }
+            else
+            {
+                progress.AddError($"Document '{document}': {snapshotResult.Errors.FirstOrDefault()?.Message}");
+            }
+        }
+        catch (Exception ex)
+        {
+            progress.AddError($"Document '{document}': {ex.Message}");
+        }
+    }
+
+    private sealed class ProjectProgress
+    {
+        private readonly string _project;
+        private readonly int _documentsTotal;
+        private readonly List<string> _errors = new();
+        private string _state = "pending";
+        private int _sessionsOpened;
+        private bool _catalogLoaded;
+        private int _documentsLoaded;
+
+        public ProjectProgress(string project, int documentsTotal)
+        {
+            _project = project;
+            _documentsTotal = documentsTotal;
+        }
+
+        public bool HasErrors
+        {
+            get { lock (_errors) { return _errors.Count > 0; } }
+        }
+
+        public void SetState(string state)
+        {
+            lock (_errors) { _state = state; }
+        }
+
+        public void SetCatalogLoaded()
+        {
+            lock (_errors) { _catalogLoaded = true; }
+        }
+
+        public void AddSession()
+        {
+            lock (_errors) { _sessionsOpened++; }
+        }
+
+        public void AddDocument()
+        {
+            lock (_errors) { _documentsLoaded++; }
+        }
+
+        public void AddError(string error)
+        {
+            lock (_errors) { _errors.Add(error); }
+        }
+
+        public PolarionWarmupProjectStatus ToStatus()
+        {
+            lock (_errors)
+            {
+                return new PolarionWarmupProjectStatus(
+                    _project, _state, _sessionsOpened, _catalogLoaded, _documentsLoaded, _documentsTotal, _errors.ToList());
+            }
+        }
+    }
+}
@@ -0,0 +1,86 @@
+using System.Collections.Concurrent;
+using System.Reflection;
+using System.Runtime.ExceptionServices;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// <see cref="IPolarionClient"/> that leases a pooled session for each call to the Polarion server and hands it
+/// back as soon as the call completes, so a request only holds a session while one of its calls is running.
+/// Wrapped by <see cref="ThrottledPolarionClient"/>, the wait for a free session happens after the call has been
+/// admitted by the project's bulkhead.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class PooledPolarionClient : DispatchProxy
+{
+    private static readonly MethodInfo LeasedCallDefinition = typeof(PooledPolarionClient)
+        .GetMethod(nameof(InvokeLeasedWithResultAsync), BindingFlags.Instance | BindingFlags.NonPublic)!;
+
+    private static readonly ConcurrentDictionary<Type, MethodInfo> LeasedCalls = new();
+
+    private Func<Task<PolarionSessionLease>> _leaseAsync = null!;
+
+    /// <summary>
+    /// Creates a client whose calls each run on a session from <paramref name="leaseAsync"/>.
+    /// </summary>
+    /// <param name="leaseAsync">Leases a session; throws <see cref="PolarionThrottledException"/> when none becomes free in time.</param>
+    public static IPolarionClient Wrap(Func<Task<PolarionSessionLease>> leaseAsync)
+    {
+        var proxy = Create<IPolarionClient, PooledPolarionClient>();
+        ((PooledPolarionClient)(object)proxy)._leaseAsync = leaseAsync;
+        return proxy;
+    }
+
+    protected override object? Invoke(MethodInfo? targetMethod, object?[]? args)
+    {
+        ArgumentNullException.ThrowIfNull(targetMethod);
+
+        // Sessions belong to the pool, which closes them itself
+        if (targetMethod.DeclaringType == typeof(IDisposable))
+        {
+            return null;
+        }
+
+        var returnType = targetMethod.ReturnType;
+        if (!typeof(Task).IsAssignableFrom(returnType))
+        {
+            // Only local helpers such as Markdown conversion are synchronous; an idle session is normally at hand
+            using var lease = _leaseAsync().GetAwaiter().GetResult();
+            return Forward(lease.Client, targetMethod, args);
+        }
+
+        if (returnType == typeof(Task))
+        {
+            return InvokeLeasedAsync(targetMethod, args);
+        }
+
+        // The caller expects the method's own Task<T>, so the call goes through a generic helper
+        var leasedCall = LeasedCalls.GetOrAdd(returnType, type => LeasedCallDefinition.MakeGenericMethod(type.GetGenericArguments()[0]));
+        return leasedCall.Invoke(this, [targetMethod, args]);
+    }
+
+    private async Task InvokeLeasedAsync(MethodInfo targetMethod, object?[]? args)
+    {
+        using var lease = await _leaseAsync();
+        await (Task)Forward(lease.Client, targetMethod, args)!;
+    }
+
+    private async Task<T> InvokeLeasedWithResultAsync<T>(MethodInfo targetMethod, object?[]? args)
+    {
+        using var lease = await _leaseAsync();
+        return await (Task<T>)Forward(lease.Client, targetMethod, args)!;
+    }
+
+    private static object? Forward(IPolarionClient client, MethodInfo targetMethod, object?[]? args)
+    {
+        try
+        {
+            return targetMethod.Invoke(client, args);
+        }
+        catch (TargetInvocationException ex) when (ex.InnerException != null)
+        {
+            ExceptionDispatchInfo.Capture(ex.InnerException).Throw();
+            throw;
+        }
+    }
+}
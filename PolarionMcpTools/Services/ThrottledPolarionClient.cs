@@ -0,0 +1,148 @@
+using System.Collections.Concurrent;
+using System.Reflection;
+using System.Runtime.ExceptionServices;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// <see cref="IPolarionClient"/> decorator that runs every call to the Polarion server through the project's
+/// <see cref="PolarionBulkhead"/>. Module pulls, and every call made inside <see cref="BeginBulkScope"/>, wait in the
+/// bulk lane; everything else waits in the point lane.
+/// A throttled call fails with <see cref="PolarionThrottledException"/> instead of reaching the server.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public class ThrottledPolarionClient : DispatchProxy
+{
+    /// <summary>
+    /// The <see cref="IPolarionClient"/> methods that wait in the <see cref="PolarionCallLane.Bulk"/> lane.
+    /// </summary>
+    public static readonly IReadOnlySet<string> BulkMethods = new HashSet<string>(StringComparer.Ordinal)
+    {
+        nameof(IPolarionClient.QueryWorkItemsInModuleAsync),
+        nameof(IPolarionClient.GetWorkItemsByModuleRevisionAsync),
+        nameof(IPolarionClient.GetModuleRevisionsByLocationAsync),
+        nameof(IPolarionClient.GetModulesInSpaceThinAsync),
+        nameof(IPolarionClient.GetModulesThinAsync)
+    };
+
+    private static readonly MethodInfo QueuedCallDefinition = typeof(ThrottledPolarionClient)
+        .GetMethod(nameof(InvokeQueuedWithResultAsync), BindingFlags.Instance | BindingFlags.NonPublic)!;
+
+    private static readonly ConcurrentDictionary<Type, MethodInfo> QueuedCalls = new();
+
+    private static readonly AsyncLocal<bool> InBulkScope = new();
+
+    private IPolarionClient _inner = null!;
+    private PolarionBulkhead _bulkhead = null!;
+
+    /// <summary>
+    /// Wraps a client so its calls are admitted by the given bulkhead.
+    /// </summary>
+    public static IPolarionClient Wrap(IPolarionClient inner, PolarionBulkhead bulkhead)
+    {
+        var proxy = Create<IPolarionClient, ThrottledPolarionClient>();
+        var throttled = (ThrottledPolarionClient)(object)proxy;
+        throttled._inner = inner;
+        throttled._bulkhead = bulkhead;
+        return proxy;
+    }
+
+    /// <summary>
+    /// Sends the calls made from the current async flow to the bulk lane until the returned scope is disposed, so
+    /// background work such as exports does not compete with interactive point lookups.
+    /// </summary>
+    public static IDisposable BeginBulkScope()
+    {
+        var scope = new BulkScope(InBulkScope.Value);
+        InBulkScope.Value = true;
+        return scope;
+    }
+
+    protected override object? Invoke(MethodInfo? targetMethod, object?[]? args)
+    {
+        ArgumentNullException.ThrowIfNull(targetMethod);
+
+        var returnType = targetMethod.ReturnType;
+        if (!typeof(Task).IsAssignableFrom(returnType))
+        {
+            return Forward(targetMethod, args);
+        }
+
+        var lane = InBulkScope.Value || BulkMethods.Contains(targetMethod.Name) ? PolarionCallLane.Bulk : PolarionCallLane.Point;
+        if (_bulkhead.TryEnter(lane))
+        {
+            return RunEntered(targetMethod, args, lane);
+        }
+
+        // The caller expects the method's own Task<T>, so the queued path goes through a generic helper
+        if (returnType == typeof(Task))
+        {
+            return InvokeQueuedAsync(targetMethod, args, lane);
+        }
+
+        var queuedCall = QueuedCalls.GetOrAdd(returnType, type => QueuedCallDefinition.MakeGenericMethod(type.GetGenericArguments()[0]));
+        return queuedCall.Invoke(this, [targetMethod, args, lane]);
+    }
+
+    private async Task InvokeQueuedAsync(MethodInfo targetMethod, object?[]? args, PolarionCallLane lane)
+    {
+        await _bulkhead.EnterAsync(lane);
+        await RunEntered(targetMethod, args, lane);
+    }
+
+    private async Task<T> InvokeQueuedWithResultAsync<T>(MethodInfo targetMethod, object?[]? args, PolarionCallLane lane)
+    {
+        await _bulkhead.EnterAsync(lane);
+        return await (Task<T>)RunEntered(targetMethod, args, lane);
+    }
+
+    private Task RunEntered(MethodInfo targetMethod, object?[]? args, PolarionCallLane lane)
+    {
+        Task task;
+        try
+        {
+            task = (Task)Forward(targetMethod, args)!;
+        }
+        catch
+        {
+            _bulkhead.Exit(lane);
+            throw;
+        }
+
+        task.ContinueWith(
+            _ => _bulkhead.Exit(lane),
+            CancellationToken.None,
+            TaskContinuationOptions.ExecuteSynchronously,
+            TaskScheduler.Default);
+
+        return task;
+    }
+
+    private object? Forward(MethodInfo targetMethod, object?[]? args)
+    {
+        try
+        {
+            return targetMethod.Invoke(_inner, args);
+        }
+        catch (TargetInvocationException ex) when (ex.InnerException != null)
+        {
+            ExceptionDispatchInfo.Capture(ex.InnerException).Throw();
+            throw;
+        }
+    }
+
+    private sealed class BulkScope : IDisposable
+    {
+        private readonly bool _previous;
+
+        public BulkScope(bool previous)
+        {
+            _previous = previous;
+        }
+
+        public void Dispose()
+        {
+            InBulkScope.Value = _previous;
+        }
+    }
+}
@@ -0,0 +1,52 @@
+using ModelContextProtocol;
+
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Sends MCP progress notifications while a tool renders a long list of work items, so clients see the
+/// answer being built instead of a silent call. Reports every <see cref="ReportInterval"/> items and once at the end.
+/// </summary>
+public sealed class ToolProgressReporter
+{
+    /// <summary>
+    /// The number of rendered items between two progress notifications.
+    /// </summary>
+    public const int ReportInterval = 50;
+
+    private readonly IProgress<ProgressNotificationValue>? _progress;
+    private readonly int _total;
+    private readonly string _activity;
+    private int _completed;
+
+    public ToolProgressReporter(IProgress<ProgressNotificationValue>? progress, int total, string activity)
+    {
+        _progress = progress;
+        _total = total;
+        _activity = activity;
+    }
+
+    /// <summary>
+    /// The number of items rendered so far.
+    /// </summary>
+    public int Completed => _completed;
+
+    /// <summary>
+    /// Marks one more item as rendered.
+    /// </summary>
+    public void Advance()
+    {
+        _completed++;
+
+        if (_progress == null || (_completed % ReportInterval != 0 && _completed != _total))
+        {
+            return;
+        }
+
+        _progress.Report(new ProgressNotificationValue
+        {
+            Progress = _completed,
+            Total = _total,
+            Message = $"{_activity}: {_completed} of {_total} work items"
+        });
+    }
+}
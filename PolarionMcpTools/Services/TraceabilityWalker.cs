@@ -0,0 +1,257 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// A work item reached while following links from a requested work item.
+/// </summary>
+/// <param name="Level">The number of links between the requested work item and this one.</param>
+/// <param name="Id">The linked work item ID.</param>
+/// <param name="Role">The link role.</param>
+/// <param name="LinkedFrom">The ID of the work item the link was found on.</param>
+public sealed record TraceabilityLink(int Level, string Id, string Role, string LinkedFrom);
+
+/// <summary>
+/// Breadth-first traversal of work item links for one or more starting work items.
+/// Each level is fetched with <see cref="WorkItemBatchFetcher"/> using only the link fields,
+/// capped at <c>maxConcurrency</c> queries in flight, and every work item is fetched at most once
+/// per walker no matter how many starting items reach it.
+/// Fetching stops once <c>nodeBudget</c> linked work items have been loaded.
+/// Exceptions from the client (SOAP faults, throttling, timeouts) are not caught and reach the caller.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class TraceabilityWalker : IDisposable
+{
+    private readonly IPolarionClient _polarionClient;
+    private readonly string _direction;
+    private readonly HashSet<string> _linkTypeFilters;
+    private readonly SemaphoreSlim _throttle;
+    private readonly int _nodeBudget;
+    private readonly int _maxConcurrency;
+    private readonly Dictionary<string, Result<WorkItem>> _workItems = new(StringComparer.Ordinal);
+    private int _nodesFetched;
+
+    private static readonly List<string> LinkFieldList = new() { "id", "linkedWorkItems", "linkedWorkItemsDerived" };
+
+    /// <param name="polarionClient">The client used for all fetches.</param>
+    /// <param name="direction">'incoming', 'outgoing' or 'both'.</param>
+    /// <param name="linkTypeFilters">Lower-case link roles to follow, or empty for all roles.</param>
+    /// <param name="maxConcurrency">Maximum concurrent Polarion requests.</param>
+    /// <param name="nodeBudget">Maximum number of linked work items fetched while walking.</param>
+    public TraceabilityWalker(
+        IPolarionClient polarionClient,
+        string direction,
+        HashSet<string> linkTypeFilters,
+        int maxConcurrency,
+        int nodeBudget)
+    {
+        _polarionClient = polarionClient;
+        _direction = direction;
+        _linkTypeFilters = linkTypeFilters;
+        _maxConcurrency = Math.Max(1, maxConcurrency);
+        _throttle = new SemaphoreSlim(_maxConcurrency);
+        _nodeBudget = Math.Max(0, nodeBudget);
+    }
+
+    /// <summary>
+    /// True if the walk stopped following links because the node budget was used up.
+    /// </summary>
+    public bool BudgetExhausted { get; private set; }
+
+    /// <summary>
+    /// The number of linked work items fetched while walking.
+    /// </summary>
+    public int NodesFetched => _nodesFetched;
+
+    /// <summary>
+    /// Loads work items that are not loaded yet with the given field list, in as few queries as possible.
+    /// The field list must include the link fields for the work items to be walked from.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public async Task LoadAsync(IEnumerable<string> workItemIds, List<string> fieldList)
+    {
+        var toLoad = workItemIds
+            .Distinct(StringComparer.Ordinal)
+            .Where(id => !_workItems.ContainsKey(id))
+            .ToList();
+
+        if (toLoad.Count == 0)
+        {
+            return;
+        }
+
+        var batchResult = await WorkItemBatchFetcher.FetchByIdsAsync(_polarionClient, toLoad, fieldList, _maxConcurrency);
+        if (batchResult.IsSuccess)
+        {
+            foreach (var id in toLoad)
+            {
+                _workItems[id] = batchResult.Value.TryGetValue(id, out var workItem)
+                    ? Result.Ok(workItem)
+                    : Result.Fail<WorkItem>("WorkItem not found.");
+            }
+            return;
+        }
+
+        // The batch query failed as a whole (e.g. an ID that cannot be queried); fall back to one request per ID
+        // so each work item gets its own error.
+        var results = await Task.WhenAll(toLoad.Select(FetchAsync));
+        for (var i = 0; i < toLoad.Count; i++)
+        {
+            _workItems[toLoad[i]] = results[i];
+        }
+    }
+
+    /// <summary>
+    /// Gets a work item previously loaded by <see cref="LoadAsync"/> or <see cref="WalkAsync"/>.
+    /// </summary>
+    public Result<WorkItem> GetWorkItem(string workItemId)
+    {
+        return _workItems.TryGetValue(workItemId, out var workItemResult)
+            ? workItemResult
+            : Result.Fail<WorkItem>("WorkItem not loaded.");
+    }
+
+    /// <summary>
+    /// Walks links from each starting work item up to <paramref name="maxLevels"/> levels deep.
+    /// Links are reported per starting work item, in breadth-first order, without repeating a work item.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public async Task<Dictionary<string, List<TraceabilityLink>>> WalkAsync(IEnumerable<string> startIds, int maxLevels)
+    {
+        var walks = startIds
+            .Distinct(StringComparer.Ordinal)
+            .ToDictionary(id => id, id => new WalkState(id), StringComparer.Ordinal);
+
+        for (var level = 1; level <= maxLevels; level++)
+        {
+            var frontier = walks.Values
+                .SelectMany(w => w.Frontier)
+                .Distinct(StringComparer.Ordinal)
+                .ToList();
+
+            if (frontier.Count == 0)
+            {
+                break;
+            }
+
+            // Fetch the whole level at once; starting items and items reached from other walks are already loaded
+            var toFetch = frontier.Where(id => !_workItems.ContainsKey(id)).ToList();
+            var remaining = _nodeBudget - _nodesFetched;
+            if (toFetch.Count > remaining)
+            {
+                BudgetExhausted = true;
+                toFetch = toFetch.Take(Math.Max(0, remaining)).ToList();
+            }
+
+            _nodesFetched += toFetch.Count;
+            await LoadAsync(toFetch, LinkFieldList);
+
+            foreach (var walk in walks.Values)
+            {
+                var nextFrontier = new List<string>();
+
+                foreach (var fromId in walk.Frontier)
+                {
+                    if (!_workItems.TryGetValue(fromId, out var workItemResult))
+                    {
+                        continue; // over budget
+                    }
+
+                    if (workItemResult.IsFailed || workItemResult.Value == null)
+                    {
+                        continue;
+                    }
+
+                    foreach (var (linkedId, role) in GetLinks(workItemResult.Value))
+                    {
+                        if (walk.Visited.Add(linkedId))
+                        {
+                            walk.Links.Add(new TraceabilityLink(level, linkedId, role, fromId));
+                            nextFrontier.Add(linkedId);
+                        }
+                    }
+                }
+
+                walk.Frontier = nextFrontier;
+            }
+        }
+
+        return walks.ToDictionary(kvp => kvp.Key, kvp => kvp.Value.Links, StringComparer.Ordinal);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private async Task<Result<WorkItem>> FetchAsync(string workItemId)
+    {
+        await _throttle.WaitAsync();
+        try
+        {
+            return await _polarionClient.GetWorkItemByIdAsync(workItemId);
+        }
+        catch (Exception ex)
+        {
+            return Result.Fail(ex.Message);
+        }
+        finally
+        {
+            _throttle.Release();
+        }
+    }
+
+    public void Dispose()
+    {
+        _throttle.Dispose();
+    }
+
+    private IEnumerable<(string Id, string Role)> GetLinks(WorkItem workItem)
+    {
+        if ((_direction == "incoming" || _direction == "both") && workItem.linkedWorkItemsDerived != null)
+        {
+            foreach (var linked in workItem.linkedWorkItemsDerived)
+            {
+                if (TryGetLink(linked.role, linked.workItemURI, out var link))
+                {
+                    yield return link;
+                }
+            }
+        }
+
+        if ((_direction == "outgoing" || _direction == "both") && workItem.linkedWorkItems != null)
+        {
+            foreach (var linked in workItem.linkedWorkItems)
+            {
+                if (TryGetLink(linked.role, linked.workItemURI, out var link))
+                {
+                    yield return link;
+                }
+            }
+        }
+    }
+
+    private bool TryGetLink(object? role, string? workItemUri, out (string Id, string Role) link)
+    {
+        link = default;
+
+        var linkRole = Utils.PolarionValueToString(role, null);
+        if (linkRole is null || linkRole == "subsection_of") return false;
+        if (_linkTypeFilters.Count > 0 && !_linkTypeFilters.Contains(linkRole.ToLower())) return false;
+
+        var uriParts = workItemUri?.Split("${WorkItem}");
+        if (uriParts is null || uriParts.Length < 2) return false;
+
+        link = (uriParts[1], linkRole);
+        return true;
+    }
+
+    private sealed class WalkState
+    {
+        public WalkState(string startId)
+        {
+            Visited = new HashSet<string>(StringComparer.Ordinal) { startId };
+            Frontier = new List<string> { startId };
+        }
+
+        public HashSet<string> Visited { get; }
+
+        public List<string> Frontier { get; set; }
+
+        public List<TraceabilityLink> Links { get; } = new();
+    }
+}
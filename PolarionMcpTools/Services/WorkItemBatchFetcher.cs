@@ -0,0 +1,96 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Fetches many work items by ID with a few <c>id:(A OR B ...)</c> Lucene queries
+/// instead of one <c>GetWorkItemByIdAsync</c> round trip per ID.
+/// </summary>
+public static class WorkItemBatchFetcher
+{
+    /// <summary>
+    /// The maximum number of IDs placed in a single <c>id:(...)</c> query.
+    /// </summary>
+    public const int IdQueryChunkSize = 100;
+
+    /// <summary>
+    /// Fetches the given work items with the given field list. IDs that do not exist are absent from the result.
+    /// Chunks are queried concurrently, at most <paramref name="maxConcurrency"/> at a time.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public static async Task<Result<Dictionary<string, WorkItem>>> FetchByIdsAsync(
+        IPolarionClient polarionClient,
+        IEnumerable<string> workItemIds,
+        List<string> fieldList,
+        int maxConcurrency = 1)
+    {
+        var distinctIds = workItemIds
+            .Where(id => !string.IsNullOrWhiteSpace(id))
+            .Distinct(StringComparer.Ordinal)
+            .ToList();
+
+        var fetched = new Dictionary<string, WorkItem>(StringComparer.Ordinal);
+        if (distinctIds.Count == 0)
+        {
+            return Result.Ok(fetched);
+        }
+
+        var invalidId = distinctIds.FirstOrDefault(id => !IsValidWorkItemId(id));
+        if (invalidId != null)
+        {
+            return Result.Fail($"Invalid work item ID '{invalidId}'.");
+        }
+
+        using var throttle = new SemaphoreSlim(Math.Max(1, maxConcurrency));
+        var chunkTasks = distinctIds
+            .Chunk(IdQueryChunkSize)
+            .Select(async chunk =>
+            {
+                await throttle.WaitAsync();
+                try
+                {
+                    return await polarionClient.SearchWorkitemAsync(BuildIdQuery(chunk), "id", fieldList);
+                }
+                finally
+                {
+                    throttle.Release();
+                }
+            })
+            .ToList();
+
+        var chunkResults = await Task.WhenAll(chunkTasks);
+        foreach (var chunkResult in chunkResults)
+        {
+            if (chunkResult.IsFailed)
+            {
+                return Result.Fail(chunkResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+            }
+
+            foreach (var workItem in chunkResult.Value ?? Array.Empty<WorkItem>())
+            {
+                if (workItem?.id != null)
+                {
+                    fetched[workItem.id] = workItem;
+                }
+            }
+        }
+
+        return Result.Ok(fetched);
+    }
+
+    /// <summary>
+    /// Builds a Lucene query matching any of the given work item IDs, e.g. <c>id:(WI-1 OR WI-2)</c>.
+    /// </summary>
+    public static string BuildIdQuery(IEnumerable<string> workItemIds)
+    {
+        return $"id:({string.Join(" OR ", workItemIds)})";
+    }
+
+    /// <summary>
+    /// Returns true if the ID can be placed in a Lucene query without escaping (letters, digits, '-', '_' and '.').
+    /// </summary>
+    public static bool IsValidWorkItemId(string workItemId)
+    {
+        return !string.IsNullOrEmpty(workItemId)
+            && char.IsAsciiLetterOrDigit(workItemId[0])
+            && workItemId.All(c => char.IsAsciiLetterOrDigit(c) || c == '-' || c == '_' || c == '.');
+    }
+}
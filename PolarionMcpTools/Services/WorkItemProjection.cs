@@ -0,0 +1,47 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// Fetches a single work item with only the fields a caller needs. <c>GetWorkItemByIdAsync</c> always returns
+/// the full work item, including the HTML description and every custom field; a projected fetch goes through
+/// <see cref="WorkItemBatchFetcher"/> with an explicit field list instead.
+/// </summary>
+public static class WorkItemProjection
+{
+    /// <summary>
+    /// The fields needed to list the outgoing links of a work item.
+    /// </summary>
+    public static readonly IReadOnlyList<string> OutgoingLinkFields = new[] { "id", "linkedWorkItems" };
+
+    /// <summary>
+    /// The fields needed to list the incoming (back) links of a work item.
+    /// </summary>
+    public static readonly IReadOnlyList<string> IncomingLinkFields = new[] { "id", "linkedWorkItemsDerived" };
+
+    /// <summary>
+    /// Gets a work item with only the given Polarion fields, or the full work item when <paramref name="fieldList"/> is null.
+    /// Fails if the work item does not exist.
+    /// </summary>
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public static async Task<Result<WorkItem>> GetWorkItemAsync(
+        IPolarionClient polarionClient,
+        string workItemId,
+        IEnumerable<string>? fieldList)
+    {
+        // IDs that cannot be placed in a Lucene query are left to the full fetch to report
+        if (fieldList == null || !WorkItemBatchFetcher.IsValidWorkItemId(workItemId))
+        {
+            return await polarionClient.GetWorkItemByIdAsync(workItemId);
+        }
+
+        var fields = fieldList.Prepend("id").Distinct(StringComparer.Ordinal).ToList();
+        var fetchResult = await WorkItemBatchFetcher.FetchByIdsAsync(polarionClient, new[] { workItemId }, fields);
+        if (fetchResult.IsFailed)
+        {
+            return Result.Fail(fetchResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        return fetchResult.Value.TryGetValue(workItemId, out var workItem)
+            ? Result.Ok(workItem)
+            : Result.Fail<WorkItem>($"WorkItem '{workItemId}' not found.");
+    }
+}
@@ -0,0 +1,74 @@
+namespace PolarionMcpTools;
+
+/// <summary>
+/// A single page of a work item search.
+/// </summary>
+/// <param name="Items">The work items on this page, in query order.</param>
+/// <param name="TotalCount">The number of work items matching the query across all pages.</param>
+/// <param name="PageNumber">The 1-based page number.</param>
+/// <param name="PageSize">The maximum number of items per page.</param>
+public sealed record WorkItemSearchPage(IReadOnlyList<WorkItem> Items, int TotalCount, int PageNumber, int PageSize)
+{
+    public int TotalPages => TotalCount == 0 ? 0 : (TotalCount + PageSize - 1) / PageSize;
+    public bool HasPreviousPage => PageNumber > 1 && TotalCount > 0;
+    public bool HasNextPage => PageNumber < TotalPages;
+}
+
+/// <summary>
+/// Pages work item searches without pulling every matching item across the wire.
+/// The query is first run with an <c>id</c>-only field list to get the ordered match list,
+/// then only the requested page is fetched with the full field list through
+/// <see cref="WorkItemBatchFetcher"/>.
+/// </summary>
+public static class WorkItemSearchPaging
+{
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    public static async Task<Result<WorkItemSearchPage>> SearchPageAsync(
+        IPolarionClient polarionClient,
+        string luceneQuery,
+        string sortField,
+        List<string> fieldList,
+        int pageNumber,
+        int pageSize)
+    {
+        if (pageNumber < 1) pageNumber = 1;
+        if (pageSize < 1) pageSize = 1;
+
+        // Phase 1: ordered IDs only, no descriptions or custom fields
+        var idResult = await polarionClient.SearchWorkitemAsync(luceneQuery, sortField, new List<string> { "id" });
+        if (idResult.IsFailed)
+        {
+            return Result.Fail(idResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var orderedIds = (idResult.Value ?? Array.Empty<WorkItem>())
+            .Where(wi => !string.IsNullOrEmpty(wi?.id))
+            .Select(wi => wi!.id)
+            .ToList();
+
+        var pageIds = orderedIds
+            .Skip((int)Math.Min((long)(pageNumber - 1) * pageSize, int.MaxValue))
+            .Take(pageSize)
+            .ToList();
+
+        if (pageIds.Count == 0)
+        {
+            return Result.Ok(new WorkItemSearchPage(Array.Empty<WorkItem>(), orderedIds.Count, pageNumber, pageSize));
+        }
+
+        // Phase 2: hydrate just this page with the caller's field list
+        var fetchResult = await WorkItemBatchFetcher.FetchByIdsAsync(polarionClient, pageIds, fieldList);
+        if (fetchResult.IsFailed)
+        {
+            return Result.Fail(fetchResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var fetched = fetchResult.Value;
+        var items = pageIds
+            .Where(fetched.ContainsKey)
+            .Select(id => fetched[id])
+            .ToList();
+
+        return Result.Ok(new WorkItemSearchPage(items, orderedIds.Count, pageNumber, pageSize));
+    }
+}
@@ -40,4 +40,12 @@ public sealed partial class McpTools
             ?? projectConfigs.FirstOrDefault(p => p.Default);
     }
 
+    /// <summary>
+    /// Gets the key that partitions shared caches by the current Polarion server and project.
+    /// </summary>
+    private string GetCurrentProjectKey()
+    {
+        return GetCurrentProjectConfig().GetProjectKey();
+    }
+
 }
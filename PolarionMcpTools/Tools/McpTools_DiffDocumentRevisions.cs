@@ -0,0 +1,191 @@
+namespace PolarionMcpTools;
+
+public sealed partial class McpTools
+{
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    [McpServerTool(Name = "diff_document_revisions"),
+     Description(
+         "Compare two revisions of a Polarion document and list the work items that were added, removed, moved or modified, " +
+         "with the changed fields of each modified work item. " +
+         "Use this instead of calling get_workitems_in_module twice and comparing the results. " +
+         "Revisions are document baseline revision numbers from get_document_revision_history; use '-1' for the latest revision."
+     )]
+    public async Task<string> DiffDocumentRevisions(
+        [Description("The Polarion space name (e.g., 'MySpace').")]
+        string space,
+
+        [Description("The document ID within the space.")]
+        string documentId,
+
+        [Description("The older document revision to compare from.")]
+        string fromRevision,
+
+        [Description("The newer document revision to compare to. Use '-1' for the latest revision.")]
+        string toRevision = "-1")
+    {
+        if (string.IsNullOrWhiteSpace(space))
+        {
+            return "ERROR: (100) Space cannot be empty.";
+        }
+
+        if (string.IsNullOrWhiteSpace(documentId))
+        {
+            return "ERROR: (101) Document ID cannot be empty.";
+        }
+
+        if (string.IsNullOrWhiteSpace(fromRevision) || string.IsNullOrWhiteSpace(toRevision))
+        {
+            return "ERROR: (102) Both fromRevision and toRevision must be provided.";
+        }
+
+        await using (var scope = _serviceProvider.CreateAsyncScope())
+        {
+            var clientFactory = scope.ServiceProvider.GetRequiredService<IPolarionClientFactory>();
+            var clientResult = await clientFactory.CreateClientAsync();
+            if (clientResult.IsFailed)
+            {
+                return clientResult.Errors.First().ToString() ?? "Internal Error (3584) unknown error when creating Polarion client";
+            }
+
+            var polarionClient = clientResult.Value;
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
+
+            try
+            {
+                // Both revisions come through the shared snapshot cache and are loaded in parallel. The Polarion client
+                // returns per-item revisions only together with the work items' content, so both are loaded in full;
+                // the revisions then spare comparing the items that did not change
+                var snapshotCache = _serviceProvider.GetRequiredService<ModuleSnapshotCache>();
+                var projectKey = GetCurrentProjectKey();
+                var fromTask = snapshotCache.GetAsync(polarionClient, projectKey, space, documentId, fromRevision);
+                var toTask = snapshotCache.GetAsync(polarionClient, projectKey, space, documentId, toRevision);
+                await Task.WhenAll(fromTask, toTask);
+
+                foreach (var (snapshotResult, revision) in new[] { (fromTask.Result, fromRevision), (toTask.Result, toRevision) })
+                {
+                    if (snapshotResult.IsFailed)
+                    {
+                        var errorMessage = snapshotResult.Errors.First().Message;
+
+                        if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
+                        {
+                            return $"ERROR: (1044) The document '{space}/{documentId}' could not be found at revision '{revision}'. " +
+                                   $"To find valid document revisions, use get_document_revision_history.";
+                        }
+
+                        return $"ERROR: (1044) Failed to fetch work items at revision '{revision}'. Error: {errorMessage}";
+                    }
+                }
+
+                var diff = DocumentRevisionDiff.Compute(fromTask.Result.Value, toTask.Result.Value);
+
+                var result = new StringBuilder();
+                result.AppendLine("# Document Revision Diff");
+                result.AppendLine();
+                result.AppendLine($"- **Space**: {space}");
+                result.AppendLine($"- **Document ID**: {documentId}");
+                result.AppendLine($"- **From Revision**: {FormatRevision(fromRevision)} ({diff.FromCount} work items)");
+                result.AppendLine($"- **To Revision**: {FormatRevision(toRevision)} ({diff.ToCount} work items)");
+                result.AppendLine($"- **Added**: {diff.AddedCount}");
+                result.AppendLine($"- **Removed**: {diff.RemovedCount}");
+                result.AppendLine($"- **Moved**: {diff.MovedCount}");
+                result.AppendLine($"- **Modified**: {diff.ModifiedCount}");
+                result.AppendLine($"- **Unchanged**: {diff.UnchangedCount} ({diff.SkippedByRevisionCount} skipped by unchanged work item revision)");
+                result.AppendLine();
+
+                if (diff.Changes.Count == 0)
+                {
+                    result.AppendLine("No work items changed between these revisions.");
+                    return result.ToString();
+                }
+
+                AppendChangeList(result, "Added", diff.Changes.Where(c => c.Kind == WorkItemChangeKind.Added),
+                    c => $"at {c.ToOutlineNumber ?? "N/A"}");
+                AppendChangeList(result, "Removed", diff.Changes.Where(c => c.Kind == WorkItemChangeKind.Removed),
+                    c => $"was at {c.FromOutlineNumber ?? "N/A"}");
+                AppendChangeList(result, "Moved", diff.Changes.Where(c => c.IsMoved),
+                    c => $"{c.FromOutlineNumber ?? "N/A"} → {c.ToOutlineNumber ?? "N/A"}");
+
+                var modified = diff.Changes.Where(c => c.Kind == WorkItemChangeKind.Modified).ToList();
+                if (modified.Count > 0)
+                {
+                    result.AppendLine("## Modified");
+                    result.AppendLine();
+
+                    foreach (var change in modified)
+                    {
+                        result.AppendLine($"### {change.Id} ({change.Type ?? "N/A"}): {change.Title ?? "N/A"}");
+                        result.AppendLine();
+                        result.AppendLine($"- **Outline Number**: {change.ToOutlineNumber ?? "N/A"}");
+
+                        if (change.FromRevision != null || change.ToRevision != null)
+                        {
+                            result.AppendLine($"- **Work Item Revision**: {change.FromRevision ?? "HEAD"} → {change.ToRevision ?? "HEAD"}");
+                        }
+
+                        foreach (var fieldChange in change.FieldChanges.Where(f => f.Field != "description"))
+                        {
+                            result.AppendLine($"- **{fieldChange.Field}**: {fieldChange.From ?? "null"} → {fieldChange.To ?? "null"}");
+                        }
+
+                        var descriptionChange = change.FieldChanges.FirstOrDefault(f => f.Field == "description");
+                        if (descriptionChange != null)
+                        {
+                            result.AppendLine();
+                            result.AppendLine("#### Description");
+                            result.AppendLine();
+                            result.AppendLine("```diff");
+
+                            // Only the changed lines and a few lines of context around them, not the whole description
+                            var hunks = DocumentRevisionDiff.FormatUnifiedDiff(
+                                markdownConversion.ConvertHtml(descriptionChange.From ?? string.Empty),
+                                markdownConversion.ConvertHtml(descriptionChange.To ?? string.Empty));
+                            foreach (var line in hunks)
+                            {
+                                result.AppendLine(line);
+                            }
+
+                            result.AppendLine("```");
+                        }
+
+                        result.AppendLine();
+                    }
+                }
+
+                return result.ToString();
+            }
+            catch (Exception ex)
+            {
+                return $"ERROR: Failed due to exception '{ex.Message}'";
+            }
+        }
+    }
+
+    private static string FormatRevision(string revision)
+    {
+        return revision == "-1" ? "HEAD" : revision;
+    }
+
+    private static void AppendChangeList(
+        StringBuilder result,
+        string heading,
+        IEnumerable<WorkItemChange> changes,
+        Func<WorkItemChange, string> describe)
+    {
+        var list = changes.ToList();
+        if (list.Count == 0)
+        {
+            return;
+        }
+
+        result.AppendLine($"## {heading}");
+        result.AppendLine();
+
+        foreach (var change in list)
+        {
+            result.AppendLine($"- **{change.Id}** ({change.Type ?? "N/A"}): {change.Title ?? "N/A"}, {describe(change)}");
+        }
+
+        result.AppendLine();
+    }
+}
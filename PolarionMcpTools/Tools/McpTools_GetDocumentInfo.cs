@@ -1,5 +1,3 @@
-using System.Reflection;
-
 namespace PolarionMcpTools;
 
 public sealed partial class McpTools
@@ -40,7 +38,7 @@ public sealed partial class McpTools
 
             var targetCustomFieldNameWhitelist = customFields.Split([','], StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries).ToList();
 
-            var markdownConverter = new ReverseMarkdown.Converter();
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
 
             var getAllCustomFields = customFields.ToLower() == "all";
             var getNoCustomFields = customFields.ToLower() == "none";
@@ -58,8 +56,6 @@ public sealed partial class McpTools
                 sb.AppendLine($"# Document (space='{space}', id='{documentId}')");
                 sb.AppendLine();
 
-                var moduleProperties = module.GetType().GetProperties(BindingFlags.Public | BindingFlags.Instance);
-
                 sb.AppendLine($"## Standard Fields");
                 sb.AppendLine();
 
@@ -69,34 +65,33 @@ public sealed partial class McpTools
                 }
                 else
                 {
-                    foreach (var fieldName in projectConfig?.PolarionDocumentDefaultFields ?? [])
+                    // Configured fields are resolved to property getters once per project configuration
+                    var standardFieldPlan = PolarionFieldAccessors<Module>.GetPlan(projectConfig.PolarionDocumentDefaultFields);
+
+                    foreach (var field in standardFieldPlan.Fields)
                     {
                         bool fieldProcessed = false;
-                        // Attempt to get standard property via reflection
-                        var standardProperty = moduleProperties.FirstOrDefault(p =>
-                            string.Equals(p.Name, fieldName, StringComparison.OrdinalIgnoreCase)
-                        );
 
-                        if (standardProperty != null)
+                        if (field.Getter != null)
                         {
                             try
                             {
-                                var value = standardProperty.GetValue(module);
-                                string valueString = Utils.PolarionValueToString(value, markdownConverter);
+                                var value = field.Getter(module);
+                                string valueString = markdownConversion.ValueToString(value);
 
-                                sb.AppendLine($"- **{fieldName}**: {valueString}");
+                                sb.AppendLine($"- **{field.FieldName}**: {valueString}");
                                 fieldProcessed = true;
                             }
                             catch (Exception ex)
                             {
-                                sb.AppendLine($"- **{fieldName}**: ERROR retrieving standard property: {ex.Message}");
+                                sb.AppendLine($"- **{field.FieldName}**: ERROR retrieving standard property: {ex.Message}");
                                 fieldProcessed = true; // Mark as processed to avoid looking in custom fields
                             }
                         }
 
                         if (!fieldProcessed) // Only report as not found if it was explicitly requested
                         {
-                            sb.AppendLine($"- **{fieldName}**: Not found as a standard property.");
+                            sb.AppendLine($"- **{field.FieldName}**: Not found as a standard property.");
                         }
                     }
                 }
@@ -125,7 +120,7 @@ public sealed partial class McpTools
                                 continue;
                             }
 
-                            var valueString = Utils.PolarionValueToString(customField.value, markdownConverter);
+                            var valueString = markdownConversion.ValueToString(customField.value);
 
                             sb.AppendLine($"- **{customField.key}**: {valueString ?? "null"}");
                         }
@@ -39,29 +39,23 @@ public sealed partial class McpTools
 
             try
             {
-                // Get all work items from the module using SQL relationship query
-                var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(
-                    space,
-                    documentId,
-                    null); // Get all types
+                // Get all work items from the module, shared with other document tools through the snapshot cache
+                var snapshotCache = _serviceProvider.GetRequiredService<ModuleSnapshotCache>();
+                var snapshotResult = await snapshotCache.GetAsync(polarionClient, GetCurrentProjectKey(), space, documentId, revision);
 
-                if (workItemsResult.IsFailed)
+                if (snapshotResult.IsFailed)
                 {
-                    return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {workItemsResult.Errors.First().Message}";
+                    return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {snapshotResult.Errors.First().Message}";
                 }
 
-                var allWorkItems = workItemsResult.Value;
+                var allWorkItems = snapshotResult.Value.WorkItems;
                 if (allWorkItems is null || allWorkItems.Length == 0)
                 {
                     return $"No work items found in module '{space}/{documentId}'.";
                 }
 
-                // Filter for headings only
-                var headings = allWorkItems
-                    .Where(wi => wi?.type?.id != null &&
-                                 wi.type.id.Equals("heading", StringComparison.OrdinalIgnoreCase))
-                    .OrderBy(wi => wi.outlineNumber ?? "")
-                    .ToList();
+                // Headings in numeric outline order, from the snapshot's outline tree
+                var headings = snapshotResult.Value.Outline.Headings;
 
                 if (headings.Count == 0)
                 {
@@ -80,15 +74,16 @@ public sealed partial class McpTools
                 result.AppendLine("---");
                 result.AppendLine();
 
-                foreach (var heading in headings)
+                foreach (var headingNode in headings)
                 {
-                    if (heading?.id is null)
+                    var heading = headingNode.WorkItem;
+                    if (heading.id is null)
                     {
                         continue;
                     }
 
                     // Calculate heading level from outline number (e.g., "1" = level 1, "1.2" = level 2, "1.2.3" = level 3)
-                    var outlineNumber = heading.outlineNumber ?? "";
+                    var outlineNumber = headingNode.OutlineNumber;
                     var headingLevel = string.IsNullOrEmpty(outlineNumber) ? 1 : outlineNumber.Count(c => c == '.') + 1;
 
                     // Clamp heading level to valid markdown range (1-6)
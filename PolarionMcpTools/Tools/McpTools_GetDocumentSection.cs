@@ -1,3 +1,5 @@
+using ModelContextProtocol;
+
 namespace PolarionMcpTools;
 
 public sealed partial class McpTools
@@ -17,7 +19,9 @@ public sealed partial class McpTools
         string sectionNumber,
 
         [Description("Document revision. Use '-1' for latest revision.")]
-        string revision = "-1")
+        string revision = "-1",
+
+        IProgress<ProgressNotificationValue>? progress = null)
     {
         if (string.IsNullOrWhiteSpace(space))
         {
@@ -44,53 +48,33 @@ public sealed partial class McpTools
             }
 
             var polarionClient = clientResult.Value;
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
 
             try
             {
-                // Get all work items from the module, using revision-aware API when needed
-                WorkItem[] allWorkItems;
+                // Get all work items from the module (HEAD or baseline revision) through the snapshot cache
+                var snapshotCache = _serviceProvider.GetRequiredService<ModuleSnapshotCache>();
+                var snapshotResult = await snapshotCache.GetAsync(polarionClient, GetCurrentProjectKey(), space, documentId, revision);
 
-                if (revision == "-1")
+                if (snapshotResult.IsFailed)
                 {
-                    // Latest revision - use standard query
-                    var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(
-                        space,
-                        documentId,
-                        null); // Get all types
+                    var errorMessage = snapshotResult.Errors.First().Message;
 
-                    if (workItemsResult.IsFailed)
+                    if (revision == "-1")
                     {
-                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {workItemsResult.Errors.First().Message}";
+                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {errorMessage}";
                     }
 
-                    allWorkItems = workItemsResult.Value;
-                }
-                else
-                {
-                    // Specific revision - use baseline revision API
-                    var workItemsResult = await polarionClient.GetWorkItemsByModuleRevisionAsync(
-                        space,
-                        documentId,
-                        revision);
-
-                    if (workItemsResult.IsFailed)
+                    if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
                     {
-                        var errorMessage = workItemsResult.Errors.First().Message;
-
-                        if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
-                        {
-                            return $"ERROR: (1044) Document '{space}/{documentId}' not found at revision '{revision}'. " +
-                                   "Use get_document_revision_history to find valid revision numbers.";
-                        }
-
-                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}' at revision '{revision}'. Error: {errorMessage}";
+                        return $"ERROR: (1044) Document '{space}/{documentId}' not found at revision '{revision}'. " +
+                               "Use get_document_revision_history to find valid revision numbers.";
                     }
 
-                    allWorkItems = workItemsResult.Value
-                        .Where(wi => wi?.WorkItem != null)
-                        .Select(wi => wi.WorkItem)
-                        .ToArray();
+                    return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}' at revision '{revision}'. Error: {errorMessage}";
                 }
+
+                var allWorkItems = snapshotResult.Value.WorkItems;
                 if (allWorkItems is null || allWorkItems.Length == 0)
                 {
                     return $"No work items found in module '{space}/{documentId}'.";
@@ -99,21 +83,17 @@ public sealed partial class McpTools
                 // Normalize section number (remove leading/trailing dots)
                 var normalizedSection = sectionNumber.Trim('.');
 
-                // Filter work items by section number prefix
-                // Match items where outlineNumber equals the section or starts with "section."
-                var sectionWorkItems = allWorkItems
-                    .Where(wi => wi?.outlineNumber != null && MatchesSection(wi.outlineNumber, normalizedSection))
-                    .OrderBy(wi => wi.outlineNumber ?? "")
-                    .ToList();
+                // The section and its sub-sections are one contiguous, numerically ordered range of the outline tree
+                var outline = snapshotResult.Value.Outline;
+                var sectionWorkItems = outline.GetSection(normalizedSection);
 
                 if (sectionWorkItems.Count == 0)
                 {
                     // List available top-level sections to help the user
-                    var topSections = allWorkItems
-                        .Where(wi => wi?.outlineNumber != null && !wi.outlineNumber.Contains('.'))
-                        .Select(wi => wi.outlineNumber)
-                        .Distinct()
-                        .OrderBy(s => s)
+                    var topSections = outline.Roots
+                        .Where(node => !string.IsNullOrEmpty(node.OutlineNumber))
+                        .Select(node => node.OutlineNumber)
+                        .Distinct(StringComparer.OrdinalIgnoreCase)
                         .Take(10)
                         .ToList();
 
@@ -137,8 +117,10 @@ public sealed partial class McpTools
                 result.AppendLine("---");
                 result.AppendLine();
 
+                var progressReporter = new ToolProgressReporter(progress, sectionWorkItems.Count, "Rendering section");
                 foreach (var workItem in sectionWorkItems)
                 {
+                    progressReporter.Advance();
                     if (workItem?.id is null)
                     {
                         continue;
@@ -172,7 +154,7 @@ public sealed partial class McpTools
 
                         if (!string.IsNullOrWhiteSpace(workItem.description?.content))
                         {
-                            var markdown = polarionClient.ConvertWorkItemToMarkdown(workItem.id, workItem);
+                            var markdown = markdownConversion.ConvertWorkItem(polarionClient, workItem.id, workItem);
                             result.AppendLine("**Description:**");
                             result.AppendLine();
                             result.AppendLine(markdown);
@@ -194,27 +176,4 @@ public sealed partial class McpTools
             }
         }
     }
-
-    /// <summary>
-    /// Checks if an outline number matches a section prefix.
-    /// For example, section "6.1" matches "6.1", "6.1.1", "6.1.2.3" but not "6.10" or "6.2".
-    /// </summary>
-    private static bool MatchesSection(string outlineNumber, string sectionPrefix)
-    {
-        if (string.IsNullOrEmpty(outlineNumber))
-        {
-            return false;
-        }
-
-        // Exact match
-        if (outlineNumber.Equals(sectionPrefix, StringComparison.OrdinalIgnoreCase))
-        {
-            return true;
-        }
-
-        // Prefix match - must be followed by a dot or dash to avoid matching "6.10" when looking for "6.1"
-        // Dot separates sub-sections (e.g., 6.1.2), dash separates work items within a section (e.g., 6.1.2-1)
-        return outlineNumber.StartsWith(sectionPrefix + ".", StringComparison.OrdinalIgnoreCase)
-            || outlineNumber.StartsWith(sectionPrefix + "-", StringComparison.OrdinalIgnoreCase);
-    }
 }
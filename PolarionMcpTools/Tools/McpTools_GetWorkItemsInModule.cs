@@ -1,3 +1,5 @@
+using ModelContextProtocol;
+
 namespace PolarionMcpTools;
 
 public sealed partial class McpTools
@@ -21,7 +23,9 @@ public sealed partial class McpTools
         string? itemTypes = null,
 
         [Description("Document revision. Use '-1' for latest revision. For historical revisions, use a document baseline revision number from document history.")]
-        string revision = "-1")
+        string revision = "-1",
+
+        IProgress<ProgressNotificationValue>? progress = null)
     {
         if (string.IsNullOrWhiteSpace(space))
         {
@@ -43,6 +47,7 @@ public sealed partial class McpTools
             }
 
             var polarionClient = clientResult.Value;
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
 
             try
             {
@@ -55,21 +60,20 @@ public sealed partial class McpTools
 
                 var isHistoricalQuery = revision != "-1";
                 WorkItem[] workItems;
-                Dictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata = null;
+                IReadOnlyDictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata = null;
+
+                // HEAD and baseline revisions both come through the shared snapshot cache
+                var snapshotCache = _serviceProvider.GetRequiredService<ModuleSnapshotCache>();
+                var snapshotResult = await snapshotCache.GetAsync(polarionClient, GetCurrentProjectKey(), space, documentId, revision);
 
                 if (isHistoricalQuery)
                 {
                     // Historical revision - use baseline revision API
                     // Note: Type filtering is not supported for historical queries (documented in parameter description)
 
-                    var workItemsResult = await polarionClient.GetWorkItemsByModuleRevisionAsync(
-                        space,
-                        documentId,
-                        revision);
-
-                    if (workItemsResult.IsFailed)
+                    if (snapshotResult.IsFailed)
                     {
-                        var errorMessage = workItemsResult.Errors.First().Message;
+                        var errorMessage = snapshotResult.Errors.First().Message;
 
                         if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
                         {
@@ -85,33 +89,20 @@ public sealed partial class McpTools
                         return $"ERROR: (1044) Failed to fetch work items. Error: {errorMessage}";
                     }
 
-                    var wiInfoArray = workItemsResult.Value;
-                    workItems = wiInfoArray.Select(wi => wi.WorkItem).ToArray();
+                    workItems = snapshotResult.Value.WorkItems;
 
-                    // Store revision metadata for output formatting
-                    revisionMetadata = new Dictionary<string, (string, string, bool)>();
-                    foreach (var wiInfo in wiInfoArray)
-                    {
-                        if (wiInfo?.WorkItem?.id != null)
-                        {
-                            revisionMetadata[wiInfo.WorkItem.id] = (wiInfo.Revision, wiInfo.HeadRevision, wiInfo.IsHistorical);
-                        }
-                    }
+                    // Revision metadata for output formatting
+                    revisionMetadata = snapshotResult.Value.RevisionMetadata;
                 }
                 else
                 {
-                    // Current revision - use standard query with type filtering support
-                    var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(
-                        space,
-                        documentId,
-                        typeList);
-
-                    if (workItemsResult.IsFailed)
+                    // Current revision - type filtering is applied to the cached snapshot
+                    if (snapshotResult.IsFailed)
                     {
-                        return $"ERROR: (1044) Failed to fetch work items. Error: {workItemsResult.Errors.First().Message}";
+                        return $"ERROR: (1044) Failed to fetch work items. Error: {snapshotResult.Errors.First().Message}";
                     }
 
-                    workItems = workItemsResult.Value;
+                    workItems = snapshotResult.Value.FilterByTypes(typeList);
                 }
 
                 if (workItems is null || workItems.Length == 0)
@@ -147,8 +138,10 @@ public sealed partial class McpTools
 
                 result.AppendLine();
 
+                var progressReporter = new ToolProgressReporter(progress, workItems.Length, "Rendering module");
                 foreach (var workItem in workItems)
                 {
+                    progressReporter.Advance();
                     if (workItem is null)
                     {
                         continue;
@@ -188,7 +181,7 @@ public sealed partial class McpTools
 
                     if (!string.IsNullOrWhiteSpace(workItem.description?.content))
                     {
-                        var markdown = polarionClient.ConvertWorkItemToMarkdown(workItem.id ?? "unknown", workItem);
+                        var markdown = markdownConversion.ConvertWorkItem(polarionClient, workItem.id ?? "unknown", workItem);
                         result.AppendLine("### Description");
                         result.AppendLine();
                         result.AppendLine(markdown);
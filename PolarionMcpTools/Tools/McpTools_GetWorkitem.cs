@@ -25,6 +25,7 @@ public sealed partial class McpTools
             }
 
             var polarionClient = clientResult.Value;
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
 
             try
             {
@@ -46,7 +47,7 @@ public sealed partial class McpTools
                         return $"ERROR: WorkItem '{workitemId}' not found.";
                     }
 
-                    var markdown = polarionClient.ConvertWorkItemToMarkdown(workitemId, workItem);
+                    var markdown = markdownConversion.ConvertWorkItem(polarionClient, workitemId, workItem);
 
                     var sb = new StringBuilder();
                     sb.AppendLine($"## WorkItem (id='{workitemId}', type={workItem.type?.id ?? "N/A"}, revision=LATEST)");
@@ -66,8 +67,9 @@ public sealed partial class McpTools
                 }
                 else
                 {
-                    // Get specific revision
-                    var workItemResult = await polarionClient.GetWorkItemByIdAsync(workitemId, revision);
+                    // Get specific revision; revision content never changes, so it is served from the shared cache when possible
+                    var historicalWorkItems = _serviceProvider.GetRequiredService<HistoricalWorkItemCache>();
+                    var workItemResult = await historicalWorkItems.GetAsync(polarionClient, GetCurrentProjectKey(), workitemId, revision!);
                     if (workItemResult.IsFailed)
                     {
                         return $"ERROR: Failed to retrieve WorkItem '{workitemId}' at revision '{revision}': {workItemResult.Errors.FirstOrDefault()?.Message ?? "Unknown error"}";
@@ -79,7 +81,7 @@ public sealed partial class McpTools
                         return $"ERROR: WorkItem '{workitemId}' not found at revision '{revision}'.";
                     }
 
-                    var markdown = polarionClient.ConvertWorkItemToMarkdown(workitemId, workItem);
+                    var markdown = markdownConversion.ConvertWorkItem(polarionClient, workitemId, workItem);
 
                     var sb = new StringBuilder();
                     sb.AppendLine($"## WorkItem (id='{workitemId}', type={workItem.type?.id ?? "N/A"}, revision={revision})");
@@ -1,5 +1,3 @@
-using System.Reflection;
-
 namespace PolarionMcpTools;
 
 public sealed partial class McpTools
@@ -62,13 +60,38 @@ public sealed partial class McpTools
             var getAllCustomFields = customFields?.ToLower() == "all";
             var getNoCustomFields = customFields?.ToLower() == "none";
 
-            var markdownConverter = new ReverseMarkdown.Converter();
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
+
+            // Resolve the configured standard fields to property getters once, not per work item
+            var standardFieldPlan = projectConfig?.PolarionWorkItemDefaultFields is null
+                ? null
+                : PolarionFieldAccessors<WorkItem>.GetPlan(projectConfig.PolarionWorkItemDefaultFields);
+
+            // One walker per call: every work item is fetched at most once, whether requested or reached through links
+            var traceabilityConfig = projectConfig?.Traceability ?? new PolarionTraceabilityConfig();
+            using var walker = new TraceabilityWalker(
+                polarionClient, direction, linkTypeFilters,
+                traceabilityConfig.MaxConcurrency, traceabilityConfig.NodeBudget);
+
+            // Fetch all requested work items in a few batched queries, then walk their links level by level
+            Dictionary<string, List<TraceabilityLink>> traceResultsById;
+            try
+            {
+                await walker.LoadAsync(ids, BuildDetailsFieldList(projectConfig, customFieldsList, getAllCustomFields, getNoCustomFields));
+                traceResultsById = followLevels > 1
+                    ? await walker.WalkAsync(ids, followLevels)
+                    : new Dictionary<string, List<TraceabilityLink>>();
+            }
+            catch (Exception ex)
+            {
+                return $"ERROR: Failed to fetch work items due to exception '{ex.Message}'";
+            }
 
             foreach (var id in ids)
             {
                 try
                 {
-                    var workItemResult = await polarionClient.GetWorkItemByIdAsync(id);
+                    var workItemResult = walker.GetWorkItem(id);
                     if (workItemResult.IsFailed)
                     {
                         sb.AppendLine($"## WorkItem (id='{id}')");
@@ -92,37 +115,33 @@ public sealed partial class McpTools
                     sb.AppendLine();
 
                     // Standard Fields
-                    var workItemProperties = workItem.GetType().GetProperties(BindingFlags.Public | BindingFlags.Instance);
                     sb.AppendLine($"### Standard Fields");
                     sb.AppendLine();
 
-                    if (projectConfig?.PolarionWorkItemDefaultFields is null)
+                    if (standardFieldPlan is null)
                     {
                         sb.AppendLine($"- No standard fields configured.");
                     }
                     else
                     {
-                        foreach (var fieldName in projectConfig.PolarionWorkItemDefaultFields)
+                        foreach (var field in standardFieldPlan.Fields)
                         {
-                            var standardProperty = workItemProperties.FirstOrDefault(p =>
-                                string.Equals(p.Name, fieldName, StringComparison.OrdinalIgnoreCase));
-
-                            if (standardProperty != null)
+                            if (field.Getter != null)
                             {
                                 try
                                 {
-                                    var value = standardProperty.GetValue(workItem);
-                                    var valueString = Utils.PolarionValueToString(value, markdownConverter);
-                                    sb.AppendLine($"- **{fieldName}**: {valueString}");
+                                    var value = field.Getter(workItem);
+                                    var valueString = markdownConversion.ValueToString(value);
+                                    sb.AppendLine($"- **{field.FieldName}**: {valueString}");
                                 }
                                 catch (Exception ex)
                                 {
-                                    sb.AppendLine($"- **{fieldName}**: ERROR: {ex.Message}");
+                                    sb.AppendLine($"- **{field.FieldName}**: ERROR: {ex.Message}");
                                 }
                             }
                             else
                             {
-                                sb.AppendLine($"- **{fieldName}**: Not found.");
+                                sb.AppendLine($"- **{field.FieldName}**: Not found.");
                             }
                         }
                     }
@@ -145,7 +164,7 @@ public sealed partial class McpTools
                                 if (customField.key is null) continue;
                                 if (!getAllCustomFields && !customFieldsList.Contains(customField.key)) continue;
 
-                                var valueString = Utils.PolarionValueToString(customField.value, markdownConverter);
+                                var valueString = markdownConversion.ValueToString(customField.value);
                                 sb.AppendLine($"- **{customField.key}**: {valueString ?? "null"}");
                             }
                         }
@@ -172,7 +191,7 @@ public sealed partial class McpTools
 
                             foreach (var linked in workItem.linkedWorkItemsDerived)
                             {
-                                var linkRole = Utils.PolarionValueToString(linked.role, markdownConverter);
+                                var linkRole = markdownConversion.ValueToString(linked.role);
                                 if (linkRole is null || linkRole == "subsection_of") continue;
 
                                 // Apply link type filter
@@ -201,7 +220,7 @@ public sealed partial class McpTools
 
                             foreach (var linked in workItem.linkedWorkItems)
                             {
-                                var linkRole = Utils.PolarionValueToString(linked.role, markdownConverter);
+                                var linkRole = markdownConversion.ValueToString(linked.role);
                                 if (linkRole is null || linkRole == "subsection_of") continue;
 
                                 // Apply link type filter
@@ -220,9 +239,7 @@ public sealed partial class McpTools
                         sb.AppendLine($"### Traceability Chain ({followLevels} levels)");
                         sb.AppendLine();
 
-                        var visited = new HashSet<string> { id };
-                        var traceResults = await GetTraceabilityChainAsync(
-                            polarionClient, id, direction, linkTypeFilters, followLevels, 1, visited, markdownConverter);
+                        var traceResults = traceResultsById.TryGetValue(id, out var links) ? links : new List<TraceabilityLink>();
 
                         if (traceResults.Count == 0)
                         {
@@ -238,6 +255,12 @@ public sealed partial class McpTools
                                 sb.AppendLine($"| {trace.Level} | {trace.Id} | {trace.Role} | {trace.LinkedFrom} |");
                             }
                         }
+
+                        if (walker.BudgetExhausted)
+                        {
+                            sb.AppendLine();
+                            sb.AppendLine($"- NOTE: Stopped following links after {walker.NodesFetched} linked work items (node budget). Narrow linkDirection, linkTypeFilter or followLevels for a complete chain.");
+                        }
                     }
                 }
                 catch (Exception ex)
@@ -254,79 +277,32 @@ public sealed partial class McpTools
         return sb.ToString();
     }
 
-    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
-    private async Task<List<(int Level, string Id, string Role, string LinkedFrom)>> GetTraceabilityChainAsync(
-        Polarion.IPolarionClient polarionClient,
-        string startId,
-        string direction,
-        HashSet<string> linkTypeFilters,
-        int maxLevels,
-        int currentLevel,
-        HashSet<string> visited,
-        ReverseMarkdown.Converter markdownConverter)
+    /// <summary>
+    /// Builds the Polarion field list needed to render work item details: the configured standard fields,
+    /// the requested custom fields and both link directions.
+    /// </summary>
+    private static List<string> BuildDetailsFieldList(
+        PolarionProjectConfig? projectConfig,
+        List<string> customFieldsList,
+        bool getAllCustomFields,
+        bool getNoCustomFields)
     {
-        var results = new List<(int Level, string Id, string Role, string LinkedFrom)>();
-
-        if (currentLevel > maxLevels) return results;
-
-        var workItemResult = await polarionClient.GetWorkItemByIdAsync(startId);
-        if (workItemResult.IsFailed) return results;
-
-        var workItem = workItemResult.Value;
-        if (workItem == null) return results;
+        var fieldList = new List<string> { "id", "linkedWorkItems", "linkedWorkItemsDerived" };
 
-        var linkedIds = new List<(string Id, string Role)>();
-
-        // Collect linked IDs based on direction
-        if ((direction == "incoming" || direction == "both") && workItem.linkedWorkItemsDerived != null)
+        if (projectConfig?.PolarionWorkItemDefaultFields != null)
         {
-            foreach (var linked in workItem.linkedWorkItemsDerived)
-            {
-                var linkRole = Utils.PolarionValueToString(linked.role, markdownConverter);
-                if (linkRole is null || linkRole == "subsection_of") continue;
-                if (linkTypeFilters.Count > 0 && !linkTypeFilters.Contains(linkRole.ToLower())) continue;
-
-                var linkedId = linked.workItemURI.Split("${WorkItem}")[1];
-                if (!visited.Contains(linkedId))
-                {
-                    linkedIds.Add((linkedId, linkRole));
-                }
-            }
+            fieldList.AddRange(projectConfig.PolarionWorkItemDefaultFields);
         }
 
-        if ((direction == "outgoing" || direction == "both") && workItem.linkedWorkItems != null)
+        if (getAllCustomFields)
         {
-            foreach (var linked in workItem.linkedWorkItems)
-            {
-                var linkRole = Utils.PolarionValueToString(linked.role, markdownConverter);
-                if (linkRole is null || linkRole == "subsection_of") continue;
-                if (linkTypeFilters.Count > 0 && !linkTypeFilters.Contains(linkRole.ToLower())) continue;
-
-                var linkedId = linked.workItemURI.Split("${WorkItem}")[1];
-                if (!visited.Contains(linkedId))
-                {
-                    linkedIds.Add((linkedId, linkRole));
-                }
-            }
+            fieldList.Add("customFields");
         }
-
-        // Add to results and recurse
-        foreach (var (linkedId, role) in linkedIds)
+        else if (!getNoCustomFields)
         {
-            if (visited.Contains(linkedId)) continue;
-            visited.Add(linkedId);
-
-            results.Add((currentLevel, linkedId, role, startId));
-
-            // Recurse to next level
-            if (currentLevel < maxLevels)
-            {
-                var childResults = await GetTraceabilityChainAsync(
-                    polarionClient, linkedId, direction, linkTypeFilters, maxLevels, currentLevel + 1, visited, markdownConverter);
-                results.AddRange(childResults);
-            }
+            fieldList.AddRange(customFieldsList.Select(field => $"customFields.{field}"));
         }
 
-        return results;
+        return fieldList.Distinct(StringComparer.OrdinalIgnoreCase).ToList();
     }
 }
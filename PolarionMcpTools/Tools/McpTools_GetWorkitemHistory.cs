@@ -50,13 +50,18 @@ public sealed partial class McpTools
                 sb.AppendLine($"Showing {limitDescription} revision{(revisionsDict.Count != 1 ? "s" : "")} (newest to oldest)");
                 sb.AppendLine();
 
-                var markdownConverter = new ReverseMarkdown.Converter();
+                var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
+                var historicalWorkItems = _serviceProvider.GetRequiredService<HistoricalWorkItemCache>();
+                var projectKey = GetCurrentProjectKey();
 
                 var i = 0;
                 foreach (var kvp in revisionsDict)
                 {
                     var revisionId = kvp.Key;
                     var revision = kvp.Value;
+
+                    // Revisions are immutable, so keep them for later get_workitem revision lookups
+                    historicalWorkItems.Intern(projectKey, workitemId, revisionId, revision);
                     var isLatest = (i == 0);
 
                     sb.AppendLine("---");
@@ -74,7 +79,7 @@ public sealed partial class McpTools
 
                     if (revision.author != null)
                     {
-                        var authorString = Utils.PolarionValueToString(revision.author, markdownConverter);
+                        var authorString = markdownConversion.ValueToString(revision.author);
                         sb.AppendLine($"- **Author**: {authorString}");
                     }
 
@@ -85,13 +90,13 @@ public sealed partial class McpTools
 
                     if (revision.status != null)
                     {
-                        var statusString = Utils.PolarionValueToString(revision.status, markdownConverter);
+                        var statusString = markdownConversion.ValueToString(revision.status);
                         sb.AppendLine($"- **Status**: {statusString}");
                     }
 
                     if (revision.type != null)
                     {
-                        var typeString = Utils.PolarionValueToString(revision.type, markdownConverter);
+                        var typeString = markdownConversion.ValueToString(revision.type);
                         sb.AppendLine($"- **Type**: {typeString}");
                     }
 
@@ -100,7 +105,7 @@ public sealed partial class McpTools
 
                     if (revision.description != null)
                     {
-                        var descriptionMarkdown = Utils.PolarionValueToString(revision.description, markdownConverter);
+                        var descriptionMarkdown = markdownConversion.ValueToString(revision.description);
                         sb.AppendLine(descriptionMarkdown);
                     }
                     else
@@ -7,7 +7,8 @@ public sealed partial class McpTools
      Description("Lists all Documents in the Polarion Project. Optionally filter by space name and/or title. Results are returned as a Markdown table with columns: Id, Title, Space, Type, Status.")]
     public async Task<string> ListDocuments(
         [Description("Optional space name to filter documents by. If not provided, returns documents from all spaces.")] string? space = null,
-        [Description("Optional title filter. Returns documents whose title contains this string (case-insensitive).")] string? titleFilter = null)
+        [Description("Optional title filter. Returns documents whose title contains this string (case-insensitive).")] string? titleFilter = null,
+        [Description("Set to true to reload the document list from Polarion first, e.g. after documents were created or moved. Defaults to false.")] bool refresh = false)
     {
         await using (var scope = _serviceProvider.CreateAsyncScope())
         {
@@ -23,39 +24,23 @@ public sealed partial class McpTools
             try
             {
                 var projectConfig = GetCurrentProjectConfig();
-                string? blacklistPattern = projectConfig?.BlacklistSpaceContainingMatch;
-
-                List<ModuleThin> modules;
-
-                if (!string.IsNullOrWhiteSpace(space))
-                {
-                    // Filter by specific space
-                    var result = await polarionClient.GetModulesInSpaceThinAsync(space);
-                    if (result.IsFailed)
-                    {
-                        return $"ERROR: Failed to fetch documents from space '{space}'. Error: {result.Errors.First()}";
-                    }
-                    modules = result.Value.ToList();
-                }
-                else
+                if (projectConfig == null)
                 {
-                    // Get all documents (with optional title filter passed to API)
-                    var result = await polarionClient.GetModulesThinAsync(blacklistPattern, titleFilter);
-                    if (result.IsFailed)
-                    {
-                        return $"ERROR: Failed to fetch Polarion documents. Error: {result.Errors.First()}";
-                    }
-                    modules = result.Value.ToList();
+                    return "ERROR: No Polarion project configuration found for this connection.";
                 }
 
-                // Apply title filter if space was specified (API doesn't filter when getting by space)
-                if (!string.IsNullOrWhiteSpace(space) && !string.IsNullOrWhiteSpace(titleFilter))
+                // Space, title and blacklist filters run against the project's cached catalog
+                var catalog = _serviceProvider.GetRequiredService<PolarionProjectCatalog>();
+                var catalogResult = refresh
+                    ? await catalog.RefreshAsync(polarionClient, projectConfig)
+                    : await catalog.GetAsync(polarionClient, projectConfig);
+                if (catalogResult.IsFailed)
                 {
-                    modules = modules.Where(m =>
-                        m.Title != null && m.Title.Contains(titleFilter, StringComparison.OrdinalIgnoreCase))
-                        .ToList();
+                    return $"ERROR: Failed to fetch Polarion documents. Error: {catalogResult.Errors.First()}";
                 }
 
+                var modules = catalogResult.Value.GetDocuments(space, titleFilter, projectConfig.BlacklistSpaceContainingMatch);
+
                 if (modules.Count == 0)
                 {
                     var filterDesc = "";
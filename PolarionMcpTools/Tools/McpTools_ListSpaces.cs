@@ -24,15 +24,19 @@ public sealed partial class McpTools
             {
                 // Get the current project configuration to check for blacklist pattern
                 var projectConfig = GetCurrentProjectConfig();
-                string? blacklistPattern = projectConfig?.BlacklistSpaceContainingMatch;
+                if (projectConfig == null)
+                {
+                    return "ERROR: No Polarion project configuration found for this connection.";
+                }
 
-                var spacesResult = await polarionClient.GetSpacesAsync(blacklistPattern);
-                if (spacesResult.IsFailed)
+                var catalog = _serviceProvider.GetRequiredService<PolarionProjectCatalog>();
+                var catalogResult = await catalog.GetAsync(polarionClient, projectConfig);
+                if (catalogResult.IsFailed)
                 {
-                    return $"ERROR: Failed to fetch Polarion spaces. Error: {spacesResult.Errors.First()}";
+                    return $"ERROR: Failed to fetch Polarion spaces. Error: {catalogResult.Errors.First()}";
                 }
 
-                var spaces = spacesResult.Value;
+                var spaces = catalogResult.Value.GetSpaces(projectConfig.BlacklistSpaceContainingMatch);
 
                 // return a comma-separated list of space names
                 var combinedWorkItems = new StringBuilder();
@@ -1,4 +1,5 @@
 using System.Text.RegularExpressions;
+using ModelContextProtocol;
 
 namespace PolarionMcpTools;
 
@@ -8,7 +9,7 @@ public sealed partial class McpTools
     [McpServerTool(Name = "search_in_document"),
      Description("Searches a Polarion Document for work items matching search terms. " +
                  "Returns matching Requirements, Test Cases, and Test Procedures as Markdown. " +
-                 "The search is performed across title and description fields.")]
+                 "The search is performed across title and description fields, and results are ranked by relevance.")]
     public async Task<string> SearchInDocument(
         [Description("The Polarion space name (e.g., 'MySpace').")]
         string space,
@@ -22,7 +23,9 @@ public sealed partial class McpTools
         string searchQuery,
 
         [Description("Document revision number. Use '-1' for latest revision.")]
-        string revision = "-1")
+        string revision = "-1",
+
+        IProgress<ProgressNotificationValue>? progress = null)
     {
         if (string.IsNullOrWhiteSpace(space))
         {
@@ -49,63 +52,42 @@ public sealed partial class McpTools
             }
 
             var polarionClient = clientResult.Value;
+            var markdownConversion = _serviceProvider.GetRequiredService<MarkdownConversionService>();
 
             try
             {
-                // Get all work items from the module, using revision-aware API when needed
-                WorkItem[] allWorkItems;
+                // Get all work items from the module (HEAD or baseline revision) through the snapshot cache
+                var snapshotCache = _serviceProvider.GetRequiredService<ModuleSnapshotCache>();
+                var snapshotResult = await snapshotCache.GetAsync(polarionClient, GetCurrentProjectKey(), space, documentId, revision);
 
-                if (revision == "-1")
+                if (snapshotResult.IsFailed)
                 {
-                    // Latest revision - use standard query
-                    var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(
-                        space,
-                        documentId,
-                        null); // Get all types
+                    var errorMessage = snapshotResult.Errors.First().Message;
 
-                    if (workItemsResult.IsFailed)
+                    if (revision == "-1")
                     {
-                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {workItemsResult.Errors.First().Message}";
+                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}'. Error: {errorMessage}";
                     }
 
-                    allWorkItems = workItemsResult.Value;
-                }
-                else
-                {
-                    // Specific revision - use baseline revision API
-                    var workItemsResult = await polarionClient.GetWorkItemsByModuleRevisionAsync(
-                        space,
-                        documentId,
-                        revision);
-
-                    if (workItemsResult.IsFailed)
+                    if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
                     {
-                        var errorMessage = workItemsResult.Errors.First().Message;
-
-                        if (errorMessage.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
-                        {
-                            return $"ERROR: (1044) Document '{space}/{documentId}' not found at revision '{revision}'. " +
-                                   "Use get_document_revision_history to find valid revision numbers.";
-                        }
-
-                        return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}' at revision '{revision}'. Error: {errorMessage}";
+                        return $"ERROR: (1044) Document '{space}/{documentId}' not found at revision '{revision}'. " +
+                               "Use get_document_revision_history to find valid revision numbers.";
                     }
 
-                    allWorkItems = workItemsResult.Value
-                        .Where(wi => wi?.WorkItem != null)
-                        .Select(wi => wi.WorkItem)
-                        .ToArray();
+                    return $"ERROR: (1044) Failed to fetch work items from module '{space}/{documentId}' at revision '{revision}'. Error: {errorMessage}";
                 }
+
+                var allWorkItems = snapshotResult.Value.WorkItems;
                 if (allWorkItems is null || allWorkItems.Length == 0)
                 {
                     return $"No work items found in module '{space}/{documentId}'.";
                 }
 
-                // Parse search query and filter work items in memory
+                // Parse search query and answer it from the snapshot's full-text index, best matches first
                 var searchMatcher = ParseSearchQuery(searchQuery);
-                var matchingWorkItems = allWorkItems
-                    .Where(wi => wi != null && MatchesSearch(wi, searchMatcher))
-                    .ToList();
+                var matchingWorkItems = snapshotResult.Value.SearchIndex.Search(
+                    searchMatcher.Terms, matchAll: searchMatcher.MatchType != SearchMatchType.AnyTerm);
 
                 if (matchingWorkItems.Count == 0)
                 {
@@ -124,8 +106,10 @@ public sealed partial class McpTools
                 result.AppendLine($"- **Total Work Items in Document**: {allWorkItems.Length}");
                 result.AppendLine();
 
+                var progressReporter = new ToolProgressReporter(progress, matchingWorkItems.Count, "Rendering search results");
                 foreach (var workItem in matchingWorkItems)
                 {
+                    progressReporter.Advance();
                     if (workItem?.id is null)
                     {
                         continue;
@@ -142,7 +126,7 @@ public sealed partial class McpTools
 
                     if (!string.IsNullOrWhiteSpace(workItem.description?.content))
                     {
-                        var markdown = polarionClient.ConvertWorkItemToMarkdown(workItem.id, workItem);
+                        var markdown = markdownConversion.ConvertWorkItem(polarionClient, workItem.id, workItem);
                         result.AppendLine("### Description");
                         result.AppendLine();
                         result.AppendLine(markdown);
@@ -211,26 +195,6 @@ public sealed partial class McpTools
         };
     }
 
-    /// <summary>
-    /// Checks if a work item matches the search criteria.
-    /// Searches in title and description fields.
-    /// </summary>
-    private static bool MatchesSearch(WorkItem workItem, SearchMatcher matcher)
-    {
-        // Combine searchable text from title and description
-        var title = workItem.title ?? "";
-        var description = workItem.description?.content ?? "";
-        var searchableText = $"{title} {description}";
-
-        return matcher.MatchType switch
-        {
-            SearchMatchType.ExactPhrase => searchableText.Contains(matcher.Terms[0], StringComparison.OrdinalIgnoreCase),
-            SearchMatchType.AllTerms => matcher.Terms.All(term => searchableText.Contains(term, StringComparison.OrdinalIgnoreCase)),
-            SearchMatchType.AnyTerm => matcher.Terms.Any(term => searchableText.Contains(term, StringComparison.OrdinalIgnoreCase)),
-            _ => false
-        };
-    }
-
     private enum SearchMatchType
     {
         AnyTerm,      // OR logic: match if any term is found
@@ -22,8 +22,11 @@ public sealed partial class McpTools
         [Description("Sort order field. Default is 'created'. Other options: 'updated', 'id', 'title'.")]
         string? sortBy = "created",
 
-        [Description("Maximum number of results to return. Default is 50, max is 500.")]
-        int? maxResults = 50)
+        [Description("Maximum number of results to return per page. Default is 50, max is 500.")]
+        int? maxResults = 50,
+
+        [Description("Optional 1-based page number. Use with maxResults to page through large result sets. Default is 1.")]
+        int? pageNumber = 1)
     {
         // Input validation
         if (string.IsNullOrWhiteSpace(searchQuery))
@@ -34,6 +37,7 @@ public sealed partial class McpTools
         // Cap maxResults to valid range
         if (maxResults < 1) maxResults = 1;
         if (maxResults > 500) maxResults = 500;
+        if (pageNumber < 1) pageNumber = 1;
 
         // Validate sortBy field
         var validSortFields = new[] { "created", "updated", "id", "title" };
@@ -62,11 +66,14 @@ public sealed partial class McpTools
                 // Get field list
                 var fieldList = GetDefaultFieldList();
 
-                // Call Polarion API
-                var searchResult = await polarionClient.SearchWorkitemAsync(
+                // Call Polarion API - only the requested page is fetched with the full field list
+                var searchResult = await WorkItemSearchPaging.SearchPageAsync(
+                    polarionClient,
                     luceneQuery,
                     sortField,
-                    fieldList);
+                    fieldList,
+                    pageNumber ?? 1,
+                    maxResults ?? 50);
 
                 if (searchResult.IsFailed)
                 {
@@ -82,15 +89,21 @@ public sealed partial class McpTools
                     return $"ERROR: (1045) Failed to search work items. Error: {errorMsg}";
                 }
 
-                var workItems = searchResult.Value;
-                if (workItems == null || workItems.Length == 0)
+                var page = searchResult.Value;
+                if (page.TotalCount == 0)
                 {
                     return $"No work items matching '{searchQuery}' found in project. " +
                            $"Lucene query used: {luceneQuery}";
                 }
 
+                if (page.Items.Count == 0)
+                {
+                    return $"Page {page.PageNumber} is beyond the last page of results for '{searchQuery}'. " +
+                           $"{page.TotalCount} work items match across {page.TotalPages} page(s) of {page.PageSize}.";
+                }
+
                 // Format and return results
-                return FormatResults(workItems, searchQuery, luceneQuery, itemTypes, statusFilter, sortField, maxResults ?? 50);
+                return FormatResults(page, searchQuery, luceneQuery, itemTypes, statusFilter, sortField);
             }
             catch (Exception ex)
             {
@@ -191,13 +204,12 @@ public sealed partial class McpTools
     /// </summary>
     [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
     private static string FormatResults(
-        WorkItem[] workItems,
+        WorkItemSearchPage page,
         string searchQuery,
         string luceneQuery,
         string? itemTypes,
         string? statusFilter,
-        string sortField,
-        int maxResults)
+        string sortField)
     {
         var sb = new StringBuilder();
         sb.AppendLine("# Search Results for Work Items");
@@ -207,13 +219,16 @@ public sealed partial class McpTools
         sb.AppendLine($"- **Type Filter**: {itemTypes ?? "All"}");
         sb.AppendLine($"- **Status Filter**: {statusFilter ?? "All"}");
         sb.AppendLine($"- **Sort By**: {sortField}");
-        sb.AppendLine($"- **Matching Work Items**: {Math.Min(workItems.Length, maxResults)}");
-        sb.AppendLine($"- **Max Results**: {maxResults}");
+        sb.AppendLine($"- **Matching Work Items**: {page.TotalCount}");
+        sb.AppendLine($"- **Max Results**: {page.PageSize}");
+        sb.AppendLine($"- **Page**: {page.PageNumber} of {page.TotalPages} ({page.Items.Count} work items on this page)");
+        if (page.HasNextPage)
+        {
+            sb.AppendLine($"- **Next Page**: call again with pageNumber={page.PageNumber + 1}");
+        }
         sb.AppendLine();
 
-        var itemsToDisplay = workItems.Take(maxResults);
-
-        foreach (var item in itemsToDisplay)
+        foreach (var item in page.Items)
         {
             if (item is null)
             {
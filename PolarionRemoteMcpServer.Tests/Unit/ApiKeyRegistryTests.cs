@@ -0,0 +1,87 @@
+using FluentAssertions;
+using Microsoft.Extensions.Options;
+using Moq;
+using PolarionRemoteMcpServer.Authentication;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for ApiKeyRegistry key lookup, cached principals and configuration reload
+/// </summary>
+public sealed class ApiKeyRegistryTests
+{
+    [Fact]
+    public async Task Find_WithConfiguredKey_ShouldReturnConsumerWithScopes()
+    {
+        // Arrange
+        using var registry = new ApiKeyRegistry(CreateMonitor(CreateConfig(("reader", "key-1", true))).Object);
+
+        // Act
+        var consumer = registry.Find("key-1");
+
+        // Assert
+        consumer.Should().NotBeNull();
+        consumer!.ConsumerId.Should().Be("reader");
+        var result = await consumer.Result;
+        result.Succeeded.Should().BeTrue();
+        result.Principal!.HasClaim("scope", ApiScopes.PolarionRead).Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task Find_ShouldRejectUnknownKeysAndFailInactiveConsumers()
+    {
+        // Arrange
+        using var registry = new ApiKeyRegistry(CreateMonitor(CreateConfig(("disabled", "key-2", false))).Object);
+
+        // Act
+        var unknown = registry.Find("key-3");
+        var inactive = registry.Find("key-2");
+
+        // Assert
+        unknown.Should().BeNull();
+        inactive.Should().NotBeNull();
+        (await inactive!.Result).Succeeded.Should().BeFalse();
+    }
+
+    [Fact]
+    public void Find_AfterConfigurationReload_ShouldUseNewKeys()
+    {
+        // Arrange
+        Action<ApiConsumersConfig, string?>? onChange = null;
+        var monitor = CreateMonitor(CreateConfig(("reader", "old-key", true)));
+        monitor.Setup(m => m.OnChange(It.IsAny<Action<ApiConsumersConfig, string?>>()))
+            .Callback<Action<ApiConsumersConfig, string?>>(listener => onChange = listener)
+            .Returns(Mock.Of<IDisposable>());
+        using var registry = new ApiKeyRegistry(monitor.Object);
+
+        // Act
+        onChange!(CreateConfig(("reader", "new-key", true)), null);
+
+        // Assert
+        registry.Find("old-key").Should().BeNull();
+        registry.Find("new-key")!.ConsumerId.Should().Be("reader");
+    }
+
+    private static Mock<IOptionsMonitor<ApiConsumersConfig>> CreateMonitor(ApiConsumersConfig config)
+    {
+        var monitor = new Mock<IOptionsMonitor<ApiConsumersConfig>>();
+        monitor.Setup(m => m.CurrentValue).Returns(config);
+        return monitor;
+    }
+
+    private static ApiConsumersConfig CreateConfig(params (string Id, string Key, bool Active)[] consumers)
+    {
+        return new ApiConsumersConfig
+        {
+            Consumers = consumers.ToDictionary(
+                c => c.Id,
+                c => new ApiConsumerConfig
+                {
+                    Name = c.Id,
+                    ApplicationKey = c.Key,
+                    Active = c.Active,
+                    AllowedScopes = new List<string> { ApiScopes.PolarionRead }
+                })
+        };
+    }
+}
@@ -0,0 +1,67 @@
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using PolarionRemoteMcpServer.Endpoints;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for ConditionalGet ETag generation and If-None-Match handling
+/// </summary>
+public sealed class ConditionalGetTests
+{
+    [Fact]
+    public void Evaluate_WithoutIfNoneMatch_ShouldSetHeadersAndReturnNull()
+    {
+        // Arrange
+        var httpContext = CreateContext("/polarion/rest/v1/projects/P/workitems/WI-1");
+
+        // Act
+        var result = ConditionalGet.Evaluate(httpContext, new[] { "WI-1@1" });
+
+        // Assert
+        result.Should().BeNull();
+        httpContext.Response.Headers.ETag.ToString().Should().StartWith("\"").And.EndWith("\"");
+        httpContext.Response.Headers.CacheControl.ToString().Should().Be(ConditionalGet.RevalidateCacheControl);
+    }
+
+    [Fact]
+    public void Evaluate_WithMatchingIfNoneMatch_ShouldReturnNotModified()
+    {
+        // Arrange
+        var etag = ConditionalGet.CreateETag(CreateContext("/items").Request, new[] { "WI-1@1" });
+        var httpContext = CreateContext("/items");
+        httpContext.Request.Headers.IfNoneMatch = $"\"other\", W/{etag}";
+
+        // Act
+        var result = ConditionalGet.Evaluate(httpContext, new[] { "WI-1@1" }, revisionPinned: true);
+
+        // Assert
+        result.Should().BeAssignableTo<IStatusCodeHttpResult>()
+            .Which.StatusCode.Should().Be(StatusCodes.Status304NotModified);
+        httpContext.Response.Headers.CacheControl.ToString().Should().Be(ConditionalGet.ImmutableCacheControl);
+    }
+
+    [Fact]
+    public void CreateETag_ShouldChangeWithVersionsAndQuery()
+    {
+        // Arrange
+        var request = CreateContext("/items", "?page[number]=1").Request;
+        var otherPage = CreateContext("/items", "?page[number]=2").Request;
+
+        // Act
+        var etag = ConditionalGet.CreateETag(request, new[] { "WI-1@1" });
+
+        // Assert
+        ConditionalGet.CreateETag(request, new[] { "WI-1@1" }).Should().Be(etag);
+        ConditionalGet.CreateETag(request, new[] { "WI-1@2" }).Should().NotBe(etag);
+        ConditionalGet.CreateETag(otherPage, new[] { "WI-1@1" }).Should().NotBe(etag);
+    }
+
+    private static DefaultHttpContext CreateContext(string path, string query = "")
+    {
+        var httpContext = new DefaultHttpContext();
+        httpContext.Request.Path = path;
+        httpContext.Request.QueryString = new QueryString(query);
+        return httpContext;
+    }
+}
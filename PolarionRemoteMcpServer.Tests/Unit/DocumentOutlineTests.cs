@@ -0,0 +1,72 @@
+using FluentAssertions;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for DocumentOutline ordering, hierarchy and section lookups
+/// </summary>
+public sealed class DocumentOutlineTests
+{
+    [Fact]
+    public void OutlineNumberComparer_ShouldOrderSegmentsNumerically()
+    {
+        // Arrange
+        var outlineNumbers = new[] { "1.10", "2", "1.2.1", "1.2-1", "1.2", "1" };
+
+        // Act
+        var sorted = outlineNumbers.Order(OutlineNumberComparer.Instance).ToList();
+
+        // Assert
+        sorted.Should().Equal("1", "1.2", "1.2-1", "1.2.1", "1.10", "2");
+    }
+
+    [Fact]
+    public void GetSection_ShouldReturnSubtreeOnly()
+    {
+        // Arrange
+        var outline = new DocumentOutline(CreateWorkItems("1", "1.1", "1.1-1", "1.10", "1.1.1", "2"));
+
+        // Act
+        var section = outline.GetSection("1.1");
+
+        // Assert
+        section.Select(wi => wi.outlineNumber).Should().Equal("1.1", "1.1-1", "1.1.1");
+    }
+
+    [Fact]
+    public void GetSection_WithoutSectionWorkItem_ShouldReturnSubSections()
+    {
+        // Arrange
+        var outline = new DocumentOutline(CreateWorkItems("1", "3.1", "3.2", "3.10", "4"));
+
+        // Act
+        var section = outline.GetSection("3");
+
+        // Assert
+        section.Select(wi => wi.outlineNumber).Should().Equal("3.1", "3.2", "3.10");
+    }
+
+    [Fact]
+    public void Constructor_ShouldLinkParentsAndChildren()
+    {
+        // Arrange
+        var outline = new DocumentOutline(CreateWorkItems("2", "1.1", "1", "1.1.1", "1.2"));
+
+        // Act
+        var section = outline.Find("1");
+
+        // Assert
+        outline.Roots.Select(n => n.OutlineNumber).Should().Equal("1", "2");
+        section!.Children.Select(n => n.OutlineNumber).Should().Equal("1.1", "1.2");
+        outline.Find("1.1.1")!.Parent!.OutlineNumber.Should().Be("1.1");
+    }
+
+    private static WorkItem[] CreateWorkItems(params string[] outlineNumbers)
+    {
+        return outlineNumbers
+            .Select(number => new WorkItem { id = $"WI-{number}", outlineNumber = number })
+            .ToArray();
+    }
+}
@@ -0,0 +1,185 @@
+using FluentAssertions;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for DocumentRevisionDiff change detection between two module snapshots
+/// </summary>
+public sealed class DocumentRevisionDiffTests
+{
+    [Fact]
+    public void Compute_ShouldReportAddedAndRemovedWorkItems()
+    {
+        // Arrange
+        var from = CreateSnapshot("10", CreateWorkItem("A", "1"), CreateWorkItem("B", "2"));
+        var to = CreateSnapshot("20", CreateWorkItem("A", "1"), CreateWorkItem("C", "2"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        diff.Changes.Select(c => (c.Id, c.Kind)).Should().Equal(
+            ("C", WorkItemChangeKind.Added),
+            ("B", WorkItemChangeKind.Removed));
+        diff.UnchangedCount.Should().Be(1);
+    }
+
+    [Fact]
+    public void Compute_ShouldSkipContentComparisonWhenRevisionIsUnchanged()
+    {
+        // Arrange
+        var from = CreateSnapshot("10", CreateWorkItem("A", "1", title: "Old"));
+        var to = CreateSnapshot("20", CreateWorkItem("A", "1", title: "New"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        diff.Changes.Should().BeEmpty();
+        diff.SkippedByRevisionCount.Should().Be(1);
+    }
+
+    [Fact]
+    public void Compute_ShouldReportChangedFieldsWhenRevisionDiffers()
+    {
+        // Arrange
+        var from = CreateSnapshot("10", CreateWorkItem("A", "1", title: "Old", status: "draft", revision: "5"));
+        var to = CreateSnapshot("20", CreateWorkItem("A", "1", title: "New", status: "draft", revision: "15"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        var change = diff.Changes.Should().ContainSingle().Subject;
+        change.Kind.Should().Be(WorkItemChangeKind.Modified);
+        change.IsMoved.Should().BeFalse();
+        change.FieldChanges.Should().ContainSingle().Which.Should().Be(new WorkItemFieldChange("title", "Old", "New"));
+    }
+
+    [Fact]
+    public void Compute_ShouldNotTreatRenumberingAsMove()
+    {
+        // Arrange
+        var from = CreateSnapshot("10", CreateWorkItem("A", "1"), CreateWorkItem("B", "2"), CreateWorkItem("C", "3"));
+        var to = CreateSnapshot("20", CreateWorkItem("B", "1"), CreateWorkItem("C", "2"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        diff.Changes.Should().ContainSingle().Which.Kind.Should().Be(WorkItemChangeKind.Removed);
+        diff.MovedCount.Should().Be(0);
+    }
+
+    [Fact]
+    public void Compute_ShouldReportReorderedWorkItemAsMoved()
+    {
+        // Arrange
+        var from = CreateSnapshot("10", CreateWorkItem("A", "1"), CreateWorkItem("B", "2"), CreateWorkItem("C", "3"));
+        var to = CreateSnapshot("20", CreateWorkItem("C", "1"), CreateWorkItem("A", "2"), CreateWorkItem("B", "3"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        var change = diff.Changes.Should().ContainSingle().Subject;
+        change.Id.Should().Be("C");
+        change.Kind.Should().Be(WorkItemChangeKind.Moved);
+        (change.FromOutlineNumber, change.ToOutlineNumber).Should().Be(("3", "1"));
+    }
+
+    [Fact]
+    public void Compute_AgainstHead_ShouldCompareOnlyItemsThatDifferFromHead()
+    {
+        // Arrange
+        var from = CreateSnapshot("10",
+            CreateWorkItem("A", "1", title: "Same", isHistorical: false),
+            CreateWorkItem("B", "2", title: "Old", revision: "5", isHistorical: true));
+        var to = CreateSnapshot("-1",
+            CreateWorkItem("A", "1", title: "Same"),
+            CreateWorkItem("B", "2", title: "New"));
+
+        // Act
+        var diff = DocumentRevisionDiff.Compute(from, to);
+
+        // Assert
+        diff.SkippedByRevisionCount.Should().Be(1);
+        diff.Changes.Should().ContainSingle().Which.Id.Should().Be("B");
+    }
+
+    [Fact]
+    public void DiffLines_ShouldKeepCommonLines()
+    {
+        // Act
+        var lines = DocumentRevisionDiff.DiffLines("a\nb\nc", "a\nx\nc");
+
+        // Assert
+        lines.Should().Equal((' ', "a"), ('-', "b"), ('+', "x"), (' ', "c"));
+    }
+
+    [Fact]
+    public void FormatUnifiedDiff_ShouldOnlyIncludeChangedLinesWithContext()
+    {
+        // Arrange
+        var from = string.Join("\n", Enumerable.Range(1, 30).Select(i => $"line {i}"));
+        var to = from.Replace("line 15", "line fifteen");
+
+        // Act
+        var hunks = DocumentRevisionDiff.FormatUnifiedDiff(from, to);
+
+        // Assert
+        hunks.Should().Equal(
+            "@@ -12,7 +12,7 @@",
+            " line 12", " line 13", " line 14",
+            "-line 15", "+line fifteen",
+            " line 16", " line 17", " line 18");
+    }
+
+    [Fact]
+    public void DiffLines_WithLongChangedMiddle_ShouldFallBackToRemoveAndAdd()
+    {
+        // Arrange
+        var from = "same\n" + string.Join("\n", Enumerable.Range(0, 10).Select(i => $"a{i}"));
+        var to = "same\n" + string.Join("\n", Enumerable.Range(0, 10).Select(i => $"b{i}"));
+
+        // Act
+        var lines = DocumentRevisionDiff.DiffLines(from, to, maxLines: 5);
+
+        // Assert
+        lines[0].Should().Be((' ', "same"));
+        lines.Skip(1).Take(10).Should().OnlyContain(l => l.Operation == '-');
+        lines.Skip(11).Should().HaveCount(10).And.OnlyContain(l => l.Operation == '+');
+    }
+
+    private static (WorkItem WorkItem, string Revision, bool IsHistorical) CreateWorkItem(
+        string id,
+        string outlineNumber,
+        string? title = null,
+        string? status = null,
+        string revision = "1",
+        bool isHistorical = true)
+    {
+        var workItem = new WorkItem
+        {
+            id = id,
+            outlineNumber = outlineNumber,
+            title = title ?? id,
+            status = status == null ? null : new EnumOptionId { id = status }
+        };
+
+        return (workItem, revision, isHistorical);
+    }
+
+    private static ModuleSnapshot CreateSnapshot(
+        string revision,
+        params (WorkItem WorkItem, string Revision, bool IsHistorical)[] items)
+    {
+        var metadata = revision == "-1"
+            ? null
+            : items.ToDictionary(item => item.WorkItem.id, item => (item.Revision, "100", item.IsHistorical));
+
+        return new ModuleSnapshot("Space", "Document", revision, items.Select(item => item.WorkItem).ToArray(), metadata);
+    }
+}
@@ -0,0 +1,125 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for HistoricalWorkItemCache hits, misses and failed lookups
+/// </summary>
+public sealed class HistoricalWorkItemCacheTests
+{
+    [Fact]
+    public async Task GetAsync_InternedRevision_ShouldNotCallPolarion()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig());
+        var client = new Mock<IPolarionClient>(MockBehavior.Strict);
+        var workItem = new WorkItem { id = "WI-1", title = "At 100" };
+        cache.Intern("P", "WI-1", "100", workItem);
+
+        // Act
+        var result = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Should().BeSameAs(workItem);
+        cache.GetStatistics().Hits.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetAsync_Miss_ShouldFetchOnceAndServeLaterCallsFromCache()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig());
+        var client = CreateClient(Result.Ok(new WorkItem { id = "WI-1", title = "At 100" }));
+
+        // Act
+        var first = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+        var second = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+
+        // Assert
+        first.Value.Should().BeSameAs(second.Value);
+        client.Verify(c => c.GetWorkItemByIdAsync("WI-1", "100"), Times.Once);
+        var statistics = cache.GetStatistics();
+        (statistics.Hits, statistics.Misses, statistics.Entries).Should().Be((1, 1, 1));
+    }
+
+    [Fact]
+    public async Task GetAsync_DifferentProjectOrRevision_ShouldNotShareEntries()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig());
+        var client = CreateClient(Result.Ok(new WorkItem { id = "WI-1" }));
+        cache.Intern("P", "WI-1", "100", new WorkItem { id = "WI-1" });
+
+        // Act
+        await cache.GetAsync(client.Object, "Q", "WI-1", "100");
+        await cache.GetAsync(client.Object, "P", "WI-1", "200");
+
+        // Assert
+        client.Verify(c => c.GetWorkItemByIdAsync("WI-1", It.IsAny<string>()), Times.Exactly(2));
+    }
+
+    [Fact]
+    public async Task GetAsync_Failure_ShouldReturnErrorAndNotBeCached()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig());
+        var client = CreateClient(Result.Fail<WorkItem>("boom"));
+
+        // Act
+        var first = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+        var second = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+
+        // Assert
+        first.IsFailed.Should().BeTrue();
+        first.Errors.Single().Message.Should().Be("boom");
+        second.IsFailed.Should().BeTrue();
+        client.Verify(c => c.GetWorkItemByIdAsync("WI-1", "100"), Times.Exactly(2));
+        cache.GetStatistics().Entries.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task GetAsync_NotFound_ShouldFail()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig());
+        var client = CreateClient(Result.Ok<WorkItem>(null!));
+
+        // Act
+        var result = await cache.GetAsync(client.Object, "P", "WI-1", "100");
+
+        // Assert
+        result.IsFailed.Should().BeTrue();
+        cache.GetStatistics().Entries.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task GetAsync_CacheDisabled_ShouldAlwaysFetch()
+    {
+        // Arrange
+        var cache = new HistoricalWorkItemCache(new PolarionCacheConfig { HistoricalWorkItemMaxMegabytes = 0 });
+        var client = CreateClient(Result.Ok(new WorkItem { id = "WI-1" }));
+
+        // Act
+        await cache.GetAsync(client.Object, "P", "WI-1", "100");
+        await cache.GetAsync(client.Object, "P", "WI-1", "100");
+
+        // Assert
+        client.Verify(c => c.GetWorkItemByIdAsync("WI-1", "100"), Times.Exactly(2));
+        cache.GetStatistics().Entries.Should().Be(0);
+    }
+
+    private static Mock<IPolarionClient> CreateClient(Result<WorkItem> result)
+    {
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>()))
+            .ReturnsAsync(result);
+        return client;
+    }
+}
@@ -0,0 +1,122 @@
+using System.Diagnostics.Metrics;
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for InstrumentedPolarionClient call outcomes reported to PolarionMetrics
+/// </summary>
+public sealed class InstrumentedPolarionClientTests : IDisposable
+{
+    // Metrics are process-wide; only measurements recorded from this test's async flow are captured
+    private readonly AsyncLocal<bool> _capturing = new();
+    private readonly List<(string? Operation, string? Outcome)> _calls = new();
+    private readonly MeterListener _listener = new();
+
+    public InstrumentedPolarionClientTests()
+    {
+        _listener.InstrumentPublished = (instrument, listener) =>
+        {
+            if (instrument.Meter.Name == PolarionMetrics.MeterName && instrument.Name == "polarion.client.call.duration")
+            {
+                listener.EnableMeasurementEvents(instrument);
+            }
+        };
+        _listener.SetMeasurementEventCallback<double>((_, _, tags, _) =>
+        {
+            if (!_capturing.Value)
+            {
+                return;
+            }
+
+            string? operation = null;
+            string? outcome = null;
+            foreach (var tag in tags)
+            {
+                switch (tag.Key)
+                {
+                    case "operation":
+                        operation = tag.Value as string;
+                        break;
+                    case "outcome":
+                        outcome = tag.Value as string;
+                        break;
+                }
+            }
+
+            lock (_calls)
+            {
+                _calls.Add((operation, outcome));
+            }
+        });
+        _listener.Start();
+    }
+
+    public void Dispose()
+    {
+        _listener.Dispose();
+    }
+
+    [Fact]
+    public async Task Call_FailedResult_ShouldBeRecordedAsError()
+    {
+        // Arrange
+        var client = CreateClient(Result.Fail<WorkItem>("boom"));
+        _capturing.Value = true;
+
+        // Act
+        var result = await client.GetWorkItemByIdAsync("WI-1", "100");
+
+        // Assert
+        result.IsFailed.Should().BeTrue();
+        _calls.Should().Equal(("GetWorkItemByIdAsync", "error"));
+    }
+
+    [Fact]
+    public async Task Call_SuccessfulResult_ShouldBeRecordedAsOk()
+    {
+        // Arrange
+        var client = CreateClient(Result.Ok(new WorkItem { id = "WI-1" }));
+        _capturing.Value = true;
+
+        // Act
+        var result = await client.GetWorkItemByIdAsync("WI-1", "100");
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        _calls.Should().Equal(("GetWorkItemByIdAsync", "ok"));
+    }
+
+    [Fact]
+    public async Task Call_Throwing_ShouldBeRecordedAsError()
+    {
+        // Arrange
+        var inner = new Mock<IPolarionClient>();
+        inner
+            .Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>()))
+            .ThrowsAsync(new InvalidOperationException("boom"));
+        var client = InstrumentedPolarionClient.Wrap(inner.Object);
+        _capturing.Value = true;
+
+        // Act
+        var act = () => client.GetWorkItemByIdAsync("WI-1", "100");
+
+        // Assert
+        await act.Should().ThrowAsync<InvalidOperationException>();
+        _calls.Should().Equal(("GetWorkItemByIdAsync", "error"));
+    }
+
+    private static IPolarionClient CreateClient(Result<WorkItem> result)
+    {
+        var inner = new Mock<IPolarionClient>();
+        inner
+            .Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>()))
+            .ReturnsAsync(result);
+        return InstrumentedPolarionClient.Wrap(inner.Object);
+    }
+}
@@ -0,0 +1,118 @@
+using FluentAssertions;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for MarkdownConversionService cache hits, size bound and disabling the cache
+/// </summary>
+public sealed class MarkdownConversionServiceTests
+{
+    [Fact]
+    public void ConvertHtml_SameHtmlTwice_ShouldConvertOnceAndReturnSameMarkdown()
+    {
+        // Arrange
+        var service = new MarkdownConversionService(new PolarionCacheConfig());
+
+        // Act
+        var first = service.ConvertHtml("<p>Shall <strong>work</strong></p>");
+        var second = service.ConvertHtml("<p>Shall <strong>work</strong></p>");
+
+        // Assert
+        first.Should().Contain("**work**");
+        second.Should().Be(first);
+        var statistics = service.GetStatistics();
+        statistics.Conversions.Should().Be(1);
+        statistics.CacheHits.Should().Be(1);
+        statistics.CacheMisses.Should().Be(1);
+        statistics.CachedEntries.Should().Be(1);
+    }
+
+    [Fact]
+    public void ConvertWorkItem_UpdatedWorkItem_ShouldBeConvertedAgain()
+    {
+        // Arrange
+        var service = new MarkdownConversionService(new PolarionCacheConfig());
+        var client = CreateClient(markdownLength: 10);
+        var workItem = CreateWorkItem("WI-1", new DateTime(2024, 1, 1));
+        var edited = CreateWorkItem("WI-1", new DateTime(2024, 1, 2));
+
+        // Act
+        var first = service.ConvertWorkItem(client.Object, "WI-1", workItem);
+        var cached = service.ConvertWorkItem(client.Object, "WI-1", workItem);
+        service.ConvertWorkItem(client.Object, "WI-1", edited);
+
+        // Assert
+        cached.Should().Be(first);
+        client.Verify(c => c.ConvertWorkItemToMarkdown("WI-1", workItem), Times.Once);
+        client.Verify(c => c.ConvertWorkItemToMarkdown("WI-1", edited), Times.Once);
+    }
+
+    [Fact]
+    public void ConvertWorkItem_OverMemoryBudget_ShouldEvictLeastRecentlyUsed()
+    {
+        // Arrange
+        var service = new MarkdownConversionService(new PolarionCacheConfig { MarkdownMaxMegabytes = 1 });
+        var client = CreateClient(markdownLength: 200_000);
+        var workItems = Enumerable.Range(1, 4).Select(i => CreateWorkItem($"WI-{i}", new DateTime(2024, 1, 1))).ToList();
+
+        // Act
+        foreach (var workItem in workItems)
+        {
+            service.ConvertWorkItem(client.Object, workItem.id, workItem);
+        }
+
+        service.ConvertWorkItem(client.Object, "WI-4", workItems[3]);
+        service.ConvertWorkItem(client.Object, "WI-1", workItems[0]);
+
+        // Assert
+        var statistics = service.GetStatistics();
+        statistics.CachedBytes.Should().BeLessThanOrEqualTo(1024L * 1024L);
+        statistics.Evictions.Should().BeGreaterThan(0);
+        client.Verify(c => c.ConvertWorkItemToMarkdown("WI-4", workItems[3]), Times.Once);
+        client.Verify(c => c.ConvertWorkItemToMarkdown("WI-1", workItems[0]), Times.Exactly(2), "WI-1 was the least recently used entry");
+    }
+
+    [Fact]
+    public void ConvertHtml_CacheDisabled_ShouldConvertEveryTime()
+    {
+        // Arrange
+        var service = new MarkdownConversionService(new PolarionCacheConfig { MarkdownMaxMegabytes = 0 });
+
+        // Act
+        var first = service.ConvertHtml("<p>Text</p>");
+        var second = service.ConvertHtml("<p>Text</p>");
+
+        // Assert
+        second.Should().Be(first);
+        var statistics = service.GetStatistics();
+        statistics.Conversions.Should().Be(2);
+        statistics.CacheHits.Should().Be(0);
+        statistics.CachedEntries.Should().Be(0);
+        statistics.CachedBytes.Should().Be(0);
+    }
+
+    private static Mock<IPolarionClient> CreateClient(int markdownLength)
+    {
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.ConvertWorkItemToMarkdown(It.IsAny<string>(), It.IsAny<WorkItem>()))
+            .Returns((string id, WorkItem _) => id + new string('x', markdownLength));
+        return client;
+    }
+
+    private static WorkItem CreateWorkItem(string id, DateTime updated)
+    {
+        return new WorkItem
+        {
+            id = id,
+            title = $"Title {id}",
+            updated = updated,
+            updatedSpecified = true,
+            description = new Text { type = "text/html", content = "<p>Body</p>" }
+        };
+    }
+}
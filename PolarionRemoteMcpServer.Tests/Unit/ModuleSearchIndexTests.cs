@@ -0,0 +1,80 @@
+using FluentAssertions;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for ModuleSearchIndex tokenizing, query matching and ranking
+/// </summary>
+public sealed class ModuleSearchIndexTests
+{
+    private static readonly WorkItem[] WorkItems =
+    [
+        CreateWorkItem("WI-1", "Power supply", "<p>The <b>voltage</b> regulator shall limit output.</p>"),
+        CreateWorkItem("WI-2", "Voltage monitoring", "<p>The sensor reports overvoltage &amp; undervoltage.</p>"),
+        CreateWorkItem("WI-3", "Timeout handling", "<p>Retry after a timeout of 5 seconds.</p>")
+    ];
+
+    [Fact]
+    public void Search_AnyTerm_ShouldRankTitleMatchesFirst()
+    {
+        // Arrange
+        var index = new ModuleSearchIndex(WorkItems);
+
+        // Act
+        var results = index.Search(["voltage"], matchAll: false);
+
+        // Assert
+        results.Select(wi => wi.id).Should().Equal("WI-2", "WI-1");
+    }
+
+    [Fact]
+    public void Search_AllTerms_ShouldRequireEveryTerm()
+    {
+        // Arrange
+        var index = new ModuleSearchIndex(WorkItems);
+
+        // Act
+        var results = index.Search(["voltage", "sensor"], matchAll: true);
+
+        // Assert
+        results.Should().ContainSingle().Which.id.Should().Be("WI-2");
+    }
+
+    [Fact]
+    public void Search_Phrase_ShouldMatchAcrossStrippedMarkup()
+    {
+        // Arrange
+        var index = new ModuleSearchIndex(WorkItems);
+
+        // Act
+        var results = index.Search(["voltage regulator"], matchAll: true);
+
+        // Assert
+        results.Should().ContainSingle().Which.id.Should().Be("WI-1");
+    }
+
+    [Fact]
+    public void Search_MarkupOnlyTerm_ShouldNotMatch()
+    {
+        // Arrange
+        var index = new ModuleSearchIndex(WorkItems);
+
+        // Act
+        var results = index.Search(["amp"], matchAll: false);
+
+        // Assert
+        results.Should().BeEmpty("HTML tags and entities are stripped before indexing");
+    }
+
+    private static WorkItem CreateWorkItem(string id, string title, string description)
+    {
+        return new WorkItem
+        {
+            id = id,
+            title = title,
+            description = new Text { type = "text/html", content = description }
+        };
+    }
+}
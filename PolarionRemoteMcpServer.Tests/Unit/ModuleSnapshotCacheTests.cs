@@ -0,0 +1,244 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for ModuleSnapshotCache size-bounded LRU eviction, HEAD snapshot expiry and prefetching
+/// </summary>
+public sealed class ModuleSnapshotCacheTests
+{
+    // About 400 KB per snapshot once estimated, so two fit in a 1 MB cache and a third does not
+    private const int DescriptionLength = 100_000;
+
+    [Fact]
+    public async Task GetAsync_OverSizeLimit_ShouldEvictLeastRecentlyUsedSnapshot()
+    {
+        // Arrange
+        var cache = CreateCache(maxMegabytes: 1);
+        var client = CreateClient(DescriptionLength, "A", "B", "C");
+
+        // Act
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "C", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+
+        // Assert
+        VerifyLoads(client, "A", Times.Once());
+        VerifyLoads(client, "B", Times.Exactly(2));
+        VerifyLoads(client, "C", Times.Once());
+
+        var statistics = cache.GetStatistics();
+        statistics.EstimatedBytes.Should().BeLessThanOrEqualTo(statistics.MaxBytes);
+        (statistics.Hits, statistics.Misses).Should().Be((2, 4));
+        statistics.Evictions.Should().Be(2, "C evicted B, then reloading B evicted C");
+    }
+
+    [Fact]
+    public async Task GetAsync_SnapshotLargerThanCache_ShouldNotBeStored()
+    {
+        // Arrange
+        var cache = CreateCache(maxMegabytes: 1);
+        var client = CreateClient(DescriptionLength * 3, "A");
+
+        // Act
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        VerifyLoads(client, "A", Times.Exactly(2));
+        cache.GetStatistics().Entries.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task GetAsync_HeadWithinTtl_ShouldBeServedFromCache()
+    {
+        // Arrange
+        var cache = CreateCache(headTtlSeconds: 60);
+        var client = CreateClient(10, "A");
+
+        // Act
+        var first = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        var second = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        second.Value.Should().BeSameAs(first.Value);
+        VerifyLoads(client, "A", Times.Once());
+    }
+
+    [Fact]
+    public async Task GetAsync_HeadPastTtl_ShouldReload()
+    {
+        // Arrange
+        var cache = CreateCache(headTtlSeconds: 1);
+        var client = CreateClient(10, "A");
+        var first = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await Task.Delay(TimeSpan.FromMilliseconds(1100));
+
+        // Act
+        var second = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        second.Value.Should().NotBeSameAs(first.Value);
+        VerifyLoads(client, "A", Times.Exactly(2));
+        cache.GetStatistics().Entries.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetAsync_HeadTtlZero_ShouldAlwaysReload()
+    {
+        // Arrange
+        var cache = CreateCache(headTtlSeconds: 0);
+        var client = CreateClient(10, "A");
+
+        // Act
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        VerifyLoads(client, "A", Times.Exactly(2));
+    }
+
+    [Fact]
+    public async Task GetAsync_Failure_ShouldNotBeCached()
+    {
+        // Arrange
+        var cache = CreateCache();
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.QueryWorkItemsInModuleAsync("Space", "A", It.IsAny<List<string>>()))
+            .ReturnsAsync(Result.Fail<WorkItem[]>("UnresolvableObjectException"));
+
+        // Act
+        var first = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        var second = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        first.IsFailed.Should().BeTrue();
+        first.Errors.Single().Message.Should().Be("UnresolvableObjectException");
+        second.IsFailed.Should().BeTrue();
+        VerifyLoads(client, "A", Times.Exactly(2));
+        cache.GetStatistics().Entries.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldDropOnlyThatDocument()
+    {
+        // Arrange
+        var cache = CreateCache();
+        var client = CreateClient(10, "A", "B");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+
+        // Act
+        var removed = cache.Invalidate("P", "Space", "A");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+
+        // Assert
+        removed.Should().Be(1);
+        VerifyLoads(client, "A", Times.Exactly(2));
+        VerifyLoads(client, "B", Times.Once());
+    }
+
+    [Fact]
+    public async Task GetWithoutCachingAsync_Miss_ShouldNotStoreOrEvictSnapshots()
+    {
+        // Arrange
+        var cache = CreateCache(maxMegabytes: 1);
+        var client = CreateClient(DescriptionLength, "A", "B", "C");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+
+        // Act
+        var exported = await cache.GetWithoutCachingAsync(client.Object, "P", "Space", "C", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        await cache.GetAsync(client.Object, "P", "Space", "B", "-1");
+
+        // Assert
+        exported.IsSuccess.Should().BeTrue();
+        VerifyLoads(client, "A", Times.Once());
+        VerifyLoads(client, "B", Times.Once());
+        cache.GetStatistics().Evictions.Should().Be(0);
+        cache.GetStatistics().Entries.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task GetWithoutCachingAsync_CachedSnapshot_ShouldBeReused()
+    {
+        // Arrange
+        var cache = CreateCache();
+        var client = CreateClient(10, "A");
+        var cached = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Act
+        var exported = await cache.GetWithoutCachingAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        exported.Value.Should().BeSameAs(cached.Value);
+        VerifyLoads(client, "A", Times.Once());
+    }
+
+    [Fact]
+    public async Task PrefetchAsync_HeadSnapshotPastTtl_ShouldBeServedOnceThenExpire()
+    {
+        // Arrange
+        var cache = CreateCache(headTtlSeconds: 0);
+        var client = CreateClient(10, "A");
+        var prefetched = await cache.PrefetchAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Act
+        var firstUse = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+        var secondUse = await cache.GetAsync(client.Object, "P", "Space", "A", "-1");
+
+        // Assert
+        firstUse.Value.Should().BeSameAs(prefetched.Value);
+        secondUse.Value.Should().NotBeSameAs(prefetched.Value);
+        VerifyLoads(client, "A", Times.Exactly(2));
+    }
+
+    private static ModuleSnapshotCache CreateCache(int maxMegabytes = 16, int headTtlSeconds = 60)
+    {
+        var cacheConfig = new PolarionCacheConfig
+        {
+            ModuleSnapshotMaxMegabytes = maxMegabytes,
+            HeadModuleTtlSeconds = headTtlSeconds
+        };
+        return new ModuleSnapshotCache(cacheConfig, new HistoricalWorkItemCache(cacheConfig));
+    }
+
+    private static Mock<IPolarionClient> CreateClient(int descriptionLength, params string[] documentIds)
+    {
+        var client = new Mock<IPolarionClient>();
+        foreach (var documentId in documentIds)
+        {
+            var workItems = new[]
+            {
+                new WorkItem
+                {
+                    id = $"{documentId}-1",
+                    title = documentId,
+                    description = new Text { type = "text/html", content = new string('x', descriptionLength) }
+                }
+            };
+
+            client
+                .Setup(c => c.QueryWorkItemsInModuleAsync("Space", documentId, It.IsAny<List<string>>()))
+                .ReturnsAsync(() => Result.Ok(workItems));
+        }
+
+        return client;
+    }
+
+    private static void VerifyLoads(Mock<IPolarionClient> client, string documentId, Times times)
+    {
+        client.Verify(c => c.QueryWorkItemsInModuleAsync("Space", documentId, It.IsAny<List<string>>()), times);
+    }
+}
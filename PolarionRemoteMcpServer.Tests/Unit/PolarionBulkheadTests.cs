@@ -0,0 +1,143 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionBulkhead admission, priority lanes and rejection, and the lane ThrottledPolarionClient picks
+/// </summary>
+public sealed class PolarionBulkheadTests
+{
+    [Fact]
+    public async Task EnterAsync_AllSlotsTaken_ShouldWaitUntilExit()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 1);
+        await bulkhead.EnterAsync(PolarionCallLane.Point);
+
+        // Act
+        var waiting = bulkhead.EnterAsync(PolarionCallLane.Point);
+        var completedBeforeExit = waiting.IsCompleted;
+        bulkhead.Exit(PolarionCallLane.Point);
+        await waiting;
+
+        // Assert
+        completedBeforeExit.Should().BeFalse();
+        bulkhead.GetStatistics().Active.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task Exit_PointAndBulkWaiting_ShouldDispatchPointFirst()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 1);
+        await bulkhead.EnterAsync(PolarionCallLane.Point);
+        var bulk = bulkhead.EnterAsync(PolarionCallLane.Bulk);
+        var point = bulkhead.EnterAsync(PolarionCallLane.Point);
+
+        // Act
+        bulkhead.Exit(PolarionCallLane.Point);
+        await point;
+
+        // Assert
+        bulk.IsCompleted.Should().BeFalse("the bulk call queued first but point lookups have priority");
+        bulkhead.GetStatistics().QueuedBulk.Should().Be(1);
+    }
+
+    [Fact]
+    public void TryEnter_BulkLimitReached_ShouldStillAdmitPointLookups()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 3, maxBulkConcurrency: 2);
+        bulkhead.TryEnter(PolarionCallLane.Bulk).Should().BeTrue();
+        bulkhead.TryEnter(PolarionCallLane.Bulk).Should().BeTrue();
+
+        // Act
+        var thirdBulk = bulkhead.TryEnter(PolarionCallLane.Bulk);
+        var point = bulkhead.TryEnter(PolarionCallLane.Point);
+
+        // Assert
+        thirdBulk.Should().BeFalse();
+        point.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task EnterAsync_QueueFull_ShouldRejectWithQueueFull()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 1, maxQueueLength: 1);
+        await bulkhead.EnterAsync(PolarionCallLane.Point);
+        _ = bulkhead.EnterAsync(PolarionCallLane.Point);
+
+        // Act
+        var act = () => bulkhead.EnterAsync(PolarionCallLane.Point);
+
+        // Assert
+        var exception = await act.Should().ThrowAsync<PolarionThrottledException>();
+        exception.Which.Reason.Should().Be(PolarionThrottleReason.QueueFull);
+        exception.Which.RetryAfter.Should().Be(TimeSpan.FromSeconds(5));
+        bulkhead.GetStatistics().Rejected.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task EnterAsync_WaitExceedsTimeout_ShouldRejectWithQueueTimeout()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 1, queueTimeoutSeconds: 1);
+        await bulkhead.EnterAsync(PolarionCallLane.Point);
+
+        // Act
+        var act = () => bulkhead.EnterAsync(PolarionCallLane.Bulk);
+
+        // Assert
+        var exception = await act.Should().ThrowAsync<PolarionThrottledException>();
+        exception.Which.Reason.Should().Be(PolarionThrottleReason.QueueTimeout);
+        bulkhead.GetStatistics().QueuedBulk.Should().Be(0, "a timed out call leaves the queue");
+    }
+
+    [Fact]
+    public async Task ThrottledClient_InBulkScope_ShouldRunPointLookupsInBulkLane()
+    {
+        // Arrange
+        var bulkhead = CreateBulkhead(maxConcurrency: 2);
+        var upstream = new TaskCompletionSource<Result<WorkItem>>();
+        var inner = new Mock<IPolarionClient>();
+        inner.Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>())).Returns(upstream.Task);
+        var client = ThrottledPolarionClient.Wrap(inner.Object, bulkhead);
+
+        // Act
+        Task<Result<WorkItem>> bulkCall;
+        using (ThrottledPolarionClient.BeginBulkScope())
+        {
+            bulkCall = client.GetWorkItemByIdAsync("WI-1", "100");
+        }
+
+        var pointCall = client.GetWorkItemByIdAsync("WI-2", "100");
+
+        // Assert
+        var statistics = bulkhead.GetStatistics();
+        (statistics.Active, statistics.ActiveBulk).Should().Be((2, 1), "only the call made inside the scope is bulk work");
+
+        upstream.SetResult(Result.Ok(new WorkItem { id = "WI-1" }));
+        await Task.WhenAll(bulkCall, pointCall);
+    }
+
+    private static PolarionBulkhead CreateBulkhead(
+        int maxConcurrency,
+        int? maxBulkConcurrency = null,
+        int maxQueueLength = 10,
+        int queueTimeoutSeconds = 30)
+    {
+        return new PolarionBulkhead("TEST", new PolarionConcurrencyConfig
+        {
+            MaxConcurrency = maxConcurrency,
+            MaxBulkConcurrency = maxBulkConcurrency ?? maxConcurrency,
+            MaxQueueLength = maxQueueLength,
+            QueueTimeoutSeconds = queueTimeoutSeconds
+        });
+    }
+}
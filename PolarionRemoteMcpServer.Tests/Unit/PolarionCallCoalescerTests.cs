@@ -0,0 +1,218 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionCallCoalescer single-flight sharing and the CoalescingPolarionClient decorator
+/// </summary>
+public sealed class PolarionCallCoalescerTests
+{
+    [Fact]
+    public async Task RunAsync_ConcurrentIdenticalCalls_ShouldShareOneUpstreamCall()
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+        var upstream = new TaskCompletionSource<string>();
+        var calls = 0;
+        Func<Task<string>> call = () =>
+        {
+            Interlocked.Increment(ref calls);
+            return upstream.Task;
+        };
+
+        // Act
+        var first = coalescer.RunAsync("pool", "Op", "a", call);
+        var second = coalescer.RunAsync("pool", "Op", "a", call);
+        upstream.SetResult("value");
+
+        // Assert
+        (await first).Should().Be("value");
+        (await second).Should().Be("value");
+        calls.Should().Be(1);
+        var statistics = coalescer.GetStatistics();
+        (statistics.Executed, statistics.Coalesced).Should().Be((1, 1));
+        statistics.CoalescedByOperation.Should().ContainKey("Op").WhoseValue.Should().Be(1);
+    }
+
+    [Theory]
+    [InlineData("pool", "Op", "b")]
+    [InlineData("pool", "OtherOp", "a")]
+    [InlineData("other-pool", "Op", "a")]
+    public async Task RunAsync_DifferentPartitionOperationOrArguments_ShouldNotShare(string partitionKey, string operation, string arguments)
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+        var upstream = new TaskCompletionSource<string>();
+        var calls = 0;
+        Func<Task<string>> call = () =>
+        {
+            Interlocked.Increment(ref calls);
+            return upstream.Task;
+        };
+
+        // Act
+        var first = coalescer.RunAsync("pool", "Op", "a", call);
+        var second = coalescer.RunAsync(partitionKey, operation, arguments, call);
+        upstream.SetResult("value");
+        await Task.WhenAll(first, second);
+
+        // Assert
+        calls.Should().Be(2);
+        coalescer.GetStatistics().Coalesced.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task RunAsync_AfterCompletion_ShouldCallUpstreamAgain()
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+        var calls = 0;
+        Func<Task<int>> call = () => Task.FromResult(Interlocked.Increment(ref calls));
+
+        // Act
+        var first = await coalescer.RunAsync("pool", "Op", "a", call);
+        var second = await coalescer.RunAsync("pool", "Op", "a", call);
+
+        // Assert
+        (first, second).Should().Be((1, 2));
+        coalescer.GetStatistics().InFlight.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task RunAsync_FaultedCall_ShouldReachEveryJoinerAndNotBeKept()
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+        var upstream = new TaskCompletionSource<string>();
+        var calls = 0;
+
+        // Act
+        var first = coalescer.RunAsync("pool", "Op", "a", () => { Interlocked.Increment(ref calls); return upstream.Task; });
+        var second = coalescer.RunAsync("pool", "Op", "a", () => { Interlocked.Increment(ref calls); return upstream.Task; });
+        upstream.SetException(new InvalidOperationException("boom"));
+
+        // Assert
+        Func<Task> awaitFirst = () => first;
+        Func<Task> awaitSecond = () => second;
+        await awaitFirst.Should().ThrowAsync<InvalidOperationException>().WithMessage("boom");
+        await awaitSecond.Should().ThrowAsync<InvalidOperationException>().WithMessage("boom");
+
+        var retry = await coalescer.RunAsync("pool", "Op", "a", () => { Interlocked.Increment(ref calls); return Task.FromResult("ok"); });
+        retry.Should().Be("ok");
+        calls.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task RunAsync_FailedResult_ShouldReachEveryJoinerAndNotBeKept()
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+        var upstream = new TaskCompletionSource<Result<string>>();
+        var calls = 0;
+        Func<Task<Result<string>>> failingCall = () =>
+        {
+            Interlocked.Increment(ref calls);
+            return upstream.Task;
+        };
+
+        // Act
+        var first = coalescer.RunAsync("pool", "Op", "a", failingCall);
+        var second = coalescer.RunAsync("pool", "Op", "a", failingCall);
+        upstream.SetResult(Result.Fail<string>("boom"));
+        var results = await Task.WhenAll(first, second);
+        var retry = await coalescer.RunAsync("pool", "Op", "a", () =>
+        {
+            Interlocked.Increment(ref calls);
+            return Task.FromResult(Result.Ok("ok"));
+        });
+
+        // Assert
+        results.Should().OnlyContain(result => result.IsFailed && result.Errors.Single().Message == "boom");
+        retry.Value.Should().Be("ok");
+        calls.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task RunAsync_ThrowingCall_ShouldNotLeaveEntryBehind()
+    {
+        // Arrange
+        var coalescer = new PolarionCallCoalescer();
+
+        // Act
+        var act = () => coalescer.RunAsync<string>("pool", "Op", "a", () => throw new InvalidOperationException("boom"));
+
+        // Assert
+        await act.Should().ThrowAsync<InvalidOperationException>();
+        coalescer.GetStatistics().InFlight.Should().Be(0);
+        (await coalescer.RunAsync("pool", "Op", "a", () => Task.FromResult("ok"))).Should().Be("ok");
+    }
+
+    [Fact]
+    public async Task CoalescingPolarionClient_ConcurrentIdenticalCalls_ShouldReachInnerClientOnce()
+    {
+        // Arrange
+        var upstream = new TaskCompletionSource<Result<WorkItem>>();
+        var inner = new Mock<IPolarionClient>();
+        inner.Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>())).Returns(upstream.Task);
+        var coalescer = new PolarionCallCoalescer();
+        var first = CoalescingPolarionClient.Wrap(inner.Object, coalescer, "pool");
+        var second = CoalescingPolarionClient.Wrap(inner.Object, coalescer, "pool");
+
+        // Act
+        var firstCall = first.GetWorkItemByIdAsync("WI-1", "100");
+        var secondCall = second.GetWorkItemByIdAsync("WI-1", "100");
+        upstream.SetResult(Result.Ok(new WorkItem { id = "WI-1" }));
+        var results = await Task.WhenAll(firstCall, secondCall);
+
+        // Assert
+        results[0].Value.Should().BeSameAs(results[1].Value);
+        inner.Verify(c => c.GetWorkItemByIdAsync("WI-1", "100"), Times.Once);
+    }
+
+    [Fact]
+    public async Task CoalescingPolarionClient_DifferentArguments_ShouldEachReachInnerClient()
+    {
+        // Arrange
+        var upstream = new TaskCompletionSource<Result<WorkItem>>();
+        var inner = new Mock<IPolarionClient>();
+        inner.Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>())).Returns(upstream.Task);
+        var client = CoalescingPolarionClient.Wrap(inner.Object, new PolarionCallCoalescer(), "pool");
+
+        // Act
+        var calls = new[]
+        {
+            client.GetWorkItemByIdAsync("WI-1", "100"),
+            client.GetWorkItemByIdAsync("WI-2", "100"),
+            client.GetWorkItemByIdAsync("WI-1", "200")
+        };
+        upstream.SetResult(Result.Ok(new WorkItem()));
+        await Task.WhenAll(calls);
+
+        // Assert
+        inner.Verify(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>()), Times.Exactly(3));
+    }
+
+    [Fact]
+    public async Task CoalescingPolarionClient_DifferentPartitions_ShouldNotShare()
+    {
+        // Arrange
+        var upstream = new TaskCompletionSource<Result<WorkItem>>();
+        var inner = new Mock<IPolarionClient>();
+        inner.Setup(c => c.GetWorkItemByIdAsync(It.IsAny<string>(), It.IsAny<string>())).Returns(upstream.Task);
+        var coalescer = new PolarionCallCoalescer();
+
+        // Act
+        var firstCall = CoalescingPolarionClient.Wrap(inner.Object, coalescer, "server|alice|P").GetWorkItemByIdAsync("WI-1", "100");
+        var secondCall = CoalescingPolarionClient.Wrap(inner.Object, coalescer, "server|bob|P").GetWorkItemByIdAsync("WI-1", "100");
+        upstream.SetResult(Result.Ok(new WorkItem()));
+        await Task.WhenAll(firstCall, secondCall);
+
+        // Assert
+        inner.Verify(c => c.GetWorkItemByIdAsync("WI-1", "100"), Times.Exactly(2));
+    }
+}
@@ -0,0 +1,120 @@
+using FluentAssertions;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionCatalogSnapshot in-memory filtering
+/// </summary>
+public sealed class PolarionCatalogSnapshotTests
+{
+    private static readonly SimulatorOptions SmallProject = new()
+    {
+        SpaceCount = 2,
+        DocumentCount = 6,
+        WorkItemsPerDocument = 1
+    };
+
+    private static readonly string RequirementsSpace = new SyntheticProject(SmallProject).GetDocumentLocation(0).Space;
+
+    [Fact]
+    public void GetSpaces_WithBlacklist_ShouldExcludeMatchingSpaces()
+    {
+        // Arrange
+        var snapshot = new PolarionCatalogSnapshot(new[] { "Requirements", "Archive_Old", "Tests" }, Array.Empty<ModuleThin>());
+
+        // Act
+        var spaces = snapshot.GetSpaces("Archive");
+
+        // Assert
+        spaces.Should().Equal("Requirements", "Tests");
+    }
+
+    [Fact]
+    public void GetSpaces_WithoutBlacklist_ShouldReturnAllSpaces()
+    {
+        // Arrange
+        var snapshot = new PolarionCatalogSnapshot(new[] { "Requirements", "Archive_Old" }, Array.Empty<ModuleThin>());
+
+        // Act
+        var spaces = snapshot.GetSpaces(null);
+
+        // Assert
+        spaces.Should().Equal("Requirements", "Archive_Old");
+    }
+
+    [Fact]
+    public async Task GetDocuments_WithoutSpace_ShouldExcludeBlacklistedSpaces()
+    {
+        // Arrange
+        var snapshot = await CreateSimulatedSnapshotAsync();
+
+        // Act
+        var documents = snapshot.GetDocuments(null, null, "Archive");
+
+        // Assert
+        documents.Should().HaveCount(3).And.OnlyContain(doc => doc.Space == RequirementsSpace);
+        snapshot.GetDocuments(null, null, null).Should().HaveCount(SmallProject.DocumentCount);
+    }
+
+    [Fact]
+    public async Task GetDocuments_WithSpace_ShouldReturnOnlyThatSpaceEvenIfBlacklisted()
+    {
+        // Arrange
+        var snapshot = await CreateSimulatedSnapshotAsync();
+
+        // Act
+        var archived = snapshot.GetDocuments("Archive", null, "Archive");
+        var requirements = snapshot.GetDocuments(RequirementsSpace, null, "Archive");
+
+        // Assert
+        archived.Should().HaveCount(3).And.OnlyContain(doc => doc.Space == "Archive");
+        requirements.Should().HaveCount(3).And.OnlyContain(doc => doc.Space == RequirementsSpace);
+    }
+
+    [Fact]
+    public async Task GetDocuments_WithTitleFilter_ShouldMatchTitlesCaseInsensitively()
+    {
+        // Arrange
+        var snapshot = await CreateSimulatedSnapshotAsync();
+        var target = snapshot.Documents.First(doc => doc.Space == RequirementsSpace);
+
+        // Act
+        var matches = snapshot.GetDocuments(RequirementsSpace, target.Title.ToUpperInvariant(), "Archive");
+        var noMatches = snapshot.GetDocuments(null, "no document has this title", "Archive");
+
+        // Assert
+        matches.Should().Contain(doc => doc.Id == target.Id)
+            .And.OnlyContain(doc => doc.Space == RequirementsSpace && doc.Title.Contains(target.Title, StringComparison.OrdinalIgnoreCase));
+        noMatches.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void GetDocuments_EmptyCatalog_ShouldReturnEmptyList()
+    {
+        // Arrange
+        var snapshot = new PolarionCatalogSnapshot(new[] { "Requirements" }, Array.Empty<ModuleThin>());
+
+        // Act
+        var documents = snapshot.GetDocuments("Requirements", "spec", "Archive");
+
+        // Assert
+        documents.Should().BeEmpty();
+    }
+
+    /// <summary>
+    /// Builds a catalog of six documents split between a regular space and "Archive", as the simulator lists them.
+    /// </summary>
+    private static async Task<PolarionCatalogSnapshot> CreateSimulatedSnapshotAsync()
+    {
+        var project = new SyntheticProject(SmallProject);
+        var documentsResult = await new SimulatedPolarionClient(project).GetModulesThinAsync(null, null);
+        documentsResult.IsSuccess.Should().BeTrue();
+
+        var documents = documentsResult.Value.ToList();
+        return new PolarionCatalogSnapshot(documents.Select(doc => doc.Space).Distinct().ToList(), documents);
+    }
+}
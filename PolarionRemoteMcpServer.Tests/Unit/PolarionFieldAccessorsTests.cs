@@ -0,0 +1,52 @@
+using FluentAssertions;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for the precompiled Polarion property accessor table and field plans
+/// </summary>
+public sealed class PolarionFieldAccessorsTests
+{
+    [Fact]
+    public void Getters_ShouldMatchPropertyNamesCaseInsensitively()
+    {
+        // Arrange
+        var workItem = new WorkItem { title = "Rigging timeout", updatedSpecified = true };
+
+        // Act
+        var title = PolarionFieldAccessors<WorkItem>.Getters["TITLE"](workItem);
+        var updatedSpecified = PolarionFieldAccessors<WorkItem>.Getters["updatedSpecified"](workItem);
+
+        // Assert
+        title.Should().Be("Rigging timeout");
+        updatedSpecified.Should().Be(true, "value-typed properties should be boxed");
+    }
+
+    [Fact]
+    public void GetPlan_ShouldKeepConfiguredOrderAndFlagUnknownFields()
+    {
+        // Arrange
+        var fieldNames = new List<string> { "status", "noSuchField", "Title" };
+
+        // Act
+        var plan = PolarionFieldAccessors<WorkItem>.GetPlan(fieldNames);
+
+        // Assert
+        plan.Fields.Select(f => f.FieldName).Should().Equal("status", "noSuchField", "Title");
+        plan.Fields[1].Getter.Should().BeNull();
+        plan.Fields[2].Getter.Should().NotBeNull();
+    }
+
+    [Fact]
+    public void GetPlan_SameFieldList_ShouldReturnCachedPlan()
+    {
+        // Arrange
+        var fieldNames = new List<string> { "id", "title" };
+
+        // Act & Assert
+        PolarionFieldAccessors<WorkItem>.GetPlan(fieldNames)
+            .Should().BeSameAs(PolarionFieldAccessors<WorkItem>.GetPlan(fieldNames));
+    }
+}
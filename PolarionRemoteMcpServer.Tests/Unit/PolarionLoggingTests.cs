@@ -0,0 +1,142 @@
+using FluentAssertions;
+using PolarionMcpTools;
+using Serilog;
+using Serilog.Core;
+using Serilog.Events;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionLogging level parsing, per-namespace overrides and Debug sampling
+/// </summary>
+public sealed class PolarionLoggingTests
+{
+    [Theory]
+    [InlineData("Trace", LogEventLevel.Verbose)]
+    [InlineData("verbose", LogEventLevel.Verbose)]
+    [InlineData("Debug", LogEventLevel.Debug)]
+    [InlineData(" Information ", LogEventLevel.Information)]
+    [InlineData("INFO", LogEventLevel.Information)]
+    [InlineData("Warn", LogEventLevel.Warning)]
+    [InlineData("Error", LogEventLevel.Error)]
+    [InlineData("Critical", LogEventLevel.Fatal)]
+    [InlineData("fatal", LogEventLevel.Fatal)]
+    public void ParseLevel_MicrosoftAndSerilogNames_ShouldMapToSerilogLevel(string level, LogEventLevel expected)
+    {
+        // Act
+        var parsed = PolarionLogging.ParseLevel(level);
+
+        // Assert
+        parsed.Should().Be(expected);
+    }
+
+    [Fact]
+    public void ParseLevel_None_ShouldTurnLoggingOff()
+    {
+        // Act
+        var parsed = PolarionLogging.ParseLevel("None");
+
+        // Assert
+        parsed.Should().Be(LevelAlias.Off);
+    }
+
+    [Fact]
+    public void ParseLevel_UnknownLevel_ShouldThrow()
+    {
+        // Act
+        var act = () => PolarionLogging.ParseLevel("Loud");
+
+        // Assert
+        act.Should().Throw<InvalidOperationException>().WithMessage("*'Loud'*Logging:LogLevel*");
+    }
+
+    [Fact]
+    public void CreateConfiguration_UnknownLevelInLogLevelSection_ShouldThrowAtStartup()
+    {
+        // Arrange
+        var config = new PolarionLoggingConfig
+        {
+            LogLevel = new Dictionary<string, string> { ["Default"] = "Information", ["PolarionMcpTools"] = "Chatty" }
+        };
+
+        // Act
+        var act = () => PolarionLogging.CreateConfiguration(config, (_, _) => { });
+
+        // Assert
+        act.Should().Throw<InvalidOperationException>().WithMessage("*'Chatty'*");
+    }
+
+    [Fact]
+    public void CreateConfiguration_NamespaceOverride_ShouldApplyToThatNamespaceOnly()
+    {
+        // Arrange
+        var sink = new CollectingSink();
+        var config = new PolarionLoggingConfig
+        {
+            Async = false,
+            LogLevel = new Dictionary<string, string>
+            {
+                ["Default"] = "Warning",
+                ["PolarionMcpTools"] = "Debug",
+                ["Microsoft.AspNetCore"] = "None"
+            }
+        };
+        using var logger = PolarionLogging.CreateConfiguration(config, (sinks, _) => sinks.Sink(sink)).CreateLogger();
+
+        // Act
+        logger.ForContext(Constants.SourceContextPropertyName, "PolarionMcpTools.ModuleSnapshotCache").Debug("tools debug");
+        logger.ForContext(Constants.SourceContextPropertyName, "PolarionRemoteMcpServer.Program").Information("server info");
+        logger.ForContext(Constants.SourceContextPropertyName, "PolarionRemoteMcpServer.Program").Warning("server warning");
+        logger.ForContext(Constants.SourceContextPropertyName, "Microsoft.AspNetCore.Hosting").Fatal("aspnet fatal");
+
+        // Assert
+        sink.Messages.Should().Equal("tools debug", "server warning");
+    }
+
+    [Fact]
+    public void CreateConfiguration_NoDefaultLevel_ShouldFallBackToVerbose()
+    {
+        // Arrange
+        var sink = new CollectingSink();
+        var config = new PolarionLoggingConfig { Async = false };
+        using var logger = PolarionLogging.CreateConfiguration(config, (sinks, _) => sinks.Sink(sink)).CreateLogger();
+
+        // Act
+        logger.Verbose("verbose");
+
+        // Assert
+        sink.Messages.Should().Equal("verbose");
+    }
+
+    [Fact]
+    public void CreateConfiguration_DebugSampleRate_ShouldKeepOneInNDebugEventsAndEveryInformationEvent()
+    {
+        // Arrange
+        var sink = new CollectingSink();
+        var config = new PolarionLoggingConfig { Async = false, DebugSampleRate = 4 };
+        using var logger = PolarionLogging.CreateConfiguration(config, (sinks, _) => sinks.Sink(sink)).CreateLogger();
+
+        // Act
+        for (var i = 1; i <= 12; i++)
+        {
+            logger.Debug("debug {Index}", i);
+            logger.Information("info {Index}", i);
+        }
+
+        // Assert
+        sink.Events.Count(e => e.Level == LogEventLevel.Debug).Should().Be(3);
+        sink.Events.Count(e => e.Level == LogEventLevel.Information).Should().Be(12);
+    }
+
+    private sealed class CollectingSink : ILogEventSink
+    {
+        public List<LogEvent> Events { get; } = new();
+
+        public IEnumerable<string> Messages => Events.Select(e => e.RenderMessage());
+
+        public void Emit(LogEvent logEvent)
+        {
+            Events.Add(logEvent);
+        }
+    }
+}
@@ -0,0 +1,312 @@
+using FluentAssertions;
+using FluentResults;
+using Microsoft.AspNetCore.Http;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Logging.Abstractions;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Endpoints;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionSessionPool leasing, per-call clients, capacity, eviction, recycling and health checks
+/// </summary>
+public sealed class PolarionSessionPoolTests
+{
+    private static readonly SimulatorOptions SmallProject = new()
+    {
+        SpaceCount = 1,
+        DocumentCount = 1,
+        WorkItemsPerDocument = 1
+    };
+
+    [Fact]
+    public async Task LeaseAsync_ReturnedSession_ShouldBeReused()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig());
+
+        // Act
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        using var lease = (await pool.LeaseAsync(project)).Value;
+
+        // Assert
+        var statistics = pool.GetStatistics().Should().ContainSingle().Subject;
+        (statistics.SessionsCreated, statistics.LeasesServed, statistics.OpenSessions).Should().Be((1, 2, 1));
+        statistics.IdleSessions.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task LeaseAsync_ProjectWithoutSessionConfig_ShouldFail()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+
+        // Act
+        var result = await pool.LeaseAsync(new PolarionProjectConfig { ProjectUrlAlias = "alpha" });
+
+        // Assert
+        result.IsFailed.Should().BeTrue();
+        pool.GetStatistics().Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task LeaseAsync_AtMaxSize_ShouldWaitForReturnedSession()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { MaxSize = 1, LeaseTimeoutSeconds = 10 });
+        var first = (await pool.LeaseAsync(project)).Value;
+
+        // Act
+        var waiting = pool.LeaseAsync(project);
+        await Task.Delay(50);
+        var completedWhileLeased = waiting.IsCompleted;
+        first.Dispose();
+        var second = await waiting.WaitAsync(TimeSpan.FromSeconds(5));
+
+        // Assert
+        completedWhileLeased.Should().BeFalse();
+        second.IsSuccess.Should().BeTrue();
+        second.Value.Dispose();
+        pool.GetStatistics().Single().SessionsCreated.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task LeaseAsync_AtMaxSize_ShouldFailAfterLeaseTimeout()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { MaxSize = 1, LeaseTimeoutSeconds = 1 });
+        using var first = (await pool.LeaseAsync(project)).Value;
+
+        // Act
+        var second = await pool.LeaseAsync(project);
+
+        // Assert
+        second.IsFailed.Should().BeTrue();
+        second.Errors.Single().Message.Should().Contain("Timed out");
+    }
+
+    [Fact]
+    public async Task Dispose_InvalidatedLease_ShouldCloseSession()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig());
+        var lease = (await pool.LeaseAsync(project)).Value;
+
+        // Act
+        lease.Invalidate();
+        lease.Dispose();
+        using var next = (await pool.LeaseAsync(project)).Value;
+
+        // Assert
+        var statistics = pool.GetStatistics().Single();
+        (statistics.SessionsCreated, statistics.OpenSessions).Should().Be((2, 1));
+    }
+
+    [Fact]
+    public async Task RunMaintenanceAsync_IdleSession_ShouldBeClosedAfterIdleTimeout()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { IdleTimeoutSeconds = 0 });
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        await Task.Delay(20);
+
+        // Act
+        await pool.RunMaintenanceAsync();
+
+        // Assert
+        var statistics = pool.GetStatistics().Single();
+        (statistics.OpenSessions, statistics.IdleSessions).Should().Be((0, 0));
+    }
+
+    [Fact]
+    public async Task RunMaintenanceAsync_MinSize_ShouldKeepAndOpenSessions()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { MinSize = 2, IdleTimeoutSeconds = 0 });
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        await Task.Delay(20);
+
+        // Act
+        await pool.RunMaintenanceAsync();
+
+        // Assert
+        var statistics = pool.GetStatistics().Single();
+        (statistics.OpenSessions, statistics.IdleSessions, statistics.SessionsCreated).Should().Be((2, 2, 2));
+    }
+
+    [Fact]
+    public async Task LeaseAsync_SessionPastMaxLifetime_ShouldBeReplaced()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { MaxLifetimeSeconds = 1 });
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        await Task.Delay(TimeSpan.FromMilliseconds(1100));
+
+        // Act
+        using var lease = (await pool.LeaseAsync(project)).Value;
+
+        // Assert
+        var statistics = pool.GetStatistics().Single();
+        (statistics.SessionsCreated, statistics.OpenSessions).Should().Be((2, 1));
+    }
+
+    [Fact]
+    public async Task LeaseAsync_IdleSessionFailingHealthCheck_ShouldBeReplaced()
+    {
+        // Arrange
+        var unhealthy = CreateClient(Result.Fail<WorkItem[]>("session expired"));
+        var healthy = CreateClient(Result.Ok(Array.Empty<WorkItem>()));
+        using var pool = new TestSessionPool(unhealthy.Object, healthy.Object);
+        var project = CreateProject(new PolarionSessionPoolConfig { HealthCheckAfterSeconds = 0 });
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        await Task.Delay(20);
+
+        // Act
+        using var lease = (await pool.LeaseAsync(project)).Value;
+
+        // Assert
+        unhealthy.Verify(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()), Times.Once);
+        var statistics = pool.GetStatistics().Single();
+        (statistics.SessionsCreated, statistics.OpenSessions).Should().Be((2, 1));
+    }
+
+    [Fact]
+    public async Task LeaseAsync_IdleSessionPassingHealthCheck_ShouldBeReused()
+    {
+        // Arrange
+        var healthy = CreateClient(Result.Ok(Array.Empty<WorkItem>()));
+        using var pool = new TestSessionPool(healthy.Object);
+        var project = CreateProject(new PolarionSessionPoolConfig { HealthCheckAfterSeconds = 0 });
+        (await pool.LeaseAsync(project)).Value.Dispose();
+        await Task.Delay(20);
+
+        // Act
+        using var lease = (await pool.LeaseAsync(project)).Value;
+
+        // Assert
+        healthy.Verify(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()), Times.Once);
+        pool.GetStatistics().Single().SessionsCreated.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetClient_Call_ShouldHoldSessionOnlyWhileRunning()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+        var project = CreateProject(new PolarionSessionPoolConfig { MaxSize = 1 });
+        var client = pool.GetClient(project).Value;
+
+        // Act
+        var first = await client.GetSpacesAsync(null);
+        var second = await client.GetSpacesAsync(null);
+
+        // Assert
+        (first.IsSuccess, second.IsSuccess).Should().Be((true, true));
+        var statistics = pool.GetStatistics().Single();
+        (statistics.SessionsCreated, statistics.LeasesServed).Should().Be((1, 2));
+        (statistics.OpenSessions, statistics.IdleSessions).Should().Be((1, 1));
+    }
+
+    [Fact]
+    public void GetClient_ProjectWithoutSessionConfig_ShouldFail()
+    {
+        // Arrange
+        using var pool = CreateSimulatedPool();
+
+        // Act
+        var result = pool.GetClient(new PolarionProjectConfig { ProjectUrlAlias = "alpha" });
+
+        // Assert
+        result.IsFailed.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task GetClient_PoolSaturated_ShouldThrowThrottledExceptionAfterLeaseTimeout()
+    {
+        // Arrange
+        var upstream = new TaskCompletionSource<Result<WorkItem>>();
+        var session = new Mock<IPolarionClient>();
+        session.Setup(c => c.GetWorkItemByIdAsync("WI-1", It.IsAny<string>())).Returns(upstream.Task);
+        session.Setup(c => c.GetWorkItemByIdAsync("WI-2", It.IsAny<string>())).ReturnsAsync(Result.Ok(new WorkItem { id = "WI-2" }));
+        using var pool = new TestSessionPool(session.Object);
+        var project = CreateProject(new PolarionSessionPoolConfig { MaxSize = 1, LeaseTimeoutSeconds = 1 });
+        var client = pool.GetClient(project).Value;
+        var running = client.GetWorkItemByIdAsync("WI-1", "100");
+
+        // Act
+        var act = () => client.GetWorkItemByIdAsync("WI-2", "100");
+
+        // Assert
+        var exception = (await act.Should().ThrowAsync<PolarionThrottledException>()).Which;
+        exception.Reason.Should().Be(PolarionThrottleReason.QueueTimeout);
+        exception.RetryAfter.Should().Be(TimeSpan.FromSeconds(new PolarionConcurrencyConfig().RetryAfterSeconds));
+        ThrottledResponse.GetStatusCode(exception.Reason).Should().Be(StatusCodes.Status503ServiceUnavailable);
+
+        upstream.SetResult(Result.Ok(new WorkItem { id = "WI-1" }));
+        (await running).Value.id.Should().Be("WI-1");
+        (await client.GetWorkItemByIdAsync("WI-2", "100")).Value.id.Should().Be("WI-2");
+        pool.GetStatistics().Single().SessionsCreated.Should().Be(1);
+    }
+
+    private static SimulatedSessionPool CreateSimulatedPool()
+    {
+        return new SimulatedSessionPool(new SyntheticProject(SmallProject), NullLogger<PolarionSessionPool>.Instance, new PolarionCallCoalescer());
+    }
+
+    private static PolarionProjectConfig CreateProject(PolarionSessionPoolConfig poolConfig)
+    {
+        var project = new ConfigurationBuilder()
+            .AddInMemoryCollection(SimulatorServiceCollectionExtensions.CreateProjectSettings(SmallProject, "simulated"))
+            .Build()
+            .GetSection("PolarionProjects")
+            .Get<List<PolarionProjectConfig>>()!
+            .Single();
+        project.SessionPool = poolConfig;
+        return project;
+    }
+
+    private static Mock<IPolarionClient> CreateClient(Result<WorkItem[]> healthCheckResult)
+    {
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()))
+            .ReturnsAsync(healthCheckResult);
+        return client;
+    }
+
+    /// <summary>
+    /// Hands out the given clients in order, one per login.
+    /// </summary>
+    private sealed class TestSessionPool : PolarionSessionPool
+    {
+        private readonly Queue<IPolarionClient> _clients;
+
+        public TestSessionPool(params IPolarionClient[] clients)
+            : base(NullLogger<PolarionSessionPool>.Instance, new PolarionCallCoalescer())
+        {
+            _clients = new Queue<IPolarionClient>(clients);
+        }
+
+        protected override Task<Result<IPolarionClient>> ConnectAsync(PolarionClientConfiguration sessionConfig)
+        {
+            lock (_clients)
+            {
+                return Task.FromResult(_clients.TryDequeue(out var client)
+                    ? Result.Ok(client)
+                    : Result.Fail<IPolarionClient>("No more clients"));
+            }
+        }
+    }
+}
@@ -0,0 +1,107 @@
+using FluentAssertions;
+using PolarionMcpSimulator;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for the synthetic project served by the Polarion simulator used by the benchmarks
+/// </summary>
+public sealed class PolarionSimulatorTests
+{
+    private static readonly SimulatorOptions SmallProject = new()
+    {
+        SpaceCount = 4,
+        DocumentCount = 12,
+        WorkItemsPerDocument = 40
+    };
+
+    [Fact]
+    public async Task GetWorkItemByIdAsync_ShouldReturnSameWorkItemForSameSeed()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var workItemId = project.GetWorkItemId(3, 5);
+
+        // Act
+        var first = await new SimulatedPolarionClient(project).GetWorkItemByIdAsync(workItemId);
+        var second = await new SimulatedPolarionClient(new SyntheticProject(SmallProject)).GetWorkItemByIdAsync(workItemId);
+
+        // Assert
+        first.IsSuccess.Should().BeTrue();
+        first.Value.id.Should().Be(workItemId);
+        first.Value.title.Should().NotBeNullOrEmpty().And.Be(second.Value.title);
+        first.Value.description.content.Should().Be(second.Value.description.content);
+    }
+
+    [Fact]
+    public async Task QueryWorkItemsInModuleAsync_ShouldReturnEveryWorkItemWithUniqueOutlineNumbers()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var (space, documentId) = project.GetDocumentLocation(2);
+
+        // Act
+        var result = await new SimulatedPolarionClient(project).QueryWorkItemsInModuleAsync(space, documentId, null);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Should().HaveCount(SmallProject.WorkItemsPerDocument);
+        result.Value.Select(wi => wi.outlineNumber).Should().OnlyHaveUniqueItems();
+        result.Value.Should().Contain(wi => wi.outlineNumber == project.GetSectionNumber(1));
+    }
+
+    [Fact]
+    public async Task SearchWorkitemAsync_WithIdClause_ShouldReturnRequestedWorkItemsOnly()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var ids = new[] { project.GetWorkItemId(0, 1), project.GetWorkItemId(5, 7), project.GetWorkItemId(11, 39) };
+
+        // Act
+        var result = await new SimulatedPolarionClient(project)
+            .SearchWorkitemAsync($"id:({string.Join(" OR ", ids)})", "id", new List<string> { "id", "title" });
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Select(wi => wi.id).Should().BeEquivalentTo(ids);
+        result.Value.Should().OnlyContain(wi => wi.status == null);
+    }
+
+    [Fact]
+    public async Task GetWorkItemByIdAsync_LinkTargets_ShouldBackLinkToSource()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var client = new SimulatedPolarionClient(project);
+        var source = (await client.GetWorkItemByIdAsync(project.GetWorkItemId(4, 3))).Value;
+        source.linkedWorkItems.Should().NotBeNullOrEmpty();
+
+        foreach (var link in source.linkedWorkItems)
+        {
+            // Act
+            var target = await client.GetWorkItemByIdAsync(link.workItemURI.Split("${WorkItem}")[1]);
+
+            // Assert
+            target.Value.linkedWorkItemsDerived.Should()
+                .Contain(backlink => backlink.workItemURI.EndsWith("${WorkItem}" + source.id));
+        }
+    }
+
+    [Fact]
+    public async Task GetWorkItemsByModuleRevisionAsync_OlderRevision_ShouldReturnHistoricalWorkItems()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var (space, documentId) = project.GetDocumentLocation(1);
+        var revision = project.GetDocumentRevision(1, revisionsBack: 2);
+
+        // Act
+        var result = await new SimulatedPolarionClient(project).GetWorkItemsByModuleRevisionAsync(space, documentId, revision);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Should().HaveCount(SmallProject.WorkItemsPerDocument - 2);
+        result.Value.Should().OnlyContain(info => info.IsHistorical && info.Revision != info.HeadRevision);
+        result.Value[0].WorkItem.id.Should().Be(project.GetWorkItemId(1, 0));
+    }
+}
@@ -0,0 +1,127 @@
+using FluentAssertions;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Logging.Abstractions;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PolarionWarmupService project selection and readiness
+/// </summary>
+public sealed class PolarionWarmupServiceTests
+{
+    [Fact]
+    public void IsReady_NoProjectWithWarmup_ShouldBeReadyImmediately()
+    {
+        // Arrange
+        var projects = new List<PolarionProjectConfig>
+        {
+            new() { ProjectUrlAlias = "alpha" },
+            new() { ProjectUrlAlias = "beta", Warmup = new PolarionWarmupConfig { Enabled = false } }
+        };
+
+        // Act
+        using var pool = CreatePool();
+        using var service = CreateService(projects, pool);
+
+        // Assert
+        service.IsReady.Should().BeTrue();
+        service.GetStatus().Projects.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_ProjectWithoutSessionConfig_ShouldBeSkipped()
+    {
+        // Arrange
+        var projects = new List<PolarionProjectConfig>
+        {
+            new() { ProjectUrlAlias = "alpha", Warmup = new PolarionWarmupConfig { Enabled = true } }
+        };
+        using var pool = CreatePool();
+        using var service = CreateService(projects, pool);
+
+        // Act
+        await service.StartAsync(CancellationToken.None);
+        await service.StopAsync(CancellationToken.None);
+
+        // Assert
+        service.IsReady.Should().BeTrue();
+        service.GetStatus().Projects.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_SimulatedProject_ShouldWarmSessionsCatalogAndDocuments()
+    {
+        // Arrange
+        var options = new SimulatorOptions { SpaceCount = 2, DocumentCount = 6, WorkItemsPerDocument = 5 };
+        var project = new SyntheticProject(options);
+        var documents = Enumerable.Range(0, options.DocumentCount)
+            .Select(project.GetDocumentLocation)
+            .Select(doc => $"{doc.Space}/{doc.DocumentId}")
+            .ToList();
+        var projects = CreateSimulatedProjects(options, sessions: 3, documents);
+        using var pool = new SimulatedSessionPool(project, NullLogger<PolarionSessionPool>.Instance, new PolarionCallCoalescer());
+        var cacheConfig = new PolarionCacheConfig();
+        var snapshotCache = new ModuleSnapshotCache(cacheConfig, new HistoricalWorkItemCache(cacheConfig));
+        using var catalog = new PolarionProjectCatalog(pool, cacheConfig, NullLogger<PolarionProjectCatalog>.Instance);
+        using var service = new PolarionWarmupService(projects, pool, catalog, snapshotCache, NullLogger<PolarionWarmupService>.Instance);
+        var readyBeforeStart = service.IsReady;
+
+        // Act
+        await service.StartAsync(CancellationToken.None);
+        await service.ExecuteTask!.WaitAsync(TimeSpan.FromSeconds(30));
+
+        // Assert
+        readyBeforeStart.Should().BeFalse();
+        service.IsReady.Should().BeTrue();
+
+        var status = service.GetStatus().Projects.Should().ContainSingle().Subject;
+        status.State.Should().Be("completed");
+        status.Errors.Should().BeEmpty();
+        status.SessionsOpened.Should().Be(3);
+        status.CatalogLoaded.Should().BeTrue();
+        (status.DocumentsLoaded, status.DocumentsTotal).Should().Be((documents.Count, documents.Count));
+
+        catalog.GetStatistics().Should().ContainSingle().Which.Documents.Should().Be(options.DocumentCount);
+        snapshotCache.GetStatistics().Entries.Should().Be(documents.Count);
+
+        // Every prefetch leased a session of its own, reusing the ones opened ahead of time
+        var poolStatistics = pool.GetStatistics().Should().ContainSingle().Subject;
+        poolStatistics.SessionsCreated.Should().Be(3);
+        poolStatistics.LeasesServed.Should().Be(3 + 1 + documents.Count);
+    }
+
+    private static List<PolarionProjectConfig> CreateSimulatedProjects(SimulatorOptions options, int sessions, List<string> documents)
+    {
+        var settings = SimulatorServiceCollectionExtensions.CreateProjectSettings(options, "simulated");
+        settings["PolarionProjects:0:Warmup:Enabled"] = "true";
+        settings["PolarionProjects:0:Warmup:Sessions"] = sessions.ToString();
+        for (var i = 0; i < documents.Count; i++)
+        {
+            settings[$"PolarionProjects:0:Warmup:Documents:{i}"] = documents[i];
+        }
+
+        return new ConfigurationBuilder()
+            .AddInMemoryCollection(settings)
+            .Build()
+            .GetSection("PolarionProjects")
+            .Get<List<PolarionProjectConfig>>()!;
+    }
+
+    private static PolarionSessionPool CreatePool()
+    {
+        return new PolarionSessionPool(NullLogger<PolarionSessionPool>.Instance, new PolarionCallCoalescer());
+    }
+
+    private static PolarionWarmupService CreateService(List<PolarionProjectConfig> projects, PolarionSessionPool pool)
+    {
+        var cacheConfig = new PolarionCacheConfig();
+        return new PolarionWarmupService(
+            projects,
+            pool,
+            new PolarionProjectCatalog(pool, cacheConfig, NullLogger<PolarionProjectCatalog>.Instance),
+            new ModuleSnapshotCache(cacheConfig, new HistoricalWorkItemCache(cacheConfig)),
+            NullLogger<PolarionWarmupService>.Instance);
+    }
+}
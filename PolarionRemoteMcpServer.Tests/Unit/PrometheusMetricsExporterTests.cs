@@ -0,0 +1,46 @@
+using FluentAssertions;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Services;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for PrometheusMetricsExporter text rendering of PolarionMetrics instruments
+/// </summary>
+public sealed class PrometheusMetricsExporterTests
+{
+    [Fact]
+    public void Export_ShouldRenderHistogramBucketsSumAndCount()
+    {
+        // Arrange
+        using var exporter = new PrometheusMetricsExporter();
+
+        // Act
+        PolarionMetrics.RecordClientCall("ExporterHistogramTest", TimeSpan.FromMilliseconds(20), failed: false);
+        PolarionMetrics.RecordClientCall("ExporterHistogramTest", TimeSpan.FromSeconds(2), failed: false);
+        var output = exporter.Export();
+
+        // Assert
+        output.Should().Contain("# TYPE polarion_client_call_duration_seconds histogram");
+        output.Should().Contain("polarion_client_call_duration_seconds_bucket{operation=\"ExporterHistogramTest\",outcome=\"ok\",le=\"0.025\"} 1");
+        output.Should().Contain("polarion_client_call_duration_seconds_bucket{operation=\"ExporterHistogramTest\",outcome=\"ok\",le=\"+Inf\"} 2");
+        output.Should().Contain("polarion_client_call_duration_seconds_count{operation=\"ExporterHistogramTest\",outcome=\"ok\"} 2");
+    }
+
+    [Fact]
+    public void Export_ShouldRenderUpDownCounterAsGauge()
+    {
+        // Arrange
+        using var exporter = new PrometheusMetricsExporter();
+
+        // Act
+        PolarionMetrics.AddActiveClientCall("ExporterGaugeTest", 1);
+        PolarionMetrics.AddActiveClientCall("ExporterGaugeTest", 1);
+        PolarionMetrics.AddActiveClientCall("ExporterGaugeTest", -1);
+        var output = exporter.Export();
+
+        // Assert
+        output.Should().Contain("# TYPE polarion_client_calls_active gauge");
+        output.Should().Contain("polarion_client_calls_active{operation=\"ExporterGaugeTest\"} 1");
+    }
+}
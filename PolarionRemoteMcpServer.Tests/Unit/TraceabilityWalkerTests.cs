@@ -0,0 +1,152 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for TraceabilityWalker link direction and role filtering, node budget and error propagation
+/// </summary>
+public sealed class TraceabilityWalkerTests
+{
+    private static readonly List<string> DetailFields = new() { "id", "title", "linkedWorkItems", "linkedWorkItemsDerived" };
+
+    [Fact]
+    public async Task WalkAsync_Outgoing_ShouldFollowOutgoingLinksLevelByLevel()
+    {
+        // Arrange
+        var client = CreateClient(("A", "B", "verifies"), ("B", "C", "verifies"), ("D", "A", "implements"));
+        using var walker = new TraceabilityWalker(client.Object, "outgoing", new HashSet<string>(), maxConcurrency: 2, nodeBudget: 100);
+        await walker.LoadAsync(new[] { "A" }, DetailFields);
+
+        // Act
+        var links = await walker.WalkAsync(new[] { "A" }, maxLevels: 3);
+
+        // Assert
+        links["A"].Should().Equal(
+            new TraceabilityLink(1, "B", "verifies", "A"),
+            new TraceabilityLink(2, "C", "verifies", "B"));
+        walker.BudgetExhausted.Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task WalkAsync_Incoming_ShouldOnlyFollowBacklinks()
+    {
+        // Arrange
+        var client = CreateClient(("A", "B", "verifies"), ("D", "A", "implements"));
+        using var walker = new TraceabilityWalker(client.Object, "incoming", new HashSet<string>(), maxConcurrency: 2, nodeBudget: 100);
+        await walker.LoadAsync(new[] { "A" }, DetailFields);
+
+        // Act
+        var links = await walker.WalkAsync(new[] { "A" }, maxLevels: 2);
+
+        // Assert
+        links["A"].Should().Equal(new TraceabilityLink(1, "D", "implements", "A"));
+    }
+
+    [Fact]
+    public async Task WalkAsync_LinkTypeFilter_ShouldSkipOtherRoles()
+    {
+        // Arrange
+        var client = CreateClient(("A", "B", "verifies"), ("A", "E", "implements"), ("E", "F", "verifies"), ("E", "G", "implements"));
+        using var walker = new TraceabilityWalker(client.Object, "both", new HashSet<string> { "implements" }, maxConcurrency: 2, nodeBudget: 100);
+        await walker.LoadAsync(new[] { "A" }, DetailFields);
+
+        // Act
+        var links = await walker.WalkAsync(new[] { "A" }, maxLevels: 2);
+
+        // Assert
+        links["A"].Select(link => link.Id).Should().Equal("E", "G");
+    }
+
+    [Fact]
+    public async Task WalkAsync_OverNodeBudget_ShouldStopFetchingAndReportIt()
+    {
+        // Arrange
+        var client = CreateClient(("A", "B", "verifies"), ("A", "C", "verifies"), ("A", "D", "verifies"),
+            ("B", "X", "verifies"), ("C", "Y", "verifies"), ("D", "Z", "verifies"));
+        using var walker = new TraceabilityWalker(client.Object, "outgoing", new HashSet<string>(), maxConcurrency: 2, nodeBudget: 2);
+        await walker.LoadAsync(new[] { "A" }, DetailFields);
+
+        // Act
+        var links = await walker.WalkAsync(new[] { "A" }, maxLevels: 2);
+
+        // Assert
+        walker.BudgetExhausted.Should().BeTrue();
+        walker.NodesFetched.Should().Be(2);
+        links["A"].Where(link => link.Level == 1).Select(link => link.Id).Should().Equal("B", "C", "D");
+        links["A"].Where(link => link.Level == 2).Should().HaveCount(2, "only the two fetched work items are walked from");
+    }
+
+    [Fact]
+    public async Task WalkAsync_SharedLinks_ShouldFetchEachWorkItemOnce()
+    {
+        // Arrange
+        var client = CreateClient(("A", "C", "verifies"), ("B", "C", "verifies"));
+        using var walker = new TraceabilityWalker(client.Object, "outgoing", new HashSet<string>(), maxConcurrency: 2, nodeBudget: 100);
+        await walker.LoadAsync(new[] { "A", "B" }, DetailFields);
+
+        // Act
+        var links = await walker.WalkAsync(new[] { "A", "B" }, maxLevels: 2);
+
+        // Assert
+        links["A"].Should().ContainSingle().Which.Id.Should().Be("C");
+        links["B"].Should().ContainSingle().Which.Id.Should().Be("C");
+        walker.NodesFetched.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task LoadAsync_ClientThrows_ShouldPropagateException()
+    {
+        // Arrange
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()))
+            .ThrowsAsync(new PolarionThrottledException("P", PolarionThrottleReason.QueueFull, TimeSpan.FromSeconds(5), "busy"));
+        using var walker = new TraceabilityWalker(client.Object, "both", new HashSet<string>(), maxConcurrency: 2, nodeBudget: 100);
+
+        // Act
+        var act = () => walker.LoadAsync(new[] { "A" }, DetailFields);
+
+        // Assert
+        await act.Should().ThrowAsync<PolarionThrottledException>();
+    }
+
+    /// <summary>
+    /// Serves batched <c>id:(A OR B)</c> queries from a graph of outgoing links; backlinks are derived from it.
+    /// </summary>
+    private static Mock<IPolarionClient> CreateClient(params (string From, string To, string Role)[] links)
+    {
+        var ids = links.SelectMany(link => new[] { link.From, link.To }).Distinct().ToList();
+        var workItems = ids.ToDictionary(
+            id => id,
+            id => new WorkItem
+            {
+                id = id,
+                linkedWorkItems = links.Where(link => link.From == id).Select(link => CreateLink(link.To, link.Role)).ToArray(),
+                linkedWorkItemsDerived = links.Where(link => link.To == id).Select(link => CreateLink(link.From, link.Role)).ToArray()
+            });
+
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()))
+            .ReturnsAsync((string query, string _, List<string> _) => Result.Ok(query["id:(".Length..^1]
+                .Split(" OR ")
+                .Where(workItems.ContainsKey)
+                .Select(id => workItems[id])
+                .ToArray()));
+        return client;
+    }
+
+    private static LinkedWorkItem CreateLink(string id, string role)
+    {
+        return new LinkedWorkItem
+        {
+            role = new EnumOptionId { id = role },
+            workItemURI = $"subterra:data-service:objects:/default/P${{WorkItem}}{id}"
+        };
+    }
+}
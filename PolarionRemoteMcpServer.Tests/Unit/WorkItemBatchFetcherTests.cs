@@ -0,0 +1,95 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for WorkItemBatchFetcher query chunking and result mapping
+/// </summary>
+public sealed class WorkItemBatchFetcherTests
+{
+    [Fact]
+    public async Task FetchByIdsAsync_ManyIds_ShouldQueryInChunks()
+    {
+        // Arrange
+        var ids = Enumerable.Range(1, 250).Select(i => $"WI-{i}").ToList();
+        var client = CreateClientReturningQueriedIds(out var queries);
+
+        // Act
+        var result = await WorkItemBatchFetcher.FetchByIdsAsync(client.Object, ids, new List<string> { "id", "title" }, maxConcurrency: 4);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Keys.Should().BeEquivalentTo(ids);
+        queries.Should().HaveCount(3, "250 IDs should be split into chunks of {0}", WorkItemBatchFetcher.IdQueryChunkSize);
+    }
+
+    [Fact]
+    public async Task FetchByIdsAsync_DuplicateIds_ShouldQueryEachIdOnce()
+    {
+        // Arrange
+        var client = CreateClientReturningQueriedIds(out var queries);
+
+        // Act
+        var result = await WorkItemBatchFetcher.FetchByIdsAsync(client.Object, new[] { "WI-1", "WI-2", "WI-1" }, new List<string> { "id" });
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        queries.Should().ContainSingle().Which.Should().Be("id:(WI-1 OR WI-2)");
+    }
+
+    [Fact]
+    public async Task FetchByIdsAsync_InvalidId_ShouldFailWithoutQuerying()
+    {
+        // Arrange
+        var client = CreateClientReturningQueriedIds(out var queries);
+
+        // Act
+        var result = await WorkItemBatchFetcher.FetchByIdsAsync(client.Object, new[] { "WI-1", "WI-2) OR (title:x" }, new List<string> { "id" });
+
+        // Assert
+        result.IsFailed.Should().BeTrue();
+        queries.Should().BeEmpty();
+    }
+
+    [Theory]
+    [InlineData("WI-123", true)]
+    [InlineData("REQ_1.2", true)]
+    [InlineData("-WI", false)]
+    [InlineData("WI 1", false)]
+    [InlineData("WI*", false)]
+    public void IsValidWorkItemId_ShouldOnlyAcceptQuerySafeIds(string id, bool expected)
+    {
+        WorkItemBatchFetcher.IsValidWorkItemId(id).Should().Be(expected);
+    }
+
+    private static Mock<IPolarionClient> CreateClientReturningQueriedIds(out List<string> queries)
+    {
+        var recordedQueries = new List<string>();
+        queries = recordedQueries;
+
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()))
+            .ReturnsAsync((string query, string _, List<string> _) =>
+            {
+                lock (recordedQueries)
+                {
+                    recordedQueries.Add(query);
+                }
+
+                // Echo back one work item per ID in "id:(A OR B)"
+                var workItems = query["id:(".Length..^1]
+                    .Split(" OR ")
+                    .Select(id => new WorkItem { id = id })
+                    .ToArray();
+                return Result.Ok(workItems);
+            });
+
+        return client;
+    }
+}
@@ -0,0 +1,135 @@
+using System.Text;
+using System.Text.Json;
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using PolarionMcpSimulator;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Endpoints;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for the NDJSON work item export and its continuation tokens
+/// </summary>
+public sealed class WorkItemExportTests
+{
+    private static readonly SimulatorOptions SmallProject = new()
+    {
+        SpaceCount = 2,
+        DocumentCount = 3,
+        WorkItemsPerDocument = 10
+    };
+
+    private static readonly HashSet<string> TitleFieldset = new(StringComparer.OrdinalIgnoreCase) { "title" };
+
+    [Fact]
+    public void ContinuationToken_ShouldRoundTrip()
+    {
+        // Arrange
+        var token = new ExportContinuationToken("Space With Spaces", "Doc/ü", "WI-7");
+
+        // Act
+        var decoded = ExportContinuationToken.TryDecode(token.Encode(), out var result);
+
+        // Assert
+        decoded.Should().BeTrue();
+        result.Should().Be(token);
+    }
+
+    [Theory]
+    [InlineData("")]
+    [InlineData("not a token")]
+    [InlineData("MXxvbmx5")]
+    public void ContinuationToken_ShouldRejectForeignValues(string value)
+    {
+        // Act
+        var decoded = ExportContinuationToken.TryDecode(value, out var result);
+
+        // Assert
+        decoded.Should().BeFalse();
+        result.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_ShouldWriteOneLinePerWorkItemAndEndLine()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var documents = GetDocuments(project);
+
+        // Act
+        var lines = await ExportAsync(project, documents, resumeFrom: null);
+
+        // Assert
+        lines.Count(line => Kind(line) == "document").Should().Be(documents.Count);
+        lines.Count(line => Kind(line) == "workitem").Should().Be(documents.Count * SmallProject.WorkItemsPerDocument);
+        var end = lines[^1];
+        Kind(end).Should().Be("end");
+        end.GetProperty("workItemCount").GetInt32().Should().Be(documents.Count * SmallProject.WorkItemsPerDocument);
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_WithContinuationToken_ShouldResumeAfterLastWorkItem()
+    {
+        // Arrange
+        var project = new SyntheticProject(SmallProject);
+        var documents = GetDocuments(project);
+        var full = (await ExportAsync(project, documents, resumeFrom: null))
+            .Where(line => Kind(line) == "workitem")
+            .ToList();
+        var stopAt = full[SmallProject.WorkItemsPerDocument + 3];
+        ExportContinuationToken.TryDecode(stopAt.GetProperty("continuation").GetString(), out var token).Should().BeTrue();
+
+        // Act
+        var remaining = documents.Where(doc => !token!.IsPast(doc.Space, doc.DocumentId)).ToList();
+        var resumed = (await ExportAsync(project, remaining, token))
+            .Where(line => Kind(line) == "workitem")
+            .ToList();
+
+        // Assert
+        resumed.Select(WorkItemId).Should().Equal(full.Skip(SmallProject.WorkItemsPerDocument + 4).Select(WorkItemId));
+    }
+
+    private static List<(string Space, string DocumentId)> GetDocuments(SyntheticProject project)
+    {
+        return Enumerable.Range(0, SmallProject.DocumentCount)
+            .Select(project.GetDocumentLocation)
+            .OrderBy(doc => doc.Space, StringComparer.Ordinal)
+            .ThenBy(doc => doc.DocumentId, StringComparer.Ordinal)
+            .ToList();
+    }
+
+    private static async Task<List<JsonElement>> ExportAsync(
+        SyntheticProject project,
+        List<(string Space, string DocumentId)> documents,
+        ExportContinuationToken? resumeFrom)
+    {
+        var cacheConfig = new PolarionCacheConfig();
+        var result = new WorkItemExportResult(
+            new SimulatedPolarionClient(project),
+            new ModuleSnapshotCache(cacheConfig, new HistoricalWorkItemCache(cacheConfig)),
+            "P",
+            "P",
+            documents,
+            TitleFieldset,
+            fetchFields: null,
+            markdownConversion: null,
+            resumeFrom);
+
+        var body = new MemoryStream();
+        var httpContext = new DefaultHttpContext();
+        httpContext.Response.Body = body;
+
+        await result.ExecuteAsync(httpContext);
+        await httpContext.Response.BodyWriter.CompleteAsync();
+
+        return Encoding.UTF8.GetString(body.ToArray())
+            .Split('\n', StringSplitOptions.RemoveEmptyEntries)
+            .Select(line => JsonDocument.Parse(line).RootElement)
+            .ToList();
+    }
+
+    private static string? Kind(JsonElement line) => line.GetProperty("kind").GetString();
+
+    private static string? WorkItemId(JsonElement line) => line.GetProperty("data").GetProperty("id").GetString();
+}
@@ -0,0 +1,126 @@
+using FluentAssertions;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Http.HttpResults;
+using Polarion.Generated.Tracker;
+using PolarionRemoteMcpServer.Endpoints;
+using PolarionRemoteMcpServer.Models.JsonApi;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for WorkItemsEndpoints sparse fieldset parsing, Polarion field mapping and fieldset-driven serialization
+/// </summary>
+public sealed class WorkItemFieldsetTests
+{
+    [Fact]
+    public void TryParseFieldset_Absent_ShouldSucceedWithoutFieldset()
+    {
+        // Act
+        var parsed = WorkItemsEndpoints.TryParseFieldset(null, out var fieldset, out var errorResponse);
+
+        // Assert
+        parsed.Should().BeTrue();
+        fieldset.Should().BeNull();
+        errorResponse.Should().BeNull();
+    }
+
+    [Fact]
+    public void TryParseFieldset_UnknownFields_ShouldReturnBadRequestNamingThem()
+    {
+        // Act
+        var parsed = WorkItemsEndpoints.TryParseFieldset("title,colour, weight", out var fieldset, out var errorResponse);
+
+        // Assert
+        parsed.Should().BeFalse();
+        fieldset.Should().BeNull();
+        var json = errorResponse.Should().BeOfType<JsonHttpResult<JsonApiDocument<object>>>().Subject;
+        json.StatusCode.Should().Be(StatusCodes.Status400BadRequest);
+        json.Value!.Errors.Should().ContainSingle().Which.Detail.Should()
+            .StartWith("Unknown field(s) in fields[workitems]: colour, weight.");
+    }
+
+    [Fact]
+    public void TryParseFieldset_MixedCaseAndWhitespace_ShouldMatchCaseInsensitively()
+    {
+        // Act
+        var parsed = WorkItemsEndpoints.TryParseFieldset(" Title , STATUS,,linkedworkitems ", out var fieldset, out _);
+
+        // Assert
+        parsed.Should().BeTrue();
+        fieldset.Should().HaveCount(3);
+        fieldset.Should().Contain(new[] { "title", "status", "linkedWorkItems" });
+    }
+
+    [Fact]
+    public void ToPolarionFieldList_ShouldMapToPolarionNamesAndAlwaysIncludeIdAndUpdated()
+    {
+        // Arrange
+        WorkItemsEndpoints.TryParseFieldset("title,backlinkedWorkItems,linkedWorkItems,Updated", out var fieldset, out _);
+
+        // Act
+        var fieldList = WorkItemsEndpoints.ToPolarionFieldList(fieldset!);
+
+        // Assert
+        fieldList.Should().StartWith(new[] { "id", "updated" });
+        fieldList.Should().BeEquivalentTo("id", "updated", "title", "linkedWorkItems", "linkedWorkItemsDerived");
+        fieldList.Should().OnlyHaveUniqueItems();
+    }
+
+    [Fact]
+    public void CreateWorkItemResource_LinkRelationshipsOnly_ShouldOmitAttributes()
+    {
+        // Arrange
+        WorkItemsEndpoints.TryParseFieldset("linkedWorkItems,BacklinkedWorkItems", out var fieldset, out _);
+        var workItem = new WorkItem
+        {
+            id = "WI-1",
+            title = "Title",
+            linkedWorkItems = new[] { CreateLink("WI-2", "verifies"), CreateLink("WI-3", "subsection_of") },
+            linkedWorkItemsDerived = new[] { CreateLink("WI-4", "implements") }
+        };
+
+        // Act
+        var resource = WorkItemsEndpoints.CreateWorkItemResource("P", "WI-1", workItem, fieldset!);
+
+        // Assert
+        resource.Attributes.Should().BeNull();
+        resource.Relationships.Should().ContainKeys("linkedWorkItems", "backlinkedWorkItems");
+        resource.Relationships!["linkedWorkItems"].Data.Should().BeOfType<List<JsonApiResourceIdentifier>>()
+            .Which.Select(r => r.Id).Should().Equal(new[] { "P/WI-2" }, "subsection_of is the document outline, not a trace link");
+        resource.Relationships["backlinkedWorkItems"].Data.Should().BeOfType<List<JsonApiResourceIdentifier>>()
+            .Which.Select(r => r.Id).Should().Equal("P/WI-4");
+    }
+
+    [Fact]
+    public void CreateWorkItemResource_AttributesOnly_ShouldReturnRequestedAttributesWithoutRelationships()
+    {
+        // Arrange
+        WorkItemsEndpoints.TryParseFieldset("TITLE,status", out var fieldset, out _);
+        var workItem = new WorkItem
+        {
+            id = "WI-1",
+            title = "Title",
+            status = new EnumOptionId { id = "open" },
+            description = new Text { type = "text/html", content = "<p>Body</p>" },
+            linkedWorkItems = new[] { CreateLink("WI-2", "verifies") }
+        };
+
+        // Act
+        var resource = WorkItemsEndpoints.CreateWorkItemResource("P", "WI-1", workItem, fieldset!);
+
+        // Assert
+        resource.Relationships.Should().BeNull();
+        resource.Attributes!.Title.Should().Be("Title");
+        resource.Attributes.Status.Should().Be("open");
+        resource.Attributes.Description.Should().BeNull();
+    }
+
+    private static LinkedWorkItem CreateLink(string id, string role)
+    {
+        return new LinkedWorkItem
+        {
+            role = new EnumOptionId { id = role },
+            workItemURI = $"subterra:data-service:objects:/default/P${{WorkItem}}{id}"
+        };
+    }
+}
@@ -0,0 +1,222 @@
+using FluentAssertions;
+using FluentResults;
+using Moq;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Endpoints;
+
+namespace PolarionRemoteMcpServer.Tests.Unit;
+
+/// <summary>
+/// Unit tests for WorkItemSearchPaging page bounds and the search page links built from it
+/// </summary>
+public sealed class WorkItemSearchPagingTests
+{
+    private const string BasePath = "/polarion/rest/v1/projects/P/workitems?query=x&page[size]=10";
+
+    private static readonly List<string> FieldList = new() { "id", "updated", "title" };
+
+    [Fact]
+    public async Task SearchPageAsync_MiddlePage_ShouldReturnThatPageInQueryOrder()
+    {
+        // Arrange
+        var client = CreateClient(25, out _);
+
+        // Act
+        var result = await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber: 2, pageSize: 10);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Items.Select(wi => wi.id).Should().Equal(Enumerable.Range(11, 10).Select(i => $"WI-{i}"));
+        result.Value.TotalCount.Should().Be(25);
+        result.Value.TotalPages.Should().Be(3);
+        result.Value.HasPreviousPage.Should().BeTrue();
+        result.Value.HasNextPage.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task SearchPageAsync_LastPartialPage_ShouldReturnRemainingItemsWithoutNextPage()
+    {
+        // Arrange
+        var client = CreateClient(25, out _);
+
+        // Act
+        var result = await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber: 3, pageSize: 10);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Items.Select(wi => wi.id).Should().Equal("WI-21", "WI-22", "WI-23", "WI-24", "WI-25");
+        result.Value.HasNextPage.Should().BeFalse();
+    }
+
+    [Theory]
+    [InlineData(0, 0)]
+    [InlineData(-3, -10)]
+    public async Task SearchPageAsync_PageNumberAndSizeBelowOne_ShouldBeClampedToOne(int pageNumber, int pageSize)
+    {
+        // Arrange
+        var client = CreateClient(5, out _);
+
+        // Act
+        var result = await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber, pageSize);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.PageNumber.Should().Be(1);
+        result.Value.PageSize.Should().Be(1);
+        result.Value.Items.Should().ContainSingle().Which.id.Should().Be("WI-1");
+        result.Value.TotalPages.Should().Be(5);
+    }
+
+    [Fact]
+    public async Task SearchPageAsync_PagePastTheEnd_ShouldReturnEmptyPageWithoutFetchingItems()
+    {
+        // Arrange
+        var client = CreateClient(25, out var queries);
+
+        // Act
+        var result = await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber: 4, pageSize: 10);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Items.Should().BeEmpty();
+        result.Value.TotalCount.Should().Be(25);
+        result.Value.HasPreviousPage.Should().BeTrue();
+        result.Value.HasNextPage.Should().BeFalse();
+        queries.Should().Equal(new[] { "type:requirement" }, "only the ID query runs when the page is empty");
+    }
+
+    [Fact]
+    public async Task SearchPageAsync_NoMatches_ShouldReturnEmptyFirstPage()
+    {
+        // Arrange
+        var client = CreateClient(0, out _);
+
+        // Act
+        var result = await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber: 1, pageSize: 10);
+
+        // Assert
+        result.IsSuccess.Should().BeTrue();
+        result.Value.Items.Should().BeEmpty();
+        result.Value.TotalPages.Should().Be(0);
+        result.Value.HasPreviousPage.Should().BeFalse();
+        result.Value.HasNextPage.Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task SearchPageAsync_ShouldFetchOnlyThePageWithTheCallersFieldList()
+    {
+        // Arrange
+        var client = CreateClient(25, out var queries);
+
+        // Act
+        await WorkItemSearchPaging.SearchPageAsync(client.Object, "type:requirement", "id", FieldList, pageNumber: 3, pageSize: 10);
+
+        // Assert
+        queries.Should().Equal("type:requirement", "id:(WI-21 OR WI-22 OR WI-23 OR WI-24 OR WI-25)");
+        client.Verify(c => c.SearchWorkitemAsync("type:requirement", "id", It.Is<List<string>>(f => f.SequenceEqual(new[] { "id" }))), Times.Once);
+        client.Verify(c => c.SearchWorkitemAsync(It.Is<string>(q => q.StartsWith("id:(")), It.IsAny<string>(), FieldList), Times.Once);
+    }
+
+    [Fact]
+    public void CreatePageLinks_MiddlePage_ShouldLinkAllNeighbours()
+    {
+        // Arrange
+        var page = new WorkItemSearchPage(Array.Empty<WorkItem>(), TotalCount: 25, PageNumber: 2, PageSize: 10);
+
+        // Act
+        var links = WorkItemsEndpoints.CreatePageLinks(BasePath, page);
+
+        // Assert
+        links.Self.Should().Be($"{BasePath}&page[number]=2");
+        links.First.Should().Be($"{BasePath}&page[number]=1");
+        links.Last.Should().Be($"{BasePath}&page[number]=3");
+        links.Prev.Should().Be($"{BasePath}&page[number]=1");
+        links.Next.Should().Be($"{BasePath}&page[number]=3");
+    }
+
+    [Fact]
+    public void CreatePageLinks_FirstAndLastPage_ShouldOmitPrevAndNext()
+    {
+        // Arrange
+        var first = new WorkItemSearchPage(Array.Empty<WorkItem>(), TotalCount: 25, PageNumber: 1, PageSize: 10);
+        var last = new WorkItemSearchPage(Array.Empty<WorkItem>(), TotalCount: 25, PageNumber: 3, PageSize: 10);
+
+        // Act
+        var firstLinks = WorkItemsEndpoints.CreatePageLinks(BasePath, first);
+        var lastLinks = WorkItemsEndpoints.CreatePageLinks(BasePath, last);
+
+        // Assert
+        firstLinks.Prev.Should().BeNull();
+        firstLinks.Next.Should().Be($"{BasePath}&page[number]=2");
+        lastLinks.Prev.Should().Be($"{BasePath}&page[number]=2");
+        lastLinks.Next.Should().BeNull();
+    }
+
+    [Fact]
+    public void CreatePageLinks_PagePastTheEnd_ShouldLinkBackToLastPage()
+    {
+        // Arrange
+        var page = new WorkItemSearchPage(Array.Empty<WorkItem>(), TotalCount: 25, PageNumber: 7, PageSize: 10);
+
+        // Act
+        var links = WorkItemsEndpoints.CreatePageLinks(BasePath, page);
+
+        // Assert
+        links.Self.Should().Be($"{BasePath}&page[number]=7");
+        links.Last.Should().Be($"{BasePath}&page[number]=3");
+        links.Prev.Should().Be($"{BasePath}&page[number]=3");
+        links.Next.Should().BeNull();
+    }
+
+    [Fact]
+    public void CreatePageLinks_NoMatches_ShouldPointLastAtFirstPage()
+    {
+        // Arrange
+        var page = new WorkItemSearchPage(Array.Empty<WorkItem>(), TotalCount: 0, PageNumber: 1, PageSize: 10);
+
+        // Act
+        var links = WorkItemsEndpoints.CreatePageLinks(BasePath, page);
+
+        // Assert
+        links.First.Should().Be($"{BasePath}&page[number]=1");
+        links.Last.Should().Be($"{BasePath}&page[number]=1");
+        links.Prev.Should().BeNull();
+        links.Next.Should().BeNull();
+    }
+
+    /// <summary>
+    /// Answers the search query with <c>WI-1</c>..<c>WI-n</c> in order and batched <c>id:(A OR B)</c> queries with
+    /// the matching work items; every query is recorded.
+    /// </summary>
+    private static Mock<IPolarionClient> CreateClient(int matchCount, out List<string> queries)
+    {
+        var workItems = Enumerable.Range(1, matchCount)
+            .Select(i => new WorkItem { id = $"WI-{i}", title = $"Title {i}" })
+            .ToArray();
+
+        var recorded = new List<string>();
+        var client = new Mock<IPolarionClient>();
+        client
+            .Setup(c => c.SearchWorkitemAsync(It.IsAny<string>(), It.IsAny<string>(), It.IsAny<List<string>>()))
+            .ReturnsAsync((string query, string _, List<string> _) =>
+            {
+                lock (recorded)
+                {
+                    recorded.Add(query);
+                }
+
+                if (!query.StartsWith("id:("))
+                {
+                    return Result.Ok(workItems.Select(wi => new WorkItem { id = wi.id }).ToArray());
+                }
+
+                var ids = query["id:(".Length..^1].Split(" OR ");
+                return Result.Ok(workItems.Where(wi => ids.Contains(wi.id)).ToArray());
+            });
+
+        queries = recorded;
+        return client;
+    }
+}
@@ -1,6 +1,4 @@
-using System.Security.Claims;
 using System.Text.Encodings.Web;
-using System.Text.Json;
 using Microsoft.AspNetCore.Authentication;
 using Microsoft.Extensions.Options;
 using PolarionRemoteMcpServer.Models.JsonApi;
@@ -21,79 +19,53 @@ public class ApiKeyAuthenticationOptions : AuthenticationSchemeOptions
 
 /// <summary>
 /// Authentication handler that validates API keys against configured consumers.
+/// Keys are looked up through the precomputed <see cref="ApiKeyRegistry"/>.
 /// </summary>
 public class ApiKeyAuthenticationHandler : AuthenticationHandler<ApiKeyAuthenticationOptions>
 {
-    private readonly ApiConsumersConfig _consumersConfig;
+    private static readonly Task<AuthenticateResult> NoResult = Task.FromResult(AuthenticateResult.NoResult());
+    private static readonly Task<AuthenticateResult> InvalidApiKey = Task.FromResult(AuthenticateResult.Fail("Invalid API key"));
+
+    private readonly ApiKeyRegistry _apiKeys;
 
     public ApiKeyAuthenticationHandler(
         IOptionsMonitor<ApiKeyAuthenticationOptions> options,
         ILoggerFactory loggerFactory,
         UrlEncoder encoder,
-        ApiConsumersConfig consumersConfig)
+        ApiKeyRegistry apiKeys)
         : base(options, loggerFactory, encoder)
     {
-        _consumersConfig = consumersConfig;
+        _apiKeys = apiKeys;
     }
 
     protected override Task<AuthenticateResult> HandleAuthenticateAsync()
     {
         // Check for API key header
-        if (!Request.Headers.TryGetValue(ApiKeyAuthenticationOptions.HeaderName, out var apiKeyHeaderValues))
-        {
-            Log.Debug("API Key authentication: No {Header} header present", ApiKeyAuthenticationOptions.HeaderName);
-            return Task.FromResult(AuthenticateResult.NoResult());
-        }
-
-        var providedApiKey = apiKeyHeaderValues.FirstOrDefault();
+        var apiKeyHeaderValues = Request.Headers[ApiKeyAuthenticationOptions.HeaderName];
+        var providedApiKey = apiKeyHeaderValues.Count > 0 ? apiKeyHeaderValues[0] : null;
         if (string.IsNullOrWhiteSpace(providedApiKey))
         {
-            Log.Debug("API Key authentication: Empty API key provided");
-            return Task.FromResult(AuthenticateResult.NoResult());
+            Log.Debug("API Key authentication: No {Header} header present", ApiKeyAuthenticationOptions.HeaderName);
+            return NoResult;
         }
 
-        // Find matching consumer by API key
-        var matchingConsumer = _consumersConfig.Consumers
-            .FirstOrDefault(kvp => kvp.Value.ApplicationKey == providedApiKey);
-
-        if (matchingConsumer.Key == null)
+        var consumer = _apiKeys.Find(providedApiKey);
+        if (consumer == null)
         {
             Log.Warning("API Key authentication: Invalid API key attempted");
-            return Task.FromResult(AuthenticateResult.Fail("Invalid API key"));
+            return InvalidApiKey;
         }
 
-        var consumerId = matchingConsumer.Key;
-        var consumer = matchingConsumer.Value;
-
-        // Check if consumer is active
         if (!consumer.Active)
         {
-            Log.Warning("API Key authentication: Inactive consumer '{ConsumerId}' attempted to authenticate", consumerId);
-            return Task.FromResult(AuthenticateResult.Fail("Consumer is inactive"));
-        }
-
-        Log.Information("API Key authentication: Consumer '{ConsumerId}' ({Name}) authenticated successfully",
-            consumerId, consumer.Name);
-
-        // Build claims
-        var claims = new List<Claim>
-        {
-            new Claim(ClaimTypes.NameIdentifier, consumerId),
-            new Claim(ClaimTypes.Name, consumer.Name),
-            new Claim("consumer_id", consumerId)
-        };
-
-        // Add scope claims
-        foreach (var scope in consumer.AllowedScopes)
-        {
-            claims.Add(new Claim("scope", scope));
+            Log.Warning("API Key authentication: Inactive consumer '{ConsumerId}' attempted to authenticate", consumer.ConsumerId);
+            return consumer.Result;
         }
 
-        var identity = new ClaimsIdentity(claims, Scheme.Name);
-        var principal = new ClaimsPrincipal(identity);
-        var ticket = new AuthenticationTicket(principal, Scheme.Name);
+        Log.Debug("API Key authentication: Consumer '{ConsumerId}' ({Name}) authenticated successfully",
+            consumer.ConsumerId, consumer.Name);
 
-        return Task.FromResult(AuthenticateResult.Success(ticket));
+        return consumer.Result;
     }
 
     protected override async Task HandleChallengeAsync(AuthenticationProperties properties)
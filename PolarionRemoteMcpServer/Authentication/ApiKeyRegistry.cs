@@ -0,0 +1,126 @@
+using System.Buffers.Binary;
+using System.Security.Claims;
+using System.Security.Cryptography;
+using System.Text;
+using Microsoft.AspNetCore.Authentication;
+using Microsoft.Extensions.Options;
+using Serilog;
+
+namespace PolarionRemoteMcpServer.Authentication;
+
+/// <summary>
+/// Precomputed API key lookup for <see cref="ApiKeyAuthenticationHandler"/>. Consumer keys are stored only as
+/// SHA-256 digests, bucketed by the first 8 bytes of the digest, and compared with
+/// <see cref="CryptographicOperations.FixedTimeEquals"/>, so a lookup costs one hash regardless of how many
+/// consumers are configured and leaks nothing about how much of a key matched. Each consumer's principal and
+/// authentication result are built once and shared by all of its requests. The table is rebuilt when the
+/// <c>ApiConsumers</c> configuration section is reloaded.
+/// </summary>
+public sealed class ApiKeyRegistry : IDisposable
+{
+    /// <summary>
+    /// Keys longer than this are rejected without hashing, so the hash buffer can live on the stack.
+    /// </summary>
+    public const int MaxApiKeyLength = 512;
+
+    private readonly IDisposable? _changeSubscription;
+    private volatile Dictionary<ulong, ApiKeyEntry[]> _entries;
+
+    public ApiKeyRegistry(IOptionsMonitor<ApiConsumersConfig> consumersConfig)
+    {
+        _entries = Build(consumersConfig.CurrentValue);
+        _changeSubscription = consumersConfig.OnChange(config =>
+        {
+            _entries = Build(config);
+            Log.Information("API Key authentication: Reloaded {Count} consumer(s)", config.Consumers.Count);
+        });
+    }
+
+    /// <summary>
+    /// Finds the consumer that owns an API key.
+    /// </summary>
+    /// <returns>The consumer entry, or null if no consumer has this key.</returns>
+    public ApiKeyEntry? Find(string apiKey)
+    {
+        if (apiKey.Length > MaxApiKeyLength)
+        {
+            return null;
+        }
+
+        Span<byte> keyBytes = stackalloc byte[Encoding.UTF8.GetMaxByteCount(MaxApiKeyLength)];
+        var keyLength = Encoding.UTF8.GetBytes(apiKey, keyBytes);
+
+        Span<byte> digest = stackalloc byte[SHA256.HashSizeInBytes];
+        SHA256.HashData(keyBytes[..keyLength], digest);
+
+        if (!_entries.TryGetValue(BinaryPrimitives.ReadUInt64LittleEndian(digest), out var candidates))
+        {
+            return null;
+        }
+
+        foreach (var candidate in candidates)
+        {
+            if (CryptographicOperations.FixedTimeEquals(candidate.KeyDigest, digest))
+            {
+                return candidate;
+            }
+        }
+
+        return null;
+    }
+
+    public void Dispose()
+    {
+        _changeSubscription?.Dispose();
+    }
+
+    private static Dictionary<ulong, ApiKeyEntry[]> Build(ApiConsumersConfig config)
+    {
+        return config.Consumers
+            .Where(consumer => !string.IsNullOrEmpty(consumer.Value.ApplicationKey))
+            .Select(consumer => new ApiKeyEntry(consumer.Key, consumer.Value))
+            .GroupBy(entry => BinaryPrimitives.ReadUInt64LittleEndian(entry.KeyDigest))
+            .ToDictionary(group => group.Key, group => group.ToArray());
+    }
+}
+
+/// <summary>
+/// A configured API consumer with its key digest and prebuilt authentication results.
+/// </summary>
+public sealed class ApiKeyEntry
+{
+    internal ApiKeyEntry(string consumerId, ApiConsumerConfig consumer)
+    {
+        ConsumerId = consumerId;
+        Name = consumer.Name;
+        Active = consumer.Active;
+        KeyDigest = SHA256.HashData(Encoding.UTF8.GetBytes(consumer.ApplicationKey));
+
+        var claims = new List<Claim>
+        {
+            new Claim(ClaimTypes.NameIdentifier, consumerId),
+            new Claim(ClaimTypes.Name, consumer.Name),
+            new Claim("consumer_id", consumerId)
+        };
+        claims.AddRange(consumer.AllowedScopes.Select(scope => new Claim("scope", scope)));
+
+        var principal = new ClaimsPrincipal(new ClaimsIdentity(claims, AuthenticationExtensions.ApiKeyScheme));
+        Result = Task.FromResult(Active
+            ? AuthenticateResult.Success(new AuthenticationTicket(principal, AuthenticationExtensions.ApiKeyScheme))
+            : AuthenticateResult.Fail("Consumer is inactive"));
+    }
+
+    public string ConsumerId { get; }
+
+    public string Name { get; }
+
+    public bool Active { get; }
+
+    internal byte[] KeyDigest { get; }
+
+    /// <summary>
+    /// The authentication result returned for every request made with this consumer's key.
+    /// The principal is shared between requests and must not be modified.
+    /// </summary>
+    public Task<AuthenticateResult> Result { get; }
+}
@@ -32,7 +32,9 @@ public static class AuthenticationExtensions
                 string.Join(", ", consumer.Value.AllowedScopes));
         }
 
-        services.AddSingleton(consumersConfig);
+        // Bound as options so that edits to the ApiConsumers section are picked up on configuration reload
+        services.Configure<ApiConsumersConfig>(configuration.GetSection("ApiConsumers"));
+        services.AddSingleton<ApiKeyRegistry>();
 
         // Add authentication
         services.AddAuthentication(options =>
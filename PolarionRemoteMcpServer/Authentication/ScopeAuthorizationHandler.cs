@@ -28,10 +28,7 @@ public class ScopeAuthorizationHandler : AuthorizationHandler<ScopeRequirement>
         AuthorizationHandlerContext context,
         ScopeRequirement requirement)
     {
-        // Get all scope claims
-        var scopeClaims = context.User.FindAll("scope").Select(c => c.Value).ToList();
-
-        if (scopeClaims.Contains(requirement.Scope))
+        if (context.User.HasClaim("scope", requirement.Scope))
         {
             Log.Debug("Authorization: User has required scope '{Scope}'", requirement.Scope);
             context.Succeed(requirement);
@@ -39,6 +36,7 @@ public class ScopeAuthorizationHandler : AuthorizationHandler<ScopeRequirement>
         else
         {
             var consumerId = context.User.FindFirst("consumer_id")?.Value ?? "unknown";
+            var scopeClaims = context.User.FindAll("scope").Select(c => c.Value);
             Log.Warning("Authorization: Consumer '{ConsumerId}' missing required scope '{Scope}'. Has scopes: [{Scopes}]",
                 consumerId, requirement.Scope, string.Join(", ", scopeClaims));
         }
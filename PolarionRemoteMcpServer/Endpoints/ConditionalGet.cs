@@ -0,0 +1,93 @@
+using System.Security.Cryptography;
+using System.Text;
+using Microsoft.AspNetCore.Http;
+
+namespace PolarionRemoteMcpServer.Endpoints;
+
+/// <summary>
+/// Strong ETags and conditional GET support for the Polarion-compatible REST endpoints.
+/// Handlers describe the version of the data behind a response (updated timestamps, revision IDs, or the
+/// listed values where Polarion keeps no timestamp); the ETag is a hash of those versions and the request
+/// target, so two requests for the same representation of unchanged data get the same tag.
+/// </summary>
+public static class ConditionalGet
+{
+    /// <summary>
+    /// Cache-Control for resources that can change: caches may store them but must revalidate with the ETag.
+    /// </summary>
+    public const string RevalidateCacheControl = "private, no-cache";
+
+    /// <summary>
+    /// Cache-Control for revision-pinned resources, whose content never changes.
+    /// </summary>
+    public const string ImmutableCacheControl = "private, max-age=31536000, immutable";
+
+    /// <summary>
+    /// Sets the <c>ETag</c> and <c>Cache-Control</c> response headers and returns a <c>304 Not Modified</c> result
+    /// if the request's <c>If-None-Match</c> already names the current ETag; otherwise returns null and the
+    /// handler writes the full response.
+    /// </summary>
+    /// <param name="httpContext">The current request.</param>
+    /// <param name="versions">Values that change whenever the response body would change.</param>
+    /// <param name="revisionPinned">True if the response is for a fixed revision and can be cached indefinitely.</param>
+    public static IResult? Evaluate(HttpContext httpContext, IEnumerable<string?> versions, bool revisionPinned = false)
+    {
+        var etag = CreateETag(httpContext.Request, versions);
+
+        var headers = httpContext.Response.Headers;
+        headers.ETag = etag;
+        headers.CacheControl = revisionPinned ? ImmutableCacheControl : RevalidateCacheControl;
+
+        return IfNoneMatch(httpContext.Request, etag)
+            ? Results.StatusCode(StatusCodes.Status304NotModified)
+            : null;
+    }
+
+    /// <summary>
+    /// Builds a quoted strong ETag from the request path and query and the given versions.
+    /// </summary>
+    public static string CreateETag(HttpRequest request, IEnumerable<string?> versions)
+    {
+        using var hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+        hash.AppendData(Encoding.UTF8.GetBytes($"{request.Path}{request.QueryString}\n"));
+
+        foreach (var version in versions)
+        {
+            hash.AppendData(Encoding.UTF8.GetBytes(version ?? string.Empty));
+            hash.AppendData("\n"u8);
+        }
+
+        return $"\"{Convert.ToHexString(hash.GetHashAndReset(), 0, 16).ToLowerInvariant()}\"";
+    }
+
+    /// <summary>
+    /// Returns true if the request's <c>If-None-Match</c> header contains the ETag or <c>*</c>.
+    /// Weak validators match by their opaque tag, as RFC 9110 requires for <c>If-None-Match</c>.
+    /// </summary>
+    public static bool IfNoneMatch(HttpRequest request, string etag)
+    {
+        foreach (var headerValue in request.Headers.IfNoneMatch)
+        {
+            if (headerValue == null)
+            {
+                continue;
+            }
+
+            foreach (var candidate in headerValue.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+            {
+                if (candidate == "*")
+                {
+                    return true;
+                }
+
+                var tag = candidate.StartsWith("W/", StringComparison.Ordinal) ? candidate[2..] : candidate;
+                if (tag == etag)
+                {
+                    return true;
+                }
+            }
+        }
+
+        return false;
+    }
+}
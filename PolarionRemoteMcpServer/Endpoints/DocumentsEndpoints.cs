@@ -33,13 +33,17 @@ public static class DocumentsEndpoints
             .RequireAuthorization(ApiScopes.PolarionRead);
         group.MapGet("/documents/{documentId}/revisions", GetDocumentRevisions)
             .RequireAuthorization(ApiScopes.PolarionRead);
+        group.MapGet("/documents/{documentId}/diff", GetDocumentDiff)
+            .RequireAuthorization(ApiScopes.PolarionRead);
     }
 
     [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
     private static async Task<IResult> GetDocuments(
         string projectId,
         string spaceId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        HttpContext httpContext)
     {
         Log.Debug("REST API: GetDocuments called for project={ProjectId}, space={SpaceId}", projectId, spaceId);
 
@@ -68,15 +72,24 @@ public static class DocumentsEndpoints
 
         try
         {
-            var documentsResult = await polarionClient.GetModulesInSpaceThinAsync(spaceId);
-            if (documentsResult.IsFailed)
+            var catalogResult = await catalog.GetAsync(polarionClient, projectConfig);
+            if (catalogResult.IsFailed)
             {
-                var errorMsg = documentsResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                var errorMsg = catalogResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
                 Log.Warning("REST API: Failed to get documents for space {SpaceId}: {Error}", spaceId, errorMsg);
                 return CreateErrorResponse("500", "Internal Server Error", errorMsg);
             }
 
-            var documents = documentsResult.Value;
+            var documents = catalogResult.Value.GetDocuments(spaceId, titleFilter: null, blacklistPattern: null);
+
+            // The thin document list carries no timestamps, so the listed values are the version
+            var notModified = ConditionalGet.Evaluate(httpContext,
+                documents.Select(doc => $"{doc.Id}\u001f{doc.Title}\u001f{doc.Type}\u001f{doc.Status}\u001f{doc.Space}"));
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             var resources = new List<DocumentResource>();
 
             foreach (var doc in documents)
@@ -115,6 +128,11 @@ public static class DocumentsEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListDocumentResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting documents for space {SpaceId} ({Reason})", spaceId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting documents for space {SpaceId}", spaceId);
@@ -127,7 +145,8 @@ public static class DocumentsEndpoints
         string projectId,
         string spaceId,
         string documentId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        HttpContext httpContext)
     {
         Log.Debug("REST API: GetDocument called for project={ProjectId}, space={SpaceId}, document={DocumentId}",
             projectId, spaceId, documentId);
@@ -172,6 +191,12 @@ public static class DocumentsEndpoints
                 return CreateErrorResponse("404", "Not Found", $"Document '{documentLocation}' not found.");
             }
 
+            var notModified = ConditionalGet.Evaluate(httpContext, new[] { $"{doc.moduleLocation}@{(doc.updatedSpecified ? doc.updated.Ticks : 0)}" });
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             var resource = new DocumentResource
             {
                 Id = $"{projectId}/{spaceId}/{documentId}",
@@ -205,6 +230,11 @@ public static class DocumentsEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentDocumentResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting document {SpaceId}/{DocumentId} ({Reason})", spaceId, documentId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting document {SpaceId}/{DocumentId}", spaceId, documentId);
@@ -218,6 +248,8 @@ public static class DocumentsEndpoints
         string spaceId,
         string documentId,
         RestApiProjectResolver projectResolver,
+        ModuleSnapshotCache snapshotCache,
+        HttpContext httpContext,
         string? types = null,
         string? revision = null)
     {
@@ -252,7 +284,7 @@ public static class DocumentsEndpoints
             // Determine if this is a historical query
             var isHistoricalQuery = !string.IsNullOrWhiteSpace(revision) && revision != "-1";
             Polarion.Generated.Tracker.WorkItem[] workItems;
-            Dictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata = null;
+            IReadOnlyDictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata = null;
 
             if (isHistoricalQuery)
             {
@@ -262,12 +294,12 @@ public static class DocumentsEndpoints
                     Log.Warning("REST API: Type filtering (types parameter) is not supported for historical queries (revision != null). Filter will be ignored.");
                 }
 
-                var workItemsResult = await polarionClient.GetWorkItemsByModuleRevisionAsync(
-                    spaceId, documentId, revision!);
+                var snapshotResult = await snapshotCache.GetAsync(
+                    polarionClient, projectConfig.GetProjectKey(), spaceId, documentId, revision!);
 
-                if (workItemsResult.IsFailed)
+                if (snapshotResult.IsFailed)
                 {
-                    var errorMsg = workItemsResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                    var errorMsg = snapshotResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
 
                     // Handle UnresolvableObjectException with helpful error
                     if (errorMsg.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
@@ -282,18 +314,8 @@ public static class DocumentsEndpoints
                     return CreateErrorResponse("500", "Internal Server Error", errorMsg);
                 }
 
-                var wiInfoArray = workItemsResult.Value;
-                workItems = wiInfoArray.Select(wi => wi.WorkItem).ToArray();
-
-                // Store revision metadata
-                revisionMetadata = new Dictionary<string, (string, string, bool)>();
-                foreach (var wiInfo in wiInfoArray)
-                {
-                    if (wiInfo?.WorkItem?.id != null)
-                    {
-                        revisionMetadata[wiInfo.WorkItem.id] = (wiInfo.Revision, wiInfo.HeadRevision, wiInfo.IsHistorical);
-                    }
-                }
+                workItems = snapshotResult.Value.WorkItems;
+                revisionMetadata = snapshotResult.Value.RevisionMetadata;
             }
             else
             {
@@ -304,67 +326,43 @@ public static class DocumentsEndpoints
                     typeList = types.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries).ToList();
                 }
 
-                var workItemsResult = await polarionClient.QueryWorkItemsInModuleAsync(spaceId, documentId, typeList);
-                if (workItemsResult.IsFailed)
+                var snapshotResult = await snapshotCache.GetAsync(polarionClient, projectConfig.GetProjectKey(), spaceId, documentId, "-1");
+                if (snapshotResult.IsFailed)
                 {
-                    var errorMsg = workItemsResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                    var errorMsg = snapshotResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
                     Log.Warning("REST API: Failed to get work items for {SpaceId}/{DocumentId}: {Error}",
                         spaceId, documentId, errorMsg);
                     return CreateErrorResponse("500", "Internal Server Error", errorMsg);
                 }
 
-                workItems = workItemsResult.Value ?? Array.Empty<Polarion.Generated.Tracker.WorkItem>();
+                workItems = snapshotResult.Value.FilterByTypes(typeList);
             }
 
-            var resources = new List<WorkItemResource>();
-
-            foreach (var workItem in workItems)
+            // Historical items are versioned by revision and head revision, current ones by their updated timestamp.
+            // Restructuring the document renumbers work items without touching their timestamp, so the outline
+            // number is part of every version.
+            var notModified = ConditionalGet.Evaluate(httpContext, workItems
+                .Where(workItem => workItem?.id != null)
+                .Select(workItem => revisionMetadata != null && revisionMetadata.TryGetValue(workItem.id, out var metadata)
+                    ? $"{workItem.id}@r{metadata.Revision}/{metadata.HeadRevision}#{workItem.outlineNumber}"
+                    : $"{workItem.id}@{(workItem.updatedSpecified ? workItem.updated.Ticks : 0)}#{workItem.outlineNumber}"));
+            if (notModified != null)
             {
-                if (workItem == null) continue;
-
-                var attributes = new WorkItemAttributes
-                {
-                    Title = workItem.title,
-                    Type = workItem.type?.id,
-                    Status = workItem.status?.id,
-                    OutlineNumber = workItem.outlineNumber,
-                    Created = workItem.createdSpecified ? workItem.created : null,
-                    Updated = workItem.updatedSpecified ? workItem.updated : null,
-                    Author = workItem.author?.id,
-                    Description = workItem.description?.content
-                };
-
-                // Add revision metadata for historical queries
-                if (isHistoricalQuery && revisionMetadata != null &&
-                    workItem.id != null && revisionMetadata.TryGetValue(workItem.id, out var metadata))
-                {
-                    attributes.Revision = metadata.Revision;
-                    attributes.HeadRevision = metadata.HeadRevision;
-                    attributes.IsHistorical = metadata.IsHistorical;
-                }
-
-                var resource = new WorkItemResource
-                {
-                    Id = $"{projectId}/{workItem.id}",
-                    Attributes = attributes,
-                    Links = new JsonApiLinks
-                    {
-                        Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workItem.id}"
-                    }
-                };
-                resources.Add(resource);
+                return notModified;
             }
 
+            var resourceCount = workItems.Count(workItem => workItem != null);
+
             var meta = new JsonApiMeta
             {
-                Count = resources.Count
+                Count = resourceCount
             };
 
             // Add revision info to meta for historical queries
             if (isHistoricalQuery && revisionMetadata != null)
             {
                 var historicalCount = revisionMetadata.Values.Count(m => m.IsHistorical);
-                var currentCount = resources.Count - historicalCount;
+                var currentCount = resourceCount - historicalCount;
 
                 // Add custom metadata fields (using existing AdditionalProperties field)
                 meta.AdditionalProperties = new Dictionary<string, object>
@@ -375,17 +373,23 @@ public static class DocumentsEndpoints
                 };
             }
 
-            var response = new JsonApiDocument<List<WorkItemResource>>
+            var links = new JsonApiLinks
             {
-                Data = resources,
-                Links = new JsonApiLinks
-                {
-                    Self = $"/polarion/rest/v1/projects/{projectId}/spaces/{spaceId}/documents/{documentId}/workitems"
-                },
-                Meta = meta
+                Self = $"/polarion/rest/v1/projects/{projectId}/spaces/{spaceId}/documents/{documentId}/workitems"
             };
 
-            return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListWorkItemResource);
+            // Large documents run to thousands of work items, so resources are built while the response is written
+            var resources = workItems
+                .Where(workItem => workItem != null)
+                .Select(workItem => CreateDocumentWorkItemResource(projectId, workItem, isHistoricalQuery ? revisionMetadata : null));
+
+            return new JsonApiStreamingResult<WorkItemResource>(
+                resources, PolarionRestApiJsonContext.Default.WorkItemResource, links, meta);
+        }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting work items for document {SpaceId}/{DocumentId} ({Reason})", spaceId, documentId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
         }
         catch (Exception ex)
         {
@@ -394,12 +398,49 @@ public static class DocumentsEndpoints
         }
     }
 
+    private static WorkItemResource CreateDocumentWorkItemResource(
+        string projectId,
+        Polarion.Generated.Tracker.WorkItem workItem,
+        IReadOnlyDictionary<string, (string Revision, string HeadRevision, bool IsHistorical)>? revisionMetadata)
+    {
+        var attributes = new WorkItemAttributes
+        {
+            Title = workItem.title,
+            Type = workItem.type?.id,
+            Status = workItem.status?.id,
+            OutlineNumber = workItem.outlineNumber,
+            Created = workItem.createdSpecified ? workItem.created : null,
+            Updated = workItem.updatedSpecified ? workItem.updated : null,
+            Author = workItem.author?.id,
+            Description = workItem.description?.content
+        };
+
+        // Add revision metadata for historical queries
+        if (revisionMetadata != null && workItem.id != null && revisionMetadata.TryGetValue(workItem.id, out var metadata))
+        {
+            attributes.Revision = metadata.Revision;
+            attributes.HeadRevision = metadata.HeadRevision;
+            attributes.IsHistorical = metadata.IsHistorical;
+        }
+
+        return new WorkItemResource
+        {
+            Id = $"{projectId}/{workItem.id}",
+            Attributes = attributes,
+            Links = new JsonApiLinks
+            {
+                Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workItem.id}"
+            }
+        };
+    }
+
     [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
     private static async Task<IResult> GetDocumentRevisions(
         string projectId,
         string spaceId,
         string documentId,
         RestApiProjectResolver projectResolver,
+        HttpContext httpContext,
         [FromQuery(Name = "page[size]")] int pageSize = 100)
     {
         // Clamp pageSize: min 1, max 500
@@ -450,6 +491,13 @@ public static class DocumentsEndpoints
             }
 
             var revisions = revisionsResult.Value ?? Array.Empty<Polarion.Generated.Tracker.Module>();
+
+            var notModified = ConditionalGet.Evaluate(httpContext, revisions.Select(revision => revision.uri));
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             var resources = new List<DocumentRevisionResource>();
 
             foreach (var revision in revisions)
@@ -491,6 +539,11 @@ public static class DocumentsEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListDocumentRevisionResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting revisions for document {SpaceId}/{DocumentId} ({Reason})", spaceId, documentId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting revisions for document {SpaceId}/{DocumentId}", spaceId, documentId);
@@ -498,6 +551,163 @@ public static class DocumentsEndpoints
         }
     }
 
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static async Task<IResult> GetDocumentDiff(
+        string projectId,
+        string spaceId,
+        string documentId,
+        RestApiProjectResolver projectResolver,
+        ModuleSnapshotCache snapshotCache,
+        HttpContext httpContext,
+        string? from = null,
+        string? to = null)
+    {
+        Log.Debug("REST API: GetDocumentDiff called for project={ProjectId}, space={SpaceId}, document={DocumentId}, from={From}, to={To}",
+            projectId, spaceId, documentId, from, to);
+
+        if (string.IsNullOrWhiteSpace(spaceId) || string.IsNullOrWhiteSpace(documentId))
+        {
+            return CreateErrorResponse("400", "Bad Request", "spaceId and documentId parameters cannot be empty.");
+        }
+
+        if (string.IsNullOrWhiteSpace(from))
+        {
+            return CreateErrorResponse("400", "Bad Request", "The 'from' query parameter is required.");
+        }
+
+        var toRevision = string.IsNullOrWhiteSpace(to) ? "-1" : to;
+
+        // Get project config - matches against SessionConfig.ProjectId, no fallback
+        var projectConfig = projectResolver.GetProjectConfig(projectId);
+        if (projectConfig == null)
+        {
+            return CreateNotFoundResponse(projectId, projectResolver.GetConfiguredProjectIds());
+        }
+
+        // Create client for this project
+        var clientResult = await projectResolver.CreateClientAsync(projectId);
+        if (clientResult.IsFailed)
+        {
+            var errorMsg = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+            Log.Error("REST API: Failed to create Polarion client: {Error}", errorMsg);
+            return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+        }
+
+        var polarionClient = clientResult.Value;
+
+        try
+        {
+            // Per-item revisions only come with the work items' content, so both revisions are loaded in full
+            var projectKey = projectConfig.GetProjectKey();
+            var fromTask = snapshotCache.GetAsync(polarionClient, projectKey, spaceId, documentId, from);
+            var toTask = snapshotCache.GetAsync(polarionClient, projectKey, spaceId, documentId, toRevision);
+            await Task.WhenAll(fromTask, toTask);
+
+            foreach (var (snapshotResult, revision) in new[] { (fromTask.Result, from), (toTask.Result, toRevision) })
+            {
+                if (snapshotResult.IsFailed)
+                {
+                    var errorMsg = snapshotResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+
+                    if (errorMsg.Contains("UnresolvableObjectException", StringComparison.OrdinalIgnoreCase))
+                    {
+                        return CreateErrorResponse("404", "Not Found",
+                            $"Document '{spaceId}/{documentId}' not found at revision '{revision}'. " +
+                            "The revision may be invalid or the document may not have existed at that revision.");
+                    }
+
+                    Log.Warning("REST API: Failed to get work items for {SpaceId}/{DocumentId} at revision {Revision}: {Error}",
+                        spaceId, documentId, revision, errorMsg);
+                    return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+                }
+            }
+
+            var fromSnapshot = fromTask.Result.Value;
+            var toSnapshot = toTask.Result.Value;
+
+            // A diff between two baselines never changes; one against HEAD changes with the HEAD work items and with
+            // the HEAD outline, since moves are detected from parents and order, which leave timestamps untouched
+            var revisionPinned = fromSnapshot.IsHistorical && toSnapshot.IsHistorical;
+            var versions = new List<string?> { from, toRevision };
+            if (!revisionPinned)
+            {
+                versions.AddRange(new[] { fromSnapshot, toSnapshot }
+                    .Where(snapshot => !snapshot.IsHistorical)
+                    .SelectMany(snapshot => snapshot.Outline.Nodes)
+                    .Select(node => $"{node.WorkItem.id}@{(node.WorkItem.updatedSpecified ? node.WorkItem.updated.Ticks : 0)}" +
+                                    $"#{node.OutlineNumber}^{node.Parent?.WorkItem.id}"));
+            }
+
+            var notModified = ConditionalGet.Evaluate(httpContext, versions, revisionPinned);
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
+            var diff = DocumentRevisionDiff.Compute(fromSnapshot, toSnapshot);
+
+            var resources = diff.Changes
+                .Select(change => new WorkItemChangeResource
+                {
+                    Id = $"{projectId}/{change.Id}",
+                    Attributes = new WorkItemChangeAttributes
+                    {
+                        ChangeType = change.Kind.ToString().ToLowerInvariant(),
+                        Moved = change.IsMoved,
+                        Title = change.Title,
+                        Type = change.Type,
+                        FromOutlineNumber = change.FromOutlineNumber,
+                        ToOutlineNumber = change.ToOutlineNumber,
+                        FromRevision = change.FromRevision,
+                        ToRevision = change.ToRevision,
+                        FieldChanges = change.FieldChanges.Count == 0
+                            ? null
+                            : change.FieldChanges
+                                .Select(field => new WorkItemFieldChangeAttributes { Field = field.Field, From = field.From, To = field.To })
+                                .ToList()
+                    },
+                    Links = new JsonApiLinks
+                    {
+                        Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{change.Id}"
+                    }
+                })
+                .ToList();
+
+            var response = new JsonApiDocument<List<WorkItemChangeResource>>
+            {
+                Data = resources,
+                Links = new JsonApiLinks
+                {
+                    Self = $"/polarion/rest/v1/projects/{projectId}/spaces/{spaceId}/documents/{documentId}/diff"
+                },
+                Meta = new DocumentDiffMeta
+                {
+                    Count = resources.Count,
+                    FromRevision = diff.FromRevision,
+                    ToRevision = diff.ToRevision,
+                    AddedCount = diff.AddedCount,
+                    RemovedCount = diff.RemovedCount,
+                    MovedCount = diff.MovedCount,
+                    ModifiedCount = diff.ModifiedCount,
+                    UnchangedCount = diff.UnchangedCount,
+                    SkippedByRevisionCount = diff.SkippedByRevisionCount
+                }
+            };
+
+            return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListWorkItemChangeResource);
+        }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled comparing revisions of document {SpaceId}/{DocumentId} ({Reason})", spaceId, documentId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
+        catch (Exception ex)
+        {
+            Log.Error(ex, "REST API: Exception comparing revisions of document {SpaceId}/{DocumentId}", spaceId, documentId);
+            return CreateErrorResponse("500", "Internal Server Error", ex.Message);
+        }
+    }
+
     /// <summary>
     /// Extracts the revision ID from a Polarion module URI.
     /// </summary>
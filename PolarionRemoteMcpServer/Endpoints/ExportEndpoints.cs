@@ -0,0 +1,236 @@
+using System.Diagnostics.CodeAnalysis;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Routing;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Authentication;
+using PolarionRemoteMcpServer.Models.JsonApi;
+using PolarionRemoteMcpServer.Services;
+using Serilog;
+
+namespace PolarionRemoteMcpServer.Endpoints;
+
+/// <summary>
+/// REST API endpoints that stream the work items of a document, a space or a whole project as newline-delimited
+/// JSON, for pipelines that would otherwise walk every document and work item one request at a time.
+/// </summary>
+public static class ExportEndpoints
+{
+    /// <summary>
+    /// The attributes exported when no sparse fieldset is requested; the module query returns all of them,
+    /// so the default export makes one upstream call per document.
+    /// </summary>
+    private static readonly HashSet<string> ModuleFieldset = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "title", "type", "status", "description", "outlineNumber", "created", "updated", "author"
+    };
+
+    /// <summary>
+    /// Maps the export endpoints to the application.
+    /// </summary>
+    public static void MapExportEndpoints(this IEndpointRouteBuilder app)
+    {
+        var group = app.MapGroup("/polarion/rest/v1/projects/{projectId}");
+
+        group.MapGet("/export", ExportProject)
+            .RequireAuthorization(ApiScopes.PolarionRead);
+        group.MapGet("/spaces/{spaceId}/export", ExportSpace)
+            .RequireAuthorization(ApiScopes.PolarionRead);
+        group.MapGet("/spaces/{spaceId}/documents/{documentId}/export", ExportDocument)
+            .RequireAuthorization(ApiScopes.PolarionRead);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static Task<IResult> ExportProject(
+        string projectId,
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        ModuleSnapshotCache snapshotCache,
+        MarkdownConversionService markdownConversion,
+        HttpContext httpContext,
+        [FromQuery(Name = "fields[workitems]")] string? fields = null,
+        bool markdown = false,
+        [FromQuery(Name = "continue")] string? continuation = null)
+    {
+        return ExportAsync(projectId, null, null, projectResolver, catalog, snapshotCache, markdownConversion, httpContext,
+            fields, markdown, continuation);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static Task<IResult> ExportSpace(
+        string projectId,
+        string spaceId,
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        ModuleSnapshotCache snapshotCache,
+        MarkdownConversionService markdownConversion,
+        HttpContext httpContext,
+        [FromQuery(Name = "fields[workitems]")] string? fields = null,
+        bool markdown = false,
+        [FromQuery(Name = "continue")] string? continuation = null)
+    {
+        return ExportAsync(projectId, spaceId, null, projectResolver, catalog, snapshotCache, markdownConversion, httpContext,
+            fields, markdown, continuation);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static Task<IResult> ExportDocument(
+        string projectId,
+        string spaceId,
+        string documentId,
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        ModuleSnapshotCache snapshotCache,
+        MarkdownConversionService markdownConversion,
+        HttpContext httpContext,
+        [FromQuery(Name = "fields[workitems]")] string? fields = null,
+        bool markdown = false,
+        [FromQuery(Name = "continue")] string? continuation = null)
+    {
+        return ExportAsync(projectId, spaceId, documentId, projectResolver, catalog, snapshotCache, markdownConversion, httpContext,
+            fields, markdown, continuation);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static async Task<IResult> ExportAsync(
+        string projectId,
+        string? spaceId,
+        string? documentId,
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        ModuleSnapshotCache snapshotCache,
+        MarkdownConversionService markdownConversion,
+        HttpContext httpContext,
+        string? fields,
+        bool markdown,
+        string? continuation)
+    {
+        Log.Debug("REST API: Export called for project={ProjectId}, space={SpaceId}, document={DocumentId}, fields={Fields}, markdown={Markdown}, resuming={Resuming}",
+            projectId, spaceId, documentId, fields, markdown, continuation != null);
+
+        if (!WorkItemsEndpoints.TryParseFieldset(fields, out var fieldset, out var fieldsetError))
+        {
+            return fieldsetError;
+        }
+
+        ExportContinuationToken? resumeFrom = null;
+        if (continuation != null && !ExportContinuationToken.TryDecode(continuation, out resumeFrom))
+        {
+            return CreateErrorResponse("400", "Bad Request", "The 'continue' parameter is not a continuation token issued by this export.");
+        }
+
+        // Get project config - matches against SessionConfig.ProjectId, no fallback
+        var projectConfig = projectResolver.GetProjectConfig(projectId);
+        if (projectConfig == null)
+        {
+            return CreateNotFoundResponse(projectId, projectResolver.GetConfiguredProjectIds());
+        }
+
+        // Create client for this project
+        var clientResult = await projectResolver.CreateClientAsync(projectId);
+        if (clientResult.IsFailed)
+        {
+            var errorMsg = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+            Log.Error("REST API: Failed to create Polarion client: {Error}", errorMsg);
+            return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+        }
+
+        var polarionClient = clientResult.Value;
+
+        try
+        {
+            List<(string Space, string DocumentId)> documents;
+            if (documentId != null)
+            {
+                documents = new List<(string Space, string DocumentId)> { (spaceId!, documentId) };
+            }
+            else
+            {
+                var catalogResult = await catalog.GetAsync(polarionClient, projectConfig);
+                if (catalogResult.IsFailed)
+                {
+                    var errorMsg = catalogResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                    Log.Warning("REST API: Failed to get documents for export of {ProjectId}/{SpaceId}: {Error}", projectId, spaceId, errorMsg);
+                    return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+                }
+
+                documents = catalogResult.Value.GetDocuments(spaceId, titleFilter: null, blacklistPattern: null)
+                    .Where(doc => doc.Space != null && doc.Id != null)
+                    .Select(doc => (doc.Space!, doc.Id!))
+                    .ToList();
+            }
+
+            // Ordinal order keeps continuation tokens valid when documents are added or removed between attempts
+            documents.Sort((a, b) =>
+            {
+                var bySpace = string.CompareOrdinal(a.Space, b.Space);
+                return bySpace != 0 ? bySpace : string.CompareOrdinal(a.DocumentId, b.DocumentId);
+            });
+
+            if (resumeFrom != null)
+            {
+                documents.RemoveAll(doc => resumeFrom.IsPast(doc.Space, doc.DocumentId));
+            }
+
+            // Fields the module query does not return are fetched per document; Markdown also needs the title and description
+            var exportFieldset = fieldset ?? ModuleFieldset;
+            List<string>? fetchFields = null;
+            if (!exportFieldset.IsSubsetOf(ModuleFieldset))
+            {
+                fetchFields = WorkItemsEndpoints.ToPolarionFieldList(markdown
+                    ? exportFieldset.Append("title").Append("description")
+                    : exportFieldset);
+            }
+
+            return new WorkItemExportResult(
+                polarionClient,
+                snapshotCache,
+                projectId,
+                projectConfig.GetProjectKey(),
+                documents,
+                exportFieldset,
+                fetchFields,
+                markdown ? markdownConversion : null,
+                resumeFrom);
+        }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled starting export of {ProjectId}/{SpaceId} ({Reason})", projectId, spaceId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
+        catch (Exception ex)
+        {
+            Log.Error(ex, "REST API: Exception starting export of {ProjectId}/{SpaceId}", projectId, spaceId);
+            return CreateErrorResponse("500", "Internal Server Error", ex.Message);
+        }
+    }
+
+    private static IResult CreateNotFoundResponse(string projectId, IEnumerable<string> availableProjects)
+    {
+        var availableList = string.Join(", ", availableProjects);
+        var detail = string.IsNullOrEmpty(availableList)
+            ? $"Project '{projectId}' not found. No projects are configured."
+            : $"Project '{projectId}' not found. Available projects: {availableList}";
+
+        return CreateErrorResponse("404", "Not Found", detail);
+    }
+
+    private static IResult CreateErrorResponse(string status, string title, string detail)
+    {
+        var errorResponse = new JsonApiDocument<object>
+        {
+            Errors = new List<JsonApiError>
+            {
+                new JsonApiError
+                {
+                    Status = status,
+                    Title = title,
+                    Detail = detail
+                }
+            }
+        };
+
+        var statusCode = int.Parse(status);
+        return Results.Json(errorResponse, PolarionRestApiJsonContext.Default.JsonApiDocumentObject, statusCode: statusCode);
+    }
+}
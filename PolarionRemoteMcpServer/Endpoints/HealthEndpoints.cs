@@ -1,4 +1,7 @@
+using System.Diagnostics.CodeAnalysis;
 using System.Reflection;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Services;
 
 namespace PolarionRemoteMcpServer.Endpoints;
 
@@ -46,8 +49,68 @@ public static class HealthEndpoints
                 return operation;
             });
 
+        // Counters of identical in-flight Polarion calls that shared one upstream call
+        app.MapGet("api/health/coalescing", (PolarionCallCoalescer coalescer) =>
+                Results.Json(coalescer.GetStatistics(), PolarionRestApiJsonContext.Default.PolarionCallCoalescerStatistics))
+            .WithTags("Health")
+            .WithName("CoalescingStatistics")
+            .WithOpenApi(operation =>
+            {
+                operation.Summary = "Request coalescing statistics";
+                operation.Description = "Returns how many Polarion calls were executed, how many identical concurrent calls joined them, and how many are in flight.";
+                return operation;
+            });
+
+        // Readiness: 503 until the configured project warm-up has finished
+        app.MapGet("api/health/ready", GetReadiness)
+            .WithTags("Health")
+            .WithName("ReadinessCheck")
+            .WithOpenApi(operation =>
+            {
+                operation.Summary = "Readiness check endpoint";
+                operation.Description = "Returns 200 once the startup warm-up of every project with Warmup enabled has finished, 503 while it is running. The body reports the progress of each project.";
+                return operation;
+            });
+
+        // Running and queued Polarion calls per project bulkhead
+        app.MapGet("api/health/bulkheads", GetBulkheadStatistics)
+            .WithTags("Health")
+            .WithName("BulkheadStatistics")
+            .WithOpenApi(operation =>
+            {
+                operation.Summary = "Polarion call bulkhead statistics";
+                operation.Description = "Returns, per project, how many Polarion calls are running, how many are queued in the point and bulk lanes, and how many were rejected.";
+                return operation;
+            });
+
+        // Prometheus scrape endpoint for tool, route, Polarion call, session and cache metrics
+        app.MapGet("api/metrics", (PrometheusMetricsExporter exporter) =>
+                Results.Text(exporter.Export(), "text/plain; version=0.0.4; charset=utf-8"))
+            .WithTags("Health")
+            .WithName("Metrics")
+            .WithOpenApi(operation =>
+            {
+                operation.Summary = "Prometheus metrics";
+                operation.Description = "Returns latency histograms per MCP tool, REST route and Polarion client operation, response sizes, in-flight requests and cache hit counters in the Prometheus text format.";
+                return operation;
+            });
+
         return app;
     }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static IResult GetReadiness(PolarionWarmupService warmup)
+    {
+        var status = warmup.GetStatus();
+        return Results.Json(status, PolarionRestApiJsonContext.Default.PolarionWarmupStatus,
+            statusCode: status.Ready ? StatusCodes.Status200OK : StatusCodes.Status503ServiceUnavailable);
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static IResult GetBulkheadStatistics(PolarionSessionPool sessionPool)
+    {
+        return Results.Json(sessionPool.GetBulkheadStatistics().ToList(), PolarionRestApiJsonContext.Default.ListPolarionBulkheadStatistics);
+    }
 }
 
 /// <summary>
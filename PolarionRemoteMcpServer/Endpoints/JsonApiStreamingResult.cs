@@ -0,0 +1,81 @@
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+using Microsoft.AspNetCore.Http;
+using PolarionRemoteMcpServer.Models.JsonApi;
+
+namespace PolarionRemoteMcpServer.Endpoints;
+
+/// <summary>
+/// Writes a JSON:API collection document straight to the response body, one resource at a time.
+/// Resources are produced lazily and the writer flushes every <see cref="FlushInterval"/> resources,
+/// so the response goes out with <c>Transfer-Encoding: chunked</c> and memory use stays flat
+/// regardless of how many resources the document holds.
+/// </summary>
+/// <typeparam name="T">The resource type written into the <c>data</c> array.</typeparam>
+public sealed class JsonApiStreamingResult<T> : IResult
+{
+    /// <summary>
+    /// The number of resources written between two flushes of the response body.
+    /// </summary>
+    public const int FlushInterval = 100;
+
+    private readonly IEnumerable<T> _resources;
+    private readonly JsonTypeInfo<T> _resourceTypeInfo;
+    private readonly JsonApiLinks? _links;
+    private readonly JsonApiMeta? _meta;
+
+    public JsonApiStreamingResult(IEnumerable<T> resources, JsonTypeInfo<T> resourceTypeInfo, JsonApiLinks? links, JsonApiMeta? meta)
+    {
+        _resources = resources;
+        _resourceTypeInfo = resourceTypeInfo;
+        _links = links;
+        _meta = meta;
+    }
+
+    public async Task ExecuteAsync(HttpContext httpContext)
+    {
+        var response = httpContext.Response;
+        var cancellationToken = httpContext.RequestAborted;
+
+        response.StatusCode = StatusCodes.Status200OK;
+        response.ContentType = "application/json; charset=utf-8";
+
+        // The pipe writer rents its buffers from the server's memory pool; flushing hands them back
+        var bodyWriter = response.BodyWriter;
+        await using var writer = new Utf8JsonWriter(bodyWriter);
+
+        writer.WriteStartObject();
+        writer.WritePropertyName("data");
+        writer.WriteStartArray();
+
+        var written = 0;
+        foreach (var resource in _resources)
+        {
+            JsonSerializer.Serialize(writer, resource, _resourceTypeInfo);
+
+            if (++written % FlushInterval == 0)
+            {
+                writer.Flush();
+                await bodyWriter.FlushAsync(cancellationToken);
+            }
+        }
+
+        writer.WriteEndArray();
+
+        if (_links != null)
+        {
+            writer.WritePropertyName("links");
+            JsonSerializer.Serialize(writer, _links, PolarionRestApiJsonContext.Default.JsonApiLinks);
+        }
+
+        if (_meta != null)
+        {
+            writer.WritePropertyName("meta");
+            JsonSerializer.Serialize(writer, _meta, PolarionRestApiJsonContext.Default.JsonApiMeta);
+        }
+
+        writer.WriteEndObject();
+        writer.Flush();
+        await bodyWriter.FlushAsync(cancellationToken);
+    }
+}
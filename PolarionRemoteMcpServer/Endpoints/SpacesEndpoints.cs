@@ -26,12 +26,16 @@ public static class SpacesEndpoints
 
         group.MapGet("/spaces", GetSpaces)
             .RequireAuthorization(ApiScopes.PolarionRead);
+        group.MapPost("/catalog/refresh", RefreshCatalog)
+            .RequireAuthorization(ApiScopes.PolarionRead);
     }
 
     [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
     private static async Task<IResult> GetSpaces(
         string projectId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        HttpContext httpContext)
     {
         Log.Debug("REST API: GetSpaces called for project={ProjectId}", projectId);
 
@@ -55,17 +59,22 @@ public static class SpacesEndpoints
 
         try
         {
-            string? blacklistPattern = projectConfig.BlacklistSpaceContainingMatch;
-
-            var spacesResult = await polarionClient.GetSpacesAsync(blacklistPattern);
-            if (spacesResult.IsFailed)
+            var catalogResult = await catalog.GetAsync(polarionClient, projectConfig);
+            if (catalogResult.IsFailed)
             {
-                var errorMsg = spacesResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                var errorMsg = catalogResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
                 Log.Warning("REST API: Failed to get spaces: {Error}", errorMsg);
                 return CreateErrorResponse("500", "Internal Server Error", errorMsg);
             }
 
-            var spaces = spacesResult.Value;
+            var spaces = catalogResult.Value.GetSpaces(projectConfig.BlacklistSpaceContainingMatch);
+
+            var notModified = ConditionalGet.Evaluate(httpContext, spaces);
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             var resources = new List<SpaceResource>();
 
             foreach (var spaceName in spaces)
@@ -100,6 +109,11 @@ public static class SpacesEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListSpaceResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting spaces ({Reason})", ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting spaces");
@@ -107,6 +121,61 @@ public static class SpacesEndpoints
         }
     }
 
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static async Task<IResult> RefreshCatalog(
+        string projectId,
+        RestApiProjectResolver projectResolver,
+        PolarionProjectCatalog catalog,
+        HttpContext httpContext)
+    {
+        Log.Debug("REST API: RefreshCatalog called for project={ProjectId}", projectId);
+
+        // Get project config - matches against SessionConfig.ProjectId, no fallback
+        var projectConfig = projectResolver.GetProjectConfig(projectId);
+        if (projectConfig == null)
+        {
+            return CreateNotFoundResponse(projectId, projectResolver.GetConfiguredProjectIds());
+        }
+
+        // Create client for this project
+        var clientResult = await projectResolver.CreateClientAsync(projectId);
+        if (clientResult.IsFailed)
+        {
+            var errorMsg = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+            Log.Error("REST API: Failed to create Polarion client: {Error}", errorMsg);
+            return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+        }
+
+        try
+        {
+            var catalogResult = await catalog.RefreshAsync(clientResult.Value, projectConfig);
+            if (catalogResult.IsFailed)
+            {
+                var errorMsg = catalogResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                Log.Warning("REST API: Failed to refresh catalog: {Error}", errorMsg);
+                return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+            }
+
+            var snapshot = catalogResult.Value;
+            Log.Information("REST API: Refreshed catalog of project {ProjectId}: {SpaceCount} spaces, {DocumentCount} documents",
+                projectId, snapshot.Spaces.Count, snapshot.Documents.Count);
+
+            return Results.Json(
+                new PolarionProjectCatalogStatistics(projectConfig.GetProjectKey(), snapshot.Spaces.Count, snapshot.Documents.Count, snapshot.LoadedUtc),
+                PolarionRestApiJsonContext.Default.PolarionProjectCatalogStatistics);
+        }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled refreshing catalog ({Reason})", ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
+        catch (Exception ex)
+        {
+            Log.Error(ex, "REST API: Exception refreshing catalog");
+            return CreateErrorResponse("500", "Internal Server Error", ex.Message);
+        }
+    }
+
     private static IResult CreateNotFoundResponse(string projectId, IEnumerable<string> availableProjects)
     {
         var availableList = string.Join(", ", availableProjects);
@@ -0,0 +1,52 @@
+using System.Globalization;
+using Microsoft.AspNetCore.Http;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Models.JsonApi;
+
+namespace PolarionRemoteMcpServer.Endpoints;
+
+/// <summary>
+/// Turns a <see cref="PolarionThrottledException"/> from a project's bulkhead into a JSON:API error response,
+/// so REST clients see backpressure instead of a generic server error.
+/// </summary>
+public static class ThrottledResponse
+{
+    /// <summary>
+    /// Sets the <c>Retry-After</c> header and returns <c>429 Too Many Requests</c> when the bulkhead queue was full,
+    /// or <c>503 Service Unavailable</c> when the request timed out waiting in it.
+    /// </summary>
+    public static IResult Create(HttpContext httpContext, PolarionThrottledException exception)
+    {
+        var statusCode = GetStatusCode(exception.Reason);
+
+        // The response is not cacheable, whatever validators the handler already set
+        httpContext.Response.Headers.Remove("ETag");
+        httpContext.Response.Headers.CacheControl = "no-store";
+        httpContext.Response.Headers.RetryAfter = Math.Ceiling(exception.RetryAfter.TotalSeconds).ToString(CultureInfo.InvariantCulture);
+
+        var errorResponse = new JsonApiDocument<object>
+        {
+            Errors = new List<JsonApiError>
+            {
+                new JsonApiError
+                {
+                    Status = statusCode.ToString(CultureInfo.InvariantCulture),
+                    Title = statusCode == StatusCodes.Status429TooManyRequests ? "Too Many Requests" : "Service Unavailable",
+                    Detail = exception.Message
+                }
+            }
+        };
+
+        return Results.Json(errorResponse, PolarionRestApiJsonContext.Default.JsonApiDocumentObject, statusCode: statusCode);
+    }
+
+    /// <summary>
+    /// Maps a throttle reason to its HTTP status code.
+    /// </summary>
+    public static int GetStatusCode(PolarionThrottleReason reason)
+    {
+        return reason == PolarionThrottleReason.QueueFull
+            ? StatusCodes.Status429TooManyRequests
+            : StatusCodes.Status503ServiceUnavailable;
+    }
+}
@@ -0,0 +1,324 @@
+using System.Buffers;
+using System.Diagnostics.CodeAnalysis;
+using System.IO.Pipelines;
+using System.Text;
+using System.Text.Json;
+using FluentResults;
+using Microsoft.AspNetCore.Http;
+using Polarion;
+using Polarion.Generated.Tracker;
+using PolarionMcpTools;
+using PolarionRemoteMcpServer.Models.JsonApi;
+using Serilog;
+
+namespace PolarionRemoteMcpServer.Endpoints;
+
+/// <summary>
+/// Position in an export, passed back by clients to resume after a dropped connection. Documents are exported in
+/// ordinal (space, document ID) order, so an export resumes at the first document not before
+/// (<see cref="Space"/>, <see cref="DocumentId"/>) and, within that document, just after <see cref="WorkItemId"/>.
+/// </summary>
+/// <param name="Space">The space of the document the export stopped in.</param>
+/// <param name="DocumentId">The document the export stopped in.</param>
+/// <param name="WorkItemId">The last work item written, or null to restart the document from its first work item.</param>
+public sealed record ExportContinuationToken(string Space, string DocumentId, string? WorkItemId)
+{
+    private const string Version = "1";
+    private const char Separator = '\u001f';
+
+    /// <summary>
+    /// Encodes the token as an opaque URL-safe string.
+    /// </summary>
+    public string Encode()
+    {
+        var text = string.Join(Separator, Version, Space, DocumentId, WorkItemId ?? string.Empty);
+        return Convert.ToBase64String(Encoding.UTF8.GetBytes(text)).TrimEnd('=').Replace('+', '-').Replace('/', '_');
+    }
+
+    /// <summary>
+    /// Decodes a token produced by <see cref="Encode"/>; returns false for anything else.
+    /// </summary>
+    public static bool TryDecode(string? value, [NotNullWhen(true)] out ExportContinuationToken? token)
+    {
+        token = null;
+        if (string.IsNullOrWhiteSpace(value))
+        {
+            return false;
+        }
+
+        var base64 = value.Replace('-', '+').Replace('_', '/');
+        base64 = base64.PadRight(base64.Length + (4 - base64.Length % 4) % 4, '=');
+
+        var bytes = new byte[base64.Length];
+        if (!Convert.TryFromBase64String(base64, bytes, out var length))
+        {
+            return false;
+        }
+
+        var parts = Encoding.UTF8.GetString(bytes, 0, length).Split(Separator);
+        if (parts.Length != 4 || parts[0] != Version || parts[1].Length == 0 || parts[2].Length == 0)
+        {
+            return false;
+        }
+
+        token = new ExportContinuationToken(parts[1], parts[2], parts[3].Length == 0 ? null : parts[3]);
+        return true;
+    }
+
+    /// <summary>
+    /// True if the document at (<paramref name="space"/>, <paramref name="documentId"/>) was completely exported
+    /// before this token was issued.
+    /// </summary>
+    public bool IsPast(string space, string documentId)
+    {
+        var bySpace = string.CompareOrdinal(space, Space);
+        return bySpace < 0 || (bySpace == 0 && string.CompareOrdinal(documentId, DocumentId) < 0);
+    }
+
+    public bool IsAt(string space, string documentId)
+    {
+        return string.Equals(space, Space, StringComparison.Ordinal) && string.Equals(documentId, DocumentId, StringComparison.Ordinal);
+    }
+}
+
+/// <summary>
+/// Streams the work items of one or more documents as newline-delimited JSON (<see cref="ExportRecord"/> per line).
+/// Up to <see cref="MaxConcurrentDocuments"/> documents are loaded ahead of the one being written, and the writer
+/// flushes every <see cref="JsonApiStreamingResult{T}.FlushInterval"/> lines, so memory use is bounded by that
+/// window rather than by the size of the project. Every work item line carries a continuation token; a document
+/// that cannot be loaded gets an "error" line and the export goes on, except when Polarion is throttling, where the
+/// export stops with a token that resumes at that document. A complete export ends with an "end" line.
+/// </summary>
+[RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+public sealed class WorkItemExportResult : IResult
+{
+    /// <summary>
+    /// The number of documents loaded concurrently, including the one being written.
+    /// </summary>
+    public const int MaxConcurrentDocuments = 4;
+
+    /// <summary>
+    /// The number of concurrent field queries per document when the fieldset needs more than the module query returns.
+    /// </summary>
+    public const int MaxConcurrentFetches = 4;
+
+    private static readonly byte[] NewLine = "\n"u8.ToArray();
+
+    private readonly IPolarionClient _polarionClient;
+    private readonly ModuleSnapshotCache _snapshotCache;
+    private readonly MarkdownConversionService? _markdownConversion;
+    private readonly string _projectId;
+    private readonly string _projectKey;
+    private readonly IReadOnlyList<(string Space, string DocumentId)> _documents;
+    private readonly HashSet<string> _fieldset;
+    private readonly List<string>? _fetchFields;
+    private readonly ExportContinuationToken? _resumeFrom;
+
+    /// <param name="documents">The documents to export, in ordinal (space, document ID) order.</param>
+    /// <param name="fieldset">The work item attributes and relationships to write.</param>
+    /// <param name="fetchFields">
+    /// The Polarion fields to fetch for every work item, or null if the module query already returns everything in
+    /// <paramref name="fieldset"/>.
+    /// </param>
+    /// <param name="markdownConversion">Converts each work item to Markdown, or null to leave Markdown out.</param>
+    /// <param name="resumeFrom">The position to resume from, or null to start at the first document.</param>
+    public WorkItemExportResult(
+        IPolarionClient polarionClient,
+        ModuleSnapshotCache snapshotCache,
+        string projectId,
+        string projectKey,
+        IReadOnlyList<(string Space, string DocumentId)> documents,
+        HashSet<string> fieldset,
+        List<string>? fetchFields,
+        MarkdownConversionService? markdownConversion,
+        ExportContinuationToken? resumeFrom)
+    {
+        _polarionClient = polarionClient;
+        _snapshotCache = snapshotCache;
+        _projectId = projectId;
+        _projectKey = projectKey;
+        _documents = documents;
+        _fieldset = fieldset;
+        _fetchFields = fetchFields;
+        _markdownConversion = markdownConversion;
+        _resumeFrom = resumeFrom;
+    }
+
+    public async Task ExecuteAsync(HttpContext httpContext)
+    {
+        var response = httpContext.Response;
+        var cancellationToken = httpContext.RequestAborted;
+
+        response.StatusCode = StatusCodes.Status200OK;
+        response.ContentType = "application/x-ndjson; charset=utf-8";
+
+        var bodyWriter = response.BodyWriter;
+        await using var writer = new Utf8JsonWriter(bodyWriter);
+
+        var loads = new Queue<(string Space, string DocumentId, Task<Result<WorkItem[]>> Load)>();
+        var next = 0;
+        var workItemCount = 0;
+        var documentCount = 0;
+        var linesSinceFlush = 0;
+
+        try
+        {
+            while (true)
+            {
+                while (loads.Count < MaxConcurrentDocuments && next < _documents.Count)
+                {
+                    var (space, documentId) = _documents[next++];
+                    loads.Enqueue((space, documentId, LoadDocumentAsync(space, documentId)));
+                }
+
+                if (!loads.TryDequeue(out var document))
+                {
+                    break;
+                }
+
+                Result<WorkItem[]> loadResult;
+                try
+                {
+                    loadResult = await document.Load;
+                }
+                catch (PolarionThrottledException ex)
+                {
+                    // Every later document would be refused too; stop where the client can pick up again
+                    Log.Warning("REST API: Export throttled at document {SpaceId}/{DocumentId} ({Reason})", document.Space, document.DocumentId, ex.Reason);
+                    WriteRecord(writer, bodyWriter, new ExportRecord
+                    {
+                        Kind = "error",
+                        Space = document.Space,
+                        DocumentId = document.DocumentId,
+                        Detail = ex.Message,
+                        Continuation = new ExportContinuationToken(document.Space, document.DocumentId, null).Encode()
+                    });
+                    await bodyWriter.FlushAsync(cancellationToken);
+                    return;
+                }
+                catch (Exception ex)
+                {
+                    loadResult = Result.Fail(ex.Message);
+                }
+
+                if (loadResult.IsFailed)
+                {
+                    var errorMsg = loadResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                    Log.Warning("REST API: Export skipped document {SpaceId}/{DocumentId}: {Error}", document.Space, document.DocumentId, errorMsg);
+                    WriteRecord(writer, bodyWriter, new ExportRecord
+                    {
+                        Kind = "error",
+                        Space = document.Space,
+                        DocumentId = document.DocumentId,
+                        Detail = errorMsg
+                    });
+                    continue;
+                }
+
+                var workItems = loadResult.Value;
+                var start = 0;
+                if (_resumeFrom?.WorkItemId != null && _resumeFrom.IsAt(document.Space, document.DocumentId))
+                {
+                    // If the work item has since left the document, the whole document is sent again
+                    start = Array.FindIndex(workItems, wi => wi.id == _resumeFrom.WorkItemId) + 1;
+                }
+
+                documentCount++;
+                WriteRecord(writer, bodyWriter, new ExportRecord
+                {
+                    Kind = "document",
+                    Space = document.Space,
+                    DocumentId = document.DocumentId,
+                    WorkItemCount = workItems.Length
+                });
+
+                for (var i = start; i < workItems.Length; i++)
+                {
+                    var workItem = workItems[i];
+                    WriteRecord(writer, bodyWriter, new ExportRecord
+                    {
+                        Kind = "workitem",
+                        Space = document.Space,
+                        DocumentId = document.DocumentId,
+                        Data = WorkItemsEndpoints.CreateWorkItemResource(_projectId, workItem.id, workItem, _fieldset),
+                        Markdown = _markdownConversion?.ConvertWorkItem(_polarionClient, workItem.id, workItem),
+                        Continuation = new ExportContinuationToken(document.Space, document.DocumentId, workItem.id).Encode()
+                    });
+                    workItemCount++;
+
+                    if (++linesSinceFlush >= JsonApiStreamingResult<ExportRecord>.FlushInterval)
+                    {
+                        linesSinceFlush = 0;
+                        await bodyWriter.FlushAsync(cancellationToken);
+                    }
+                }
+
+                await bodyWriter.FlushAsync(cancellationToken);
+            }
+
+            WriteRecord(writer, bodyWriter, new ExportRecord
+            {
+                Kind = "end",
+                WorkItemCount = workItemCount,
+                DocumentCount = documentCount
+            });
+            await bodyWriter.FlushAsync(cancellationToken);
+        }
+        finally
+        {
+            // Loads still running when the client disconnects are abandoned; observe their failures
+            foreach (var pending in loads)
+            {
+                _ = pending.Load.ContinueWith(static task => _ = task.Exception, TaskContinuationOptions.OnlyOnFaulted);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Loads the work items of one document in outline order, fetching the fieldset's extra fields when needed.
+    /// Export calls wait in the bulk lane, and a document that is not already cached is read without being added
+    /// to the snapshot cache, so a large export does not evict the snapshots interactive requests reuse.
+    /// </summary>
+    private async Task<Result<WorkItem[]>> LoadDocumentAsync(string space, string documentId)
+    {
+        using var bulkScope = ThrottledPolarionClient.BeginBulkScope();
+
+        var snapshotResult = await _snapshotCache.GetWithoutCachingAsync(_polarionClient, _projectKey, space, documentId, "-1");
+        if (snapshotResult.IsFailed)
+        {
+            return Result.Fail(snapshotResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var workItems = snapshotResult.Value.Outline.Nodes
+            .Select(node => node.WorkItem)
+            .Where(wi => wi.id != null)
+            .ToArray();
+
+        if (_fetchFields == null || workItems.Length == 0)
+        {
+            return Result.Ok(workItems);
+        }
+
+        var fetchResult = await WorkItemBatchFetcher.FetchByIdsAsync(
+            _polarionClient, workItems.Select(wi => wi.id), _fetchFields, MaxConcurrentFetches);
+        if (fetchResult.IsFailed)
+        {
+            return Result.Fail(fetchResult.Errors.FirstOrDefault()?.Message ?? "Unknown error");
+        }
+
+        var fetched = fetchResult.Value;
+        return Result.Ok(workItems
+            .Select(wi => fetched.TryGetValue(wi.id, out var projected) ? projected : wi)
+            .ToArray());
+    }
+
+    private static void WriteRecord(Utf8JsonWriter writer, PipeWriter bodyWriter, ExportRecord record)
+    {
+        JsonSerializer.Serialize(writer, record, PolarionRestApiJsonContext.Default.ExportRecord);
+        writer.Flush();
+        bodyWriter.Write(NewLine);
+
+        // Each line is a separate JSON value, so the writer starts over for the next one
+        writer.Reset(bodyWriter);
+    }
+}
@@ -41,16 +41,25 @@ public static class WorkItemsEndpoints
     private static async Task<IResult> GetWorkItem(
         string projectId,
         string workitemId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        HistoricalWorkItemCache historicalWorkItems,
+        HttpContext httpContext,
+        [FromQuery(Name = "fields[workitems]")] string? fields = null,
+        [FromQuery] string? revision = null)
     {
-        Log.Debug("REST API: GetWorkItem called for project={ProjectId}, workitemId={WorkitemId}",
-            projectId, workitemId);
+        Log.Debug("REST API: GetWorkItem called for project={ProjectId}, workitemId={WorkitemId}, fields={Fields}, revision={Revision}",
+            projectId, workitemId, fields, revision);
 
         if (string.IsNullOrWhiteSpace(workitemId))
         {
             return CreateErrorResponse("400", "Bad Request", "workitemId parameter cannot be empty.");
         }
 
+        if (!TryParseFieldset(fields, out var fieldset, out var fieldsetError))
+        {
+            return fieldsetError;
+        }
+
         // Get project config - matches against SessionConfig.ProjectId, no fallback
         var projectConfig = projectResolver.GetProjectConfig(projectId);
         if (projectConfig == null)
@@ -71,7 +80,14 @@ public static class WorkItemsEndpoints
 
         try
         {
-            var workItemResult = await polarionClient.GetWorkItemByIdAsync(workitemId);
+            // A work item at a fixed revision never changes, so it comes from the shared revision cache
+            var isRevisionPinned = !string.IsNullOrWhiteSpace(revision) && revision != "-1";
+
+            // Without a sparse fieldset the full work item is fetched, as before
+            var workItemResult = isRevisionPinned
+                ? await historicalWorkItems.GetAsync(polarionClient, projectConfig.GetProjectKey(), workitemId, revision!)
+                : await WorkItemProjection.GetWorkItemAsync(
+                    polarionClient, workitemId, fieldset != null ? ToPolarionFieldList(fieldset) : null);
             if (workItemResult.IsFailed)
             {
                 var errorMsg = workItemResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -85,39 +101,48 @@ public static class WorkItemsEndpoints
                 return CreateErrorResponse("404", "Not Found", $"WorkItem '{workitemId}' not found.");
             }
 
-            var resource = new WorkItemResource
+            var notModified = isRevisionPinned
+                ? ConditionalGet.Evaluate(httpContext, new[] { $"{workitemId}@r{revision}" }, revisionPinned: true)
+                : ConditionalGet.Evaluate(httpContext, GetWorkItemVersions(workItem));
+            if (notModified != null)
             {
-                Id = $"{projectId}/{workitemId}",
-                Attributes = new WorkItemAttributes
-                {
-                    Title = workItem.title,
-                    Type = workItem.type?.id,
-                    Status = workItem.status?.id,
-                    OutlineNumber = workItem.outlineNumber,
-                    Created = workItem.createdSpecified ? workItem.created : null,
-                    Updated = workItem.updatedSpecified ? workItem.updated : null,
-                    Author = workItem.author?.id,
-                    Severity = workItem.severity?.id,
-                    Priority = workItem.priority?.id,
-                    Description = workItem.description?.content
-                },
-                Links = new JsonApiLinks
-                {
-                    Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}"
-                }
-            };
+                return notModified;
+            }
+
+            var resource = CreateWorkItemResource(projectId, workitemId, workItem, fieldset ?? GetWorkItemDefaultFieldset);
+
+            var selfQuery = new List<string>();
+            if (!string.IsNullOrWhiteSpace(fields))
+            {
+                selfQuery.Add($"fields[workitems]={Uri.EscapeDataString(fields)}");
+            }
+            if (isRevisionPinned)
+            {
+                selfQuery.Add($"revision={Uri.EscapeDataString(revision!)}");
+            }
+
+            var selfLink = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}";
+            if (selfQuery.Count > 0)
+            {
+                selfLink += $"?{string.Join("&", selfQuery)}";
+            }
 
             var response = new JsonApiDocument<WorkItemResource>
             {
                 Data = resource,
                 Links = new JsonApiLinks
                 {
-                    Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}"
+                    Self = selfLink
                 }
             };
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentWorkItemResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting work item {WorkitemId} ({Reason})", workitemId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting work item {WorkitemId}", workitemId);
@@ -130,6 +155,8 @@ public static class WorkItemsEndpoints
         string projectId,
         string workitemId,
         RestApiProjectResolver projectResolver,
+        HistoricalWorkItemCache historicalWorkItems,
+        HttpContext httpContext,
         [FromQuery(Name = "page[size]")] int pageSize = 100)
     {
         // Clamp pageSize: min 1, max 500
@@ -179,15 +206,27 @@ public static class WorkItemsEndpoints
             }
 
             var revisionsDict = revisionsResult.Value;
+
+            // Revisions never change, so the list of revision IDs identifies the response
+            var notModified = ConditionalGet.Evaluate(httpContext, revisionsDict?.Keys ?? Enumerable.Empty<string>());
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             var resources = new List<WorkItemRevisionResource>();
 
             if (revisionsDict != null)
             {
+                var projectKey = projectConfig.GetProjectKey();
                 foreach (var kvp in revisionsDict)
                 {
                     var revisionId = kvp.Key;
                     var revision = kvp.Value;
 
+                    // Revisions are immutable, so keep them for later revision-pinned reads
+                    historicalWorkItems.Intern(projectKey, workitemId, revisionId, revision);
+
                     var resource = new WorkItemRevisionResource
                     {
                         Id = $"{projectId}/{workitemId}/{revisionId}",
@@ -224,6 +263,11 @@ public static class WorkItemsEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListWorkItemRevisionResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting revisions for work item {WorkitemId} ({Reason})", workitemId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting revisions for work item {WorkitemId}", workitemId);
@@ -235,7 +279,8 @@ public static class WorkItemsEndpoints
     private static async Task<IResult> GetLinkedWorkItems(
         string projectId,
         string workitemId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        HttpContext httpContext)
     {
         Log.Debug("REST API: GetLinkedWorkItems called for project={ProjectId}, workitemId={WorkitemId}",
             projectId, workitemId);
@@ -263,7 +308,9 @@ public static class WorkItemsEndpoints
 
         try
         {
-            var workItemResult = await polarionClient.GetWorkItemByIdAsync(workitemId);
+            // Only the link list is needed, not the description or custom fields
+            var workItemResult = await WorkItemProjection.GetWorkItemAsync(
+                polarionClient, workitemId, WorkItemProjection.OutgoingLinkFields);
             if (workItemResult.IsFailed)
             {
                 var errorMsg = workItemResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -314,8 +361,19 @@ public static class WorkItemsEndpoints
                 Meta = new JsonApiMeta { Count = resources.Count }
             };
 
+            var notModified = ConditionalGet.Evaluate(httpContext, GetLinkVersions(resources));
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListLinkedWorkItemResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting linked work items for {WorkitemId} ({Reason})", workitemId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting linked work items for {WorkitemId}", workitemId);
@@ -327,7 +385,8 @@ public static class WorkItemsEndpoints
     private static async Task<IResult> GetBackLinkedWorkItems(
         string projectId,
         string workitemId,
-        RestApiProjectResolver projectResolver)
+        RestApiProjectResolver projectResolver,
+        HttpContext httpContext)
     {
         Log.Debug("REST API: GetBackLinkedWorkItems called for project={ProjectId}, workitemId={WorkitemId}",
             projectId, workitemId);
@@ -355,7 +414,9 @@ public static class WorkItemsEndpoints
 
         try
         {
-            var workItemResult = await polarionClient.GetWorkItemByIdAsync(workitemId);
+            // Only the back-link list is needed, not the description or custom fields
+            var workItemResult = await WorkItemProjection.GetWorkItemAsync(
+                polarionClient, workitemId, WorkItemProjection.IncomingLinkFields);
             if (workItemResult.IsFailed)
             {
                 var errorMsg = workItemResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -406,8 +467,19 @@ public static class WorkItemsEndpoints
                 Meta = new JsonApiMeta { Count = resources.Count }
             };
 
+            var notModified = ConditionalGet.Evaluate(httpContext, GetLinkVersions(resources));
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListLinkedWorkItemResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled getting back-linked work items for {WorkitemId} ({Reason})", workitemId, ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception getting back-linked work items for {WorkitemId}", workitemId);
@@ -448,24 +520,40 @@ public static class WorkItemsEndpoints
     private static async Task<IResult> SearchWorkItems(
         string projectId,
         RestApiProjectResolver projectResolver,
+        HttpContext httpContext,
         [FromQuery] string? query = null,
         [FromQuery] string? types = null,
         [FromQuery] string? status = null,
         [FromQuery] string? sort = "created",
-        [FromQuery(Name = "page[size]")] int pageSize = 50)
+        [FromQuery(Name = "page[size]")] int pageSize = 50,
+        [FromQuery(Name = "page[number]")] int pageNumber = 1,
+        [FromQuery(Name = "filter[id]")] string? filterId = null,
+        [FromQuery(Name = "fields[workitems]")] string? fields = null)
     {
-        Log.Debug("REST API: SearchWorkItems called for project={ProjectId}, query={Query}, types={Types}, status={Status}",
-            projectId, query, types, status);
+        Log.Debug("REST API: SearchWorkItems called for project={ProjectId}, query={Query}, types={Types}, status={Status}, page={PageNumber}, filterId={FilterId}",
+            projectId, query, types, status, pageNumber, filterId);
+
+        if (!TryParseFieldset(fields, out var fieldset, out var fieldsetError))
+        {
+            return fieldsetError;
+        }
+
+        // An explicit ID list replaces the search query
+        if (!string.IsNullOrWhiteSpace(filterId))
+        {
+            return await GetWorkItemsByIds(projectId, filterId, fieldset, projectResolver, httpContext);
+        }
 
         // Validate query parameter
         if (string.IsNullOrWhiteSpace(query))
         {
-            return CreateErrorResponse("400", "Bad Request", "query parameter is required.");
+            return CreateErrorResponse("400", "Bad Request", "query or filter[id] parameter is required.");
         }
 
         // Clamp pageSize
         if (pageSize < 1) pageSize = 1;
         if (pageSize > 500) pageSize = 500;
+        if (pageNumber < 1) pageNumber = 1;
 
         // Validate sort field and direction
         var sortField = sort ?? "created";
@@ -502,14 +590,17 @@ public static class WorkItemsEndpoints
             // Build Lucene query (reuse logic from MCP tool)
             var luceneQuery = BuildLuceneQuery(query, types, status);
 
-            // Default field list
-            var fieldList = GetSearchFieldList();
+            // Only the fields that are serialized are fetched
+            var fieldList = ToPolarionFieldList(fieldset ?? SearchDefaultFieldset);
 
-            // Call Polarion API
-            var searchResult = await polarionClient.SearchWorkitemAsync(
+            // Call Polarion API - only the requested page is fetched with the full field list
+            var searchResult = await WorkItemSearchPaging.SearchPageAsync(
+                polarionClient,
                 luceneQuery,
                 sortField.ToLower(),
-                fieldList);
+                fieldList,
+                pageNumber,
+                pageSize);
 
             if (searchResult.IsFailed)
             {
@@ -525,33 +616,19 @@ public static class WorkItemsEndpoints
                 return CreateErrorResponse("500", "Internal Server Error", errorMsg);
             }
 
-            var workItems = searchResult.Value ?? Array.Empty<Polarion.Generated.Tracker.WorkItem>();
+            var page = searchResult.Value;
+
+            var notModified = ConditionalGet.Evaluate(httpContext, page.Items
+                .SelectMany(GetWorkItemVersions)
+                .Append($"total={page.TotalCount}"));
+            if (notModified != null)
+            {
+                return notModified;
+            }
 
             // Convert to JSON:API format
-            var resources = workItems
-                .Take(pageSize)
-                .Select(wi => new WorkItemResource
-                {
-                    Id = $"{projectId}/{wi.id}",
-                    Attributes = new WorkItemAttributes
-                    {
-                        Title = wi.title,
-                        Type = wi.type?.id,
-                        Status = wi.status?.id,
-                        OutlineNumber = wi.outlineNumber,
-                        Created = wi.createdSpecified ? wi.created : null,
-                        Updated = wi.updatedSpecified ? wi.updated : null,
-                        Author = wi.author?.id,
-                        Assignee = wi.assignee != null && wi.assignee.Length > 0
-                            ? wi.assignee[0]?.id
-                            : null,
-                        Description = wi.description?.content
-                    },
-                    Links = new JsonApiLinks
-                    {
-                        Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{wi.id}"
-                    }
-                })
+            var resources = page.Items
+                .Select(wi => CreateWorkItemResource(projectId, wi.id, wi, fieldset ?? SearchDefaultFieldset))
                 .ToList();
 
             var queryString = $"query={Uri.EscapeDataString(query)}";
@@ -561,18 +638,22 @@ public static class WorkItemsEndpoints
                 queryString += $"&status={Uri.EscapeDataString(status)}";
             if (!string.IsNullOrWhiteSpace(sort))
                 queryString += $"&sort={Uri.EscapeDataString(sort)}";
+            if (!string.IsNullOrWhiteSpace(fields))
+                queryString += $"&fields[workitems]={Uri.EscapeDataString(fields)}";
             queryString += $"&page[size]={pageSize}";
 
+            var basePath = $"/polarion/rest/v1/projects/{projectId}/workitems?{queryString}";
+
             var response = new JsonApiDocument<List<WorkItemResource>>
             {
                 Data = resources,
-                Links = new JsonApiLinks
-                {
-                    Self = $"/polarion/rest/v1/projects/{projectId}/workitems?{queryString}"
-                },
+                Links = CreatePageLinks(basePath, page),
                 Meta = new WorkItemSearchMeta
                 {
                     Count = resources.Count,
+                    TotalCount = page.TotalCount,
+                    PageNumber = page.PageNumber,
+                    PageSize = page.PageSize,
                     Query = query,
                     LuceneQuery = luceneQuery,
                     TypeFilter = types,
@@ -582,6 +663,11 @@ public static class WorkItemsEndpoints
 
             return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListWorkItemResource);
         }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled during work item search ({Reason})", ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
         catch (Exception ex)
         {
             Log.Error(ex, "REST API: Exception during work item search");
@@ -589,6 +675,134 @@ public static class WorkItemsEndpoints
         }
     }
 
+    /// <summary>
+    /// Builds the self/first/last/prev/next links of a search page. A page past the end links back to the last page.
+    /// </summary>
+    internal static JsonApiLinks CreatePageLinks(string basePath, WorkItemSearchPage page)
+    {
+        string PageLink(int number) => $"{basePath}&page[number]={number}";
+
+        var lastPage = Math.Max(1, page.TotalPages);
+        return new JsonApiLinks
+        {
+            Self = PageLink(page.PageNumber),
+            First = PageLink(1),
+            Last = PageLink(lastPage),
+            Prev = page.HasPreviousPage ? PageLink(Math.Min(page.PageNumber - 1, lastPage)) : null,
+            Next = page.HasNextPage ? PageLink(page.PageNumber + 1) : null
+        };
+    }
+
+    /// <summary>
+    /// The maximum number of IDs accepted by a single filter[id] request.
+    /// </summary>
+    private const int MaxFilterIds = 500;
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private static async Task<IResult> GetWorkItemsByIds(
+        string projectId,
+        string filterId,
+        HashSet<string>? fieldset,
+        RestApiProjectResolver projectResolver,
+        HttpContext httpContext)
+    {
+        var requestedIds = filterId
+            .Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+            .Distinct(StringComparer.Ordinal)
+            .ToList();
+
+        if (requestedIds.Count == 0)
+        {
+            return CreateErrorResponse("400", "Bad Request", "filter[id] must contain at least one work item ID.");
+        }
+
+        if (requestedIds.Count > MaxFilterIds)
+        {
+            return CreateErrorResponse("400", "Bad Request",
+                $"filter[id] contains {requestedIds.Count} IDs. At most {MaxFilterIds} IDs are allowed per request.");
+        }
+
+        var invalidIds = requestedIds.Where(id => !WorkItemBatchFetcher.IsValidWorkItemId(id)).ToList();
+        if (invalidIds.Count > 0)
+        {
+            return CreateErrorResponse("400", "Bad Request",
+                $"Invalid work item ID(s) in filter[id]: {string.Join(", ", invalidIds)}");
+        }
+
+        var projectConfig = projectResolver.GetProjectConfig(projectId);
+        if (projectConfig == null)
+        {
+            return CreateNotFoundResponse(projectId, projectResolver.GetConfiguredProjectIds());
+        }
+
+        var clientResult = await projectResolver.CreateClientAsync(projectId);
+        if (clientResult.IsFailed)
+        {
+            var errorMsg = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+            Log.Error("REST API: Failed to create Polarion client: {Error}", errorMsg);
+            return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+        }
+
+        var polarionClient = clientResult.Value;
+
+        try
+        {
+            var fetchResult = await WorkItemBatchFetcher.FetchByIdsAsync(
+                polarionClient, requestedIds, ToPolarionFieldList(fieldset ?? SearchDefaultFieldset));
+            if (fetchResult.IsFailed)
+            {
+                var errorMsg = fetchResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
+                Log.Warning("REST API: Batch fetch of {Count} work items failed: {Error}", requestedIds.Count, errorMsg);
+                return CreateErrorResponse("500", "Internal Server Error", errorMsg);
+            }
+
+            var fetched = fetchResult.Value;
+
+            var notModified = ConditionalGet.Evaluate(httpContext, requestedIds
+                .Select(id => fetched.TryGetValue(id, out var wi) ? GetWorkItemVersions(wi) : new[] { $"{id}@missing" })
+                .SelectMany(versions => versions));
+            if (notModified != null)
+            {
+                return notModified;
+            }
+
+            // Keep the order of the request
+            var resources = requestedIds
+                .Where(fetched.ContainsKey)
+                .Select(id => CreateWorkItemResource(projectId, id, fetched[id], fieldset ?? SearchDefaultFieldset))
+                .ToList();
+
+            var missingIds = requestedIds.Where(id => !fetched.ContainsKey(id)).ToList();
+
+            var response = new JsonApiDocument<List<WorkItemResource>>
+            {
+                Data = resources,
+                Links = new JsonApiLinks
+                {
+                    Self = $"/polarion/rest/v1/projects/{projectId}/workitems?filter[id]={Uri.EscapeDataString(string.Join(",", requestedIds))}"
+                },
+                Meta = new WorkItemBatchMeta
+                {
+                    Count = resources.Count,
+                    RequestedCount = requestedIds.Count,
+                    MissingIds = missingIds.Count > 0 ? missingIds : null
+                }
+            };
+
+            return Results.Json(response, PolarionRestApiJsonContext.Default.JsonApiDocumentListWorkItemResource);
+        }
+        catch (PolarionThrottledException ex)
+        {
+            Log.Warning("REST API: Throttled fetching work items by ID ({Reason})", ex.Reason);
+            return ThrottledResponse.Create(httpContext, ex);
+        }
+        catch (Exception ex)
+        {
+            Log.Error(ex, "REST API: Exception fetching work items by ID");
+            return CreateErrorResponse("500", "Internal Server Error", ex.Message);
+        }
+    }
+
     /// <summary>
     /// Builds a Lucene query from user inputs.
     /// Same logic as the search_workitems MCP tool.
@@ -665,14 +879,181 @@ public static class WorkItemsEndpoints
     }
 
     /// <summary>
-    /// Returns the default list of fields to retrieve from Polarion for search results.
+    /// Work item attribute and relationship names accepted in <c>fields[workitems]</c>,
+    /// mapped to the Polarion field each one is read from.
+    /// </summary>
+    private static readonly Dictionary<string, string> SparseFieldMap = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ["title"] = "title",
+        ["type"] = "type",
+        ["status"] = "status",
+        ["description"] = "description",
+        ["outlineNumber"] = "outlineNumber",
+        ["created"] = "created",
+        ["updated"] = "updated",
+        ["author"] = "author",
+        ["assignee"] = "assignee",
+        ["severity"] = "severity",
+        ["priority"] = "priority",
+        ["linkedWorkItems"] = "linkedWorkItems",
+        ["backlinkedWorkItems"] = "linkedWorkItemsDerived"
+    };
+
+    /// <summary>
+    /// The attributes returned by GET /workitems/{workitemId} when no sparse fieldset is requested.
+    /// </summary>
+    private static readonly HashSet<string> GetWorkItemDefaultFieldset = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "title", "type", "status", "outlineNumber", "created", "updated", "author", "severity", "priority", "description"
+    };
+
+    /// <summary>
+    /// The attributes returned by work item searches when no sparse fieldset is requested.
+    /// </summary>
+    private static readonly HashSet<string> SearchDefaultFieldset = new(StringComparer.OrdinalIgnoreCase)
+    {
+        "title", "type", "status", "description", "updated", "created", "outlineNumber", "author", "assignee"
+    };
+
+    /// <summary>
+    /// Parses a JSON:API sparse fieldset (e.g. <c>title,status,linkedWorkItems</c>).
+    /// The fieldset is null when the parameter is absent.
+    /// </summary>
+    internal static bool TryParseFieldset(
+        string? fields,
+        out HashSet<string>? fieldset,
+        [NotNullWhen(false)] out IResult? errorResponse)
+    {
+        fieldset = null;
+        errorResponse = null;
+
+        if (fields == null)
+        {
+            return true;
+        }
+
+        var requested = fields.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries);
+        var unknown = requested.Where(f => !SparseFieldMap.ContainsKey(f)).ToList();
+        if (unknown.Count > 0)
+        {
+            errorResponse = CreateErrorResponse("400", "Bad Request",
+                $"Unknown field(s) in fields[workitems]: {string.Join(", ", unknown)}. Valid fields: {string.Join(", ", SparseFieldMap.Keys)}");
+            return false;
+        }
+
+        fieldset = new HashSet<string>(requested, StringComparer.OrdinalIgnoreCase);
+        return true;
+    }
+
+    /// <summary>
+    /// Returns the Polarion field list needed to serialize the given fieldset.
+    /// </summary>
+    internal static List<string> ToPolarionFieldList(IEnumerable<string> fieldset)
+    {
+        // "updated" is always fetched so sparse responses still get an ETag
+        return fieldset
+            .Select(f => SparseFieldMap[f])
+            .Prepend("updated")
+            .Prepend("id")
+            .Distinct(StringComparer.Ordinal)
+            .ToList();
+    }
+
+    /// <summary>
+    /// Returns the ETag versions of a work item: its updated timestamp, plus its back-links when they were fetched,
+    /// since linking from another work item does not change this one's updated timestamp.
     /// </summary>
-    private static List<string> GetSearchFieldList()
+    private static IEnumerable<string> GetWorkItemVersions(Polarion.Generated.Tracker.WorkItem wi)
     {
-        return new List<string>
+        yield return $"{wi.id}@{(wi.updatedSpecified ? wi.updated.Ticks : 0)}";
+
+        if (wi.linkedWorkItemsDerived != null)
         {
-            "id", "title", "type", "status", "description",
-            "updated", "created", "outlineNumber", "author", "assignee"
+            foreach (var link in wi.linkedWorkItemsDerived)
+            {
+                yield return $"<{link.role?.id}:{link.workItemURI}:{link.suspect}";
+            }
+        }
+    }
+
+    /// <summary>
+    /// Returns the ETag versions of a link list. Links carry no timestamp of their own, so their content is used.
+    /// </summary>
+    private static IEnumerable<string> GetLinkVersions(IEnumerable<LinkedWorkItemResource> resources)
+    {
+        return resources.Select(r => $"{r.Id}:{r.Attributes?.Suspect}");
+    }
+
+    /// <summary>
+    /// Builds a work item resource containing only the attributes and relationships in the fieldset.
+    /// </summary>
+    internal static WorkItemResource CreateWorkItemResource(string projectId, string workitemId, Polarion.Generated.Tracker.WorkItem wi, HashSet<string> fieldset)
+    {
+        var resource = new WorkItemResource
+        {
+            Id = $"{projectId}/{workitemId}",
+            Links = new JsonApiLinks
+            {
+                Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}"
+            }
         };
+
+        if (fieldset.Any(f => !f.Equals("linkedWorkItems", StringComparison.OrdinalIgnoreCase) &&
+                              !f.Equals("backlinkedWorkItems", StringComparison.OrdinalIgnoreCase)))
+        {
+            resource.Attributes = new WorkItemAttributes
+            {
+                Title = fieldset.Contains("title") ? wi.title : null,
+                Type = fieldset.Contains("type") ? wi.type?.id : null,
+                Status = fieldset.Contains("status") ? wi.status?.id : null,
+                Description = fieldset.Contains("description") ? wi.description?.content : null,
+                OutlineNumber = fieldset.Contains("outlineNumber") ? wi.outlineNumber : null,
+                Created = fieldset.Contains("created") && wi.createdSpecified ? wi.created : null,
+                Updated = fieldset.Contains("updated") && wi.updatedSpecified ? wi.updated : null,
+                Author = fieldset.Contains("author") ? wi.author?.id : null,
+                Assignee = fieldset.Contains("assignee") && wi.assignee != null && wi.assignee.Length > 0
+                    ? wi.assignee[0]?.id
+                    : null,
+                Severity = fieldset.Contains("severity") ? wi.severity?.id : null,
+                Priority = fieldset.Contains("priority") ? wi.priority?.id : null
+            };
+        }
+
+        if (fieldset.Contains("linkedWorkItems") || fieldset.Contains("backlinkedWorkItems"))
+        {
+            resource.Relationships = new Dictionary<string, JsonApiRelationship>();
+
+            if (fieldset.Contains("linkedWorkItems"))
+            {
+                resource.Relationships["linkedWorkItems"] = new JsonApiRelationship
+                {
+                    Data = ToResourceIdentifiers(projectId, wi.linkedWorkItems?.Select(l => (l.role?.id, l.workItemURI))),
+                    Links = new JsonApiLinks { Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}/linkedworkitems" }
+                };
+            }
+
+            if (fieldset.Contains("backlinkedWorkItems"))
+            {
+                resource.Relationships["backlinkedWorkItems"] = new JsonApiRelationship
+                {
+                    Data = ToResourceIdentifiers(projectId, wi.linkedWorkItemsDerived?.Select(l => (l.role?.id, l.workItemURI))),
+                    Links = new JsonApiLinks { Self = $"/polarion/rest/v1/projects/{projectId}/workitems/{workitemId}/backlinkedworkitems" }
+                };
+            }
+        }
+
+        return resource;
+    }
+
+    private static List<JsonApiResourceIdentifier> ToResourceIdentifiers(string projectId, IEnumerable<(string? Role, string? WorkItemUri)>? links)
+    {
+        return (links ?? Enumerable.Empty<(string? Role, string? WorkItemUri)>())
+            .Where(l => l.Role != null && l.Role != "subsection_of" && l.WorkItemUri != null && l.WorkItemUri.Contains("${WorkItem}"))
+            .Select(l => new JsonApiResourceIdentifier
+            {
+                Type = "workitems",
+                Id = $"{projectId}/{l.WorkItemUri!.Split("${WorkItem}")[1]}"
+            })
+            .ToList();
     }
 }
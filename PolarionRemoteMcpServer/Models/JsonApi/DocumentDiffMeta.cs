@@ -0,0 +1,44 @@
+using System.Text.Json.Serialization;
+
+namespace PolarionRemoteMcpServer.Models.JsonApi;
+
+/// <summary>
+/// Metadata specific to comparing two Document revisions.
+/// </summary>
+public class DocumentDiffMeta : JsonApiMeta
+{
+    /// <summary>
+    /// The older document revision, or "-1" for HEAD.
+    /// </summary>
+    [JsonPropertyName("fromRevision")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? FromRevision { get; set; }
+
+    /// <summary>
+    /// The newer document revision, or "-1" for HEAD.
+    /// </summary>
+    [JsonPropertyName("toRevision")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? ToRevision { get; set; }
+
+    [JsonPropertyName("addedCount")]
+    public int AddedCount { get; set; }
+
+    [JsonPropertyName("removedCount")]
+    public int RemovedCount { get; set; }
+
+    [JsonPropertyName("movedCount")]
+    public int MovedCount { get; set; }
+
+    [JsonPropertyName("modifiedCount")]
+    public int ModifiedCount { get; set; }
+
+    [JsonPropertyName("unchangedCount")]
+    public int UnchangedCount { get; set; }
+
+    /// <summary>
+    /// Work items present in both revisions whose content was not compared because their revision did not change.
+    /// </summary>
+    [JsonPropertyName("skippedByRevisionCount")]
+    public int SkippedByRevisionCount { get; set; }
+}
@@ -106,3 +106,89 @@ public class DocumentRevisionAttributes
     [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
     public string? Status { get; set; }
 }
+
+/// <summary>
+/// JSON:API resource representing a work item that changed between two Document revisions.
+/// </summary>
+public class WorkItemChangeResource : JsonApiResource
+{
+    public WorkItemChangeResource()
+    {
+        Type = "workitem_changes";
+    }
+
+    [JsonPropertyName("attributes")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public new WorkItemChangeAttributes? Attributes { get; set; }
+}
+
+/// <summary>
+/// Attributes for a work item change resource.
+/// </summary>
+public class WorkItemChangeAttributes
+{
+    /// <summary>
+    /// One of "added", "removed", "modified" or "moved".
+    /// </summary>
+    [JsonPropertyName("changeType")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? ChangeType { get; set; }
+
+    /// <summary>
+    /// True if the work item changed parent section or position; also set on modified work items that moved.
+    /// </summary>
+    [JsonPropertyName("moved")]
+    public bool Moved { get; set; }
+
+    [JsonPropertyName("title")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Title { get; set; }
+
+    [JsonPropertyName("type")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Type { get; set; }
+
+    [JsonPropertyName("fromOutlineNumber")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? FromOutlineNumber { get; set; }
+
+    [JsonPropertyName("toOutlineNumber")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? ToOutlineNumber { get; set; }
+
+    /// <summary>
+    /// The work item revision in the older document revision, when that revision is historical.
+    /// </summary>
+    [JsonPropertyName("fromRevision")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? FromRevision { get; set; }
+
+    /// <summary>
+    /// The work item revision in the newer document revision, when that revision is historical.
+    /// </summary>
+    [JsonPropertyName("toRevision")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? ToRevision { get; set; }
+
+    /// <summary>
+    /// The changed fields of a modified work item. Descriptions and rich-text fields are HTML.
+    /// </summary>
+    [JsonPropertyName("fieldChanges")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public List<WorkItemFieldChangeAttributes>? FieldChanges { get; set; }
+}
+
+/// <summary>
+/// One changed field of a work item change resource.
+/// </summary>
+public class WorkItemFieldChangeAttributes
+{
+    [JsonPropertyName("field")]
+    public string Field { get; set; } = string.Empty;
+
+    [JsonPropertyName("from")]
+    public string? From { get; set; }
+
+    [JsonPropertyName("to")]
+    public string? To { get; set; }
+}
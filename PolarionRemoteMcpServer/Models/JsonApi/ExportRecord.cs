@@ -0,0 +1,58 @@
+using System.Text.Json.Serialization;
+
+namespace PolarionRemoteMcpServer.Models.JsonApi;
+
+/// <summary>
+/// One line of an NDJSON export. <see cref="Kind"/> is "document" at the start of each document, "workitem" for
+/// each work item in outline order, "error" for a document that could not be exported, and "end" as the last line
+/// of a complete export.
+/// </summary>
+public class ExportRecord
+{
+    [JsonPropertyName("kind")]
+    public string Kind { get; set; } = string.Empty;
+
+    [JsonPropertyName("space")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Space { get; set; }
+
+    [JsonPropertyName("documentId")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? DocumentId { get; set; }
+
+    /// <summary>
+    /// Work items in the document ("document" lines) or in the whole export ("end" line).
+    /// </summary>
+    [JsonPropertyName("workItemCount")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? WorkItemCount { get; set; }
+
+    /// <summary>
+    /// Documents in the export ("end" line).
+    /// </summary>
+    [JsonPropertyName("documentCount")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? DocumentCount { get; set; }
+
+    [JsonPropertyName("data")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public WorkItemResource? Data { get; set; }
+
+    /// <summary>
+    /// The work item converted to Markdown, when requested with <c>markdown=true</c>.
+    /// </summary>
+    [JsonPropertyName("markdown")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Markdown { get; set; }
+
+    [JsonPropertyName("detail")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Detail { get; set; }
+
+    /// <summary>
+    /// Token that resumes the export just after this line when passed back as the <c>continue</c> query parameter.
+    /// </summary>
+    [JsonPropertyName("continuation")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Continuation { get; set; }
+}
@@ -56,7 +56,11 @@ public class JsonApiLinks
 
 /// <summary>
 /// Represents metadata in a JSON:API document.
+/// Derived metadata types are listed so their properties are written when serialized as <see cref="JsonApiMeta"/>.
 /// </summary>
+[JsonDerivedType(typeof(WorkItemSearchMeta))]
+[JsonDerivedType(typeof(WorkItemBatchMeta))]
+[JsonDerivedType(typeof(DocumentDiffMeta))]
 public class JsonApiMeta
 {
     /// <summary>
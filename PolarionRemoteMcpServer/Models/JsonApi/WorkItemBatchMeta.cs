@@ -0,0 +1,23 @@
+using System.Text.Json.Serialization;
+
+namespace PolarionRemoteMcpServer.Models.JsonApi;
+
+/// <summary>
+/// Metadata specific to fetching work items by an explicit ID list.
+/// </summary>
+public class WorkItemBatchMeta : JsonApiMeta
+{
+    /// <summary>
+    /// The number of distinct IDs requested.
+    /// </summary>
+    [JsonPropertyName("requestedCount")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? RequestedCount { get; set; }
+
+    /// <summary>
+    /// The requested IDs that did not match a work item.
+    /// </summary>
+    [JsonPropertyName("missingIds")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public List<string>? MissingIds { get; set; }
+}
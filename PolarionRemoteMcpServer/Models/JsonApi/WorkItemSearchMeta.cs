@@ -7,6 +7,21 @@ namespace PolarionRemoteMcpServer.Models.JsonApi;
 /// </summary>
 public class WorkItemSearchMeta : JsonApiMeta
 {
+    /// <summary>
+    /// The number of work items matching the query across all pages.
+    /// </summary>
+    [JsonPropertyName("totalCount")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? TotalCount { get; set; }
+
+    [JsonPropertyName("pageNumber")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? PageNumber { get; set; }
+
+    [JsonPropertyName("pageSize")]
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public int? PageSize { get; set; }
+
     [JsonPropertyName("query")]
     [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
     public string? Query { get; set; }
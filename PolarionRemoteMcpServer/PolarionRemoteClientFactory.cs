@@ -10,15 +10,18 @@ namespace PolarionRemoteMcpServer
     {
         private readonly List<PolarionProjectConfig> _projectConfigs; // Changed from single configuration
         private readonly ILogger<PolarionRemoteClientFactory> _logger;
+        private readonly PolarionSessionPool _sessionPool;
         private readonly IHttpContextAccessor? _httpContextAccessor;
 
         // Constructor updated to inject the list of project configurations
         public PolarionRemoteClientFactory(
             List<PolarionProjectConfig> projectConfigs, // Changed parameter type
+            PolarionSessionPool sessionPool,
             ILogger<PolarionRemoteClientFactory> logger,
             IHttpContextAccessor? httpContextAccessor)
         {
             _projectConfigs = projectConfigs; // Assign the injected list
+            _sessionPool = sessionPool;
             _logger = logger;
             _httpContextAccessor = httpContextAccessor;
         }
@@ -27,7 +30,13 @@ namespace PolarionRemoteMcpServer
         public string? ProjectId => _httpContextAccessor?.HttpContext?.GetRouteValue("projectId")?.ToString();
 
         [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
-        public async Task<Result<IPolarionClient>> CreateClientAsync()
+        public Task<Result<IPolarionClient>> CreateClientAsync()
+        {
+            return Task.FromResult(CreateClient());
+        }
+
+        [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+        private Result<IPolarionClient> CreateClient()
         {
             string? routeProjectId = ProjectId; // Get project ID alias from route
             _logger.LogDebug("Attempting to create Polarion client for requested Project Alias: {RouteProjectId}", routeProjectId ?? "[Not Provided]");
@@ -73,11 +82,11 @@ namespace PolarionRemoteMcpServer
                 return Result.Fail(errorMessage);
             }
 
-            _logger.LogDebug("Creating Polarion client using Server: {ServerUrl}, User: {Username}, Project: {RealProjectId}", 
+            _logger.LogDebug("Creating pooled Polarion client using Server: {ServerUrl}, User: {Username}, Project: {RealProjectId}", 
                 clientConfig.ServerUrl, clientConfig.Username, clientConfig.ProjectId);
 
-            // Create the client using the selected configuration
-            var clientResult = await PolarionClient.CreateAsync(clientConfig); 
+            // The client takes a pooled session for each call and hands it back when the call completes
+            var clientResult = _sessionPool.GetClient(selectedConfig);
             if (clientResult.IsFailed)
             {
                 var errorMessage = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -86,9 +95,7 @@ namespace PolarionRemoteMcpServer
                 return Result.Fail($"Failed to create Polarion client via factory for alias '{selectedConfig.ProjectUrlAlias}': {errorMessage}");
             }
 
-            _logger.LogDebug("Successfully created new Polarion client for server: {ServerUrl} (Alias: {Alias})", 
-                clientConfig.ServerUrl, selectedConfig.ProjectUrlAlias);
-            return clientResult.Value;
+            return clientResult;
         }
     }
 }
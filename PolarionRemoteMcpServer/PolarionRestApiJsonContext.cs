@@ -1,6 +1,7 @@
 using System.Text.Json.Serialization;
 using PolarionRemoteMcpServer.Authentication;
 using PolarionRemoteMcpServer.Endpoints;
+using PolarionMcpTools;
 using PolarionRemoteMcpServer.Models.JsonApi;
 
 namespace PolarionRemoteMcpServer;
@@ -16,6 +17,7 @@ namespace PolarionRemoteMcpServer;
 [JsonSerializable(typeof(JsonApiErrorSource))]
 [JsonSerializable(typeof(JsonApiRelationship))]
 [JsonSerializable(typeof(JsonApiResourceIdentifier))]
+[JsonSerializable(typeof(List<JsonApiResourceIdentifier>))]
 [JsonSerializable(typeof(JsonApiResource))]
 [JsonSerializable(typeof(JsonApiResourceMeta))]
 
@@ -25,6 +27,7 @@ namespace PolarionRemoteMcpServer;
 [JsonSerializable(typeof(WorkItemRevisionResource))]
 [JsonSerializable(typeof(WorkItemRevisionAttributes))]
 [JsonSerializable(typeof(WorkItemSearchMeta))]
+[JsonSerializable(typeof(WorkItemBatchMeta))]
 [JsonSerializable(typeof(LinkedWorkItemResource))]
 [JsonSerializable(typeof(LinkedWorkItemAttributes))]
 [JsonSerializable(typeof(List<WorkItemResource>))]
@@ -40,11 +43,18 @@ namespace PolarionRemoteMcpServer;
 [JsonSerializable(typeof(DocumentAttributes))]
 [JsonSerializable(typeof(DocumentRevisionResource))]
 [JsonSerializable(typeof(DocumentRevisionAttributes))]
+[JsonSerializable(typeof(WorkItemChangeResource))]
+[JsonSerializable(typeof(WorkItemChangeAttributes))]
+[JsonSerializable(typeof(WorkItemFieldChangeAttributes))]
+[JsonSerializable(typeof(DocumentDiffMeta))]
 [JsonSerializable(typeof(List<DocumentResource>))]
 [JsonSerializable(typeof(List<DocumentRevisionResource>))]
+[JsonSerializable(typeof(List<WorkItemChangeResource>))]
+[JsonSerializable(typeof(List<WorkItemFieldChangeAttributes>))]
 [JsonSerializable(typeof(JsonApiDocument<DocumentResource>))]
 [JsonSerializable(typeof(JsonApiDocument<List<DocumentResource>>))]
 [JsonSerializable(typeof(JsonApiDocument<List<DocumentRevisionResource>>))]
+[JsonSerializable(typeof(JsonApiDocument<List<WorkItemChangeResource>>))]
 
 // Space types
 [JsonSerializable(typeof(SpaceResource))]
@@ -52,12 +62,19 @@ namespace PolarionRemoteMcpServer;
 [JsonSerializable(typeof(List<SpaceResource>))]
 [JsonSerializable(typeof(JsonApiDocument<List<SpaceResource>>))]
 
+// Export types
+[JsonSerializable(typeof(ExportRecord))]
+
 // Error response type
 [JsonSerializable(typeof(JsonApiDocument<object>))]
 [JsonSerializable(typeof(List<JsonApiError>))]
 
 // Health endpoint types
 [JsonSerializable(typeof(VersionInfo))]
+[JsonSerializable(typeof(PolarionCallCoalescerStatistics))]
+[JsonSerializable(typeof(List<PolarionBulkheadStatistics>))]
+[JsonSerializable(typeof(PolarionProjectCatalogStatistics))]
+[JsonSerializable(typeof(PolarionWarmupStatus))]
 [JsonSerializable(typeof(string))]
 
 // Common nullable types used in query parameters
@@ -32,10 +32,12 @@ public class Program
             var builder = WebApplication.CreateBuilder(args);
 
             // Configure Serilog based on environment
+            // Levels, output format, sampling and background writing come from the Logging section
             //
             var logDirectory = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "logs");
-            var logConfig = new LoggerConfiguration().MinimumLevel.Verbose();
+            var loggingConfig = builder.Configuration.GetSection("Logging").Get<PolarionLoggingConfig>();
 
+            LoggerConfiguration logConfig;
             if (builder.Environment.EnvironmentName == "Test")
             {
                 // Test environment: Use timestamped log files in test-runs subdirectory
@@ -45,10 +47,9 @@ public class Program
                 var timestamp = DateTime.Now.ToString("yyyy-MM-dd-HHmmss");
                 var logPath = Path.Combine(testLogDirectory, $"test-run-{timestamp}.log");
 
-                logConfig
-                    .WriteTo.File(logPath,
-                        outputTemplate: "{Timestamp:yyyy-MM-dd HH:mm:ss.fff zzz} [{Level:u3}] {Message:lj}{NewLine}{Exception}")
-                    .WriteTo.Console();
+                logConfig = PolarionLogging.CreateConfiguration(loggingConfig, (writeTo, formatter) => writeTo
+                    .File(formatter, logPath)
+                    .WriteTo.Console(formatter));
 
                 // Clean up old test logs (keep last 10)
                 CleanupOldTestLogs(testLogDirectory, retainCount: 10);
@@ -56,12 +57,10 @@ public class Program
             else
             {
                 // Development/Production: Use rolling daily logs
-                logConfig
-                    .WriteTo.File(Path.Combine(logDirectory, "PolarionMcpServer_.log"),
-                        rollingInterval: RollingInterval.Day,
-                        outputTemplate: "{Timestamp:yyyy-MM-dd HH:mm:ss.fff zzz} [{Level:u3}] {Message:lj}{NewLine}{Exception}")
-                    .WriteTo.Debug()
-                    .WriteTo.Console(standardErrorFromLevel: Serilog.Events.LogEventLevel.Verbose);
+                logConfig = PolarionLogging.CreateConfiguration(loggingConfig, (writeTo, formatter) => writeTo
+                    .File(formatter, Path.Combine(logDirectory, "PolarionMcpServer_.log"), rollingInterval: RollingInterval.Day)
+                    .WriteTo.Debug(formatter)
+                    .WriteTo.Console(formatter, standardErrorFromLevel: Serilog.Events.LogEventLevel.Verbose));
             }
 
             Log.Logger = logConfig.CreateLogger();
@@ -189,6 +188,16 @@ public class Program
             // Add the configurations and the factory to the DI container
             //
             builder.Services.AddSingleton(polarionProjects); // Register the list of project configurations
+            builder.Services.AddSingleton<PolarionCallCoalescer>(); // Single-flight sharing of identical in-flight Polarion calls
+            builder.Services.AddSingleton<PolarionSessionPool>(); // Warm Polarion sessions shared by MCP and REST requests
+            builder.Services.AddSingleton(appConfig.Caching ?? new PolarionCacheConfig());
+            builder.Services.AddSingleton<HistoricalWorkItemCache>(); // Immutable work items at specific revisions
+            builder.Services.AddSingleton<ModuleSnapshotCache>(); // Document work item snapshots shared by MCP and REST requests
+            builder.Services.AddSingleton<MarkdownConversionService>(); // Cached HTML to Markdown conversion
+            builder.Services.AddSingleton<PolarionProjectCatalog>(); // Space and document catalogs shared by MCP and REST requests
+            builder.Services.AddSingleton<PolarionWarmupService>(); // Opens sessions and loads catalogs and hot documents at startup
+            builder.Services.AddHostedService(sp => sp.GetRequiredService<PolarionWarmupService>());
+            builder.Services.AddSingleton<PrometheusMetricsExporter>(); // Aggregates PolarionMetrics for /api/metrics
             builder.Services.AddScoped<IPolarionClientFactory, PolarionRemoteClientFactory>(); // For MCP endpoints (uses ProjectUrlAlias)
             builder.Services.AddScoped<RestApiProjectResolver>(); // For REST API endpoints (uses SessionConfig.ProjectId)
 
@@ -204,6 +213,15 @@ public class Program
             Log.Information("Starting PolarionMcpServer...");
             var app = builder.Build();
 
+            // Start aggregating metrics before the first request and publish the shared cache counters
+            //
+            app.Services.GetRequiredService<PrometheusMetricsExporter>();
+            PolarionMetrics.ObserveCaches(
+                app.Services.GetRequiredService<ModuleSnapshotCache>(),
+                app.Services.GetRequiredService<HistoricalWorkItemCache>(),
+                app.Services.GetRequiredService<MarkdownConversionService>(),
+                app.Services.GetRequiredService<PolarionCallCoalescer>());
+
             // Enable forwarded headers to correctly detect HTTPS and host when behind a reverse proxy
             // This ensures OpenAPI/Scalar shows the correct URL (https://your-domain.com) instead of http://localhost
             //
@@ -212,6 +230,10 @@ public class Program
                 ForwardedHeaders = ForwardedHeaders.XForwardedFor | ForwardedHeaders.XForwardedProto | ForwardedHeaders.XForwardedHost
             });
 
+            // Measure every request (route latency, response size, in-flight count and MCP tool calls)
+            //
+            app.UseRequestMetrics();
+
             // Add authentication and authorization middleware
             //
             app.UseApiKeyAuthentication();
@@ -273,7 +295,7 @@ public class Program
             // Map health and version endpoints
             //
             app.MapHealthEndpoints();
-            Log.Information("Health endpoints mapped at /api/health and /api/version");
+            Log.Information("Health endpoints mapped at /api/health, /api/health/coalescing, /api/metrics and /api/version");
 
             // Map MCP endpoints
             //
@@ -285,10 +307,12 @@ public class Program
             app.MapWorkItemsEndpoints();
             app.MapSpacesEndpoints();
             app.MapDocumentsEndpoints();
+            app.MapExportEndpoints();
             Log.Information("REST API endpoints mapped at /polarion/rest/v1/projects/{{projectId}}/...");
             Log.Information("PolarionMcpServer v{Version} started successfully", version);
 
             app.Run();
+            Log.CloseAndFlush(); // Drain the background log writer
             return 0;
         }
         catch (Exception ex)
@@ -296,6 +320,12 @@ public class Program
             Console.ForegroundColor = ConsoleColor.Red;
             Log.Fatal($"Host terminated unexpectedly. Exception: {ex}");
             Console.ResetColor();
+
+            // The test host aborts Main on purpose and keeps using the logger afterwards
+            if (ex is not HostAbortedException)
+            {
+                Log.CloseAndFlush();
+            }
             return 1;
         }
     }
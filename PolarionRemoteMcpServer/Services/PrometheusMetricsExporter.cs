@@ -0,0 +1,208 @@
+using System.Collections.Concurrent;
+using System.Diagnostics.Metrics;
+using System.Globalization;
+using System.Text;
+using PolarionMcpTools;
+
+namespace PolarionRemoteMcpServer.Services;
+
+/// <summary>
+/// Aggregates the <see cref="PolarionMetrics"/> instruments in process and renders them in the Prometheus
+/// text exposition format for <c>GET /api/metrics</c>. Built on <see cref="MeterListener"/> rather than an
+/// exporter package so it needs no reflection under the trimmed single-file publish.
+/// </summary>
+public sealed class PrometheusMetricsExporter : IDisposable
+{
+    private static readonly double[] SecondsBuckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60];
+    private static readonly double[] BytesBuckets = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216];
+
+    private readonly MeterListener _listener = new();
+    private readonly ConcurrentDictionary<Instrument, InstrumentState> _instruments = new();
+
+    public PrometheusMetricsExporter()
+    {
+        _listener.InstrumentPublished = (instrument, listener) =>
+        {
+            if (instrument.Meter.Name == PolarionMetrics.MeterName)
+            {
+                _instruments.TryAdd(instrument, new InstrumentState(instrument));
+                listener.EnableMeasurementEvents(instrument);
+            }
+        };
+        _listener.SetMeasurementEventCallback<long>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _listener.SetMeasurementEventCallback<double>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _listener.Start();
+    }
+
+    /// <summary>
+    /// Collects observable instruments and renders every series.
+    /// </summary>
+    public string Export()
+    {
+        _listener.RecordObservableInstruments();
+
+        var output = new StringBuilder();
+        foreach (var state in _instruments.Values.OrderBy(s => s.Name, StringComparer.Ordinal))
+        {
+            state.Write(output);
+        }
+
+        return output.ToString();
+    }
+
+    public void Dispose()
+    {
+        _listener.Dispose();
+    }
+
+    private void Record(Instrument instrument, double value, ReadOnlySpan<KeyValuePair<string, object?>> tags)
+    {
+        if (_instruments.TryGetValue(instrument, out var state))
+        {
+            state.Record(value, FormatLabels(tags));
+        }
+    }
+
+    private static string FormatLabels(ReadOnlySpan<KeyValuePair<string, object?>> tags)
+    {
+        if (tags.Length == 0)
+        {
+            return string.Empty;
+        }
+
+        var labels = new StringBuilder();
+        foreach (var tag in tags)
+        {
+            if (labels.Length > 0)
+            {
+                labels.Append(',');
+            }
+
+            var value = Convert.ToString(tag.Value, CultureInfo.InvariantCulture) ?? string.Empty;
+            labels.Append(tag.Key).Append("=\"")
+                .Append(value.Replace("\\", "\\\\").Replace("\"", "\\\"").Replace("\n", "\\n"))
+                .Append('"');
+        }
+
+        return labels.ToString();
+    }
+
+    private static string FormatValue(double value)
+    {
+        return double.IsPositiveInfinity(value) ? "+Inf" : value.ToString(CultureInfo.InvariantCulture);
+    }
+
+    private sealed class InstrumentState
+    {
+        private readonly Instrument _instrument;
+        private readonly string _type;
+        private readonly double[]? _buckets;
+        private readonly ConcurrentDictionary<string, Series> _series = new(StringComparer.Ordinal);
+
+        public InstrumentState(Instrument instrument)
+        {
+            _instrument = instrument;
+
+            var unitSuffix = instrument.Unit switch
+            {
+                "s" => "_seconds",
+                "By" => "_bytes",
+                _ => string.Empty
+            };
+            var isCounter = instrument is Counter<long> or Counter<double> or ObservableCounter<long> or ObservableCounter<double>;
+            var isHistogram = instrument is Histogram<long> or Histogram<double>;
+
+            Name = instrument.Name.Replace('.', '_') + unitSuffix + (isCounter ? "_total" : string.Empty);
+            _type = isHistogram ? "histogram" : isCounter ? "counter" : "gauge";
+            _buckets = isHistogram ? (instrument.Unit == "By" ? BytesBuckets : SecondsBuckets) : null;
+        }
+
+        public string Name { get; }
+
+        public void Record(double value, string labels)
+        {
+            var series = _series.GetOrAdd(labels, _ => new Series(_buckets?.Length ?? 0));
+            lock (series)
+            {
+                if (_buckets != null)
+                {
+                    for (var i = 0; i < _buckets.Length; i++)
+                    {
+                        if (value <= _buckets[i])
+                        {
+                            series.BucketCounts[i]++;
+                        }
+                    }
+
+                    series.Count++;
+                    series.Sum += value;
+                }
+                else if (_instrument.IsObservable)
+                {
+                    // Observable instruments report the current total, not a delta
+                    series.Sum = value;
+                }
+                else
+                {
+                    series.Sum += value;
+                }
+            }
+        }
+
+        public void Write(StringBuilder output)
+        {
+            if (_series.IsEmpty)
+            {
+                return;
+            }
+
+            output.Append("# HELP ").Append(Name).Append(' ').Append(_instrument.Description).Append('\n');
+            output.Append("# TYPE ").Append(Name).Append(' ').Append(_type).Append('\n');
+
+            foreach (var (labels, series) in _series.OrderBy(s => s.Key, StringComparer.Ordinal))
+            {
+                lock (series)
+                {
+                    if (_buckets == null)
+                    {
+                        AppendSample(output, Name, labels, series.Sum);
+                        continue;
+                    }
+
+                    var separator = labels.Length > 0 ? "," : string.Empty;
+                    for (var i = 0; i < _buckets.Length; i++)
+                    {
+                        AppendSample(output, Name + "_bucket", $"{labels}{separator}le=\"{FormatValue(_buckets[i])}\"", series.BucketCounts[i]);
+                    }
+
+                    AppendSample(output, Name + "_bucket", $"{labels}{separator}le=\"+Inf\"", series.Count);
+                    AppendSample(output, Name + "_sum", labels, series.Sum);
+                    AppendSample(output, Name + "_count", labels, series.Count);
+                }
+            }
+        }
+
+        private static void AppendSample(StringBuilder output, string name, string labels, double value)
+        {
+            output.Append(name);
+            if (labels.Length > 0)
+            {
+                output.Append('{').Append(labels).Append('}');
+            }
+
+            output.Append(' ').Append(FormatValue(value)).Append('\n');
+        }
+    }
+
+    private sealed class Series
+    {
+        public Series(int bucketCount)
+        {
+            BucketCounts = new long[bucketCount];
+        }
+
+        public long[] BucketCounts { get; }
+        public long Count { get; set; }
+        public double Sum { get; set; }
+    }
+}
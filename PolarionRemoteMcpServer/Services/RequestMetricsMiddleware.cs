@@ -0,0 +1,175 @@
+using System.Diagnostics;
+using System.Text.Json;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Routing;
+using PolarionMcpTools;
+using Serilog;
+
+namespace PolarionRemoteMcpServer.Services;
+
+/// <summary>
+/// Measures every HTTP request by route template (latency, response size and in-flight count), and every
+/// streamable HTTP MCP <c>tools/call</c> request by tool name.
+/// </summary>
+public sealed class RequestMetricsMiddleware
+{
+    /// <summary>
+    /// MCP request bodies larger than this are not inspected for a tool name.
+    /// </summary>
+    private const long MaxInspectedBodyBytes = 64 * 1024;
+
+    private readonly RequestDelegate _next;
+
+    public RequestMetricsMiddleware(RequestDelegate next)
+    {
+        _next = next;
+    }
+
+    public async Task InvokeAsync(HttpContext context)
+    {
+        var path = context.Request.Path.Value ?? string.Empty;
+        var kind = path.StartsWith("/polarion/rest", StringComparison.OrdinalIgnoreCase) ? "rest"
+            : path.StartsWith("/api", StringComparison.OrdinalIgnoreCase) ? "api"
+            : "mcp";
+
+        // Legacy SSE posts to /message are answered with 202 and the result arrives on the SSE stream,
+        // so only streamable HTTP posts measure the tool call itself
+        var toolName = kind == "mcp" && HttpMethods.IsPost(context.Request.Method) && !path.EndsWith("/message")
+            ? await TryReadToolNameAsync(context.Request)
+            : null;
+
+        var originalBody = context.Response.Body;
+        var countingBody = new CountingStream(originalBody);
+        context.Response.Body = countingBody;
+
+        var startTimestamp = Stopwatch.GetTimestamp();
+        PolarionMetrics.AddActiveHttpRequest(kind, 1);
+        try
+        {
+            await _next(context);
+        }
+        finally
+        {
+            PolarionMetrics.AddActiveHttpRequest(kind, -1);
+            context.Response.Body = originalBody;
+
+            var elapsed = Stopwatch.GetElapsedTime(startTimestamp);
+            var route = (context.GetEndpoint() as RouteEndpoint)?.RoutePattern.RawText ?? "unmatched";
+            PolarionMetrics.RecordHttpRequest(route, context.Request.Method, context.Response.StatusCode, elapsed, countingBody.BytesWritten);
+
+            if (toolName != null)
+            {
+                PolarionMetrics.RecordToolCall(toolName, elapsed, countingBody.BytesWritten);
+                Log.Debug("MCP tool {ToolName} completed in {ElapsedMs:F1} ms ({Bytes} bytes)",
+                    toolName, elapsed.TotalMilliseconds, countingBody.BytesWritten);
+            }
+            else
+            {
+                Log.Debug("HTTP {Method} {Route} responded {StatusCode} in {ElapsedMs:F1} ms ({Bytes} bytes)",
+                    context.Request.Method, route, context.Response.StatusCode, elapsed.TotalMilliseconds, countingBody.BytesWritten);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Returns the tool name of a JSON-RPC <c>tools/call</c> request body, leaving the body readable for the MCP handler.
+    /// </summary>
+    private static async Task<string?> TryReadToolNameAsync(HttpRequest request)
+    {
+        if (request.ContentLength is null or > MaxInspectedBodyBytes)
+        {
+            return null;
+        }
+
+        request.EnableBuffering();
+        try
+        {
+            using var document = await JsonDocument.ParseAsync(request.Body);
+            var root = document.RootElement;
+            if (root.ValueKind == JsonValueKind.Object &&
+                root.TryGetProperty("method", out var method) && method.ValueEquals("tools/call") &&
+                root.TryGetProperty("params", out var parameters) && parameters.ValueKind == JsonValueKind.Object &&
+                parameters.TryGetProperty("name", out var name) && name.ValueKind == JsonValueKind.String)
+            {
+                return name.GetString();
+            }
+
+            return null;
+        }
+        catch (JsonException)
+        {
+            return null;
+        }
+        finally
+        {
+            request.Body.Position = 0;
+        }
+    }
+
+    /// <summary>
+    /// Write-through stream that counts the response bytes.
+    /// </summary>
+    private sealed class CountingStream : Stream
+    {
+        private readonly Stream _inner;
+
+        public CountingStream(Stream inner)
+        {
+            _inner = inner;
+        }
+
+        public long BytesWritten { get; private set; }
+
+        public override bool CanRead => false;
+        public override bool CanSeek => false;
+        public override bool CanWrite => true;
+        public override long Length => throw new NotSupportedException();
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            _inner.Write(buffer, offset, count);
+            BytesWritten += count;
+        }
+
+        public override void Write(ReadOnlySpan<byte> buffer)
+        {
+            _inner.Write(buffer);
+            BytesWritten += buffer.Length;
+        }
+
+        public override async Task WriteAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+        {
+            await _inner.WriteAsync(buffer.AsMemory(offset, count), cancellationToken);
+            BytesWritten += count;
+        }
+
+        public override async ValueTask WriteAsync(ReadOnlyMemory<byte> buffer, CancellationToken cancellationToken = default)
+        {
+            await _inner.WriteAsync(buffer, cancellationToken);
+            BytesWritten += buffer.Length;
+        }
+
+        public override void Flush() => _inner.Flush();
+        public override Task FlushAsync(CancellationToken cancellationToken) => _inner.FlushAsync(cancellationToken);
+        public override int Read(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+        public override void SetLength(long value) => throw new NotSupportedException();
+    }
+}
+
+public static class RequestMetricsMiddlewareExtensions
+{
+    /// <summary>
+    /// Adds request and MCP tool metrics to the application pipeline.
+    /// </summary>
+    public static IApplicationBuilder UseRequestMetrics(this IApplicationBuilder app)
+    {
+        return app.UseMiddleware<RequestMetricsMiddleware>();
+    }
+}
@@ -10,17 +10,22 @@ namespace PolarionRemoteMcpServer.Services;
 /// Unlike MCP endpoints which use ProjectUrlAlias, REST API endpoints match against
 /// the actual Polarion ProjectId (SessionConfig.ProjectId) for compatibility with
 /// the native Polarion REST API.
+/// Clients come from the shared <see cref="PolarionSessionPool"/> and take a pooled session
+/// only while one of their calls is running.
 /// </summary>
 public class RestApiProjectResolver
 {
     private readonly List<PolarionProjectConfig> _projectConfigs;
+    private readonly PolarionSessionPool _sessionPool;
     private readonly ILogger<RestApiProjectResolver> _logger;
 
     public RestApiProjectResolver(
         List<PolarionProjectConfig> projectConfigs,
+        PolarionSessionPool sessionPool,
         ILogger<RestApiProjectResolver> logger)
     {
         _projectConfigs = projectConfigs;
+        _sessionPool = sessionPool;
         _logger = logger;
     }
 
@@ -68,7 +73,13 @@ public class RestApiProjectResolver
     /// <param name="projectId">The Polarion project ID from the REST API route.</param>
     /// <returns>A Result containing the Polarion client or an error.</returns>
     [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
-    public async Task<Result<IPolarionClient>> CreateClientAsync(string projectId)
+    public Task<Result<IPolarionClient>> CreateClientAsync(string projectId)
+    {
+        return Task.FromResult(CreateClient(projectId));
+    }
+
+    [RequiresUnreferencedCode("Uses Polarion API which requires reflection")]
+    private Result<IPolarionClient> CreateClient(string projectId)
     {
         var config = GetProjectConfig(projectId);
         if (config == null)
@@ -81,10 +92,10 @@ public class RestApiProjectResolver
             return Result.Fail($"Project '{projectId}' has no SessionConfig defined.");
         }
 
-        _logger.LogDebug("REST API: Creating Polarion client for project '{ProjectId}' on server '{ServerUrl}'",
+        _logger.LogDebug("REST API: Creating pooled Polarion client for project '{ProjectId}' on server '{ServerUrl}'",
             projectId, config.SessionConfig.ServerUrl);
 
-        var clientResult = await PolarionClient.CreateAsync(config.SessionConfig);
+        var clientResult = _sessionPool.GetClient(config);
         if (clientResult.IsFailed)
         {
             var errorMessage = clientResult.Errors.FirstOrDefault()?.Message ?? "Unknown error";
@@ -93,8 +104,7 @@ public class RestApiProjectResolver
             return Result.Fail($"Failed to connect to Polarion for project '{projectId}': {errorMessage}");
         }
 
-        // Convert PolarionClient to IPolarionClient
-        return Result.Ok<IPolarionClient>(clientResult.Value);
+        return clientResult;
     }
 
     /// <summary>
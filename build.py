@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Build script for PolarionMcpServers
-Supports: build, run, start, stop, status, mcp commands
+Supports: build, run, start, stop, status, mcp, rest, bench, bench-compare commands
 """
 
 import sys
@@ -16,6 +16,7 @@ import subprocess
 import signal
 import time
 import json
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -34,6 +35,14 @@ try:
 except ImportError:
     pass
 
+# Optional: httpx (installed with fastmcp) for concurrent REST requests in 'bench'
+HTTPX_AVAILABLE = False
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    pass
+
 # Optional: python-dotenv for .env support
 try:
     from dotenv import load_dotenv
@@ -321,19 +330,311 @@ def run_test_command(filter_pattern: Optional[str] = None,
         sys.exit(0)
 
 
-def search_log(pattern: Optional[str] = None, tail: int = 0, level: Optional[str] = None, test_run: Optional[str] = None) -> None:
-    """Search or tail the log file
+# Serilog text lines start with "yyyy-MM-dd HH:mm:ss.fff zzz [LVL]"; JSON lines with {"Timestamp":"yyyy-MM-ddTHH:mm:ss...
+LOG_TIMESTAMP_PATTERN = re.compile(rb'^(?:\{"Timestamp":")?(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2}(?:\.\d{1,3})?)')
+LOG_LEVEL_PATTERN = re.compile(rb'\[(VRB|DBG|INF|WRN|ERR|FTL)\]|"Level":"(\w+)"')
+LOG_LEVELS = {
+    "verbose": "VRB", "trace": "VRB", "debug": "DBG", "info": "INF", "information": "INF",
+    "warn": "WRN", "warning": "WRN", "error": "ERR", "fatal": "FTL", "critical": "FTL",
+}
+# Written at Debug level by RequestMetricsMiddleware
+TOOL_LATENCY_PATTERN = re.compile(r'MCP tool (\S+) completed in ([\d.,]+) ms \((\d+) bytes\)')
+HTTP_LATENCY_PATTERN = re.compile(r'HTTP (\S+) (\S+) responded (\d+) in ([\d.,]+) ms \((\d+) bytes\)')
+ROLLING_LOG_DIR = Path("PolarionRemoteMcpServer/bin/Debug/net9.0/logs")
+LOG_BLOCK_SIZE = 64 * 1024
+
+
+def parse_log_time(value: str, end: bool = False) -> Optional[str]:
+    """Turn a --since/--until value into a sortable 'yyyy-MM-dd HH:mm:ss.fff' key.
+
+    Accepts relative ages ('15m', '2h', '1d'), a date ('2025-01-31') or a date and time
+    ('2025-01-31 14:05', '2025-01-31T14:05:30'). A bare date used with `end` covers the whole day.
+    """
+    import datetime
+
+    match = re.fullmatch(r'(\d+)([smhd])', value.strip())
+    if match:
+        seconds = int(match.group(1)) * {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+        moment = datetime.datetime.now() - datetime.timedelta(seconds=seconds)
+        return moment.strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
+
+    try:
+        moment = datetime.datetime.fromisoformat(value.strip().replace(" ", "T"))
+    except ValueError:
+        return None
+
+    if end and len(value.strip()) == 10:
+        return moment.strftime("%Y-%m-%d") + " 23:59:59.999"
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
+
+
+def _log_time_key(line: bytes) -> Optional[str]:
+    """Sortable timestamp key of a log entry's first line, or None for continuation lines."""
+    match = LOG_TIMESTAMP_PATTERN.match(line)
+    if not match:
+        return None
+    return f"{match.group(1).decode()} {match.group(2).decode()}"
+
+
+def _log_level(line: bytes) -> Optional[str]:
+    """Three-letter Serilog level of a log entry's first line."""
+    match = LOG_LEVEL_PATTERN.search(line, 0, 400)
+    if not match:
+        return None
+    if match.group(1):
+        return match.group(1).decode()
+    return LOG_LEVELS.get(match.group(2).decode().lower())
+
+
+def _read_lines_reverse(path: Path):
+    """Yield the lines of a file from last to first, reading fixed-size blocks from the end."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        at_end = True
+        while position > 0:
+            size = min(LOG_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            if at_end:
+                # A trailing newline ends the last line rather than starting an empty one
+                if lines[-1] == b"":
+                    lines.pop()
+                at_end = False
+            # The first piece may be the tail of a line that starts in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                yield line.rstrip(b"\r")
+        if remainder:
+            yield remainder.rstrip(b"\r")
+
+
+def _next_timestamped_line(f, position: int):
+    """Offset and time key of the first timestamped line starting after `position`."""
+    f.seek(position)
+    if position > 0:
+        f.readline()  # Skip the partial line
+    while True:
+        offset = f.tell()
+        line = f.readline()
+        if not line:
+            return None
+        key = _log_time_key(line)
+        if key:
+            return offset, key
+
+
+def _seek_log_time(f, since: str) -> int:
+    """Binary search for the offset of the first entry at or after `since` (entries are in time order)."""
+    f.seek(0, os.SEEK_END)
+    low, high = 0, f.tell()
+    while high - low > LOG_BLOCK_SIZE:
+        middle = (low + high) // 2
+        found = _next_timestamped_line(f, middle)
+        if found is None or found[1] >= since:
+            high = middle
+        else:
+            low = found[0] + 1
+
+    # Start on a line boundary; the scan skips any earlier entries that remain
+    f.seek(low)
+    if low > 0:
+        f.readline()
+    return f.tell()
+
+
+def _read_lines_forward(path: Path, since: Optional[str] = None):
+    """Yield the lines of a file from the first entry at or after `since` (or the start) to the end."""
+    with open(path, 'rb') as f:
+        f.seek(_seek_log_time(f, since) if since else 0)
+        for line in f:
+            yield line.rstrip(b"\r\n")
+
+
+def _group_log_entries(lines, reverse: bool = False):
+    """Group lines into (time_key, lines) entries; continuation lines (e.g. stack traces) join their entry."""
+    pending = []
+    for line in lines:
+        key = _log_time_key(line)
+        if reverse:
+            pending.append(line)
+            if key:
+                pending.reverse()
+                yield key, pending
+                pending = []
+        elif key:
+            if pending:
+                yield _log_time_key(pending[0]), pending
+            pending = [line]
+        else:
+            pending.append(line)
+    if pending:
+        if reverse:
+            pending.reverse()
+        yield _log_time_key(pending[0]), pending
+
+
+def _log_file_day(path: Path) -> Optional[str]:
+    """Day of a rolling log file from its name, e.g. PolarionMcpServer_20250131_001.log -> '2025-01-31'."""
+    match = re.search(r'_(\d{4})(\d{2})(\d{2})(?:_\d+)?\.log$', path.name)
+    return f"{match.group(1)}-{match.group(2)}-{match.group(3)}" if match else None
+
+
+def find_rolling_logs(log_dir: Path, since: Optional[str] = None, until: Optional[str] = None) -> list:
+    """Rolling PolarionMcpServer_*.log files in time order, skipping days outside the range."""
+    files = []
+    for path in log_dir.glob("PolarionMcpServer_*.log"):
+        day = _log_file_day(path)
+        if day and since and day < since[:10]:
+            continue
+        if day and until and day > until[:10]:
+            continue
+        files.append(path)
+    return sorted(files, key=lambda p: p.name)
+
+
+def _summarize_latencies(values: list) -> str:
+    values = sorted(values)
+    return (f"{len(values):>8} {percentile(values, 50):>9.1f} {percentile(values, 95):>9.1f} "
+            f"{percentile(values, 99):>9.1f} {values[-1]:>9.1f}")
+
+
+def print_log_stats(entries) -> int:
+    """Aggregate level counts and per tool/route latencies from the request metrics log lines."""
+    levels = {}
+    latencies = {}
+    sizes = {}
+    errors = {}
+    first = last = None
+    count = 0
+
+    for key, entry in entries:
+        count += 1
+        first = first or key
+        last = key or last
+        level = _log_level(entry[0]) or "???"
+        levels[level] = levels.get(level, 0) + 1
+
+        if level != "DBG":
+            continue
+        message = entry[0].decode('utf-8', errors='replace')
+        tool = TOOL_LATENCY_PATTERN.search(message)
+        if tool:
+            name, elapsed, size, status = f"mcp {tool.group(1)}", tool.group(2), tool.group(3), 200
+        else:
+            http = HTTP_LATENCY_PATTERN.search(message)
+            if not http:
+                continue
+            name = f"{http.group(1)} {http.group(2)}"
+            elapsed, size, status = http.group(4), http.group(5), int(http.group(3))
+        latencies.setdefault(name, []).append(float(elapsed.replace(",", ".")))
+        sizes[name] = sizes.get(name, 0) + int(size)
+        if status >= 400:
+            errors[name] = errors.get(name, 0) + 1
+
+    if count == 0:
+        print("No matching log entries found")
+        return 0
+
+    print(f"Entries: {count} ({first} → {last})")
+    print("")
+    print("Levels:")
+    order = ["FTL", "ERR", "WRN", "INF", "DBG", "VRB", "???"]
+    for level in sorted(levels, key=lambda l: order.index(l) if l in order else len(order)):
+        print(f"  {level:<5} {levels[level]:>10}")
+
+    if latencies:
+        print("")
+        print("Request latency (ms), from Debug-level request metrics:")
+        print(f"  {'Tool / route':<60} {'Count':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'Max':>9} {'Errors':>7} {'Avg size':>10}")
+        for name in sorted(latencies, key=lambda n: -len(latencies[n])):
+            values = latencies[name]
+            print(f"  {name[:60]:<60} {_summarize_latencies(values)} {errors.get(name, 0):>7} "
+                  f"{sizes[name] // len(values):>9}B")
+    else:
+        print("")
+        print("No request latencies found (they are logged at Debug level)")
+    return count
+
+
+def follow_log(log_files_source, matches) -> None:
+    """Print new matching entries as they are written, like `tail -f`, until Ctrl+C.
+
+    Args:
+        log_files_source: Returns the current list of files; the last one is followed, so a new
+                          rolling file is picked up when the day changes
+        matches: Entry filter taking the entry's lines
+    """
+    files = log_files_source()
+    path = files[-1] if files else None
+    position = path.stat().st_size if path and path.exists() else 0
+    pending = b""
+    entry = []
+    showing = False
+
+    print("--- Following (Ctrl+C to stop) ---")
+    try:
+        while True:
+            files = log_files_source()
+            if files and files[-1] != path:
+                path, position, pending = files[-1], 0, b""
+
+            if path and path.exists():
+                size = path.stat().st_size
+                if size < position:
+                    position, pending = 0, b""  # Truncated or replaced
+                if size > position:
+                    with open(path, 'rb') as f:
+                        f.seek(position)
+                        data = pending + f.read(size - position)
+                        position = size
+                    lines = data.split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        line = line.rstrip(b"\r")
+                        if _log_time_key(line):
+                            entry = [line]
+                            showing = matches(entry)
+                        elif entry:
+                            entry.append(line)
+                        else:
+                            showing = matches([line])
+                        if showing:
+                            print(line.decode('utf-8', errors='replace'), flush=True)
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        print("\nStopped following")
+
+
+def search_log(pattern: Optional[str] = None, tail: int = 0, level: Optional[str] = None,
+               test_run: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+               follow: bool = False, rolling: bool = False, stats: bool = False,
+               log_dir: Optional[str] = None) -> None:
+    """Search, tail, follow or summarize the log file(s) without loading them into memory.
 
     Args:
         pattern: Regex pattern to search for (case-insensitive)
-        tail: Number of lines to show from end (0 = all)
-        level: Filter by log level (error, warn, info, debug)
+        tail: Number of matching entries to show from the end (0 = all)
+        level: Filter by log level (error, warn, info, debug, verbose, fatal)
         test_run: View test run log - 'latest' or number 1-10 (1 = most recent)
+        since: Only entries at or after this time (see parse_log_time)
+        until: Only entries at or before this time
+        follow: Keep printing new matching entries until Ctrl+C
+        rolling: Read the server's rolling PolarionMcpServer_*.log files instead of the dev log
+        stats: Print level counts and per tool/route latency summaries instead of entries
+        log_dir: Directory of the rolling log files (default: the Debug build output)
     """
-    import re
-
     log_file = LOG_FILE
 
+    since_key = parse_log_time(since) if since else None
+    until_key = parse_log_time(until, end=True) if until else None
+    if (since and not since_key) or (until and not until_key):
+        print(f"Invalid time: {since if since and not since_key else until}. "
+              "Use e.g. '30m', '2h', '1d', '2025-01-31' or '2025-01-31 14:05'")
+        return
+
     # Handle test run logs
     if test_run:
         test_log_dir = Path("PolarionRemoteMcpServer.Tests/bin/Debug/net9.0/logs/test-runs")
@@ -362,42 +663,91 @@ def search_log(pattern: Optional[str] = None, tail: int = 0, level: Optional[str
                 print(f"Invalid test run value: {test_run}. Use 'latest' or a number 1-10")
                 return
 
-    if not log_file.exists():
-        print(f"Log file not found: {log_file}")
-        if not test_run:
-            print("Start the application first with: python build.py start")
+    if rolling and not test_run:
+        rolling_dir = Path(log_dir) if log_dir else ROLLING_LOG_DIR
+        def list_files():
+            return find_rolling_logs(rolling_dir, since_key, until_key)
+        files = list_files()
+        if not files and not follow:
+            print(f"No PolarionMcpServer_*.log files found in {rolling_dir}")
+            return
+    else:
+        if not log_file.exists():
+            print(f"Log file not found: {log_file}")
+            if not test_run:
+                print("Start the application first with: python build.py start")
+            return
+        def list_files():
+            return [log_file]
+        files = list_files()
+
+    # Entry filters, cheapest first
+    level_code = LOG_LEVELS.get(level.lower()) if level else None
+    if level and not level_code:
+        print(f"Unknown level: {level}. Use verbose, debug, info, warn, error or fatal")
         return
 
+    regex = None
+    if pattern:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            print(f"Invalid regex pattern: {e}")
+            return
+
+    def matches(entry) -> bool:
+        if level_code and _log_level(entry[0]) != level_code:
+            return False
+        if regex:
+            return any(regex.search(line.decode('utf-8', errors='replace')) for line in entry)
+        return True
+
+    def in_range(key) -> bool:
+        return (not since_key or (key or "") >= since_key) and (not until_key or (key or "") <= until_key)
+
+    def forward_entries():
+        for path in files:
+            for key, entry in _group_log_entries(_read_lines_forward(path, since_key)):
+                if until_key and key and key > until_key:
+                    break
+                if in_range(key) and matches(entry):
+                    yield key, entry
+
     try:
-        with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-        
-        # Apply tail
-        if tail > 0:
-            lines = lines[-tail:]
-        
-        # Filter by level if specified
-        if level:
-            level_upper = level.upper()
-            level_pattern = re.compile(rf'\b{level_upper}\b|{level_upper}:', re.IGNORECASE)
-            lines = [line for line in lines if level_pattern.search(line)]
-        
-        # Filter by pattern if specified
-        if pattern:
-            try:
-                regex = re.compile(pattern, re.IGNORECASE)
-                lines = [line for line in lines if regex.search(line)]
-            except re.error as e:
-                print(f"Invalid regex pattern: {e}")
-                return
-        
-        if lines:
-            for line in lines:
-                print(line.rstrip())
-            print(f"\n--- {len(lines)} line(s) shown ---")
+        if stats:
+            print_log_stats(forward_entries())
         else:
-            print("No matching log entries found")
-    
+            if tail > 0 and not since_key:
+                # Newest first from the end of the newest file; stops once enough entries matched
+                selected = []
+                for path in reversed(files):
+                    for key, entry in _group_log_entries(_read_lines_reverse(path), reverse=True):
+                        if (until_key and key and key > until_key) or not matches(entry):
+                            continue
+                        selected.append(entry)
+                        if len(selected) >= tail:
+                            break
+                    if len(selected) >= tail:
+                        break
+                selected.reverse()
+            else:
+                from collections import deque
+                selected = deque((entry for _, entry in forward_entries()), maxlen=tail if tail > 0 else None)
+
+            for entry in selected:
+                for line in entry:
+                    print(line.decode('utf-8', errors='replace'))
+            if selected:
+                print(f"\n--- {len(selected)} entr{'y' if len(selected) == 1 else 'ies'} shown ---")
+            elif not follow:
+                print("No matching log entries found")
+
+        if follow:
+            follow_log(list_files, matches)
+
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        sys.exit(0)
     except Exception as e:
         print(f"Error reading log file: {e}")
 
@@ -621,6 +971,41 @@ def get_project_aliases() -> str:
         return "configured in appsettings.json"
 
 
+def load_appsettings() -> Optional[dict]:
+    """Load appsettings.Development.json, falling back to appsettings.json.
+
+    Returns:
+        The parsed settings, or None if they could not be read
+    """
+    try:
+        appsettings_path = Path("PolarionRemoteMcpServer/appsettings.Development.json")
+        if not appsettings_path.exists():
+            appsettings_path = Path("PolarionRemoteMcpServer/appsettings.json")
+
+        with open(appsettings_path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"✗ Failed to load appsettings: {e}")
+        return None
+
+
+def get_api_key(appsettings: dict) -> Optional[str]:
+    """Get the application key of the first active API consumer."""
+    consumers = appsettings.get('ApiConsumers', {}).get('Consumers', {})
+    for consumer_id, consumer in consumers.items():
+        if consumer.get('Active', False):
+            return consumer.get('ApplicationKey')
+    return None
+
+
+def get_project_id(appsettings: dict, project_alias: str) -> Optional[str]:
+    """Translate a project alias to its SessionConfig.ProjectId, as used by the REST routes."""
+    for proj in appsettings.get('PolarionProjects', []):
+        if proj.get('ProjectUrlAlias') == project_alias:
+            return proj.get('SessionConfig', {}).get('ProjectId')
+    return None
+
+
 def run_rest(method: str, path: str, query_params: dict, project_alias: Optional[str] = None,
              output_format: str = "pretty") -> int:
     """Execute REST API calls with automatic auth and project translation.
@@ -643,25 +1028,12 @@ def run_rest(method: str, path: str, query_params: dict, project_alias: Optional
         return 1
 
     # Load appsettings to get API key and project config
-    try:
-        appsettings_path = Path("PolarionRemoteMcpServer/appsettings.Development.json")
-        if not appsettings_path.exists():
-            appsettings_path = Path("PolarionRemoteMcpServer/appsettings.json")
-
-        with open(appsettings_path, 'r') as f:
-            appsettings = json.load(f)
-    except Exception as e:
-        print(f"✗ Failed to load appsettings: {e}")
+    appsettings = load_appsettings()
+    if appsettings is None:
         return 1
 
     # Get first active API consumer
-    api_key = None
-    consumers = appsettings.get('ApiConsumers', {}).get('Consumers', {})
-    for consumer_id, consumer in consumers.items():
-        if consumer.get('Active', False):
-            api_key = consumer.get('ApplicationKey')
-            break
-
+    api_key = get_api_key(appsettings)
     if not api_key:
         print("✗ No active API consumer found in appsettings")
         return 1
@@ -670,13 +1042,7 @@ def run_rest(method: str, path: str, query_params: dict, project_alias: Optional
     project_alias = project_alias or get_default_project()
     if "{project}" in path:
         # Find project config by alias
-        project_id = None
-        projects = appsettings.get('PolarionProjects', [])
-        for proj in projects:
-            if proj.get('ProjectUrlAlias') == project_alias:
-                project_id = proj.get('SessionConfig', {}).get('ProjectId')
-                break
-
+        project_id = get_project_id(appsettings, project_alias)
         if not project_id:
             print(f"✗ Project alias '{project_alias}' not found in configuration")
             return 1
@@ -746,6 +1112,350 @@ def run_rest(method: str, path: str, query_params: dict, project_alias: Optional
         return 1
 
 
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    import math
+
+    rank = max(1, math.ceil(pct * len(sorted_values) / 100))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_samples(samples: list, elapsed: float) -> dict:
+    """Summarize (latency_ms, ok, size_bytes, status) samples of one tool or route."""
+    latencies = sorted(s[0] for s in samples)
+    errors = sum(1 for s in samples if not s[1])
+    sizes = [s[2] for s in samples]
+    statuses = {}
+    for s in samples:
+        statuses[s[3]] = statuses.get(s[3], 0) + 1
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+        },
+        "response_bytes": {
+            "mean": round(sum(sizes) / len(sizes)) if sizes else 0,
+            "max": max(sizes) if sizes else 0,
+            "total": sum(sizes),
+        },
+        "status": statuses,
+    }
+
+
+def load_bench_scenario(scenario_path: str) -> Optional[dict]:
+    """Load and validate a bench scenario file.
+
+    A scenario is a JSON object with optional defaults ("project", "concurrency", "ramp_up_seconds",
+    "duration_seconds", "timeout_seconds", "seed"), optional "variables" substituted as {name} into
+    paths, parameters and tool arguments, and a "requests" list. Each request has either "mcp" (tool
+    name, with "args") or "rest" (path, with optional "method" and "params"), plus an optional "name"
+    and relative "weight".
+    """
+    try:
+        with open(scenario_path, 'r', encoding='utf-8') as f:
+            scenario = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"✗ Failed to load scenario '{scenario_path}': {e}")
+        return None
+
+    requests = scenario.get("requests") or []
+    if not requests:
+        print(f"✗ Scenario '{scenario_path}' has no requests")
+        return None
+
+    for index, request in enumerate(requests):
+        if ("mcp" in request) == ("rest" in request):
+            print(f"✗ Scenario request #{index + 1} must have exactly one of 'mcp' or 'rest'")
+            return None
+        if request.get("weight", 1) <= 0:
+            print(f"✗ Scenario request #{index + 1} must have a positive weight")
+            return None
+        if "name" not in request:
+            request["name"] = (f"mcp {request['mcp']}" if "mcp" in request
+                               else f"{request.get('method', 'GET').upper()} {request['rest']}")
+
+    return scenario
+
+
+def _substitute(value, variables: dict):
+    """Replace {name} placeholders in strings, lists and dicts."""
+    if isinstance(value, str):
+        for name, replacement in variables.items():
+            value = value.replace("{" + name + "}", str(replacement))
+        return value
+    if isinstance(value, list):
+        return [_substitute(v, variables) for v in value]
+    if isinstance(value, dict):
+        return {k: _substitute(v, variables) for k, v in value.items()}
+    return value
+
+
+async def run_bench_command(scenario: dict, concurrency: int, ramp_up: float, duration: float,
+                            timeout: float, project: str, project_id: Optional[str],
+                            api_key: Optional[str], seed: int) -> dict:
+    """Replay a scenario with `concurrency` virtual users for `duration` seconds.
+
+    Users start evenly spread over `ramp_up` seconds. Each user keeps its own MCP session and
+    picks requests at random by weight until the deadline. A user whose MCP session cannot be
+    opened stops and is recorded as a failed "mcp session" sample.
+
+    Returns:
+        The raw samples per request name and the measured wall time
+    """
+    import random
+    from urllib.parse import quote, urlencode
+
+    variables = dict(scenario.get("variables") or {})
+    variables.setdefault("project", project_id or project)
+    requests = [_substitute(r, variables) for r in scenario["requests"]]
+    weights = [r.get("weight", 1) for r in requests]
+    uses_mcp = any("mcp" in r for r in requests)
+    uses_rest = any("rest" in r for r in requests)
+
+    samples = {r["name"]: [] for r in requests}
+    mcp_url = f"http://localhost:{DEV_PORT}/{project}/mcp"
+    base_url = f"http://localhost:{DEV_PORT}"
+
+    rest_client = None
+    if uses_rest:
+        rest_client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"X-API-Key": api_key} if api_key else {},
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency))
+
+    async def call_mcp(client, request: dict):
+        result = await client.call_tool_mcp(request["mcp"], request.get("args") or {})
+        text = "".join(getattr(c, "text", "") for c in (result.content or []))
+        # Tools report failures as text starting with "ERROR" rather than MCP errors
+        ok = not result.isError and not text.lstrip().startswith("ERROR")
+        return ok, len(text.encode("utf-8")), "ok" if ok else "error"
+
+    async def call_rest(request: dict):
+        path = quote(request["rest"] if request["rest"].startswith('/') else '/' + request["rest"], safe="/%:@")
+        params = {k: v for k, v in (request.get("params") or {}).items() if v is not None}
+        if params:
+            path += "?" + urlencode(params)
+        response = await rest_client.request(request.get("method", "GET").upper(), path)
+        return response.status_code < 400, len(response.content), str(response.status_code)
+
+    async def user(index: int, deadline: float):
+        rng = random.Random(seed + index)
+        await asyncio.sleep(ramp_up * index / concurrency)
+
+        mcp_client = None
+        if uses_mcp:
+            client = McpClient(mcp_url, timeout=timeout)
+            started = time.perf_counter()
+            try:
+                await client.__aenter__()
+            except Exception as e:
+                # A user that cannot open its MCP session is reported as a failed request, not a failed run
+                samples.setdefault("mcp session", []).append(
+                    ((time.perf_counter() - started) * 1000, False, 0, type(e).__name__))
+                return
+            mcp_client = client
+
+        try:
+            while time.perf_counter() < deadline:
+                request = rng.choices(requests, weights)[0]
+                started = time.perf_counter()
+                try:
+                    if "mcp" in request:
+                        ok, size, status = await call_mcp(mcp_client, request)
+                    else:
+                        ok, size, status = await call_rest(request)
+                except Exception as e:
+                    ok, size, status = False, 0, type(e).__name__
+                samples[request["name"]].append(((time.perf_counter() - started) * 1000, ok, size, status))
+        finally:
+            if mcp_client is not None:
+                await mcp_client.__aexit__(None, None, None)
+
+    started = time.perf_counter()
+    deadline = started + ramp_up + duration
+    try:
+        await asyncio.gather(*(user(i, deadline) for i in range(concurrency)))
+    finally:
+        if rest_client is not None:
+            await rest_client.aclose()
+
+    return {"samples": samples, "elapsed": time.perf_counter() - started}
+
+
+def run_bench(scenario_path: str, concurrency: Optional[int] = None, ramp_up: Optional[float] = None,
+              duration: Optional[float] = None, project: Optional[str] = None,
+              output_path: Optional[str] = None) -> int:
+    """Load-test the running server with a scenario of MCP tool calls and REST requests.
+
+    Command-line options override the scenario's defaults. Prints per tool/route throughput,
+    latency percentiles, error rates and response sizes, and writes them as JSON.
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    if not FASTMCP_AVAILABLE or not HTTPX_AVAILABLE:
+        print("✗ fastmcp package is not installed")
+        print("\nInstall it with:")
+        print("  pip install fastmcp")
+        return 1
+
+    pid = get_running_pid()
+    if not pid:
+        print("✗ Application is not running")
+        print("Start it first with: python build.py start")
+        return 1
+
+    scenario = load_bench_scenario(scenario_path)
+    if scenario is None:
+        return 1
+
+    appsettings = load_appsettings()
+    if appsettings is None:
+        return 1
+
+    concurrency = concurrency if concurrency is not None else int(scenario.get("concurrency", 4))
+    if concurrency < 1:
+        print("✗ Concurrency must be at least 1")
+        return 1
+    ramp_up = ramp_up if ramp_up is not None else float(scenario.get("ramp_up_seconds", 0))
+    duration = duration if duration is not None else float(scenario.get("duration_seconds", 30))
+    timeout = float(scenario.get("timeout_seconds", 120))
+    seed = int(scenario.get("seed", 1))
+    project = project or scenario.get("project") or get_default_project()
+
+    project_id = get_project_id(appsettings, project)
+    api_key = get_api_key(appsettings)
+    if any("rest" in r for r in scenario["requests"]):
+        if not api_key:
+            print("✗ No active API consumer found in appsettings")
+            return 1
+        if not project_id:
+            print(f"✗ Project alias '{project}' not found in configuration")
+            return 1
+
+    print(f"Scenario: {scenario_path} ({len(scenario['requests'])} request(s))")
+    print(f"Project: {project} → {project_id}")
+    print(f"Users: {concurrency}, ramp-up: {ramp_up:g}s, duration: {duration:g}s")
+
+    try:
+        run = asyncio.run(run_bench_command(scenario, concurrency, ramp_up, duration, timeout,
+                                            project, project_id, api_key, seed))
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        return 1
+    except Exception as e:
+        print(f"✗ Bench Error ({type(e).__name__}): {e}")
+        return 1
+
+    elapsed = run["elapsed"]
+    results = {name: summarize_samples(s, elapsed) for name, s in run["samples"].items()}
+    all_samples = [sample for s in run["samples"].values() for sample in s]
+    report = {
+        "scenario": scenario_path,
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time() - elapsed)),
+        "project": project,
+        "concurrency": concurrency,
+        "ramp_up_seconds": ramp_up,
+        "duration_seconds": duration,
+        "elapsed_seconds": round(elapsed, 2),
+        "total": summarize_samples(all_samples, elapsed),
+        "requests": results,
+    }
+
+    print()
+    print(f"{'Tool / route':<48} {'Reqs':>7} {'Err%':>6} {'RPS':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'Avg size':>10}")
+    print("-" * 110)
+    for name, stats in list(results.items()) + [("TOTAL", report["total"])]:
+        latency = stats["latency_ms"]
+        print(f"{name[:48]:<48} {stats['requests']:>7} {stats['error_rate'] * 100:>5.1f}% "
+              f"{stats['throughput_rps']:>8.1f} {latency['p50']:>7.0f}ms {latency['p95']:>6.0f}ms "
+              f"{latency['p99']:>6.0f}ms {stats['response_bytes']['mean']:>9}B")
+
+    if output_path is None:
+        Path("bench-results").mkdir(exist_ok=True)
+        output_path = str(Path("bench-results") / f"{Path(scenario_path).stem}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {output_path}")
+
+    return 0 if report["total"]["errors"] == 0 else 1
+
+
+def load_benchmark_results(results_dir: str) -> dict:
+    """Read BenchmarkDotNet full JSON reports into {benchmark: (median ns, allocated bytes per op)}."""
+    results = {}
+    for report_path in sorted(Path(results_dir).glob("*-report-full.json")):
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        for benchmark in report.get("Benchmarks", []):
+            statistics = benchmark.get("Statistics") or {}
+            if "Median" not in statistics:
+                continue  # Failed benchmarks have no statistics
+            memory = benchmark.get("Memory") or {}
+            results[benchmark["FullName"]] = (statistics["Median"], memory.get("BytesAllocatedPerOperation"))
+    return results
+
+
+def compare_benchmarks(baseline_dir: str, results_dir: str, threshold_percent: float) -> int:
+    """Compare BenchmarkDotNet results against a baseline run.
+
+    A benchmark regresses when its median time or its allocations per operation exceed the
+    baseline by more than threshold_percent. Benchmarks missing from either run are listed, not judged.
+
+    Returns:
+        Exit code (0 when nothing regressed or there is no baseline, 1 otherwise)
+    """
+    current = load_benchmark_results(results_dir)
+    if not current:
+        print(f"✗ No BenchmarkDotNet reports (*-report-full.json) found in {results_dir}")
+        return 1
+
+    baseline = load_benchmark_results(baseline_dir) if Path(baseline_dir).is_dir() else {}
+    if not baseline:
+        print(f"No baseline found in {baseline_dir}; nothing to compare against")
+        return 0
+
+    limit = 1 + threshold_percent / 100
+    regressions = 0
+    print(f"{'Benchmark':<80} {'Median':>12} {'Δ time':>8} {'Allocated':>12} {'Δ alloc':>8}")
+    print("-" * 124)
+    for name, (median, allocated) in sorted(current.items()):
+        if name not in baseline:
+            print(f"{name[:80]:<80} {median / 1e6:>10.3f}ms {'new':>8}")
+            continue
+
+        base_median, base_allocated = baseline[name]
+        time_ratio = median / base_median if base_median else 1
+        alloc_ratio = allocated / base_allocated if allocated is not None and base_allocated else 1
+        regressed = time_ratio > limit or alloc_ratio > limit
+        regressions += regressed
+        allocated_text = f"{allocated:>11}B" if allocated is not None else f"{'-':>12}"
+        print(f"{name[:80]:<80} {median / 1e6:>10.3f}ms {(time_ratio - 1) * 100:>+7.1f}% "
+              f"{allocated_text} {(alloc_ratio - 1) * 100:>+7.1f}%{'  ✗' if regressed else ''}")
+
+    for name in sorted(set(baseline) - set(current)):
+        print(f"{name[:80]:<80} {'missing':>12}")
+
+    if regressions:
+        print(f"\n✗ {regressions} benchmark(s) regressed by more than {threshold_percent:g}%")
+        return 1
+
+    print(f"\n✓ No benchmark regressed by more than {threshold_percent:g}%")
+    return 0
+
+
 def print_usage() -> None:
     """Print usage information"""
     print("Usage: python build.py [command] [options]")
@@ -780,16 +1490,33 @@ def print_usage() -> None:
     print("    --revision <n>       - Document revision number")
     print("    --format <fmt>       - Output format: pretty (default) or raw")
     print("")
+    print("Load Test Commands (requires: pip install fastmcp psutil):")
+    print("  bench <scenario.json> [options]           - Replay MCP tool calls and REST requests concurrently")
+    print("    --concurrency <n>    - Concurrent virtual users (default: scenario or 4)")
+    print("    --ramp-up <s>        - Seconds over which users start (default: scenario or 0)")
+    print("    --duration <s>       - Seconds to run after ramp-up (default: scenario or 30)")
+    print("    --project <alias>    - Project to use (default: scenario or default project)")
+    print("    --output <file>      - JSON results file (default: bench-results/<scenario>-<time>.json)")
+    print("  bench-compare <baseline-dir> <results-dir> [--threshold <pct>]")
+    print("                                            - Fail when BenchmarkDotNet results regress (default: 20%)")
+    print("")
     project_aliases = get_project_aliases()
     print(f"  Project aliases: {project_aliases}")
     print("")
     print("Log Commands:")
-    print("  log                      - Show last 50 lines of log")
-    print("  log <pattern>            - Search log for regex pattern")
-    print("  log --tail <n>           - Show last n lines")
-    print("  log --level <level>      - Filter by level (error/warn/info/debug)")
+    print("  log                      - Show last 50 entries of log")
+    print("  log <pattern>            - Search log for regex pattern (last 50 matches)")
+    print("  log --tail <n>           - Show last n matching entries (0 = all)")
+    print("  log --level <level>      - Filter by level (error/warn/info/debug/verbose/fatal)")
+    print("  log --since <time>       - Entries from a time: 30m, 2h, 1d, 2025-01-31 or '2025-01-31 14:05'")
+    print("  log --until <time>       - Entries up to a time (same formats)")
+    print("  log --follow, -f         - Keep printing new matching entries (Ctrl+C to stop)")
+    print("  log --rolling            - Read the server's rolling PolarionMcpServer_*.log files")
+    print("  log --log-dir <dir>      - Rolling log directory (implies --rolling)")
+    print("  log --stats              - Level counts and per tool/route latency (needs Debug logging)")
     print("  log --test-run <n>       - View test run log (latest or 1-10)")
     print("  log --tail 100 --level error - Combine options")
+    print("  log --rolling --since 1d --stats         - Summarize the last day")
     print("")
     print("URLs (when running):")
     print(f"  http://localhost:{DEV_PORT}              - Landing page")
@@ -803,6 +1530,7 @@ def print_usage() -> None:
     print('  python build.py rest GET "polarion/rest/v1/projects/{project}/workitems" --query "search term" --project <alias>')
     print('  python build.py rest GET "polarion/rest/v1/projects/{project}/workitems/WI-12345" --project <alias>')
     print('  python build.py rest GET "polarion/rest/v1/projects/{project}/spaces" --project <alias>')
+    print("  python build.py bench bench-scenario.example.json --concurrency 16 --duration 60")
     print("  python build.py log --level error           # View error logs")
     print("  python build.py stop                        # Stop the server")
 
@@ -823,9 +1551,15 @@ def main() -> None:
     # Log command
     if command == "log":
         pattern = None
-        tail = 50  # Default to last 50 lines
+        tail = None
         level = None
         test_run = None
+        since = None
+        until = None
+        follow = False
+        rolling = False
+        stats = False
+        log_dir = None
 
         # Parse log options
         args = sys.argv[2:]
@@ -844,7 +1578,26 @@ def main() -> None:
             elif args[i] == "--test-run" and i + 1 < len(args):
                 test_run = args[i + 1]
                 i += 2
-            elif not args[i].startswith("--"):
+            elif args[i] == "--since" and i + 1 < len(args):
+                since = args[i + 1]
+                i += 2
+            elif args[i] == "--until" and i + 1 < len(args):
+                until = args[i + 1]
+                i += 2
+            elif args[i] == "--log-dir" and i + 1 < len(args):
+                log_dir = args[i + 1]
+                rolling = True
+                i += 2
+            elif args[i] in ("--follow", "-f"):
+                follow = True
+                i += 1
+            elif args[i] == "--rolling":
+                rolling = True
+                i += 1
+            elif args[i] == "--stats":
+                stats = True
+                i += 1
+            elif not args[i].startswith("-"):
                 pattern = args[i]
                 i += 1
             else:
@@ -852,7 +1605,12 @@ def main() -> None:
                 print_usage()
                 sys.exit(1)
 
-        search_log(pattern=pattern, tail=tail, level=level, test_run=test_run)
+        if tail is None:
+            # Time ranges show every entry in the range; otherwise the last 50 matching entries
+            tail = 0 if since or until else 50
+
+        search_log(pattern=pattern, tail=tail, level=level, test_run=test_run, since=since, until=until,
+                   follow=follow, rolling=rolling, stats=stats, log_dir=log_dir)
         return
     
     # MCP command
@@ -942,6 +1700,72 @@ def main() -> None:
 
         sys.exit(run_rest(method, path, query_params, project, output_format))
 
+    # Bench command
+    if command == "bench":
+        if len(sys.argv) < 3:
+            print("Error: bench requires a scenario file")
+            print("Usage: python build.py bench <scenario.json> [options]")
+            sys.exit(1)
+
+        scenario_path = sys.argv[2]
+        concurrency = None
+        ramp_up = None
+        duration = None
+        project = None
+        output_path = None
+
+        args = sys.argv[3:]
+        i = 0
+        try:
+            while i < len(args):
+                if args[i] == "--concurrency" and i + 1 < len(args):
+                    concurrency = int(args[i + 1])
+                    i += 2
+                elif args[i] == "--ramp-up" and i + 1 < len(args):
+                    ramp_up = float(args[i + 1])
+                    i += 2
+                elif args[i] == "--duration" and i + 1 < len(args):
+                    duration = float(args[i + 1])
+                    i += 2
+                elif args[i] == "--project" and i + 1 < len(args):
+                    project = args[i + 1]
+                    i += 2
+                elif args[i] == "--output" and i + 1 < len(args):
+                    output_path = args[i + 1]
+                    i += 2
+                else:
+                    print(f"Unknown option: {args[i]}")
+                    sys.exit(1)
+        except ValueError:
+            print(f"Invalid value for {args[i]}: {args[i + 1]}")
+            sys.exit(1)
+
+        sys.exit(run_bench(scenario_path, concurrency, ramp_up, duration, project, output_path))
+
+    # Bench compare command
+    if command == "bench-compare":
+        if len(sys.argv) < 4:
+            print("Error: bench-compare requires a baseline and a results directory")
+            print("Usage: python build.py bench-compare <baseline-dir> <results-dir> [--threshold <pct>]")
+            sys.exit(1)
+
+        threshold = 20.0
+        args = sys.argv[4:]
+        i = 0
+        while i < len(args):
+            if args[i] == "--threshold" and i + 1 < len(args):
+                try:
+                    threshold = float(args[i + 1])
+                except ValueError:
+                    print(f"Invalid threshold value: {args[i + 1]}")
+                    sys.exit(1)
+                i += 2
+            else:
+                print(f"Unknown option: {args[i]}")
+                sys.exit(1)
+
+        sys.exit(compare_benchmarks(sys.argv[2], sys.argv[3], threshold))
+
     # Test command
     if command == "test":
         filter_pattern = None